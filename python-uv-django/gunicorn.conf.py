@@ -0,0 +1,191 @@
+"""Gunicorn configuration, sized from the container it runs in.
+
+Run from the project root (the ``Dockerfile`` does)::
+
+    gunicorn --config gunicorn.conf.py
+
+Environment variables:
+
+* ``GUNICORN_WORKER_CLASS``: ``sync`` (default), ``gthread`` or ``uvicorn``.
+  ``uvicorn`` serves ``config.asgi`` (the async task API), the others
+  ``config.wsgi``.
+* ``WEB_CONCURRENCY`` and ``GUNICORN_THREADS``: worker processes and threads
+  per worker. By default they follow the CPUs the container may use (its
+  cgroup CPU quota, or the CPUs the process may run on): ``2 * cpus + 1``
+  sync workers, ``cpus + 1`` gthread workers of 4 threads, or ``cpus``
+  uvicorn workers.
+* ``GUNICORN_PRELOAD`` (default true): import the application once in the
+  master. The garbage collector is held off while it loads and everything
+  it created is frozen before each fork, so the workers share those pages
+  instead of copying them the first time a collection touches them.
+* ``GUNICORN_MAX_REQUESTS`` (default 1000) and ``GUNICORN_MAX_REQUESTS_JITTER``
+  (default 100): restart a worker after that many requests plus up to the
+  jitter, so workers do not all restart at once.
+* ``GUNICORN_BIND`` (default ``0.0.0.0:8000``) and ``GUNICORN_TIMEOUT``
+  (default 30 seconds).
+
+Each worker logs its memory once it is ready: ``pss`` (its fair share of
+shared pages) and ``private`` are what another worker would add to the node.
+"""
+
+from __future__ import annotations
+
+import gc
+import math
+import os
+import resource
+from pathlib import Path
+from typing import Any
+
+# Root of the cgroup file system, where the container's CPU quota is found.
+CGROUP_ROOT = Path('/sys/fs/cgroup')
+
+# gunicorn worker class and application of each GUNICORN_WORKER_CLASS.
+WORKER_CLASSES = {
+    'sync': ('sync', 'config.wsgi:application'),
+    'gthread': ('gthread', 'config.wsgi:application'),
+    'uvicorn': ('uvicorn_worker.UvicornWorker', 'config.asgi:application'),
+}
+
+
+def cpu_limit(root: Path = CGROUP_ROOT) -> int:
+    """Return the number of CPUs this process may use, rounding a quota up.
+
+    Reads the CFS quota of cgroup v2 (``cpu.max``) or v1
+    (``cpu.cfs_quota_us`` over ``cpu.cfs_period_us``) and caps it at the
+    CPUs in the process's affinity mask.
+    """
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else os.cpu_count()
+    quota = period = None
+    try:
+        quota, period = (root / 'cpu.max').read_text().split()
+    except (OSError, ValueError):
+        for directory in (root / 'cpu', root / 'cpu,cpuacct'):
+            try:
+                quota = (directory / 'cpu.cfs_quota_us').read_text().strip()
+                period = (directory / 'cpu.cfs_period_us').read_text().strip()
+                break
+            except OSError:
+                continue
+    if quota not in (None, 'max', '-1'):
+        return max(1, min(cpus or 1, math.ceil(int(quota) / int(period))))
+    return cpus or 1
+
+
+def worker_counts(worker_class: str, cpus: int) -> tuple[int, int]:
+    """Return the default number of workers and threads per worker for ``cpus`` CPUs."""
+    if worker_class == 'sync':
+        return 2 * cpus + 1, 1
+    if worker_class == 'gthread':
+        return cpus + 1, 4
+    return cpus, 1
+
+
+def memory_usage(pid: int | str = 'self') -> dict[str, int]:
+    """Return the resident memory of process ``pid`` in KiB: rss, pss, shared and private.
+
+    Reads ``/proc/<pid>/smaps_rollup``. Where it does not exist only the
+    peak ``rss`` of this process is known.
+    """
+    try:
+        lines = Path(f'/proc/{pid}/smaps_rollup').read_text().splitlines()
+    except OSError:
+        return {'rss': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}
+    fields = {}
+    for line in lines[1:]:
+        name, _, value = line.partition(':')
+        fields[name] = int(value.split()[0])
+    return {
+        'rss': fields['Rss'],
+        'pss': fields['Pss'],
+        'shared': fields['Shared_Clean'] + fields['Shared_Dirty'],
+        'private': fields['Private_Clean'] + fields['Private_Dirty'],
+    }
+
+
+def format_memory(usage: dict[str, int]) -> str:
+    """Format ``memory_usage()`` in MiB."""
+    return ' '.join(f'{name}={kib / 1024:.1f}MiB' for name, kib in usage.items())
+
+
+_worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'sync')
+if _worker_class not in WORKER_CLASSES:
+    raise ValueError(
+        f'GUNICORN_WORKER_CLASS must be one of {", ".join(WORKER_CLASSES)}, not {_worker_class!r}'
+    )
+_workers, _threads = worker_counts(_worker_class, cpu_limit())
+
+# Server socket
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:8000')
+
+# Application, imported from src/
+chdir = str(Path(__file__).resolve().parent / 'src')
+worker_class, wsgi_app = WORKER_CLASSES[_worker_class]
+
+# Worker processes
+workers = int(os.getenv('WEB_CONCURRENCY', _workers))
+threads = int(os.getenv('GUNICORN_THREADS', _threads))
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '30'))
+
+# Worker recycling
+max_requests = int(os.getenv('GUNICORN_MAX_REQUESTS', '1000'))
+max_requests_jitter = int(os.getenv('GUNICORN_MAX_REQUESTS_JITTER', '100'))
+
+# Import the application once, before forking
+preload_app = os.getenv('GUNICORN_PRELOAD', 'true').lower() == 'true'
+
+# Worker heartbeat files in memory; an overlay file system can stall them
+if os.path.isdir('/dev/shm'):
+    worker_tmp_dir = '/dev/shm'
+
+# Whether the application's warm-up (config.warmup) opens database connections
+_warmup_databases = os.getenv('DJANGO_WARMUP_DATABASES', 'true').lower() == 'true'
+
+if preload_app:
+    # Collections in the master while the application loads would leave
+    # freed holes in the pages the workers are about to share.
+    gc.disable()
+    # Connections must not cross the fork: each worker opens its own.
+    os.environ['DJANGO_WARMUP_DATABASES'] = 'false'
+
+
+def pre_fork(server: Any, worker: Any) -> None:
+    """Move the master's objects out of the collector's reach before forking."""
+    if preload_app:
+        gc.freeze()
+
+
+def post_fork(server: Any, worker: Any) -> None:
+    """Collect garbage in the worker again; the frozen objects are left alone."""
+    if preload_app:
+        gc.enable()
+
+
+def when_ready(server: Any) -> None:
+    """Log the worker setup and the master's memory."""
+    server.log.info(
+        'Starting %d %s workers x %d threads (%d CPUs), preload %s: master %s',
+        workers,
+        _worker_class,
+        threads if _worker_class == 'gthread' else 1,
+        cpu_limit(),
+        'on' if preload_app else 'off',
+        format_memory(memory_usage()),
+    )
+
+
+def post_worker_init(worker: Any) -> None:
+    """Connect the worker to its databases if the master could not, then log its memory.
+
+    Only a sync worker keeps the connections: it serves requests on this
+    thread. gthread and uvicorn workers serve them on other threads, each
+    with its own connection, so this thread's would sit idle.
+    """
+    if preload_app and _warmup_databases:
+        from django.conf import settings
+
+        from config.warmup import connect_databases
+
+        if settings.WARMUP:
+            connect_databases(keep=_worker_class == 'sync')
+    worker.log.info('Worker %d ready: %s', worker.pid, format_memory(memory_usage()))
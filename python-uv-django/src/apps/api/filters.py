@@ -0,0 +1,46 @@
+"""Filter backends for the API."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from django.db.models import QuerySet
+from rest_framework import filters
+from rest_framework.request import Request
+from rest_framework.views import APIView
+
+from apps.core.models import Task
+from apps.core.search import SEARCH_RANK, TaskSearchBackend, get_task_search_backend
+
+
+class TaskSearchFilter(filters.SearchFilter):
+    """Route ``?search=`` through the task full-text search backend."""
+
+    def filter_queryset(
+        self, request: Request, queryset: QuerySet[Any], view: APIView
+    ) -> QuerySet[Any]:
+        """Filter and rank ``queryset`` by the search term, if any."""
+        term = request.query_params.get(self.search_param, "").strip()
+        if not term:
+            return queryset
+        if queryset.model is Task:
+            backend = get_task_search_backend(queryset.db)
+        else:
+            # The full-text index only covers the task table, so lists that
+            # include archived tasks are matched by scanning.
+            backend = TaskSearchBackend()
+        return backend.search(queryset, term, rank=True)
+
+
+class TaskOrderingFilter(filters.OrderingFilter):
+    """Order search results by relevance unless ``?ordering=`` says otherwise."""
+
+    def get_ordering(
+        self, request: Request, queryset: QuerySet[Any], view: APIView
+    ) -> list[str] | tuple[str, ...] | None:
+        """Prepend the search rank to the default ordering for searches."""
+        ordering = super().get_ordering(request, queryset, view)
+        explicit = request.query_params.get(self.ordering_param)
+        if not explicit and SEARCH_RANK in queryset.query.annotations:
+            return [f"-{SEARCH_RANK}", *(ordering or [])]
+        return ordering
@@ -0,0 +1,203 @@
+"""Pagination classes for the API."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from asgiref.sync import sync_to_async
+
+from django.conf import settings
+from django.db.models import QuerySet
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+from rest_framework.views import APIView
+
+from apps.core.pagination import (
+    EstimatedCountPaginator,
+    InvalidCursor,
+    KeysetPage,
+    KeysetPaginator,
+)
+
+
+class EstimatedPageNumberPagination(PageNumberPagination):
+    """Page-number pagination whose large counts come from planner estimates.
+
+    The envelope carries ``count_is_approximate`` next to ``count`` so
+    clients can tell an estimate (and a ``next`` link past it) apart.
+    """
+
+    django_paginator_class = EstimatedCountPaginator
+
+    def get_paginated_response(self, data: Any) -> Response:
+        """Return the page envelope, flagging an estimated count."""
+        return Response(
+            {
+                "count": self.page.paginator.count,
+                "count_is_approximate": self.page.paginator.count_is_estimate,
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_next_link(self) -> str | None:
+        """Return the next page; past an estimate, follow full pages instead of the count."""
+        if not self.page.paginator.count_is_estimate:
+            return super().get_next_link()
+        if len(self.page) < self.page.paginator.per_page:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.page_query_param, self.page.number + 1)
+
+    def get_paginated_response_schema(self, schema: dict[str, Any]) -> dict[str, Any]:
+        """Describe the envelope, including ``count_is_approximate``."""
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema["properties"]["count_is_approximate"] = {"type": "boolean"}
+        return response_schema
+
+
+class KeysetPagination(BasePagination):
+    """Cursor pagination over a composite ordering, with page-number fallback.
+
+    Requests carrying ``?page=`` (or every request when ``PAGINATION_MODE`` is
+    ``"page"``) are answered by the legacy ``PageNumberPagination`` so existing
+    clients keep their ``count`` and page links. Everything else is paginated
+    by seeking on the view's ordering (including ``?ordering=`` chosen through
+    ``OrderingFilter``) plus an ``id`` tiebreaker, using opaque ``?cursor=``
+    tokens and no ``COUNT(*)``.
+    """
+
+    page_size = api_settings.PAGE_SIZE
+    cursor_query_param = "cursor"
+    page_query_param = "page"
+    legacy_pagination_class = EstimatedPageNumberPagination
+
+    def paginate_queryset(
+        self, queryset: QuerySet[Any], request: Request, view: APIView | None = None
+    ) -> list[Any] | None:
+        """Paginate ``queryset`` in cursor or page-number mode."""
+        self.request = request
+        self.legacy: PageNumberPagination | None = None
+        if self.use_page_numbers(request):
+            self.legacy = self.legacy_pagination_class()
+            return self.legacy.paginate_queryset(queryset, request, view)
+
+        self.paginator = KeysetPaginator(
+            queryset.model, self.get_ordering(request, queryset, view), self.page_size
+        )
+        try:
+            self.page: KeysetPage = self.paginator.paginate(
+                queryset, request.query_params.get(self.cursor_query_param)
+            )
+        except InvalidCursor as exc:
+            raise NotFound(str(exc)) from exc
+        return self.page.object_list
+
+    async def apaginate_queryset(
+        self, queryset: QuerySet[Any], request: Request, view: APIView | None = None
+    ) -> list[Any] | None:
+        """Async version of ``paginate_queryset()``.
+
+        Cursor pages are fetched with async iteration; legacy page numbers
+        need ``Paginator.count`` and run in a worker thread.
+        """
+        if self.use_page_numbers(request):
+            return await sync_to_async(self.paginate_queryset)(queryset, request, view)
+
+        self.request = request
+        self.legacy = None
+        self.paginator = KeysetPaginator(
+            queryset.model, self.get_ordering(request, queryset, view), self.page_size
+        )
+        cursor = request.query_params.get(self.cursor_query_param)
+        try:
+            position = self.paginator.decode_cursor(cursor) if cursor else None
+        except InvalidCursor as exc:
+            raise NotFound(str(exc)) from exc
+        rows = [row async for row in self.paginator.page_queryset(queryset, position)]
+        self.page = self.paginator.build_page(rows, position)
+        return self.page.object_list
+
+    def use_page_numbers(self, request: Request) -> bool:
+        """Return whether this request should use legacy page numbers."""
+        if self.page_query_param in request.query_params:
+            return True
+        return settings.PAGINATION_MODE == "page"
+
+    def get_ordering(
+        self, request: Request, queryset: QuerySet[Any], view: APIView | None
+    ) -> list[str]:
+        """Return the ordering chosen by the view's ordering filter, if any."""
+        for backend in getattr(view, "filter_backends", []):
+            if hasattr(backend, "get_ordering"):
+                ordering = backend().get_ordering(request, queryset, view)
+                if ordering:
+                    return list(ordering)
+        return list(queryset.query.order_by or queryset.model._meta.ordering)
+
+    def get_paginated_response(self, data: Any) -> Response:
+        """Return the page envelope for the active mode."""
+        if self.legacy is not None:
+            return self.legacy.get_paginated_response(data)
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_next_link(self) -> str | None:
+        """Return the URL of the next page."""
+        if self.legacy is not None:
+            return self.legacy.get_next_link()
+        return self._link(self.page.next_cursor)
+
+    def get_previous_link(self) -> str | None:
+        """Return the URL of the previous page."""
+        if self.legacy is not None:
+            return self.legacy.get_previous_link()
+        return self._link(self.page.previous_cursor)
+
+    def _link(self, cursor: str | None) -> str | None:
+        """Build an absolute URL carrying ``cursor``."""
+        if cursor is None:
+            return None
+        url = remove_query_param(self.request.build_absolute_uri(), self.page_query_param)
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def get_paginated_response_schema(self, schema: dict[str, Any]) -> dict[str, Any]:
+        """Describe the cursor-mode envelope."""
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view: APIView) -> list[dict[str, Any]]:
+        """Document both the cursor and the legacy page parameters."""
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Opaque pagination cursor.",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.page_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Page number (legacy page-number mode).",
+                "schema": {"type": "integer"},
+            },
+        ]
@@ -0,0 +1,45 @@
+"""Parsers for the API."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import IO, Any
+
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.utils.mediatypes import parse_header_parameters
+
+from .renderers import FastJSONRenderer, orjson
+
+
+class FastJSONParser(JSONParser):
+    """``JSONParser`` backed by orjson.
+
+    Falls back to the stdlib decoder when orjson is not installed, when the
+    request body is not UTF-8 or when ``STRICT_JSON`` is off (orjson always
+    rejects ``NaN`` and ``Infinity``).
+    """
+
+    renderer_class = FastJSONRenderer
+
+    def parse(
+        self,
+        stream: IO[Any],
+        media_type: str | None = None,
+        parser_context: Mapping[str, Any] | None = None,
+    ) -> Any:
+        """Parse the request body as JSON."""
+        if orjson is None or not self.strict or not self._is_utf8(media_type):
+            return super().parse(stream, media_type, parser_context)
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}") from exc
+
+    @staticmethod
+    def _is_utf8(media_type: str | None) -> bool:
+        """Return whether the declared charset (if any) is UTF-8."""
+        if not media_type:
+            return True
+        _, params = parse_header_parameters(media_type)
+        return params.get("charset", "utf-8").lower().replace("_", "-") in ("utf-8", "utf8")
@@ -0,0 +1,115 @@
+"""Renderers for the API."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator, Mapping
+from typing import Any
+
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.settings import api_settings
+from rest_framework.utils import encoders
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson installed
+    orjson = None  # type: ignore[assignment]
+
+# Non-string keys (e.g. per-item error indexes) are stringified like json.dumps does.
+ORJSON_OPTIONS = (orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
+_fallback_encoder = encoders.JSONEncoder()
+
+
+def fast_json_available() -> bool:
+    """Return whether the orjson fast path can produce DRF-compatible output."""
+    return orjson is not None and api_settings.UNICODE_JSON and api_settings.COMPACT_JSON
+
+
+def fast_dumps(data: Any) -> bytes:
+    """Encode ``data`` with orjson, matching ``JSONRenderer``'s compact output.
+
+    Types orjson does not know (lazy strings, decimals, querysets, ...) go
+    through DRF's own encoder. Callers must check ``fast_json_available()``.
+    """
+    output = orjson.dumps(data, default=_fallback_encoder.default, option=ORJSON_OPTIONS)
+    # JSONRenderer escapes these so the output is also valid JavaScript.
+    if b"\xe2\x80\xa8" in output or b"\xe2\x80\xa9" in output:
+        output = output.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+    return output
+
+
+def ndjson_line(data: Any) -> bytes:
+    """Encode one record as a newline-terminated compact JSON line."""
+    if fast_json_available():
+        return fast_dumps(data) + b"\n"
+    line = json.dumps(
+        data,
+        cls=encoders.JSONEncoder,
+        ensure_ascii=not api_settings.UNICODE_JSON,
+        allow_nan=not api_settings.STRICT_JSON,
+        separators=(",", ":"),
+    )
+    return line.encode() + b"\n"
+
+
+def ndjson_lines(records: Iterable[Any]) -> Iterator[bytes]:
+    """Encode records lazily, one NDJSON line at a time."""
+    for record in records:
+        yield ndjson_line(record)
+
+
+async def andjson_lines(records: AsyncIterable[Any]) -> AsyncIterator[bytes]:
+    """Async version of ``ndjson_lines()``."""
+    async for record in records:
+        yield ndjson_line(record)
+
+
+class NDJSONRenderer(BaseRenderer):
+    """Renderer for newline-delimited JSON (one JSON document per line).
+
+    Large listings are streamed by the views without going through this
+    renderer; it exists so ``Accept: application/x-ndjson`` is negotiable and
+    so non-streamed responses (errors, single objects) are still valid NDJSON.
+    """
+
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+    charset = None
+
+    def render(
+        self,
+        data: Any,
+        accepted_media_type: str | None = None,
+        renderer_context: Mapping[str, Any] | None = None,
+    ) -> bytes:
+        """Render a list as one line per item and anything else as one line."""
+        if data is None:
+            return b""
+        if isinstance(data, list):
+            return b"".join(ndjson_lines(data))
+        return ndjson_line(data)
+
+
+class FastJSONRenderer(JSONRenderer):
+    """``JSONRenderer`` backed by orjson, with the same output.
+
+    Falls back to the stdlib encoder when orjson is not installed, when an
+    indented rendering is requested (``Accept: application/json; indent=4``,
+    the browsable API) or when ``UNICODE_JSON``/``COMPACT_JSON`` are off.
+    """
+
+    def render(
+        self,
+        data: Any,
+        accepted_media_type: str | None = None,
+        renderer_context: Mapping[str, Any] | None = None,
+    ) -> bytes:
+        """Render ``data`` into JSON bytes."""
+        if data is None:
+            return b""
+        if not fast_json_available() or self.get_indent(
+            accepted_media_type, renderer_context or {}
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        return fast_dumps(data)
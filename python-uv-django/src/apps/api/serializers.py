@@ -1,7 +1,77 @@
 """API-specific serializers."""
 
-# Currently using serializers from core app
-# This file can be used for API-specific serializer customizations
-from apps.core.serializers import TaskCreateSerializer, TaskSerializer, TaskUpdateSerializer
+from __future__ import annotations
 
-__all__ = ["TaskSerializer", "TaskCreateSerializer", "TaskUpdateSerializer"]
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from rest_framework import serializers
+
+from apps.core.serializers import (
+    TaskCreateSerializer,
+    TaskReadSerializer,
+    TaskSerializer,
+    TaskUpdateSerializer,
+)
+
+__all__ = [
+    "TaskSerializer",
+    "TaskCreateSerializer",
+    "TaskUpdateSerializer",
+    "TaskReadSerializer",
+    "TaskBulkTransitionSerializer",
+    "parse_fieldset",
+]
+
+
+def parse_fieldset(
+    query_params: Mapping[str, str], available: Sequence[str]
+) -> tuple[str, ...] | None:
+    """Return the fields selected by ``?fields=`` / ``?exclude=``, or None for all.
+
+    Both take comma-separated names; the result keeps the order of
+    ``available``. Unknown names are rejected with a 400.
+    """
+    requested = {
+        param: [name.strip() for name in query_params.get(param, "").split(",") if name.strip()]
+        for param in ("fields", "exclude")
+    }
+    if not requested["fields"] and not requested["exclude"]:
+        return None
+    errors = {
+        param: [f"Unknown field(s): {', '.join(unknown)}."]
+        for param, names in requested.items()
+        if (unknown := [name for name in names if name not in available])
+    }
+    if errors:
+        raise serializers.ValidationError(errors)
+    include = set(requested["fields"] or available)
+    exclude = set(requested["exclude"])
+    return tuple(name for name in available if name in include and name not in exclude)
+
+
+class TaskBulkTransitionSerializer(serializers.Serializer):  # type: ignore[type-arg]
+    """Validate the ids of a bulk complete/start request.
+
+    Expects ``queryset`` (where the ids must exist) and ``max_batch_size`` in
+    the serializer context.
+    """
+
+    ids = serializers.ListField(child=serializers.IntegerField(min_value=1), allow_empty=False)
+
+    def validate_ids(self, value: list[int]) -> list[int]:
+        """Check the batch size and that every id exists, reporting each missing one."""
+        max_batch_size = self.context["max_batch_size"]
+        if len(value) > max_batch_size:
+            raise serializers.ValidationError(
+                f"Ensure this field has no more than {max_batch_size} elements."
+            )
+        found = set(self.context["queryset"].filter(pk__in=value).values_list("pk", flat=True))
+        errors: dict[int, Any] = {
+            index: [f'Invalid pk "{pk}" - object does not exist.']
+            for index, pk in enumerate(value)
+            if pk not in found
+        }
+        if errors:
+            raise serializers.ValidationError(errors)
+        return list(dict.fromkeys(value))
@@ -1,5 +1,6 @@
 """API URL configuration."""
 
+from django.conf import settings
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
@@ -9,7 +10,11 @@ app_name = "api"
 
 # Create a router and register viewsets
 router = DefaultRouter()
-router.register(r"tasks", views.TaskViewSet, basename="task")
+router.register(
+    r"tasks",
+    views.AsyncTaskViewSet if settings.TASK_API_ASYNC else views.TaskViewSet,
+    basename="task",
+)
 
 urlpatterns = [
     path("", include(router.urls)),
@@ -2,28 +2,79 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Awaitable, Callable
+from functools import update_wrapper
 from typing import Any
 
+from asgiref.sync import sync_to_async
+
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
 from django.db.models import QuerySet
-from rest_framework import filters, serializers, viewsets
+from django.http import Http404, HttpRequest, HttpResponse, HttpResponseBase, StreamingHttpResponse
+from django.utils import timezone
+from rest_framework import serializers, status, viewsets
+from rest_framework.authentication import SessionAuthentication
 from rest_framework.decorators import action
+from rest_framework.permissions import BasePermission
+from rest_framework.renderers import BaseRenderer, JSONRenderer
 from rest_framework.request import Request
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
 
-from apps.core.models import Task
+from apps.core.cache import (
+    aget_cached_list,
+    aset_cached_list,
+    atask_version,
+    get_cached_list,
+    list_cache_key,
+    list_cache_stats,
+    set_cached_list,
+    task_objects,
+    task_version,
+)
+from apps.core.conditional import (
+    Validators,
+    page_validators,
+    task_validators,
+)
+from apps.core.models import Task, TaskWithArchived
+from apps.core.replicas import reads_from_replicas, reads_pinned
 from apps.core.selectors import TaskSelector
-from apps.core.serializers import TaskCreateSerializer, TaskSerializer, TaskUpdateSerializer
-from apps.core.services import TaskService
+from apps.core.services import InvalidTransition, TaskService
+
+from .filters import TaskOrderingFilter, TaskSearchFilter
+from .renderers import NDJSONRenderer, andjson_lines, ndjson_lines
+from .serializers import (
+    TaskBulkTransitionSerializer,
+    TaskCreateSerializer,
+    TaskReadSerializer,
+    TaskSerializer,
+    TaskUpdateSerializer,
+    parse_fieldset,
+)
 
 
+@reads_from_replicas
 class TaskViewSet(viewsets.ModelViewSet):  # type: ignore[type-arg]
     """ViewSet for Task model API endpoints."""
 
     queryset = Task.objects.all()
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [TaskSearchFilter, TaskOrderingFilter]
     search_fields = ["title", "description"]
     ordering_fields = ["title", "priority", "due_date", "created_at", "status"]
     ordering = ["-priority", "-created_at"]
+    filter_params = ["status", "overdue", "search", "include_archived"]
+    # Query parameters that select a cached listing (with the fieldset).
+    cache_params = ["status", "overdue", "search", "include_archived", "ordering", "cursor", "page"]
+    # Actions that read archived tasks too when asked with ?include_archived=1.
+    archive_actions = ["list", "retrieve", "statistics"]
+    # Actions that only read their task, so a copy from the object cache (at
+    # most TASK_OBJECT_CACHE_STALENESS old) will do. Writes re-read the row:
+    # the counters are adjusted from its stored status.
+    cached_object_actions = ["retrieve"]
+    read_actions = ["list", "retrieve", "pending"]
+    renderer_classes = [*api_settings.DEFAULT_RENDERER_CLASSES, NDJSONRenderer]
 
     def get_serializer_class(self) -> type[serializers.Serializer[Any]]:
         """Return appropriate serializer class based on action."""
@@ -31,11 +82,103 @@ class TaskViewSet(viewsets.ModelViewSet):  # type: ignore[type-arg]
             return TaskCreateSerializer
         elif self.action in ["update", "partial_update"]:
             return TaskUpdateSerializer
+        elif self.action == "bulk":
+            return TaskCreateSerializer if self.request.method == "POST" else TaskUpdateSerializer
+        elif self.action in ["bulk_complete", "bulk_start"]:
+            return TaskBulkTransitionSerializer
+        elif self.action in self.read_actions and settings.TASK_FAST_SERIALIZER:
+            return TaskReadSerializer
         return TaskSerializer
 
+    def get_serializer_context(self) -> dict[str, Any]:
+        """Add the bulk batch limit, one request-wide "now" and the sparse fieldset."""
+        context = super().get_serializer_context()
+        context["max_batch_size"] = settings.TASK_BULK_MAX_BATCH_SIZE
+        context["now"] = timezone.now()
+        if self.action in self.read_actions:
+            context["fields"] = self.get_fieldset()
+        return context
+
+    def get_fieldset(self) -> tuple[str, ...] | None:
+        """Return the output fields chosen with ``?fields=`` / ``?exclude=``."""
+        if not hasattr(self, "_fieldset"):
+            self._fieldset = parse_fieldset(self.request.query_params, TaskSerializer.Meta.fields)
+        return self._fieldset
+
+    def read_queryset(self, queryset: QuerySet[Task], validated: bool = False) -> QuerySet[Any]:
+        """Load only the columns a read response needs.
+
+        With the fast serializer the rows are ``.values()`` dicts; otherwise
+        a sparse fieldset defers the unused columns with ``.only()``.
+        Annotations (such as the search rank) are kept so they can still be
+        used as keyset sort keys. ``validated`` adds the columns the list
+        validators are computed from.
+        """
+        fields = self.query_fields(queryset, validated)
+        if self.get_serializer_class() is TaskReadSerializer:
+            return queryset.values(*fields, *queryset.query.annotations)
+        if self.get_fieldset() is not None:
+            return queryset.only(*fields)
+        return queryset
+
+    def query_fields(self, queryset: QuerySet[Task], validated: bool = False) -> list[str]:
+        """Return the columns needed for the selected fields, the validators and the sort keys."""
+        selected = self.get_fieldset()
+        needed: dict[str, None] = {}
+        if validated:
+            # page_validators() reads these columns of each row.
+            needed.update(dict.fromkeys(["id", "updated_at", "due_date", "status"]))
+        for name in TaskSerializer.Meta.fields if selected is None else selected:
+            if name == "is_overdue":
+                needed.update(dict.fromkeys(["due_date", "status"]))
+            else:
+                needed[name] = None
+        # Keyset cursors are minted from the sort keys of the last row.
+        model_fields = {field.name for field in Task._meta.concrete_fields}
+        for term in queryset.query.order_by or Task._meta.ordering:
+            name = str(term).lstrip("-")
+            if name in model_fields:
+                needed[name] = None
+        return list(needed)
+
+    def get_object(self) -> Task:
+        """Return the task, from the object cache when the action allows it."""
+        if not self.uses_object_cache():
+            return super().get_object()
+        try:
+            task = task_objects.get(self.get_queryset(), self.kwargs[self.lookup_url_kwarg_name])
+        except (Task.DoesNotExist, DjangoValidationError) as exc:
+            raise Http404 from exc
+        self.check_object_permissions(self.request, task)
+        return task
+
+    @property
+    def lookup_url_kwarg_name(self) -> str:
+        """Return the URL keyword argument holding the task id."""
+        return self.lookup_url_kwarg or self.lookup_field
+
+    def uses_object_cache(self) -> bool:
+        """Return whether the task may come from the object cache.
+
+        Filter parameters restrict which tasks can be retrieved, so filtered
+        lookups always go to the database.
+        """
+        if self.action not in self.cached_object_actions:
+            return False
+        return not any(self.request.query_params.get(param) for param in self.filter_params)
+
+    def includes_archived(self) -> bool:
+        """Return whether the request reads archived tasks as well as active ones."""
+        if self.action not in self.archive_actions:
+            return False
+        return self.request.query_params.get("include_archived", "").lower() in ("1", "true")
+
     def get_queryset(self) -> QuerySet[Task]:
-        """Override queryset to add filtering by status."""
-        queryset = super().get_queryset()
+        """Override queryset to add filtering by status and to include archived tasks."""
+        if self.includes_archived():
+            queryset: QuerySet[Any] = TaskWithArchived.objects.all()
+        else:
+            queryset = super().get_queryset()
         status_filter = self.request.query_params.get("status")
         if status_filter:
             queryset = queryset.filter(status=status_filter)
@@ -51,39 +194,441 @@ class TaskViewSet(viewsets.ModelViewSet):  # type: ignore[type-arg]
 
         return queryset
 
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> HttpResponseBase:
+        """List tasks, streaming them as NDJSON when requested.
+
+        Answers conditional requests with 304 from the rows of the page once
+        it is fetched, before it is serialized. Pages are served from the
+        versioned list cache when possible.
+        """
+        self.get_fieldset()  # reject unknown ?fields= before answering with 304
+        parts = self.list_cache_parts(request)
+        cache_key = list_cache_key(task_version(), *parts) if parts is not None else None
+        if cache_key is not None and (cached := get_cached_list(cache_key)) is not None:
+            return self.cached_response(request, *cached)
+        queryset = self.filter_queryset(self.get_queryset())
+        if self.wants_stream(request):
+            return self.stream(self.read_queryset(queryset))
+        queryset = self.read_queryset(queryset, validated=True)
+        page = self.paginate_queryset(queryset)
+        rows = page if page is not None else list(queryset)
+        validators = self.list_validators(request, rows, paginated=page is not None)
+        response = validators.not_modified(request)
+        if response is not None:
+            return response
+        data = self.get_serializer(rows, many=True).data
+        response = self.get_paginated_response(data) if page is not None else Response(data)
+        if cache_key is not None:
+            set_cached_list(cache_key, (validators, response.data), queryset.db)
+            response["X-Cache"] = "MISS"
+        return validators.apply(response)
+
+    def list_validators(self, request: Request, rows: list[Any], paginated: bool) -> Validators:
+        """Return validators for the listed rows and, when paginated, their page links.
+
+        The envelope is built without results so the validators also change
+        with the links and counts around the page.
+        """
+        extra: list[tuple[str, Any]] = []
+        if paginated:
+            envelope = self.get_paginated_response([]).data
+            extra = sorted((name, value) for name, value in envelope.items() if name != "results")
+        return page_validators(rows, variant=self.representation_variant(request), extra=extra)
+
+    def list_cache_parts(self, request: Request) -> tuple[Any, ...] | None:
+        """Return what identifies a listing in the cache, or None if it is not cached.
+
+        Query parameters are normalized so equivalent requests share an
+        entry; the absolute URL of the endpoint is included because the page
+        links are built from it. Clients pinned to the primary after a write
+        bypass the cache, whose pages may come from a replica.
+        """
+        if not settings.TASK_LIST_CACHE_TIMEOUT or self.wants_stream(request) or reads_pinned():
+            return None
+        params = {name: request.query_params.get(name) for name in self.cache_params}
+        params = {name: value.strip() if value else value for name, value in params.items()}
+        params["overdue"] = (params["overdue"] or "").lower() == "true"
+        params["include_archived"] = self.includes_archived()
+        return (
+            sorted(params.items()),
+            self.get_fieldset(),
+            request.accepted_media_type,
+            request.build_absolute_uri(request.path),
+            settings.PAGINATION_MODE,
+        )
+
+    def cached_response(
+        self, request: Request, validators: Validators, data: Any
+    ) -> HttpResponseBase:
+        """Answer from a cached listing, with 304 if the client has it already."""
+        response = validators.not_modified(request)
+        if response is None:
+            response = Response(data, headers={"X-Cache": "HIT"})
+        return validators.apply(response)
+
+    def retrieve(self, request: Request, *args: Any, **kwargs: Any) -> HttpResponseBase:
+        """Retrieve a task, answering conditional requests without serializing."""
+        task = self.get_object()
+        validators = task_validators(task, variant=self.representation_variant(request))
+        response = validators.not_modified(request)
+        if response is None:
+            response = Response(self.get_serializer(task).data)
+        return validators.apply(response)
+
+    def representation_variant(self, request: Request) -> str:
+        """Return what, besides the rows, shapes a GET response (for its ETag)."""
+        return f"{request.accepted_media_type}|{request.get_full_path()}"
+
+    def wants_stream(self, request: Request) -> bool:
+        """Return whether the client asked for an NDJSON stream."""
+        if request.query_params.get("stream", "").lower() in ("1", "true"):
+            return True
+        return getattr(request.accepted_renderer, "format", None) == NDJSONRenderer.format
+
+    def stream(self, queryset: QuerySet[Any]) -> StreamingHttpResponse:
+        """Stream every row of ``queryset`` as NDJSON without pagination.
+
+        Rows are read with a chunked (server-side where supported) cursor and
+        written as soon as they are serialized, so memory stays flat however
+        many rows match. The rows come from the database the request chose,
+        though they are read after its middleware has finished.
+        """
+        serializer = self.get_serializer()
+        rows = queryset.using(queryset.db).iterator(chunk_size=settings.STREAM_CHUNK_SIZE)
+        records = (serializer.to_representation(task) for task in rows)
+        return StreamingHttpResponse(ndjson_lines(records), content_type=NDJSONRenderer.media_type)
+
     @action(detail=True, methods=["post"])
     def complete(self, request: Request, pk: int | None = None) -> Response:
         """Mark a task as completed using service layer."""
-        task = self.get_object()
-        task = TaskService.complete_task(task)
-        serializer = self.get_serializer(task)
-        return Response(serializer.data)
+        return self.transition(TaskService.complete_task)
 
     @action(detail=True, methods=["post"])
     def start(self, request: Request, pk: int | None = None) -> Response:
         """Mark a task as in progress using service layer."""
-        task = self.get_object()
-        task = TaskService.start_task(task)
-        serializer = self.get_serializer(task)
-        return Response(serializer.data)
+        return self.transition(TaskService.start_task)
+
+    def transition(self, apply: Callable[[Any, QuerySet[Task]], Task]) -> Response:
+        """Apply a single-task transition and return the written task.
+
+        The UPDATE only reaches tasks in ``filter_queryset(get_queryset())``.
+        The task is not read before it unless a permission class checks
+        individual objects. A transition the rules forbid is answered with
+        409 Conflict.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        if self.checks_objects():
+            task = self.get_object()
+        else:
+            task = self.kwargs[self.lookup_url_kwarg_name]
+        try:
+            task = apply(task, queryset)
+        except (Task.DoesNotExist, DjangoValidationError) as exc:
+            raise Http404 from exc
+        except InvalidTransition as exc:
+            return Response({"detail": str(exc)}, status=status.HTTP_409_CONFLICT)
+        return Response(self.get_serializer(task).data)
+
+    def checks_objects(self) -> bool:
+        """Return whether a permission class overrides ``has_object_permission()``."""
+        return any(
+            type(permission).has_object_permission is not BasePermission.has_object_permission
+            for permission in self.get_permissions()
+        )
+
+    @action(detail=False, methods=["post", "patch"], url_path="bulk")
+    def bulk(self, request: Request) -> Response:
+        """Create (POST) or partially update (PATCH) a list of tasks in one transaction.
+
+        Each item of a PATCH names its task with ``id``. Nothing is written
+        unless every item is valid; errors are keyed by the position of the
+        failing items in the request.
+        """
+        list_kwargs = {
+            "many": True,
+            "allow_empty": False,
+            "max_length": settings.TASK_BULK_MAX_BATCH_SIZE,
+        }
+        if request.method == "POST":
+            serializer = self.get_serializer(data=request.data, **list_kwargs)
+        else:
+            serializer = self.get_serializer(
+                self.get_queryset(), data=request.data, partial=True, **list_kwargs
+            )
+        serializer.is_valid(raise_exception=True)
+        tasks = serializer.save()
+        response_status = (
+            status.HTTP_201_CREATED if request.method == "POST" else status.HTTP_200_OK
+        )
+        return Response(TaskSerializer(tasks, many=True).data, status=response_status)
+
+    @action(detail=False, methods=["post"], url_path="bulk/complete", url_name="bulk-complete")
+    def bulk_complete(self, request: Request) -> Response:
+        """Mark the tasks listed in ``ids`` that may be completed as completed."""
+        return self.bulk_transition(request, Task.Status.COMPLETED)
+
+    @action(detail=False, methods=["post"], url_path="bulk/start", url_name="bulk-start")
+    def bulk_start(self, request: Request) -> Response:
+        """Mark the tasks listed in ``ids`` that may be started as in progress."""
+        return self.bulk_transition(request, Task.Status.IN_PROGRESS)
+
+    def bulk_transition(self, request: Request, task_status: str) -> Response:
+        """Validate ``ids``, move them to ``task_status`` and return the updated tasks.
+
+        Tasks the transition rules leave alone are not in the response.
+        """
+        queryset = self.get_queryset()
+        serializer = self.get_serializer(
+            data=request.data, context={**self.get_serializer_context(), "queryset": queryset}
+        )
+        serializer.is_valid(raise_exception=True)
+        ids = serializer.validated_data["ids"]
+        tasks = TaskService.transition_tasks(queryset.filter(pk__in=ids), task_status)
+        position = {pk: index for index, pk in enumerate(ids)}
+        tasks.sort(key=lambda task: position[task.pk])
+        return Response(TaskSerializer(tasks, many=True).data)
 
     @action(detail=False, methods=["get"])
-    def pending(self, request: Request) -> Response:
+    def pending(self, request: Request) -> Response | StreamingHttpResponse:
         """Get all pending tasks using selector layer."""
-        pending_tasks = TaskSelector.get_pending_tasks()
+        pending_tasks = self.read_queryset(TaskSelector.get_pending_tasks())
+        if self.wants_stream(request):
+            return self.stream(pending_tasks)
         serializer = self.get_serializer(pending_tasks, many=True)
         return Response(serializer.data)
 
     @action(detail=False, methods=["get"])
     def statistics(self, request: Request) -> Response:
         """Get task statistics using selector layer."""
-        queryset = self.get_queryset()
-        stats = {
-            "total": queryset.count(),
-            "pending": TaskSelector.get_pending_tasks().count(),
-            "in_progress": queryset.filter(status=Task.Status.IN_PROGRESS).count(),
-            "completed": TaskSelector.get_completed_tasks().count(),
-            "cancelled": queryset.filter(status=Task.Status.CANCELLED).count(),
-            "overdue": TaskSelector.get_overdue_tasks().count(),
-        }
+        filtered = any(request.query_params.get(param) for param in self.filter_params)
+        if filtered:
+            stats = TaskSelector.get_statistics(self.filter_queryset(self.get_queryset()))
+        else:
+            stats = TaskSelector.get_statistics()
+        return Response(stats)
+
+    @action(detail=False, methods=["get"], url_path="cache-stats")
+    def cache_stats(self, request: Request) -> Response:
+        """Get the list cache's counters (all workers) and the object cache's (this worker)."""
+        return Response({"list": list_cache_stats(), "objects": task_objects.stats()})
+
+
+class AsyncTaskViewSet(TaskViewSet):
+    """TaskViewSet whose hot actions run natively on the ASGI event loop.
+
+    The actions named in ``async_actions`` are served by their ``a``-prefixed
+    coroutine (``list`` by ``alist`` and so on) through Django's async ORM,
+    so a request no longer occupies a worker thread end to end. Each query
+    still runs in Django's sync thread, but only for as long as the query
+    itself. Every other action is the inherited sync handler, called through
+    ``sync_to_async``.
+
+    Under WSGI every request would pay for an event loop instead, so the
+    router only uses this class when ``TASK_API_ASYNC`` is set (as
+    ``config/asgi.py`` does).
+    """
+
+    async_actions = frozenset(["list", "retrieve", "statistics", "complete", "start"])
+    # Renderers cheap and side-effect free enough to run on the event loop;
+    # anything else (such as the browsable API) is rendered by Django in a thread.
+    loop_renderers: tuple[type[BaseRenderer], ...] = (JSONRenderer, NDJSONRenderer)
+
+    @classmethod
+    def as_view(
+        cls, actions: dict[str, str] | None = None, **initkwargs: Any
+    ) -> Callable[..., Any]:
+        """Return an async view when any of ``actions`` has an async handler."""
+        view = super().as_view(actions, **initkwargs)
+        if not cls.async_actions.intersection((actions or {}).values()):
+            return view
+        sync_view = sync_to_async(view)
+
+        async def async_view(request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponseBase:
+            if cls.action_for(view.actions, request) in cls.async_actions:
+                response: HttpResponseBase = await view(request, *args, **kwargs)
+            else:
+                response = await sync_view(request, *args, **kwargs)
+            return response
+
+        # Carry over csrf_exempt and the cls/actions attributes DRF relies on.
+        return update_wrapper(async_view, view)
+
+    @staticmethod
+    def action_for(actions: dict[str, str], request: HttpRequest) -> str | None:
+        """Return the action ``request`` is routed to."""
+        method = (request.method or "").lower()
+        if method == "head":
+            return actions.get("head", actions.get("get"))
+        return actions.get(method)
+
+    def dispatch(self, request: HttpRequest, *args: Any, **kwargs: Any) -> Any:
+        """Return the ``adispatch()`` coroutine for async actions."""
+        if self.action_for(self.action_map, request) in self.async_actions:
+            return self.adispatch(request, *args, **kwargs)
+        return super().dispatch(request, *args, **kwargs)
+
+    async def adispatch(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponseBase:
+        """Async version of ``dispatch()`` for the actions in ``async_actions``."""
+        self.args = args
+        self.kwargs = kwargs
+        drf_request = self.initialize_request(request, *args, **kwargs)
+        self.request = drf_request
+        self.headers = self.default_response_headers
+
+        try:
+            await self.aperform_authentication(drf_request)
+            self.initial(drf_request, *args, **kwargs)
+            handler = getattr(self, f"a{self.action}")
+            response = await handler(drf_request, *args, **kwargs)
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(drf_request, response, *args, **kwargs)
+        return self.render_on_loop(self.response)
+
+    async def aperform_authentication(self, request: Request) -> None:
+        """Resolve the user without touching the database from the event loop.
+
+        The session user is loaded with ``auser()``, after which DRF's session
+        authentication is pure. Other authenticators run in a worker thread.
+        """
+        django_request = request._request
+        if hasattr(django_request, "auser"):
+            django_request.user = await django_request.auser()
+        if not all(isinstance(auth, SessionAuthentication) for auth in request.authenticators):
+            await sync_to_async(self.perform_authentication)(request)
+
+    def render_on_loop(self, response: HttpResponseBase) -> HttpResponseBase:
+        """Render a JSON response here instead of in one more thread hop.
+
+        Django renders any response with a ``render()`` method in a worker
+        thread, so the rendered content is handed back as a plain response.
+        """
+        renderer = getattr(response, "accepted_renderer", None)
+        if not isinstance(response, Response) or not isinstance(renderer, self.loop_renderers):
+            return response
+        response.render()
+        rendered = HttpResponse(response.content, status=response.status_code)
+        rendered.headers = response.headers
+        rendered.cookies = response.cookies
+        return rendered
+
+    async def afilter_queryset(self, queryset: QuerySet[Task]) -> QuerySet[Task]:
+        """Async version of ``filter_queryset()``.
+
+        Searches are filtered in a worker thread because the search backend
+        may inspect the schema the first time it is used.
+        """
+        if self.request.query_params.get(TaskSearchFilter.search_param, "").strip():
+            filtered: QuerySet[Task] = await sync_to_async(self.filter_queryset)(queryset)
+            return filtered
+        return self.filter_queryset(queryset)
+
+    async def aget_object(self) -> Task:
+        """Async version of ``get_object()``."""
+        try:
+            if self.uses_object_cache():
+                task = await task_objects.aget(
+                    self.get_queryset(), self.kwargs[self.lookup_url_kwarg_name]
+                )
+            else:
+                queryset = await self.afilter_queryset(self.get_queryset())
+                task = await queryset.aget(
+                    **{self.lookup_field: self.kwargs[self.lookup_url_kwarg_name]}
+                )
+        except (Task.DoesNotExist, TypeError, ValueError, DjangoValidationError) as exc:
+            raise Http404 from exc
+        self.check_object_permissions(self.request, task)
+        return task
+
+    async def apaginate_queryset(self, queryset: QuerySet[Any]) -> list[Any] | None:
+        """Async version of ``paginate_queryset()``."""
+        if self.paginator is None:
+            return None
+        if hasattr(self.paginator, "apaginate_queryset"):
+            page: list[Any] | None = await self.paginator.apaginate_queryset(
+                queryset, self.request, view=self
+            )
+            return page
+        return await sync_to_async(self.paginate_queryset)(queryset)
+
+    async def alist(self, request: Request, *args: Any, **kwargs: Any) -> HttpResponseBase:
+        """Async version of ``list()``."""
+        self.get_fieldset()  # reject unknown ?fields= before answering with 304
+        parts = self.list_cache_parts(request)
+        cache_key = list_cache_key(await atask_version(), *parts) if parts is not None else None
+        if cache_key is not None and (cached := await aget_cached_list(cache_key)) is not None:
+            return self.cached_response(request, *cached)
+        queryset = await self.afilter_queryset(self.get_queryset())
+        if self.wants_stream(request):
+            return self.astream(self.read_queryset(queryset))
+        queryset = self.read_queryset(queryset, validated=True)
+        page = await self.apaginate_queryset(queryset)
+        rows = page if page is not None else [row async for row in queryset]
+        validators = self.list_validators(request, rows, paginated=page is not None)
+        response = validators.not_modified(request)
+        if response is not None:
+            return response
+        data = self.get_serializer(rows, many=True).data
+        response = self.get_paginated_response(data) if page is not None else Response(data)
+        if cache_key is not None:
+            await aset_cached_list(cache_key, (validators, response.data), queryset.db)
+            response["X-Cache"] = "MISS"
+        return validators.apply(response)
+
+    async def aretrieve(self, request: Request, *args: Any, **kwargs: Any) -> HttpResponseBase:
+        """Async version of ``retrieve()``."""
+        task = await self.aget_object()
+        validators = task_validators(task, variant=self.representation_variant(request))
+        response = validators.not_modified(request)
+        if response is None:
+            response = Response(self.get_serializer(task).data)
+        return validators.apply(response)
+
+    def astream(self, queryset: QuerySet[Any]) -> StreamingHttpResponse:
+        """Async version of ``stream()``, fed by an async iterator."""
+        serializer = self.get_serializer()
+        queryset = queryset.using(queryset.db)
+
+        async def records() -> AsyncIterator[dict[str, Any]]:
+            async for row in queryset.aiterator(chunk_size=settings.STREAM_CHUNK_SIZE):
+                yield serializer.to_representation(row)
+
+        return StreamingHttpResponse(
+            andjson_lines(records()), content_type=NDJSONRenderer.media_type
+        )
+
+    async def acomplete(self, request: Request, pk: int | None = None) -> Response:
+        """Async version of ``complete()``."""
+        return await self.atransition(TaskService.acomplete_task)
+
+    async def astart(self, request: Request, pk: int | None = None) -> Response:
+        """Async version of ``start()``."""
+        return await self.atransition(TaskService.astart_task)
+
+    async def atransition(
+        self, apply: Callable[[Any, QuerySet[Task]], Awaitable[Task]]
+    ) -> Response:
+        """Async version of ``transition()``."""
+        queryset = await self.afilter_queryset(self.get_queryset())
+        if self.checks_objects():
+            task = await self.aget_object()
+        else:
+            task = self.kwargs[self.lookup_url_kwarg_name]
+        try:
+            task = await apply(task, queryset)
+        except (Task.DoesNotExist, DjangoValidationError) as exc:
+            raise Http404 from exc
+        except InvalidTransition as exc:
+            return Response({"detail": str(exc)}, status=status.HTTP_409_CONFLICT)
+        return Response(self.get_serializer(task).data)
+
+    async def astatistics(self, request: Request) -> Response:
+        """Async version of ``statistics()``."""
+        filtered = any(request.query_params.get(param) for param in self.filter_params)
+        if filtered:
+            queryset = await self.afilter_queryset(self.get_queryset())
+            stats = await TaskSelector.aget_statistics(queryset)
+        else:
+            stats = await TaskSelector.aget_statistics()
         return Response(stats)
@@ -2,12 +2,47 @@
 
 from __future__ import annotations
 
-from django.contrib import admin
+from django.contrib import admin, messages
+from django.contrib.admin.views.main import ChangeList
 from django.db.models import QuerySet
 from django.http import HttpRequest
 from django.utils.html import format_html
 
-from .models import Task
+from .models import Task, TaskArchive, TaskQuerySet
+from .pagination import EstimatedCountPaginator
+from .search import get_task_search_backend
+from .services import TaskService
+
+
+class EstimatedCount(int):
+    """A row count from planner statistics, shown with a leading "~"."""
+
+    def __str__(self) -> str:
+        """Return the count marked as approximate."""
+        return f"~{int(self)}"
+
+
+class TaskChangeList(ChangeList):
+    """Changelist whose unfiltered total comes from the estimating paginator.
+
+    Django's ``show_full_result_count`` runs an exact ``COUNT(*)`` over the
+    whole table on every page view; here that total is estimated like the
+    filtered count. Estimated counts are ``EstimatedCount`` values, so the
+    stock admin templates show them with a "~".
+    """
+
+    def get_results(self, request: HttpRequest) -> None:
+        """Compute the results, then the (possibly estimated) full count."""
+        super().get_results(request)
+        if self.paginator.count_is_estimate:
+            self.result_count = EstimatedCount(self.result_count)
+        totals = EstimatedCountPaginator(self.root_queryset, self.list_per_page)
+        self.full_result_count = totals.count
+        self.full_result_count_is_estimate = totals.count_is_estimate
+        if totals.count_is_estimate:
+            self.full_result_count = EstimatedCount(self.full_result_count)
+        self.show_full_result_count = True
+        self.show_admin_actions = bool(self.full_result_count)
 
 
 @admin.register(Task)
@@ -27,6 +62,9 @@ class TaskAdmin(admin.ModelAdmin):  # type: ignore[type-arg]
     readonly_fields = ("created_at", "updated_at", "completed_at")
     date_hierarchy = "created_at"
     ordering = ("-priority", "-created_at")
+    paginator = EstimatedCountPaginator
+    # TaskChangeList estimates the full count instead of counting it.
+    show_full_result_count = False
 
     fieldsets = (
         (
@@ -45,6 +83,19 @@ class TaskAdmin(admin.ModelAdmin):  # type: ignore[type-arg]
 
     actions = ["mark_as_completed", "mark_as_in_progress", "mark_as_pending"]
 
+    def get_changelist(self, request: HttpRequest, **kwargs: object) -> type[ChangeList]:
+        """Use the changelist that estimates its full result count."""
+        return TaskChangeList
+
+    def get_search_results(
+        self, request: HttpRequest, queryset: QuerySet[Task], search_term: str
+    ) -> tuple[QuerySet[Task], bool]:
+        """Search through the full-text backend instead of icontains scans."""
+        search_term = search_term.strip()
+        if not search_term:
+            return queryset, False
+        return get_task_search_backend(queryset.db).search(queryset, search_term), False
+
     @admin.display(description="Status")
     def status_badge(self, obj: Task) -> str:
         """Display status with color badge."""
@@ -68,21 +119,52 @@ class TaskAdmin(admin.ModelAdmin):  # type: ignore[type-arg]
         return obj.is_overdue
 
     @admin.action(description="Mark selected tasks as completed")
-    def mark_as_completed(self, request: HttpRequest, queryset: QuerySet[Task]) -> None:
+    def mark_as_completed(self, request: HttpRequest, queryset: TaskQuerySet) -> None:
         """Mark selected tasks as completed."""
-        for task in queryset:
-            task.mark_completed()
-        self.message_user(request, f"{queryset.count()} tasks marked as completed.")
+        self.transition(request, queryset, Task.Status.COMPLETED)
 
     @admin.action(description="Mark selected tasks as in progress")
-    def mark_as_in_progress(self, request: HttpRequest, queryset: QuerySet[Task]) -> None:
+    def mark_as_in_progress(self, request: HttpRequest, queryset: TaskQuerySet) -> None:
         """Mark selected tasks as in progress."""
-        for task in queryset:
-            task.mark_in_progress()
-        self.message_user(request, f"{queryset.count()} tasks marked as in progress.")
+        self.transition(request, queryset, Task.Status.IN_PROGRESS)
 
     @admin.action(description="Mark selected tasks as pending")
-    def mark_as_pending(self, request: HttpRequest, queryset: QuerySet[Task]) -> None:
+    def mark_as_pending(self, request: HttpRequest, queryset: TaskQuerySet) -> None:
         """Mark selected tasks as pending."""
-        queryset.update(status=Task.Status.PENDING)
-        self.message_user(request, f"{queryset.count()} tasks marked as pending.")
+        self.transition(request, queryset, Task.Status.PENDING)
+
+    def transition(self, request: HttpRequest, queryset: TaskQuerySet, status: str) -> None:
+        """Move the selected tasks to ``status`` with set-based UPDATEs and report skips."""
+        selected = queryset.count()
+        updated = len(TaskService.transition_tasks(queryset, status))
+        label = Task.Status(status).label.lower()
+        self.message_user(request, f"{updated} tasks marked as {label}.")
+        if updated < selected:
+            self.message_user(
+                request,
+                f"{selected - updated} tasks were skipped: they cannot be marked as "
+                f"{label} from their current status.",
+                messages.WARNING,
+            )
+
+
+@admin.register(TaskArchive)
+class TaskArchiveAdmin(admin.ModelAdmin):  # type: ignore[type-arg]
+    """Read-only admin for tasks moved to the archive table by ``archive_tasks``."""
+
+    list_display = ("title", "status", "priority", "completed_at", "updated_at", "archived_at")
+    list_filter = ("status", "archived_at")
+    # The archive has no full-text index; its searches scan the table.
+    search_fields = ("title",)
+    date_hierarchy = "archived_at"
+    ordering = ("-archived_at",)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def has_add_permission(self, request: HttpRequest) -> bool:
+        """Archived tasks only come from ``manage.py archive_tasks``."""
+        return False
+
+    def has_change_permission(self, request: HttpRequest, obj: TaskArchive | None = None) -> bool:
+        """Archived tasks are read-only."""
+        return False
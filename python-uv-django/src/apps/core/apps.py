@@ -1,6 +1,8 @@
 """Core app configuration."""
 
 from django.apps import AppConfig
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_migrate, pre_migrate
 
 
 class CoreConfig(AppConfig):
@@ -9,3 +11,14 @@ class CoreConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.core"
     verbose_name = "Core"
+
+    def ready(self) -> None:
+        """Connect signal handlers."""
+        from .archive import drop_archive_view, install_archive_view
+        from .search import install_sqlite_fts_triggers
+        from .timing import instrument_connection
+
+        pre_migrate.connect(drop_archive_view, sender=self)
+        post_migrate.connect(install_sqlite_fts_triggers, sender=self)
+        post_migrate.connect(install_archive_view, sender=self)
+        connection_created.connect(instrument_connection)
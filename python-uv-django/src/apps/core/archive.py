@@ -0,0 +1,129 @@
+"""Archival of finished tasks into the cold ``TaskArchive`` table.
+
+Completed and cancelled tasks that have not been updated for a retention
+window are moved out of ``core_task`` in small batches, each one short
+transaction of ``INSERT ... SELECT`` into ``core_taskarchive`` and ``DELETE``
+from ``core_task``, with a pause between batches. The task table and its
+indexes then only grow with the active workload.
+
+Archived tasks stay readable through the ``core_task_with_archived`` view
+(``TaskWithArchived``), which the API serves with ``?include_archived=1``.
+"""
+
+from __future__ import annotations
+
+import datetime
+import time
+from collections.abc import Callable
+from typing import Any
+
+from django.db import DEFAULT_DB_ALIAS, connections, models, transaction
+from django.utils import timezone
+
+from .models import AbstractTask, Task, TaskArchive, TaskWithArchived
+
+
+def archive_batch(
+    before: datetime.datetime,
+    batch_size: int,
+    after: int = 0,
+    using: str = DEFAULT_DB_ALIAS,
+) -> list[int]:
+    """Move up to ``batch_size`` archivable tasks with ids above ``after``.
+
+    Copies the rows with one ``INSERT ... SELECT`` and removes them with one
+    ``DELETE``, which adjusts the counters and bumps the task table version,
+    in the same transaction. Only the batch's rows are locked; on PostgreSQL,
+    rows another transaction holds are skipped rather than waited for.
+    Returns the ids moved, in ascending order.
+    """
+    connection = connections[using]
+    quote = connection.ops.quote_name
+    tasks = Task.objects.using(using).archivable(before)
+    with transaction.atomic(using=using):
+        pks = list(
+            tasks.filter(pk__gt=after)
+            .order_by("pk")
+            .select_for_update(skip_locked=True)
+            .values_list("pk", flat=True)[:batch_size]
+        )
+        if not pks:
+            return []
+        batch = tasks.filter(pk__in=pks)
+        names = ["id", *(field.attname for field in AbstractTask._meta.concrete_fields)]
+        select, params = (
+            batch.order_by()
+            .annotate(archived=models.Value(timezone.now(), models.DateTimeField()))
+            .values_list(*names, "archived")
+            .query.sql_with_params()
+        )
+        columns = [TaskArchive._meta.get_field(name).column for name in [*names, "archived_at"]]
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {quote(TaskArchive._meta.db_table)} "
+                f"({', '.join(quote(column) for column in columns)}) {select}",
+                params,
+            )
+        batch.delete()
+    return pks
+
+
+def archive_tasks(
+    older_than: datetime.timedelta,
+    *,
+    batch_size: int = 1000,
+    pause: float = 0.1,
+    limit: int | None = None,
+    using: str = DEFAULT_DB_ALIAS,
+    progress: Callable[[int], None] | None = None,
+) -> int:
+    """Archive finished tasks not updated within ``older_than``; return how many.
+
+    Batches are taken in id order and ``pause`` seconds apart, so the
+    archival yields to other writers and replication can keep up. At most
+    ``limit`` tasks are moved. ``progress`` is called with the running total
+    after each batch.
+    """
+    before = timezone.now() - older_than
+    archived, after = 0, 0
+    while limit is None or archived < limit:
+        size = batch_size if limit is None else min(batch_size, limit - archived)
+        pks = archive_batch(before, size, after, using)
+        if not pks:
+            break
+        archived += len(pks)
+        after = pks[-1]
+        if progress is not None:
+            progress(archived)
+        if pause:
+            time.sleep(pause)
+    return archived
+
+
+def _view_sql(using: str) -> str:
+    """Return the ``CREATE VIEW`` statement of ``TaskWithArchived``."""
+    quote = connections[using].ops.quote_name
+    fields = sorted(TaskWithArchived._meta.concrete_fields, key=lambda field: not field.primary_key)
+    columns = ", ".join(quote(field.column) for field in fields)
+    return (
+        f"CREATE VIEW {quote(TaskWithArchived._meta.db_table)} AS "
+        f"SELECT {columns} FROM {quote(Task._meta.db_table)} "
+        f"UNION ALL SELECT {columns} FROM {quote(TaskArchive._meta.db_table)}"
+    )
+
+
+def drop_archive_view(using: str = DEFAULT_DB_ALIAS, **kwargs: Any) -> None:
+    """Drop the view before migrating: SQLite cannot rebuild a table a view reads."""
+    with connections[using].cursor() as cursor:
+        cursor.execute(f"DROP VIEW IF EXISTS {TaskWithArchived._meta.db_table}")
+
+
+def install_archive_view(using: str = DEFAULT_DB_ALIAS, **kwargs: Any) -> None:
+    """Create the view after migrating, once both of its tables exist."""
+    connection = connections[using]
+    with connection.cursor() as cursor:
+        tables = set(connection.introspection.table_names(cursor, include_views=True))
+        if TaskWithArchived._meta.db_table in tables:
+            return
+        if {Task._meta.db_table, TaskArchive._meta.db_table} <= tables:
+            cursor.execute(_view_sql(using))
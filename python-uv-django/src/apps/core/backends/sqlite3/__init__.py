@@ -0,0 +1 @@
+"""SQLite backend that queues a process's write transactions."""
@@ -0,0 +1,89 @@
+"""SQLite backend that queues a process's write transactions.
+
+SQLite lets one transaction write at a time. With ``transaction_mode``
+``IMMEDIATE`` every ``atomic()`` block takes the write lock when it begins,
+so a transaction never fails half-way when it upgrades from reading to
+writing; the others wait in SQLite's busy handler, which polls with
+sleeps and gives up with ``database is locked`` after ``timeout`` seconds.
+Under load, threads of one worker process then race each other for the
+lock and some lose repeatedly.
+
+This backend queues the transactions of the threads of one process on a
+lock of its own (one per database file) before ``BEGIN``, so they take
+turns in order and only contend with other processes in SQLite. A thread
+that waited ``timeout`` seconds for the lock goes on to SQLite's busy
+handler as before. In-memory databases are left alone.
+
+Use it with the options ``config.database.sqlite_concurrency()`` sets.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from typing import Any
+
+from django.db.backends.sqlite3 import base
+
+# The write lock of each database file, shared by every connection to it in this process.
+_write_locks: dict[str, threading.Lock] = {}
+_write_locks_guard = threading.Lock()
+
+
+def write_lock(name: str) -> threading.Lock:
+    """Return the process-wide write lock of database file ``name``."""
+    with _write_locks_guard:
+        return _write_locks.setdefault(os.path.abspath(name), threading.Lock())
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """SQLite connection whose transactions take turns within the process."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Start without holding the write lock."""
+        super().__init__(*args, **kwargs)
+        self.holds_write_lock = False
+
+    def _start_transaction_under_autocommit(self) -> None:
+        """Wait for this process's turn to write, then begin the transaction."""
+        self._acquire_write_lock()
+        try:
+            super()._start_transaction_under_autocommit()
+        except BaseException:
+            self._release_write_lock()
+            raise
+
+    def _commit(self) -> None:
+        """Commit, then let the next transaction in."""
+        try:
+            super()._commit()
+        finally:
+            self._release_write_lock()
+
+    def _rollback(self) -> None:
+        """Roll back, then let the next transaction in."""
+        try:
+            super()._rollback()
+        finally:
+            self._release_write_lock()
+
+    def _close(self) -> None:
+        """Close, releasing the lock of a transaction left open."""
+        try:
+            super()._close()
+        finally:
+            self._release_write_lock()
+
+    def _acquire_write_lock(self) -> None:
+        """Take the write lock, unless the database is in memory or the wait times out."""
+        if self.holds_write_lock or self.is_in_memory_db():
+            return
+        timeout = float(self.settings_dict["OPTIONS"].get("timeout", 5.0))
+        lock = write_lock(str(self.settings_dict["NAME"]))
+        self.holds_write_lock = lock.acquire(timeout=timeout)
+
+    def _release_write_lock(self) -> None:
+        """Release the write lock if this connection holds it."""
+        if self.holds_write_lock:
+            self.holds_write_lock = False
+            write_lock(str(self.settings_dict["NAME"])).release()
@@ -0,0 +1,410 @@
+"""Versioned caches for task list responses and single task rows.
+
+Every write to the task table bumps a single "task table version" kept in the
+cache, and cached listings are keyed by that version. One increment therefore
+invalidates every cached listing at once, however many filter/page
+combinations are stored; the orphaned entries simply expire.
+
+The version is bumped as soon as the write runs (so the writer reads its own
+write) and once more when the transaction commits, so a listing cached by
+another request while the transaction was open is not served afterwards.
+Nothing is cached from inside a transaction: its writes may still roll
+back, and no second bump would then retire what it read.
+
+Listings also depend on the clock (``is_overdue``, ``?overdue=true``), which
+no write announces, so entries live at most ``TASK_LIST_CACHE_TIMEOUT``
+seconds.
+
+Single rows are cached in two tiers by ``TaskObjectCache``: a bounded LRU in
+each worker process in front of the shared cache. Each entry is stamped with
+the row's own version and the "task generation" (bumped by set-based writes,
+which may touch any row). A worker serves its local copy for at most
+``TASK_OBJECT_CACHE_STALENESS`` seconds before checking the stamps again, so
+a write in another worker is seen within that bound.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+from collections import Counter, OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from django.conf import settings
+from django.core.cache import cache as default_cache
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.db.models import QuerySet
+
+from .replicas import is_replica
+from .timing import TimedCache
+
+if TYPE_CHECKING:
+    from .models import Task
+
+# Calls through this proxy count towards the request's Server-Timing cache time.
+cache = TimedCache(default_cache)
+
+VERSION_KEY = "tasks:version"
+HITS_KEY = "tasks:list:hits"
+MISSES_KEY = "tasks:list:misses"
+GENERATION_KEY = "tasks:generation"
+
+
+def _initial_version() -> int:
+    """Return a starting version that no evicted version can have had."""
+    return time.time_ns()
+
+
+def task_version() -> int:
+    """Return the current task table version, creating it if needed."""
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        initial = _initial_version()
+        cache.add(VERSION_KEY, initial, timeout=None)
+        version = cache.get(VERSION_KEY, initial)
+    return int(version)
+
+
+async def atask_version() -> int:
+    """Async version of ``task_version()``."""
+    version = await cache.aget(VERSION_KEY)
+    if version is None:
+        initial = _initial_version()
+        await cache.aadd(VERSION_KEY, initial, timeout=None)
+        version = await cache.aget(VERSION_KEY, initial)
+    return int(version)
+
+
+def _increment(key: str, initial: int = 1, timeout: int | None = None) -> None:
+    """Atomically increment ``key``, creating it with ``initial`` if missing."""
+    try:
+        cache.incr(key)
+    except ValueError:
+        if not cache.add(key, initial, timeout=timeout):
+            cache.incr(key)
+
+
+async def _aincrement(key: str, initial: int = 1) -> None:
+    """Async version of ``_increment()``."""
+    try:
+        await cache.aincr(key)
+    except ValueError:
+        if not await cache.aadd(key, initial, timeout=None):
+            await cache.aincr(key)
+
+
+def _bump() -> None:
+    """Move the task table version forward."""
+    _increment(VERSION_KEY, _initial_version())
+
+
+def bump_task_version(using: str = DEFAULT_DB_ALIAS) -> None:
+    """Invalidate every cached task listing after a write on ``using``.
+
+    Call it once the write has run: a reader between the bump and the write
+    would cache the old rows under the new version.
+    """
+    _on_write(_bump, using)
+
+
+def _on_write(bump: Callable[[], None], using: str) -> None:
+    """Run ``bump`` now and, inside a transaction, again when it commits."""
+    bump()
+    if connections[using].in_atomic_block:
+        transaction.on_commit(bump, using=using)
+
+
+def invalidate_task_objects(using: str = DEFAULT_DB_ALIAS, pk: Any = None) -> None:
+    """Invalidate the cached copy of task ``pk``, or of every task if ``pk`` is None.
+
+    As with ``bump_task_version()``, call it after the write.
+    """
+    if pk is None:
+        _on_write(task_objects.bump_generation, using)
+    else:
+        _on_write(lambda: task_objects.bump_row(pk), using)
+
+
+def list_cache_key(version: int, *parts: Any) -> str:
+    """Return the cache key of the listing described by ``parts``."""
+    digest = hashlib.md5(repr(parts).encode(), usedforsecurity=False).hexdigest()
+    return f"tasks:list:{version}:{digest}"
+
+
+def get_cached_list(key: str) -> Any | None:
+    """Return the listing cached under ``key`` and count the hit or miss."""
+    value = cache.get(key)
+    _increment(MISSES_KEY if value is None else HITS_KEY)
+    return value
+
+
+async def aget_cached_list(key: str) -> Any | None:
+    """Async version of ``get_cached_list()``."""
+    value = await cache.aget(key)
+    await _aincrement(MISSES_KEY if value is None else HITS_KEY)
+    return value
+
+
+def set_cached_list(key: str, value: Any, using: str = DEFAULT_DB_ALIAS) -> None:
+    """Cache a listing read from ``using`` for ``TASK_LIST_CACHE_TIMEOUT`` seconds.
+
+    A listing read from a replica is only kept for the replica pin window: it
+    may predate writes the version already accounts for. A listing read
+    inside a transaction is not cached.
+    """
+    if not in_transaction(using):
+        cache.set(key, value, timeout=_list_timeout(using))
+
+
+async def aset_cached_list(key: str, value: Any, using: str = DEFAULT_DB_ALIAS) -> None:
+    """Async version of ``set_cached_list()``."""
+    if not in_transaction(using):
+        await cache.aset(key, value, timeout=_list_timeout(using))
+
+
+def in_transaction(using: str) -> bool:
+    """Return whether ``using`` is inside a transaction, whose writes may still roll back."""
+    return connections[using].in_atomic_block
+
+
+def _list_timeout(using: str) -> int:
+    """Return how long a listing read from ``using`` may be cached."""
+    timeout: int = settings.TASK_LIST_CACHE_TIMEOUT
+    if is_replica(using):
+        timeout = min(timeout, settings.DATABASE_REPLICA_PIN_SECONDS)
+    return timeout
+
+
+def list_cache_stats() -> dict[str, Any]:
+    """Return the shared hit/miss counters and the current version."""
+    counts = cache.get_many([HITS_KEY, MISSES_KEY])
+    hits = int(counts.get(HITS_KEY, 0))
+    misses = int(counts.get(MISSES_KEY, 0))
+    return {
+        "version": task_version(),
+        "hits": hits,
+        "misses": misses,
+        "hit_ratio": _ratio(hits, hits + misses),
+    }
+
+
+@dataclass
+class _Entry:
+    """A task row held by the process-local tier."""
+
+    stamps: tuple[int, int]
+    values: tuple[Any, ...]
+    checked_at: float
+
+
+class TaskObjectCache:
+    """Two-tier (process-local LRU, then shared) cache of single task rows.
+
+    Rows are stored as field values and rebuilt with ``Model.from_db()``, so
+    every lookup returns an instance of its own. Lookups are counted per
+    tier and per process. A row read inside a transaction is not stored: the
+    transaction may roll back after its write bumped the row's stamp.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty local tier."""
+        self._local: OrderedDict[Any, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._counts: Counter[str] = Counter()
+
+    @property
+    def enabled(self) -> bool:
+        """Return whether the cache is on (``TASK_OBJECT_CACHE_SIZE`` > 0)."""
+        return settings.TASK_OBJECT_CACHE_SIZE > 0
+
+    def get(self, queryset: QuerySet[Task], pk: Any) -> Task:
+        """Return task ``pk``, loading it with ``queryset`` on a miss.
+
+        Raises ``DoesNotExist`` like ``queryset.get()``, and ``ValidationError``
+        for a malformed ``pk``.
+        """
+        pk = queryset.model._meta.pk.to_python(pk)
+        if not self.enabled:
+            return queryset.get(pk=pk)
+        queryset = self._primary(queryset)
+        entry = self._fresh(pk)
+        if entry is None:
+            found = cache.get_many([GENERATION_KEY, self._row_key(pk), self._object_key(pk)])
+            stamps = (
+                self._stamp(GENERATION_KEY, found, timeout=None),
+                self._stamp(self._row_key(pk), found, timeout=self._timeout()),
+            )
+            entry = self._revalidate(pk, stamps, found)
+            if entry is None:
+                task = queryset.get(pk=pk)
+                if in_transaction(queryset.db):
+                    return task
+                entry = self._store(pk, stamps, task)
+                cache.set(self._object_key(pk), (stamps, entry.values), self._timeout())
+        return self._build(queryset, entry)
+
+    async def aget(self, queryset: QuerySet[Task], pk: Any) -> Task:
+        """Async version of ``get()``."""
+        pk = queryset.model._meta.pk.to_python(pk)
+        if not self.enabled:
+            return await queryset.aget(pk=pk)
+        queryset = self._primary(queryset)
+        entry = self._fresh(pk)
+        if entry is None:
+            found = await cache.aget_many([GENERATION_KEY, self._row_key(pk), self._object_key(pk)])
+            stamps = (
+                await self._astamp(GENERATION_KEY, found, timeout=None),
+                await self._astamp(self._row_key(pk), found, timeout=self._timeout()),
+            )
+            entry = self._revalidate(pk, stamps, found)
+            if entry is None:
+                task = await queryset.aget(pk=pk)
+                if in_transaction(queryset.db):
+                    return task
+                entry = self._store(pk, stamps, task)
+                await cache.aset(self._object_key(pk), (stamps, entry.values), self._timeout())
+        return self._build(queryset, entry)
+
+    def bump_row(self, pk: Any) -> None:
+        """Invalidate task ``pk`` in this process now and in the others within the bound."""
+        self.discard(pk)
+        _increment(self._row_key(pk), _initial_version(), timeout=self._timeout())
+
+    def bump_generation(self) -> None:
+        """Invalidate every task (after a set-based write)."""
+        self.clear()
+        _increment(GENERATION_KEY, _initial_version())
+
+    def discard(self, pk: Any) -> None:
+        """Drop task ``pk`` from the local tier."""
+        with self._lock:
+            self._local.pop(pk, None)
+
+    def clear(self) -> None:
+        """Empty the local tier."""
+        with self._lock:
+            self._local.clear()
+
+    def reset_stats(self) -> None:
+        """Zero the lookup counters."""
+        self._counts.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Return this process's lookup counters and hit ratio per tier."""
+        local, shared, misses = (self._counts[tier] for tier in ("local", "shared", "miss"))
+        lookups = local + shared + misses
+        return {
+            "pid": os.getpid(),
+            "size": len(self._local),
+            "max_size": settings.TASK_OBJECT_CACHE_SIZE,
+            "lookups": lookups,
+            "local": {"hits": local, "hit_ratio": _ratio(local, lookups)},
+            "shared": {"hits": shared, "hit_ratio": _ratio(shared, lookups - local)},
+            "misses": misses,
+        }
+
+    def _fresh(self, pk: Any) -> _Entry | None:
+        """Return the local entry for ``pk`` if it was checked recently enough."""
+        with self._lock:
+            entry = self._local.get(pk)
+            if entry is not None:
+                self._local.move_to_end(pk)
+        if entry is None:
+            return None
+        if time.monotonic() - entry.checked_at >= settings.TASK_OBJECT_CACHE_STALENESS:
+            return None
+        self._counts["local"] += 1
+        return entry
+
+    def _revalidate(self, pk: Any, stamps: tuple[int, int], found: dict[str, Any]) -> _Entry | None:
+        """Return a local or shared entry still carrying ``stamps``, or None on a miss."""
+        with self._lock:
+            entry = self._local.get(pk)
+        if entry is not None and entry.stamps == stamps:
+            entry.checked_at = time.monotonic()
+            self._counts["local"] += 1
+            return entry
+        shared = found.get(self._object_key(pk))
+        if shared is not None and shared[0] == stamps:
+            self._counts["shared"] += 1
+            return self._remember(pk, _Entry(stamps, shared[1], time.monotonic()))
+        self._counts["miss"] += 1
+        return None
+
+    def _store(self, pk: Any, stamps: tuple[int, int], task: Task) -> _Entry:
+        """Keep a freshly loaded row in the local tier."""
+        fields = task._meta.concrete_fields
+        values = tuple(getattr(task, field.attname) for field in fields)
+        return self._remember(pk, _Entry(stamps, values, time.monotonic()))
+
+    def _remember(self, pk: Any, entry: _Entry) -> _Entry:
+        """Add ``entry`` to the local tier, evicting the least recently used rows."""
+        with self._lock:
+            self._local[pk] = entry
+            self._local.move_to_end(pk)
+            while len(self._local) > settings.TASK_OBJECT_CACHE_SIZE:
+                self._local.popitem(last=False)
+        return entry
+
+    @staticmethod
+    def _primary(queryset: QuerySet[Task]) -> QuerySet[Task]:
+        """Return ``queryset`` on the primary if it would read a replica.
+
+        Entries live until their row changes, so a row from a lagging replica
+        could stay cached under stamps that already count the newer write.
+        """
+        return queryset.using(DEFAULT_DB_ALIAS) if is_replica(queryset.db) else queryset
+
+    @staticmethod
+    def _build(queryset: QuerySet[Task], entry: _Entry) -> Task:
+        """Return a new model instance for ``entry``."""
+        model = queryset.model
+        names = [field.attname for field in model._meta.concrete_fields]
+        return model.from_db(queryset.db, names, entry.values)
+
+    @staticmethod
+    def _stamp(key: str, found: dict[str, Any], timeout: int | None) -> int:
+        """Return the stamp stored at ``key``, creating it if missing."""
+        if key not in found:
+            initial = _initial_version()
+            found[key] = initial if cache.add(key, initial, timeout) else cache.get(key, initial)
+        return int(found[key])
+
+    @staticmethod
+    async def _astamp(key: str, found: dict[str, Any], timeout: int | None) -> int:
+        """Async version of ``_stamp()``."""
+        if key not in found:
+            initial = _initial_version()
+            if await cache.aadd(key, initial, timeout):
+                found[key] = initial
+            else:
+                found[key] = await cache.aget(key, initial)
+        return int(found[key])
+
+    @staticmethod
+    def _row_key(pk: Any) -> str:
+        """Return the key of the row stamp of task ``pk``."""
+        return f"tasks:row:{pk}"
+
+    @staticmethod
+    def _object_key(pk: Any) -> str:
+        """Return the key of the shared-tier copy of task ``pk``."""
+        return f"tasks:object:{pk}"
+
+    @staticmethod
+    def _timeout() -> int:
+        """Return how long shared-tier rows and row stamps are kept."""
+        return settings.TASK_OBJECT_CACHE_TIMEOUT
+
+
+def _ratio(hits: int, lookups: int) -> float | None:
+    """Return ``hits / lookups`` rounded for display, or None without lookups."""
+    return round(hits / lookups, 4) if lookups else None
+
+
+# One per process: the local tier is what each worker keeps in memory.
+task_objects = TaskObjectCache()
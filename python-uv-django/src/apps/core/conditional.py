@@ -0,0 +1,105 @@
+"""Cheap HTTP validators (ETag / Last-Modified) for task responses.
+
+Validators are computed from a single indexed row or from the rows of a page
+once they are fetched, so a conditional request can be answered with ``304 Not
+Modified`` before any serializer or template runs, and an unconditional one
+costs no extra query.
+
+A task's representation also changes when it silently becomes overdue, so
+both validators account for that: the ETag includes each row's overdue state
+and Last-Modified includes the due dates that have passed.
+"""
+
+from __future__ import annotations
+
+import datetime
+import hashlib
+from calendar import timegm
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from django.http import HttpRequest, HttpResponseBase
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+from .models import Task
+
+
+@dataclass(frozen=True)
+class Validators:
+    """ETag and Last-Modified values for one response."""
+
+    etag: str
+    last_modified: datetime.datetime | None
+
+    @property
+    def timestamp(self) -> int | None:
+        """Return Last-Modified as a Unix timestamp."""
+        if self.last_modified is None:
+            return None
+        return timegm(self.last_modified.utctimetuple())
+
+    def not_modified(self, request: HttpRequest) -> HttpResponseBase | None:
+        """Return a 304 (or 412) response if the request's preconditions allow it."""
+        response = get_conditional_response(request, etag=self.etag, last_modified=self.timestamp)
+        return self.apply(response) if response is not None else None
+
+    def apply(self, response: HttpResponseBase) -> HttpResponseBase:
+        """Set the validator headers on ``response`` and return it."""
+        response.headers.setdefault("ETag", self.etag)
+        if self.timestamp is not None:
+            response.headers.setdefault("Last-Modified", http_date(self.timestamp))
+        return response
+
+
+def _etag(*parts: Any) -> str:
+    """Hash ``parts`` into a weak ETag."""
+    digest = hashlib.md5(repr(parts).encode(), usedforsecurity=False).hexdigest()
+    return "W/" + quote_etag(digest)
+
+
+def task_validators(
+    task: Task, variant: str = "", now: datetime.datetime | None = None
+) -> Validators:
+    """Return validators for a single task.
+
+    ``variant`` distinguishes representations of the same task (for example
+    the negotiated media type).
+    """
+    now = now or timezone.now()
+    overdue = bool(task.due_date and task.status != Task.Status.COMPLETED and task.due_date < now)
+    last_modified = task.updated_at
+    if overdue and task.due_date and task.due_date > last_modified:
+        last_modified = task.due_date
+    return Validators(_etag(task.pk, task.updated_at, overdue, variant), last_modified)
+
+
+def page_validators(
+    rows: Iterable[Any],
+    variant: str = "",
+    now: datetime.datetime | None = None,
+    extra: Any = (),
+) -> Validators:
+    """Return validators for a page of tasks from the rows already fetched for it.
+
+    ``rows`` are task instances or ``.values()`` dicts carrying ``id``,
+    ``updated_at``, ``due_date`` and ``status``. The ETag covers each row's
+    id, ``updated_at`` and overdue state, so inserts, updates and deletes
+    that reach the page change it; ``extra`` should hold the rest of the
+    envelope (links, counts) and ``variant`` everything else that shapes the
+    response, such as the media type.
+    """
+    now = now or timezone.now()
+    state = []
+    last_modified = None
+    for row in rows:
+        values = row if isinstance(row, dict) else row.__dict__
+        due_date = values["due_date"]
+        overdue = bool(due_date and values["status"] != Task.Status.COMPLETED and due_date < now)
+        state.append((values["id"], values["updated_at"], overdue))
+        for candidate in (values["updated_at"], due_date if overdue else None):
+            if candidate and (last_modified is None or candidate > last_modified):
+                last_modified = candidate
+    return Validators(_etag(state, extra, variant), last_modified)
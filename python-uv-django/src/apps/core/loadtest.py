@@ -0,0 +1,588 @@
+"""Load generator for the task API, behind ``manage.py loadtest``.
+
+A ``Workload`` turns a weighted mix of operations (list, detail, create,
+...) into HTTP calls. A client sends them to a running server over kept-alive
+connections (``HTTPClient``, ``AsyncHTTPClient``) or straight into this
+process's WSGI or ASGI application (``WSGIClient``, ``ASGIClient``), so the
+middleware and views are measured without a server in front.
+
+``run_threads()`` and ``run_asyncio()`` drive the clients in one of two ways:
+
+* closed loop: ``concurrency`` workers each send their next request as soon
+  as the previous one is answered, so the server sets the pace;
+* open loop: requests are scheduled at ``rate`` per second (Poisson
+  arrivals), whether or not earlier ones were answered, and ``concurrency``
+  caps the requests in flight. Latency is measured from the scheduled time,
+  so queueing in front of a saturated server counts (no coordinated
+  omission).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import http.client
+import io
+import itertools
+import json
+import queue
+import random
+import threading
+import time
+from collections import Counter, defaultdict, deque
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import urlsplit
+
+from .models import Task
+
+# Every operation and the call it makes; ``{id}`` is a known task id.
+OPERATIONS: dict[str, tuple[str, str]] = {
+    "list": ("GET", "/api/tasks/"),
+    "list-pending": ("GET", f"/api/tasks/?status={Task.Status.PENDING}"),
+    "list-overdue": ("GET", "/api/tasks/?overdue=true"),
+    "search": ("GET", "/api/tasks/?search={term}"),
+    "detail": ("GET", "/api/tasks/{id}/"),
+    "statistics": ("GET", "/api/tasks/statistics/"),
+    "pending": ("GET", "/api/tasks/pending/"),
+    "create": ("POST", "/api/tasks/"),
+    "complete": ("POST", "/api/tasks/{id}/complete/"),
+}
+
+DEFAULT_MIX = "list=4,detail=4,statistics=1,create=1"
+
+SEARCH_TERMS = ("report", "deploy", "billing", "release", "python")
+
+# Upper bounds of the latency histogram buckets, in milliseconds.
+BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+# Behind a TLS-terminating proxy; keeps SECURE_SSL_REDIRECT from redirecting.
+HEADERS = {"Accept": "application/json", "X-Forwarded-Proto": "https"}
+
+
+def parse_mix(mix: str) -> dict[str, int]:
+    """Parse ``"list=4,detail=1"`` into operation weights."""
+    weights = {}
+    for item in mix.split(","):
+        name, _, weight = item.strip().partition("=")
+        if name not in OPERATIONS:
+            raise ValueError(f"Unknown operation {name!r}; choose from {', '.join(OPERATIONS)}.")
+        try:
+            weights[name] = int(weight or 1)
+        except ValueError:
+            raise ValueError(f"Weight of {name!r} must be an integer.") from None
+        if weights[name] < 0:
+            raise ValueError(f"Weight of {name!r} must not be negative.")
+    if not any(weights.values()):
+        raise ValueError("The mix needs at least one operation with a positive weight.")
+    return weights
+
+
+@dataclass(frozen=True)
+class Call:
+    """One HTTP request of an operation."""
+
+    operation: str
+    method: str
+    path: str
+    body: bytes = b""
+
+
+class Workload:
+    """Pick the next call from the mix, with the task ids it needs.
+
+    ``detail`` reads a random known task. ``complete`` completes a pending
+    task no other call of the run has completed, so the transition is always
+    valid; once they run out it falls back to ``create``.
+    """
+
+    def __init__(
+        self, weights: dict[str, int], task_ids: Iterable[int] = (), pending_ids: Iterable[int] = ()
+    ) -> None:
+        """Read ``task_ids`` and complete ``pending_ids``."""
+        self.operations = [name for name, weight in weights.items() if weight]
+        self.weights = [weights[name] for name in self.operations]
+        self.task_ids = list(task_ids)
+        self.pending_ids = deque(pending_ids)
+        self.created = itertools.count(1)
+
+    def next_call(self, rng: random.Random) -> Call:
+        """Return the next call to send."""
+        operation = rng.choices(self.operations, self.weights)[0]
+        if operation == "complete":
+            try:
+                task_id = self.pending_ids.popleft()
+            except IndexError:
+                operation = "create"
+            else:
+                return Call(operation, "POST", OPERATIONS[operation][1].format(id=task_id))
+        if operation == "create":
+            body = {"title": f"Load test task {next(self.created)}", "priority": rng.randint(0, 5)}
+            return Call(operation, "POST", OPERATIONS[operation][1], json.dumps(body).encode())
+        if operation == "detail" and not self.task_ids:
+            return Call("list", *OPERATIONS["list"])
+        method, path = OPERATIONS[operation]
+        path = path.format(
+            id=rng.choice(self.task_ids) if self.task_ids else 0, term=rng.choice(SEARCH_TERMS)
+        )
+        return Call(operation, method, path)
+
+
+@dataclass
+class Results:
+    """Latencies (seconds) per operation, and failures, of the measured requests."""
+
+    latencies: dict[str, list[float]] = field(default_factory=lambda: defaultdict(list))
+    errors: Counter[str] = field(default_factory=Counter)
+    failed: Counter[str] = field(default_factory=Counter)
+    missed: int = 0
+    elapsed: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def add(self, call: Call, latency: float, error: str | None) -> None:
+        """Record one answered (or failed) request."""
+        with self._lock:
+            self.latencies[call.operation].append(latency)
+            if error:
+                self.errors[error] += 1
+                self.failed[call.operation] += 1
+
+    def miss(self) -> None:
+        """Record a scheduled request the run ended before it could be sent."""
+        with self._lock:
+            self.missed += 1
+
+    @property
+    def requests(self) -> int:
+        """Return the number of measured requests."""
+        return sum(len(samples) for samples in self.latencies.values())
+
+    def summary(self) -> dict[str, Any]:
+        """Return throughput, error rate, percentiles and histogram as plain data."""
+        every = sorted(sample for samples in self.latencies.values() for sample in samples)
+        requests = len(every)
+        return {
+            "requests": requests,
+            "elapsed_s": round(self.elapsed, 3),
+            "throughput_rps": round(requests / self.elapsed, 1) if self.elapsed else 0.0,
+            "error_rate": round(sum(self.errors.values()) / requests, 4) if requests else 0.0,
+            "errors": dict(self.errors),
+            "missed": self.missed,
+            "latency_ms": _percentiles(every),
+            "histogram_ms": _histogram(every),
+            "operations": {
+                name: {
+                    "requests": len(samples),
+                    "errors": self.failed[name],
+                    "latency_ms": _percentiles(sorted(samples)),
+                }
+                for name, samples in sorted(self.latencies.items())
+            },
+        }
+
+
+def _percentiles(ordered: list[float]) -> dict[str, float]:
+    """Return nearest-rank percentiles of sorted seconds, in milliseconds."""
+    if not ordered:
+        return {}
+    points = {"p50": 0.50, "p90": 0.90, "p95": 0.95, "p99": 0.99, "max": 1.0}
+    return {
+        name: round(ordered[max(int(len(ordered) * point + 0.5) - 1, 0)] * 1000, 2)
+        for name, point in points.items()
+    }
+
+
+def _histogram(ordered: list[float]) -> dict[str, int]:
+    """Count sorted seconds into ``BUCKETS_MS``, keyed by the bucket's upper bound."""
+    names = [f"<={bound}" for bound in BUCKETS_MS] + [f">{BUCKETS_MS[-1]}"]
+    counts = [0] * len(names)
+    bucket = 0
+    for sample in ordered:
+        while bucket < len(BUCKETS_MS) and sample * 1000 > BUCKETS_MS[bucket]:
+            bucket += 1
+        counts[bucket] += 1
+    return dict(zip(names, counts, strict=True))
+
+
+def _error(status: int) -> str | None:
+    """Return the error a response status counts as, if any."""
+    return f"HTTP {status}" if status >= 400 else None
+
+
+class HTTPClient:
+    """Send calls to a server over one kept-alive connection (one per worker)."""
+
+    def __init__(self, url: str, timeout: float = 30.0) -> None:
+        """Connect lazily to the server at ``url``."""
+        parts = urlsplit(url)
+        connection_class = (
+            http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        )
+        # http.client reopens the connection by itself after a server closes it
+        # (as gunicorn's sync workers do after every response).
+        self.connection = connection_class(parts.netloc, timeout=timeout)
+        self.prefix = parts.path.rstrip("/")
+
+    def send(self, call: Call) -> tuple[int, bytes]:
+        """Send ``call`` and return the status and body."""
+        headers = dict(HEADERS)
+        if call.body:
+            headers["Content-Type"] = "application/json"
+        try:
+            self.connection.request(
+                call.method, self.prefix + call.path, body=call.body or None, headers=headers
+            )
+            response = self.connection.getresponse()
+            return response.status, response.read()
+        except (OSError, http.client.HTTPException):
+            self.connection.close()
+            raise
+
+    def close(self) -> None:
+        """Close the connection."""
+        self.connection.close()
+
+
+class WSGIClient:
+    """Send calls straight into a WSGI application in this process."""
+
+    def __init__(self, application: Callable[..., Any], host: str = "localhost") -> None:
+        """Call ``application`` as if served at ``host``."""
+        self.application = application
+        self.host = host
+
+    def send(self, call: Call) -> tuple[int, bytes]:
+        """Send ``call`` and return the status and body."""
+        path, _, query = call.path.partition("?")
+        environ = {
+            "REQUEST_METHOD": call.method,
+            "SCRIPT_NAME": "",
+            "PATH_INFO": path,
+            "QUERY_STRING": query,
+            "SERVER_NAME": self.host,
+            "SERVER_PORT": "80",
+            "SERVER_PROTOCOL": "HTTP/1.1",
+            "REMOTE_ADDR": "127.0.0.1",
+            "HTTP_HOST": self.host,
+            "CONTENT_LENGTH": str(len(call.body)),
+            "CONTENT_TYPE": "application/json" if call.body else "",
+            "wsgi.version": (1, 0),
+            "wsgi.url_scheme": "http",
+            "wsgi.input": io.BytesIO(call.body),
+            "wsgi.errors": io.StringIO(),
+            "wsgi.multithread": True,
+            "wsgi.multiprocess": False,
+            "wsgi.run_once": False,
+        }
+        for name, value in HEADERS.items():
+            environ[f"HTTP_{name.upper().replace('-', '_')}"] = value
+        statuses = []
+
+        def start_response(status: str, headers: Any, exc_info: Any = None) -> None:
+            statuses.append(int(status.split(" ", 1)[0]))
+
+        body = self.application(environ, start_response)
+        try:
+            content = b"".join(body)
+        finally:
+            if hasattr(body, "close"):
+                body.close()
+        return statuses[-1], content
+
+    def close(self) -> None:
+        """Nothing to close."""
+
+
+class AsyncHTTPClient:
+    """Send calls to a server over one kept-alive HTTP/1.1 connection, on asyncio."""
+
+    def __init__(self, url: str, timeout: float = 30.0) -> None:
+        """Connect lazily to the server at ``url``."""
+        parts = urlsplit(url)
+        self.ssl = parts.scheme == "https"
+        self.host = parts.hostname or "localhost"
+        self.port = parts.port or (443 if self.ssl else 80)
+        self.netloc = parts.netloc
+        self.prefix = parts.path.rstrip("/")
+        self.timeout = timeout
+        self.reader: asyncio.StreamReader | None = None
+        self.writer: asyncio.StreamWriter | None = None
+
+    async def send(self, call: Call) -> tuple[int, bytes]:
+        """Send ``call`` and return the status and body."""
+        try:
+            return await asyncio.wait_for(self._send(call), self.timeout)
+        except (TimeoutError, OSError, asyncio.IncompleteReadError, ValueError):
+            await self.close()
+            raise
+
+    async def _send(self, call: Call) -> tuple[int, bytes]:
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(
+                self.host, self.port, ssl=self.ssl or None
+            )
+        assert self.reader is not None
+        headers = {"Host": self.netloc, **HEADERS, "Content-Length": str(len(call.body))}
+        if call.body:
+            headers["Content-Type"] = "application/json"
+        head = f"{call.method} {self.prefix}{call.path} HTTP/1.1\r\n"
+        head += "".join(f"{name}: {value}\r\n" for name, value in headers.items())
+        self.writer.write(head.encode("latin-1") + b"\r\n" + call.body)
+        await self.writer.drain()
+
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionResetError("server closed the connection")
+        version, status = status_line.split(b" ", 2)[:2]
+        response_headers = {}
+        while (line := await self.reader.readline()) not in (b"\r\n", b"\n", b""):
+            name, _, value = line.decode("latin-1").partition(":")
+            response_headers[name.strip().lower()] = value.strip()
+        if response_headers.get("transfer-encoding", "").lower() == "chunked":
+            body = await self._read_chunked()
+        elif "content-length" in response_headers:
+            body = await self.reader.readexactly(int(response_headers["content-length"]))
+        else:
+            body = await self.reader.read()
+            response_headers["connection"] = "close"
+        if response_headers.get("connection", "").lower() == "close" or version == b"HTTP/1.0":
+            await self.close()
+        return int(status), body
+
+    async def _read_chunked(self) -> bytes:
+        assert self.reader is not None
+        chunks = []
+        while size := int((await self.reader.readline()).split(b";")[0], 16):
+            chunks.append(await self.reader.readexactly(size))
+            await self.reader.readline()
+        while await self.reader.readline() not in (b"\r\n", b"\n", b""):
+            pass  # trailers
+        return b"".join(chunks)
+
+    async def close(self) -> None:
+        """Close the connection."""
+        writer, self.reader, self.writer = self.writer, None, None
+        if writer is not None:
+            writer.close()
+            with contextlib.suppress(OSError):
+                await writer.wait_closed()
+
+
+class ASGIClient:
+    """Send calls straight into an ASGI application in this process."""
+
+    def __init__(self, application: Callable[..., Any], host: str = "localhost") -> None:
+        """Call ``application`` as if served at ``host``."""
+        self.application = application
+        self.host = host
+
+    async def send(self, call: Call) -> tuple[int, bytes]:
+        """Send ``call`` and return the status and body."""
+        path, _, query = call.path.partition("?")
+        headers = [(b"host", self.host.encode())]
+        headers += [(name.lower().encode(), value.encode()) for name, value in HEADERS.items()]
+        if call.body:
+            headers += [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(call.body)).encode()),
+            ]
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": call.method,
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": query.encode(),
+            "root_path": "",
+            "headers": headers,
+            "client": ("127.0.0.1", 0),
+            "server": (self.host, 80),
+        }
+        request_sent = False
+        finished = asyncio.Event()
+        status = 0
+        chunks: list[bytes] = []
+
+        async def receive() -> dict[str, Any]:
+            nonlocal request_sent
+            if not request_sent:
+                request_sent = True
+                return {"type": "http.request", "body": call.body, "more_body": False}
+            await finished.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message: dict[str, Any]) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+                if not message.get("more_body"):
+                    finished.set()
+
+        try:
+            await self.application(scope, receive, send)
+        finally:
+            finished.set()
+        return status, b"".join(chunks)
+
+    async def close(self) -> None:
+        """Nothing to close."""
+
+
+def run_threads(
+    make_client: Callable[[], Any],
+    workload: Workload,
+    *,
+    concurrency: int,
+    duration: float,
+    warmup: float = 0.0,
+    rate: float | None = None,
+    seed: int = 0,
+) -> Results:
+    """Drive blocking clients from ``concurrency`` threads, each with its own client."""
+    results = Results()
+    started = time.perf_counter()
+    measure_from = started + warmup
+    end = measure_from + duration
+    schedule: queue.Queue[float | None] = queue.Queue()
+
+    def send(client: Any, call: Call, start: float) -> None:
+        try:
+            status, _body = client.send(call)
+        except Exception as exc:  # noqa: BLE001 - every failure is a result
+            error = type(exc).__name__
+        else:
+            error = _error(status)
+        if start >= measure_from:
+            results.add(call, time.perf_counter() - start, error)
+
+    def closed_loop(index: int) -> None:
+        client, rng = make_client(), random.Random(seed + index)
+        try:
+            while (start := time.perf_counter()) < end:
+                send(client, workload.next_call(rng), start)
+        finally:
+            client.close()
+
+    def open_loop(index: int) -> None:
+        client, rng = make_client(), random.Random(seed + index)
+        try:
+            while (scheduled := schedule.get()) is not None:
+                if time.perf_counter() >= end:
+                    if scheduled >= measure_from:
+                        results.miss()
+                    continue
+                send(client, workload.next_call(rng), scheduled)
+        finally:
+            client.close()
+
+    threads = [
+        threading.Thread(target=open_loop if rate else closed_loop, args=(index,), daemon=True)
+        for index in range(concurrency)
+    ]
+    for thread in threads:
+        thread.start()
+    if rate:
+        for scheduled in _arrivals(rate, started, end, random.Random(seed)):
+            if scheduled - time.perf_counter() > 0:
+                time.sleep(scheduled - time.perf_counter())
+            schedule.put(scheduled)
+        for _ in threads:
+            schedule.put(None)
+    for thread in threads:
+        thread.join()
+    results.elapsed = min(time.perf_counter(), end) - measure_from
+    return results
+
+
+def run_asyncio(
+    make_client: Callable[[], Any],
+    workload: Workload,
+    *,
+    concurrency: int,
+    duration: float,
+    warmup: float = 0.0,
+    rate: float | None = None,
+    seed: int = 0,
+) -> Results:
+    """Drive asyncio clients from one event loop, ``concurrency`` at a time."""
+    return asyncio.run(
+        _run_asyncio(make_client, workload, concurrency, duration, warmup, rate, seed)
+    )
+
+
+async def _run_asyncio(
+    make_client: Callable[[], Any],
+    workload: Workload,
+    concurrency: int,
+    duration: float,
+    warmup: float,
+    rate: float | None,
+    seed: int,
+) -> Results:
+    results = Results()
+    started = time.perf_counter()
+    measure_from = started + warmup
+    end = measure_from + duration
+    clients = [make_client() for _ in range(concurrency)]
+
+    async def send(client: Any, call: Call, start: float) -> None:
+        try:
+            status, _body = await client.send(call)
+        except Exception as exc:  # noqa: BLE001 - every failure is a result
+            error = type(exc).__name__
+        else:
+            error = _error(status)
+        if start >= measure_from:
+            results.add(call, time.perf_counter() - start, error)
+
+    async def closed_loop(index: int) -> None:
+        rng = random.Random(seed + index)
+        while (start := time.perf_counter()) < end:
+            await send(clients[index], workload.next_call(rng), start)
+
+    async def open_loop() -> None:
+        idle: asyncio.Queue[Any] = asyncio.Queue()
+        for client in clients:
+            idle.put_nowait(client)
+        rng = random.Random(seed)
+
+        async def one(scheduled: float) -> None:
+            client = await idle.get()
+            try:
+                if time.perf_counter() < end:
+                    await send(client, workload.next_call(rng), scheduled)
+                elif scheduled >= measure_from:
+                    results.miss()
+            finally:
+                idle.put_nowait(client)
+
+        pending = set()
+        for scheduled in _arrivals(rate or 1.0, started, end, random.Random(seed)):
+            await asyncio.sleep(max(scheduled - time.perf_counter(), 0))
+            task = asyncio.create_task(one(scheduled))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+        if pending:
+            await asyncio.wait(pending)
+
+    try:
+        if rate:
+            await open_loop()
+        else:
+            await asyncio.gather(*(closed_loop(index) for index in range(concurrency)))
+    finally:
+        await asyncio.gather(*(client.close() for client in clients))
+    results.elapsed = min(time.perf_counter(), end) - measure_from
+    return results
+
+
+def _arrivals(rate: float, start: float, end: float, rng: random.Random) -> Iterable[float]:
+    """Yield Poisson arrival times at ``rate`` per second between ``start`` and ``end``."""
+    scheduled = start
+    while (scheduled := scheduled + rng.expovariate(rate)) < end:
+        yield scheduled
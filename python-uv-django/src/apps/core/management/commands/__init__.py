@@ -0,0 +1 @@
+"""Core app management commands."""
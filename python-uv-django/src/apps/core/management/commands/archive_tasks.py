@@ -0,0 +1,77 @@
+"""Move old finished tasks from the task table into the archive table."""
+
+from __future__ import annotations
+
+import datetime
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.utils import timezone
+
+from apps.core.models import Task
+from apps.core.services import TaskService
+
+
+class Command(BaseCommand):
+    """Archive completed and cancelled tasks in short, throttled batches."""
+
+    help = (
+        "Move completed and cancelled tasks not updated for --older-than days from the "
+        "task table to the archive table, a batch per transaction. Archived tasks stay "
+        "readable with ?include_archived=1 and in the admin."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Register command options."""
+        parser.add_argument(
+            "--older-than",
+            type=int,
+            default=settings.TASK_ARCHIVE_AFTER_DAYS,
+            metavar="DAYS",
+            help="Days since the task's last update (default: %(default)s, "
+            "TASK_ARCHIVE_AFTER_DAYS).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Tasks moved per transaction (default: %(default)s).",
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=0.1,
+            help="Seconds to pause between batches (default: %(default)s).",
+        )
+        parser.add_argument("--limit", type=int, help="Archive at most this many tasks.")
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only count the tasks that would be archived.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Archive the tasks and print how many moved."""
+        if options["older_than"] < 0 or options["batch_size"] < 1 or options["sleep"] < 0:
+            raise CommandError(
+                "--older-than and --sleep must not be negative, and --batch-size must be positive."
+            )
+        older_than = datetime.timedelta(days=options["older_than"])
+        if options["dry_run"]:
+            count = Task.objects.archivable(timezone.now() - older_than).count()
+            self.stdout.write(f"{count} tasks would be archived.")
+            return
+
+        def progress(archived: int) -> None:
+            if options["verbosity"] > 1:
+                self.stdout.write(f"{archived} tasks archived")
+
+        archived = TaskService.archive_tasks(
+            older_than,
+            batch_size=options["batch_size"],
+            pause=options["sleep"],
+            limit=options["limit"],
+            progress=progress,
+        )
+        self.stdout.write(self.style.SUCCESS(f"Archived {archived} tasks."))
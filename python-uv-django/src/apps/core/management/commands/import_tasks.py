@@ -0,0 +1,79 @@
+"""Bulk-import tasks from a CSV or NDJSON file."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from apps.core.importer import ImportResult, TaskImportError
+from apps.core.services import TaskService
+
+
+class Command(BaseCommand):
+    """Stream a file into the task table in validated, resumable batches."""
+
+    help = (
+        "Import tasks from a CSV or NDJSON file with the API's validation rules. "
+        "Interrupted imports resume where they stopped; rejected records are written "
+        "to an error file beside the input."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Register command options."""
+        parser.add_argument("path", help="CSV (with a header row) or NDJSON file.")
+        parser.add_argument(
+            "--format",
+            choices=["csv", "ndjson"],
+            help="File format (default: from the extension: .csv, .ndjson or .jsonl).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Records validated and committed together (default: %(default)s).",
+        )
+        parser.add_argument(
+            "--errors",
+            help="Where rejected records go (default: <path>.errors.csv or .ndjson).",
+        )
+        parser.add_argument(
+            "--restart",
+            action="store_true",
+            help="Ignore the file's checkpoint and import it from the start.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Run the import and print its totals."""
+        verbosity = options["verbosity"]
+
+        def progress(result: ImportResult) -> None:
+            if verbosity > 1:
+                self.stdout.write(
+                    f"{result.records} records: {result.imported} imported, "
+                    f"{result.rejected} rejected ({result.records_per_second:,.0f} records/s)"
+                )
+
+        try:
+            result = TaskService.import_tasks(
+                options["path"],
+                fmt=options["format"],
+                batch_size=options["batch_size"],
+                errors_path=options["errors"],
+                restart=options["restart"],
+                progress=progress,
+            )
+        except TaskImportError as exc:
+            raise CommandError(str(exc)) from exc
+
+        if result.resumed_from:
+            self.stdout.write(f"Resumed after record {result.resumed_from}.")
+        self.stdout.write(
+            f"Read {result.records - result.resumed_from} records in {result.elapsed:.1f}s "
+            f"({result.records_per_second:,.0f} records/s)."
+        )
+        summary = f"{result.imported} tasks imported, {result.rejected} rejected in total."
+        if result.rejected:
+            self.stdout.write(self.style.WARNING(summary + " See the error file."))
+        else:
+            self.stdout.write(self.style.SUCCESS(summary))
@@ -0,0 +1,184 @@
+"""Drive the task API with a concurrent mix of requests and report the results."""
+
+from __future__ import annotations
+
+import json
+from functools import partial
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from apps.core import loadtest
+from apps.core.models import Task
+
+
+class Command(BaseCommand):
+    """Measure throughput, latency and errors of a server or the in-process app."""
+
+    help = (
+        "Load test the task API: a running server (--url) or this process's WSGI or "
+        "ASGI application (--app), in a closed loop or at an open-loop --rate."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Register command options."""
+        target = parser.add_mutually_exclusive_group()
+        target.add_argument(
+            "--url", help="Base URL of a running server, e.g. http://127.0.0.1:8000."
+        )
+        target.add_argument(
+            "--app",
+            choices=["wsgi", "asgi"],
+            help="Call config.wsgi or config.asgi in this process (default: wsgi).",
+        )
+        parser.add_argument(
+            "--engine",
+            choices=["threads", "asyncio"],
+            help="threads (blocking clients) or asyncio (default: asyncio for --app asgi, "
+            "threads otherwise). In-process WSGI needs threads, ASGI needs asyncio.",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=10,
+            help="Workers (closed loop) or the cap on requests in flight (open loop).",
+        )
+        parser.add_argument(
+            "--rate",
+            type=float,
+            help="Open loop: requests per second (Poisson arrivals). Default: closed loop.",
+        )
+        parser.add_argument("--duration", type=float, default=10.0, help="Seconds measured.")
+        parser.add_argument(
+            "--warmup", type=float, default=2.0, help="Seconds run before measuring."
+        )
+        parser.add_argument(
+            "--mix",
+            default=loadtest.DEFAULT_MIX,
+            help=f"Operation weights, from {', '.join(loadtest.OPERATIONS)} "
+            "(default: %(default)s).",
+        )
+        parser.add_argument("--seed", type=int, default=0, help="Random seed of the mix.")
+        parser.add_argument("--timeout", type=float, default=30.0, help="Per-request timeout.")
+        parser.add_argument("--json", type=Path, help="Also write the results to this file.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Run the load test and print the report."""
+        try:
+            weights = loadtest.parse_mix(options["mix"])
+        except ValueError as exc:
+            raise CommandError(str(exc)) from exc
+        if options["concurrency"] < 1 or options["duration"] <= 0:
+            raise CommandError("--concurrency and --duration must be positive.")
+        if options["rate"] is not None and options["rate"] <= 0:
+            raise CommandError("--rate must be positive.")
+
+        url, app = options["url"], options["app"] or ("wsgi" if not options["url"] else None)
+        engine = options["engine"] or ("asyncio" if app == "asgi" else "threads")
+        if app == "wsgi" and engine != "threads":
+            raise CommandError("The in-process WSGI app needs --engine threads.")
+        if app == "asgi" and engine != "asyncio":
+            raise CommandError("The in-process ASGI app needs --engine asyncio.")
+
+        if url:
+            client_class = loadtest.HTTPClient if engine == "threads" else loadtest.AsyncHTTPClient
+            make_client = partial(client_class, url, timeout=options["timeout"])
+            task_ids = self.remote_task_ids(url, options["timeout"])
+            pending_ids = self.remote_task_ids(
+                url, options["timeout"], f"?status={Task.Status.PENDING}"
+            )
+        else:
+            if app == "wsgi":
+                from config.wsgi import application
+
+                make_client = partial(loadtest.WSGIClient, application)
+            else:
+                from config.asgi import application
+
+                make_client = partial(loadtest.ASGIClient, application)
+            tasks = Task.objects.order_by("-pk").values_list("pk", flat=True)
+            task_ids = list(tasks[:1000])
+            pending_ids = list(tasks.filter(status=Task.Status.PENDING)[:10000])
+
+        run = loadtest.run_threads if engine == "threads" else loadtest.run_asyncio
+        mode = f"open loop at {options['rate']:g} req/s" if options["rate"] else "closed loop"
+        self.stdout.write(
+            f"Load testing {url or f'in-process {app.upper()}'} with {engine}, {mode}, "
+            f"concurrency {options['concurrency']}, {options['duration']:g}s "
+            f"(+{options['warmup']:g}s warm-up), mix {options['mix']}"
+        )
+        results = run(
+            make_client,
+            loadtest.Workload(weights, task_ids, pending_ids),
+            concurrency=options["concurrency"],
+            duration=options["duration"],
+            warmup=options["warmup"],
+            rate=options["rate"],
+            seed=options["seed"],
+        )
+        summary = results.summary()
+        summary["config"] = {
+            "target": url or app,
+            "engine": engine,
+            **{key: options[key] for key in ("concurrency", "rate", "duration", "mix")},
+        }
+        self.report(summary)
+        if options["json"]:
+            options["json"].write_text(json.dumps(summary, indent=2) + "\n")
+
+    def remote_task_ids(
+        self, url: str, timeout: float, query: str = "", pages: int = 10
+    ) -> list[int]:
+        """Return ids of tasks the server lists, following up to ``pages`` ``next`` links."""
+        client = loadtest.HTTPClient(url, timeout=timeout)
+        path, ids = f"/api/tasks/{query}", []
+        try:
+            for _ in range(pages):
+                status, body = client.send(loadtest.Call("list", "GET", path))
+                if status != 200:
+                    raise CommandError(f"GET {path} returned {status}; is {url} the task API?")
+                page = json.loads(body)
+                ids += [task["id"] for task in page["results"]]
+                if not page.get("next"):
+                    break
+                # Links are absolute; keep the part below the base URL.
+                link = urlsplit(page["next"])
+                path = f"{link.path.removeprefix(client.prefix)}?{link.query}"
+        except (OSError, ValueError, KeyError) as exc:
+            raise CommandError(f"Could not list tasks at {url}: {exc}") from exc
+        finally:
+            client.close()
+        return ids
+
+    def report(self, summary: dict[str, Any]) -> None:
+        """Print throughput, errors, percentiles, per-operation results and the histogram."""
+        requests = summary["requests"]
+        self.stdout.write(
+            f"\n{requests} requests in {summary['elapsed_s']:.1f}s: "
+            f"{summary['throughput_rps']:.1f} req/s, "
+            f"{summary['error_rate']:.2%} errors, {summary['missed']} missed"
+        )
+        for error, count in sorted(summary["errors"].items()):
+            self.stdout.write(self.style.WARNING(f"  {error}: {count}"))
+        latency = summary["latency_ms"]
+        if latency:
+            self.stdout.write(
+                "Latency ms: " + "  ".join(f"{name} {value:.1f}" for name, value in latency.items())
+            )
+
+        self.stdout.write(f"\n{'operation':<14}{'requests':>9}{'errors':>8}{'p50':>9}{'p99':>9}")
+        for name, operation in summary["operations"].items():
+            percentiles = operation["latency_ms"]
+            self.stdout.write(
+                f"{name:<14}{operation['requests']:>9}{operation['errors']:>8}"
+                f"{percentiles['p50']:>9.1f}{percentiles['p99']:>9.1f}"
+            )
+
+        self.stdout.write("\nLatency histogram (ms)")
+        widest = max(summary["histogram_ms"].values(), default=0) or 1
+        for bucket, count in summary["histogram_ms"].items():
+            bar = "#" * round(40 * count / widest)
+            share = count / requests if requests else 0
+            self.stdout.write(f"{bucket:>7} {count:>8} {share:>6.1%} {bar}")
@@ -0,0 +1,40 @@
+"""Rebuild the maintained task counters from the task table."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from apps.core.models import TaskCounter
+
+
+class Command(BaseCommand):
+    """Recompute TaskCounter rows and report any drift that was corrected."""
+
+    help = "Rebuild the per-status and overdue task counters from the task table."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Register command options."""
+        parser.add_argument(
+            "--database",
+            default="default",
+            help="Database alias to reconcile (default: %(default)s).",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Rebuild the counters and print the corrections."""
+        counters = TaskCounter.objects.db_manager(options["database"])
+        before = dict(counters.values_list("key", "value"))
+        after = counters.rebuild()
+
+        drifted = 0
+        for key, value in after.items():
+            previous = before.get(key)
+            if previous != value:
+                drifted += 1
+                self.stdout.write(f"{key}: {previous} -> {value}")
+        if drifted:
+            self.stdout.write(self.style.WARNING(f"Corrected {drifted} drifted counter(s)."))
+        else:
+            self.stdout.write(self.style.SUCCESS("Task counters are consistent."))
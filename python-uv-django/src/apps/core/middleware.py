@@ -0,0 +1,150 @@
+"""Project middleware: request timings and read replica scopes.
+
+Both are sync and async capable, so they add no thread hop to an ASGI
+request.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from asgiref.sync import async_to_sync, iscoroutinefunction, markcoroutinefunction
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponseBase
+
+from . import replicas, timing
+
+
+class TimingMiddleware:
+    """Report each request's query count and db, cache and serializer time.
+
+    Put it first in ``MIDDLEWARE`` so the total covers the whole chain. The
+    figures go to a ``Server-Timing`` header (when ``SERVER_TIMING`` is on)
+    and to a JSON line on the ``apps.core.timing`` logger. Work done while a
+    streaming response is iterated is not included.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable[..., Any]) -> None:
+        """Mark the instance as a coroutine function when the chain below is async."""
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> HttpResponseBase | Awaitable[HttpResponseBase]:
+        """Handle the request with its timings open."""
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        timings, token = timing.start()
+        try:
+            response: HttpResponseBase = self.get_response(request)
+        finally:
+            timing.finish(token)
+        return self.report(request, response, timings)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponseBase:
+        """Async version of ``__call__()``."""
+        timings, token = timing.start()
+        try:
+            response: HttpResponseBase = await self.get_response(request)
+        finally:
+            timing.finish(token)
+        return self.report(request, response, timings)
+
+    @staticmethod
+    def report(
+        request: HttpRequest, response: HttpResponseBase, timings: timing.RequestTimings
+    ) -> HttpResponseBase:
+        """Add the ``Server-Timing`` header and log the request."""
+        if settings.SERVER_TIMING:
+            response["Server-Timing"] = timings.server_timing()
+        timing.log_request(request, response, timings)
+        return response
+
+
+class ReplicaMiddleware:
+    """Open each request's read scope and pin clients that just wrote.
+
+    GET and HEAD requests to views marked with ``@reads_from_replicas`` may
+    read from a replica unless the client is pinned; a successful unsafe
+    request pins the client to the primary for
+    ``DATABASE_REPLICA_PIN_SECONDS``. See ``apps.core.replicas``. Without
+    replicas it passes requests straight through.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable[..., Any]) -> None:
+        """Mark the instance as a coroutine function when the chain below is async."""
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+            self.process_view = self.aprocess_view  # type: ignore[method-assign]
+
+    def __call__(self, request: HttpRequest) -> HttpResponseBase | Awaitable[HttpResponseBase]:
+        """Handle the request inside its read scope."""
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not replicas.replicas_configured():
+            response: HttpResponseBase = self.get_response(request)
+            return response
+        token = replicas.start(request)
+        try:
+            response = self.get_response(request)
+        finally:
+            replicas.finish(token)
+        return replicas.pin(request, response)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponseBase:
+        """Async version of ``__call__()``."""
+        if not replicas.replicas_configured():
+            response: HttpResponseBase = await self.get_response(request)
+            return response
+        token = replicas.start(request)
+        try:
+            response = await self.get_response(request)
+        finally:
+            replicas.finish(token)
+        return replicas.pin(request, response)
+
+    def process_view(
+        self,
+        request: HttpRequest,
+        view_func: Callable[..., Any],
+        view_args: tuple[Any, ...],
+        view_kwargs: dict[str, Any],
+    ) -> None:
+        """Let safe requests to views that accept it read from a replica."""
+        replicas.allow_replica_reads(request, view_func, view_args, view_kwargs)
+
+    async def aprocess_view(
+        self,
+        request: HttpRequest,
+        view_func: Callable[..., Any],
+        view_args: tuple[Any, ...],
+        view_kwargs: dict[str, Any],
+    ) -> None:
+        """Async version of ``process_view()``."""
+        replicas.allow_replica_reads(request, view_func, view_args, view_kwargs)
+
+    def process_exception(
+        self, request: HttpRequest, exception: Exception
+    ) -> HttpResponseBase | None:
+        """Serve the request from the primary when its replica failed mid-request.
+
+        Django runs exception middleware synchronously, also under ASGI, so
+        an async view is driven with ``async_to_sync()``.
+        """
+        view = replicas.fail_over(exception)
+        if view is None:
+            return None
+        if iscoroutinefunction(view.func):
+            response: HttpResponseBase = async_to_sync(view)()
+        else:
+            response = view()
+        return response
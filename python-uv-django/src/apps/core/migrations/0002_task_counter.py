@@ -0,0 +1,59 @@
+# Generated by Django 6.1.2 on 2026-10-17 06:36
+
+from django.db import migrations, models
+from django.db.models import Count
+from django.utils import timezone
+
+
+def populate_counters(apps, schema_editor):
+    """Seed the counters from the rows that already exist."""
+    Task = apps.get_model('core', 'Task')
+    TaskCounter = apps.get_model('core', 'TaskCounter')
+    db = schema_editor.connection.alias
+
+    values = dict.fromkeys(['PENDING', 'IN_PROGRESS', 'COMPLETED', 'CANCELLED'], 0)
+    rows = Task.objects.using(db).order_by().values_list('status').annotate(total=Count('pk'))
+    values.update(dict(rows))
+    values['OVERDUE'] = (
+        Task.objects.using(db)
+        .filter(due_date__lt=timezone.now())
+        .exclude(status='COMPLETED')
+        .count()
+    )
+    TaskCounter.objects.using(db).bulk_create(
+        [TaskCounter(key=key, value=value) for key, value in values.items()]
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskCounter',
+            fields=[
+                (
+                    'key',
+                    models.CharField(
+                        help_text='Task status or OVERDUE',
+                        max_length=20,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ('value', models.BigIntegerField(default=0, help_text='Number of tasks')),
+                (
+                    'updated_at',
+                    models.DateTimeField(auto_now=True, help_text='When the counter last changed'),
+                ),
+            ],
+            options={
+                'verbose_name': 'Task counter',
+                'verbose_name_plural': 'Task counters',
+            },
+        ),
+        migrations.RunPython(populate_counters, migrations.RunPython.noop),
+    ]
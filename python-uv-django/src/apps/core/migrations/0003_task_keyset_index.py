@@ -0,0 +1,23 @@
+# Generated by Django 6.1.2 on 2026-10-17 06:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_task_counter'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(
+                fields=['-priority', '-created_at', 'id'], name='core_task_priorit_abeb0d_idx'
+            ),
+        ),
+        migrations.RemoveIndex(
+            model_name='task',
+            name='core_task_priorit_a789c6_idx',
+        ),
+    ]
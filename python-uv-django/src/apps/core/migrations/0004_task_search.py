@@ -0,0 +1,130 @@
+# Generated by Django 6.1.2 on 2026-10-17 07:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# The search structures are created with raw SQL: the PostgreSQL column is
+# outside the model state, and TaskSearchIndex is an unmanaged model that
+# only lets the ORM join to the SQLite FTS5 table.
+
+POSTGRES_FORWARD = [
+    # A stored generated column is recomputed by PostgreSQL on every INSERT,
+    # UPDATE and COPY, so no application code has to maintain it. Adding it
+    # rewrites the table; on large installations run this in a quiet window.
+    """
+    ALTER TABLE core_task ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(description, '')), 'B')
+    ) STORED
+    """,
+    'CREATE INDEX core_task_search_vector_idx ON core_task USING GIN (search_vector)',
+]
+
+POSTGRES_BACKWARD = [
+    'DROP INDEX IF EXISTS core_task_search_vector_idx',
+    'ALTER TABLE core_task DROP COLUMN IF EXISTS search_vector',
+]
+
+SQLITE_FORWARD = [
+    # External-content table: the text lives only in core_task, the FTS index
+    # is kept in step by the triggers below (apps.core.search re-creates them
+    # after migrations, because SQLite table rebuilds drop triggers).
+    """
+    CREATE VIRTUAL TABLE core_task_fts USING fts5(
+        title, description,
+        content='core_task', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS core_task_fts_ai AFTER INSERT ON core_task BEGIN
+        INSERT INTO core_task_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS core_task_fts_ad AFTER DELETE ON core_task BEGIN
+        INSERT INTO core_task_fts(core_task_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS core_task_fts_au
+    AFTER UPDATE OF title, description ON core_task BEGIN
+        INSERT INTO core_task_fts(core_task_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO core_task_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+    "INSERT INTO core_task_fts(core_task_fts) VALUES ('rebuild')",
+]
+
+SQLITE_BACKWARD = [
+    'DROP TRIGGER IF EXISTS core_task_fts_ai',
+    'DROP TRIGGER IF EXISTS core_task_fts_ad',
+    'DROP TRIGGER IF EXISTS core_task_fts_au',
+    'DROP TABLE IF EXISTS core_task_fts',
+]
+
+
+def _sqlite_has_fts5(connection):
+    """Return whether this SQLite build was compiled with FTS5."""
+    with connection.cursor() as cursor:
+        cursor.execute('PRAGMA compile_options')
+        return any(row[0] == 'ENABLE_FTS5' for row in cursor.fetchall())
+
+
+def _run(schema_editor, statements):
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def forward(apps, schema_editor):
+    """Create the vendor-specific full-text search structures."""
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        _run(schema_editor, POSTGRES_FORWARD)
+    elif vendor == 'sqlite' and _sqlite_has_fts5(schema_editor.connection):
+        _run(schema_editor, SQLITE_FORWARD)
+
+
+def backward(apps, schema_editor):
+    """Drop the vendor-specific full-text search structures."""
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        _run(schema_editor, POSTGRES_BACKWARD)
+    elif vendor == 'sqlite':
+        _run(schema_editor, SQLITE_BACKWARD)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_task_keyset_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(forward, backward),
+        migrations.CreateModel(
+            name='TaskSearchIndex',
+            fields=[
+                (
+                    'task',
+                    models.OneToOneField(
+                        db_column='rowid',
+                        db_constraint=False,
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        primary_key=True,
+                        related_name='search_index',
+                        serialize=False,
+                        to='core.task',
+                    ),
+                ),
+            ],
+            options={
+                'db_table': 'core_task_fts',
+                'managed': False,
+            },
+        ),
+    ]
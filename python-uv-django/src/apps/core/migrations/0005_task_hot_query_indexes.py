@@ -0,0 +1,49 @@
+# Generated by Django 6.1.2 on 2026-10-17 08:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_task_search'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(
+                fields=['-priority', '-created_at', '-id'], name='core_task_priorit_8a2c74_idx'
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['due_date', 'id'], name='core_task_due_dat_f60266_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(
+                fields=['status', 'due_date', 'updated_at'], name='core_task_status_2549a7_idx'
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(
+                condition=models.Q(('status', 'COMPLETED'), _negated=True),
+                fields=['due_date', 'id'],
+                name='core_task_open_due_date_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(
+                condition=models.Q(('status', 'COMPLETED'), _negated=True),
+                fields=['-priority', '-created_at', '-id'],
+                name='core_task_open_priority_idx',
+            ),
+        ),
+        migrations.RemoveIndex(
+            model_name='task',
+            name='core_task_priorit_abeb0d_idx',
+        ),
+    ]
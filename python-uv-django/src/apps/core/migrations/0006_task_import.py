@@ -0,0 +1,61 @@
+# Generated by Django 6.1.2 on 2026-10-17 09:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_task_hot_query_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskImport',
+            fields=[
+                (
+                    'id',
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name='ID'
+                    ),
+                ),
+                (
+                    'source',
+                    models.CharField(
+                        help_text='Absolute path of the file', max_length=500, unique=True
+                    ),
+                ),
+                (
+                    'fingerprint',
+                    models.CharField(help_text='Hash of the start of the file', max_length=64),
+                ),
+                (
+                    'records',
+                    models.BigIntegerField(default=0, help_text='Records read and committed'),
+                ),
+                ('imported', models.BigIntegerField(default=0, help_text='Tasks created')),
+                (
+                    'rejected',
+                    models.BigIntegerField(default=0, help_text='Records that failed validation'),
+                ),
+                (
+                    'started_at',
+                    models.DateTimeField(auto_now_add=True, help_text='When the import started'),
+                ),
+                (
+                    'updated_at',
+                    models.DateTimeField(auto_now=True, help_text='When the last batch committed'),
+                ),
+                (
+                    'finished_at',
+                    models.DateTimeField(
+                        blank=True, help_text='When the whole file was imported', null=True
+                    ),
+                ),
+            ],
+            options={
+                'verbose_name': 'Task import',
+                'verbose_name_plural': 'Task imports',
+            },
+        ),
+    ]
@@ -0,0 +1,137 @@
+# Generated by Django 6.1.2 on 2026-10-17 09:17
+
+from django.db import migrations, models
+
+# TaskWithArchived is an unmanaged model over this view. Both arms list the
+# columns explicitly, so a column added to core_task alone (such as the
+# PostgreSQL search_vector) does not break it.
+COLUMNS = 'id, title, description, status, priority, due_date, completed_at, created_at, updated_at'
+
+CREATE_VIEW = f"""
+    CREATE VIEW core_task_with_archived AS
+    SELECT {COLUMNS} FROM core_task
+    UNION ALL
+    SELECT {COLUMNS} FROM core_taskarchive
+"""
+
+DROP_VIEW = 'DROP VIEW IF EXISTS core_task_with_archived'
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_task_import'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskWithArchived',
+            fields=[
+                ('title', models.CharField(help_text='Task title', max_length=200)),
+                (
+                    'description',
+                    models.TextField(blank=True, help_text='Detailed description of the task'),
+                ),
+                (
+                    'status',
+                    models.CharField(
+                        choices=[
+                            ('PENDING', 'Pending'),
+                            ('IN_PROGRESS', 'In Progress'),
+                            ('COMPLETED', 'Completed'),
+                            ('CANCELLED', 'Cancelled'),
+                        ],
+                        default='PENDING',
+                        help_text='Current task status',
+                        max_length=20,
+                    ),
+                ),
+                (
+                    'priority',
+                    models.IntegerField(
+                        default=0, help_text='Task priority (higher = more important)'
+                    ),
+                ),
+                (
+                    'due_date',
+                    models.DateTimeField(blank=True, help_text='Task due date', null=True),
+                ),
+                (
+                    'completed_at',
+                    models.DateTimeField(
+                        blank=True, help_text='When the task was completed', null=True
+                    ),
+                ),
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(help_text='When the task was created')),
+                ('updated_at', models.DateTimeField(help_text='When the task was last updated')),
+            ],
+            options={
+                'db_table': 'core_task_with_archived',
+                'ordering': ['-priority', '-created_at'],
+                'managed': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='TaskArchive',
+            fields=[
+                ('title', models.CharField(help_text='Task title', max_length=200)),
+                (
+                    'description',
+                    models.TextField(blank=True, help_text='Detailed description of the task'),
+                ),
+                (
+                    'status',
+                    models.CharField(
+                        choices=[
+                            ('PENDING', 'Pending'),
+                            ('IN_PROGRESS', 'In Progress'),
+                            ('COMPLETED', 'Completed'),
+                            ('CANCELLED', 'Cancelled'),
+                        ],
+                        default='PENDING',
+                        help_text='Current task status',
+                        max_length=20,
+                    ),
+                ),
+                (
+                    'priority',
+                    models.IntegerField(
+                        default=0, help_text='Task priority (higher = more important)'
+                    ),
+                ),
+                (
+                    'due_date',
+                    models.DateTimeField(blank=True, help_text='Task due date', null=True),
+                ),
+                (
+                    'completed_at',
+                    models.DateTimeField(
+                        blank=True, help_text='When the task was completed', null=True
+                    ),
+                ),
+                (
+                    'id',
+                    models.BigIntegerField(
+                        help_text='Id the task had while active', primary_key=True, serialize=False
+                    ),
+                ),
+                ('created_at', models.DateTimeField(help_text='When the task was created')),
+                ('updated_at', models.DateTimeField(help_text='When the task was last updated')),
+                ('archived_at', models.DateTimeField(help_text='When the task was archived')),
+            ],
+            options={
+                'verbose_name': 'Archived task',
+                'verbose_name_plural': 'Archived tasks',
+                'ordering': ['-priority', '-created_at'],
+                'indexes': [
+                    models.Index(
+                        fields=['-priority', '-created_at', '-id'],
+                        name='core_taskar_priorit_0d4cc0_idx',
+                    ),
+                    models.Index(fields=['archived_at'], name='core_taskar_archive_313700_idx'),
+                ],
+            },
+        ),
+        migrations.RunSQL(CREATE_VIEW, DROP_VIEW),
+    ]
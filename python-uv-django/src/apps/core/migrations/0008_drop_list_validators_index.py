@@ -0,0 +1,17 @@
+# Generated by Django 6.1.2 on 2026-10-17 10:00
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_task_archive'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='task',
+            name='core_task_status_2549a7_idx',
+        ),
+    ]
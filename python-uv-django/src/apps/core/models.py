@@ -1,19 +1,245 @@
 """Core app models."""
 
-from django.db import models
+from __future__ import annotations
+
+import datetime
+from collections import Counter
+from collections.abc import Iterable, Mapping
+from contextvars import ContextVar
+from typing import Any
+
+from asgiref.sync import sync_to_async
+
+from django.conf import settings
+from django.db import connections, models, router, transaction
+from django.db.models import Count, F
 from django.utils import timezone
 
+from .cache import bump_task_version, invalidate_task_objects
 
-class Task(models.Model):
-    """Example Task model demonstrating Django ORM patterns."""
+# Set while bulk_update() runs its internal UPDATE, whose counter deltas it
+# computes itself from the objects being written.
+_bulk_update_in_progress: ContextVar[bool] = ContextVar("bulk_update_in_progress", default=False)
+
+
+class TaskQuerySet(models.QuerySet["Task"]):
+    """QuerySet that keeps the task counters in step with set-based writes.
+
+    Every write also bumps the task table version that keys the list cache
+    and invalidates the cached task rows. Write methods set ``_for_write``
+    before anything reads ``self.db``, as Django's own do, so the writes and
+    the counter updates go to the primary rather than a read replica.
+    """
+
+    def overdue(self, now: datetime.datetime | None = None) -> TaskQuerySet:
+        """Filter to tasks past their due date that are not completed."""
+        return self.filter(due_date__lt=now or timezone.now()).exclude(status=Task.Status.COMPLETED)
+
+    def archivable(self, before: datetime.datetime) -> TaskQuerySet:
+        """Filter to finished (completed or cancelled) tasks last updated before ``before``."""
+        return self.filter(status__in=Task.ARCHIVABLE, updated_at__lt=before)
+
+    def status_counts(self) -> dict[str, int]:
+        """Return the number of rows per status with a single GROUP BY."""
+        rows = self.order_by().values_list("status").annotate(total=Count("pk"))
+        return dict(rows)
+
+    def bulk_create(self, objs: Iterable[Task], *args: Any, **kwargs: Any) -> list[Task]:
+        """Insert tasks in bulk and add them to the counters."""
+        self._for_write = True
+        with transaction.atomic(using=self.db, savepoint=False):
+            created = super().bulk_create(objs, *args, **kwargs)
+            bump_task_version(self.db)
+            if kwargs.get("update_conflicts"):
+                invalidate_task_objects(self.db)
+            if kwargs.get("ignore_conflicts") or kwargs.get("update_conflicts"):
+                # Conflicting rows are skipped or merged silently, so the
+                # number of inserted rows per status is unknown.
+                TaskCounter.objects.db_manager(self.db).rebuild()
+            else:
+                TaskCounter.objects.db_manager(self.db).adjust(
+                    Counter(task.status for task in created)
+                )
+        return created
+
+    def bulk_update(
+        self, objs: Iterable[Task], fields: Iterable[str], batch_size: int | None = None
+    ) -> int:
+        """Update tasks in bulk and move changed statuses between counters."""
+        self._for_write = True
+        objs = list(objs)
+        fields = list(fields)
+        if "status" not in fields:
+            return super().bulk_update(objs, fields, batch_size=batch_size)
+        with transaction.atomic(using=self.db, savepoint=False):
+            # Locked until commit, so no other writer moves the rows meanwhile.
+            previous = dict(
+                self.model._base_manager.using(self.db)
+                .select_for_update()
+                .filter(pk__in=[task.pk for task in objs])
+                .values_list("pk", "status")
+            )
+            token = _bulk_update_in_progress.set(True)
+            try:
+                rows = super().bulk_update(objs, fields, batch_size=batch_size)
+            finally:
+                _bulk_update_in_progress.reset(token)
+            current = {task.pk: task.status for task in objs}
+            if len(current) < len(objs):
+                # A task passed twice ends with whichever copy the UPDATE wrote.
+                current = dict(
+                    self.model._base_manager.using(self.db)
+                    .filter(pk__in=current)
+                    .values_list("pk", "status")
+                )
+            deltas: Counter[str] = Counter()
+            for pk, status in current.items():
+                old_status = previous.get(pk)
+                if old_status is not None and old_status != status:
+                    deltas[old_status] -= 1
+                    deltas[status] += 1
+            TaskCounter.objects.db_manager(self.db).adjust(deltas)
+        return rows
+
+    def update(self, **kwargs: Any) -> int:
+        """Run a set-based UPDATE and move affected rows between counters.
+
+        A new status is written with one UPDATE per status the rows may have
+        now, as in ``transition()``: each statement's row count is then the
+        exact number of rows it moved, whatever other writers commit meanwhile.
+        """
+        self._for_write = True
+        new_status = kwargs.get("status")
+        with transaction.atomic(using=self.db, savepoint=False):
+            if new_status is None or _bulk_update_in_progress.get():
+                rows = super().update(**kwargs)
+            elif not isinstance(new_status, str):
+                # Expressions such as Case()/F() can route rows to any status.
+                rows = super().update(**kwargs)
+                TaskCounter.objects.db_manager(self.db).rebuild()
+            else:
+                sources = [value for value in Task.Status.values if value != new_status]
+                deltas: Counter[str] = Counter()
+                rows = 0
+                for source in sources:
+                    moved = models.QuerySet.update(self.order_by().filter(status=source), **kwargs)
+                    deltas[source] -= moved
+                    deltas[new_status] += moved
+                    rows += moved
+                # Rows already in the new status keep their counter.
+                rows += models.QuerySet.update(
+                    self.order_by().exclude(status__in=sources), **kwargs
+                )
+                TaskCounter.objects.db_manager(self.db).adjust(deltas)
+            # After the write, so no reader can cache the old rows under the
+            # new version; the block also makes the bump repeat on commit.
+            bump_task_version(self.db)
+            invalidate_task_objects(self.db)
+        return rows
+
+    def transition(self, status: str, *, force: bool = False) -> list[Task]:
+        """Move the matching tasks to ``status`` and return them as written.
+
+        Only rows whose current status may move to ``status`` (see
+        ``Task.TRANSITIONS``) are updated, unless ``force`` is set. The rule is
+        part of the UPDATE's WHERE clause, so it holds under concurrent writes.
+        There is one UPDATE per allowed source status, which makes the counter
+        deltas exact without reading the rows first. Where the database
+        supports ``RETURNING`` (PostgreSQL, SQLite) the written rows come back
+        from the same statement.
+        """
+        self._for_write = True
+        if status not in Task.TRANSITIONS:
+            raise ValueError(f"Unknown task status: {status!r}")
+        sources = [value for value in Task.Status.values if value != status]
+        if not force:
+            sources = [value for value in sources if value in Task.TRANSITIONS[status]]
+        fields = {field.name: field for field in self.model._meta.concrete_fields}
+        now = timezone.now()
+        updated: list[Task] = []
+        deltas: Counter[str] = Counter()
+        with transaction.atomic(using=self.db, savepoint=False):
+            for source in sources:
+                values: dict[str, Any] = {"status": status, "updated_at": now}
+                if status == Task.Status.COMPLETED:
+                    values["completed_at"] = now
+                elif source == Task.Status.COMPLETED:
+                    values["completed_at"] = None
+                tasks = self._update_returning(
+                    self.order_by().filter(status=source),
+                    [(fields[name], None, value) for name, value in values.items()],
+                )
+                deltas[source] -= len(tasks)
+                deltas[status] += len(tasks)
+                updated.extend(tasks)
+            if updated:
+                TaskCounter.objects.db_manager(self.db).adjust(deltas)
+                bump_task_version(self.db)
+                invalidate_task_objects(self.db, updated[0].pk if len(updated) == 1 else None)
+        return updated
 
-    class Status(models.TextChoices):
-        """Task status choices."""
+    async def atransition(self, status: str, *, force: bool = False) -> list[Task]:
+        """Async version of ``transition()``.
 
-        PENDING = "PENDING", "Pending"
-        IN_PROGRESS = "IN_PROGRESS", "In Progress"
-        COMPLETED = "COMPLETED", "Completed"
-        CANCELLED = "CANCELLED", "Cancelled"
+        As with Django's ``aupdate()``, the UPDATEs and the counter deltas run
+        in one thread: their transaction cannot span an ``await``.
+        """
+        return await sync_to_async(self.transition)(status, force=force)
+
+    def _update_returning(self, queryset: TaskQuerySet, values: list[Any]) -> list[Task]:
+        """Run one UPDATE of ``queryset`` and return the updated rows as tasks."""
+        model = self.model
+        concrete = model._meta.concrete_fields
+        if connections[self.db].features.can_return_rows_from_update:
+            rows = queryset._update(values, returning_fields=concrete)
+            names = [field.attname for field in concrete]
+            return [model.from_db(self.db, names, row) for row in rows]
+        # Without RETURNING, lock the rows, update them by id and read them back.
+        rows_manager = model._base_manager.using(self.db)
+        pks = list(queryset.select_for_update().values_list("pk", flat=True))
+        rows_manager.filter(pk__in=pks)._update(values)
+        return list(rows_manager.filter(pk__in=pks))
+
+    def delete(self) -> tuple[int, dict[str, int]]:
+        """Delete matching rows and remove them from the counters.
+
+        Like ``update()``, there is one DELETE per status so the counter
+        deltas are the rows each statement actually deleted.
+        """
+        self._for_write = True
+        label = self.model._meta.label
+        total = 0
+        per_model: Counter[str] = Counter()
+        deltas: Counter[str] = Counter()
+        with transaction.atomic(using=self.db, savepoint=False):
+            for status in Task.Status.values:
+                deleted, rows = models.QuerySet.delete(self.filter(status=status))
+                total += deleted
+                per_model.update(rows)
+                deltas[status] -= rows.get(label, 0)
+            # Rows in a status outside Task.Status have no counter.
+            deleted, rows = models.QuerySet.delete(self.exclude(status__in=Task.Status.values))
+            total += deleted
+            per_model.update(rows)
+            bump_task_version(self.db)
+            invalidate_task_objects(self.db)
+            TaskCounter.objects.db_manager(self.db).adjust(deltas)
+        return total, dict(per_model)
+
+
+class TaskStatus(models.TextChoices):
+    """Task status choices."""
+
+    PENDING = "PENDING", "Pending"
+    IN_PROGRESS = "IN_PROGRESS", "In Progress"
+    COMPLETED = "COMPLETED", "Completed"
+    CANCELLED = "CANCELLED", "Cancelled"
+
+
+class AbstractTask(models.Model):
+    """Fields and behaviour shared by tasks, archived tasks and the view of both."""
+
+    Status = TaskStatus
 
     title = models.CharField(max_length=200, help_text="Task title")
     description = models.TextField(blank=True, help_text="Detailed description of the task")
@@ -31,6 +257,39 @@ class Task(models.Model):
     created_at = models.DateTimeField(auto_now_add=True, help_text="When the task was created")
     updated_at = models.DateTimeField(auto_now=True, help_text="When the task was last updated")
 
+    class Meta:
+        """Model metadata."""
+
+        abstract = True
+
+    def __str__(self) -> str:
+        """Return string representation."""
+        return f"{self.title} ({self.get_status_display()})"
+
+    @property
+    def is_overdue(self) -> bool:
+        """Check if task is overdue."""
+        if self.due_date and self.status != self.Status.COMPLETED:
+            return timezone.now() > self.due_date
+        return False
+
+
+class Task(AbstractTask):
+    """Example Task model demonstrating Django ORM patterns."""
+
+    # Statuses each status may be entered from. TaskQuerySet.transition()
+    # enforces this in SQL unless forced; e.g. completed tasks are not reopened.
+    TRANSITIONS: dict[str, frozenset[str]] = {
+        TaskStatus.PENDING: frozenset({TaskStatus.IN_PROGRESS, TaskStatus.CANCELLED}),
+        TaskStatus.IN_PROGRESS: frozenset({TaskStatus.PENDING}),
+        TaskStatus.COMPLETED: frozenset({TaskStatus.PENDING, TaskStatus.IN_PROGRESS}),
+        TaskStatus.CANCELLED: frozenset({TaskStatus.PENDING, TaskStatus.IN_PROGRESS}),
+    }
+    # Statuses whose tasks ``manage.py archive_tasks`` moves to TaskArchive.
+    ARCHIVABLE = frozenset({TaskStatus.COMPLETED, TaskStatus.CANCELLED})
+
+    objects = TaskQuerySet.as_manager()
+
     class Meta:
         """Model metadata."""
 
@@ -39,12 +298,91 @@ class Task(models.Model):
         verbose_name_plural = "Tasks"
         indexes = [
             models.Index(fields=["status", "-created_at"]),
-            models.Index(fields=["-priority"]),
+            # Serves the default ordering plus the keyset (and admin -pk)
+            # tiebreaker, in either direction.
+            models.Index(fields=["-priority", "-created_at", "-id"]),
+            # ?ordering=due_date / -due_date pages.
+            models.Index(fields=["due_date", "id"]),
+            # Overdue lists only ever look at open tasks: most overdue first,
+            # and in the default ordering (walked until a page of overdue
+            # rows is found, rather than sorting every overdue task).
+            models.Index(
+                fields=["due_date", "id"],
+                condition=~models.Q(status="COMPLETED"),
+                name="core_task_open_due_date_idx",
+            ),
+            models.Index(
+                fields=["-priority", "-created_at", "-id"],
+                condition=~models.Q(status="COMPLETED"),
+                name="core_task_open_priority_idx",
+            ),
         ]
 
-    def __str__(self) -> str:
-        """Return string representation."""
-        return f"{self.title} ({self.get_status_display()})"
+    def save(
+        self,
+        *,
+        force_insert: Any = False,
+        force_update: bool = False,
+        using: str | None = None,
+        update_fields: Iterable[str] | None = None,
+    ) -> None:
+        """Save the task and its counter adjustment in one transaction.
+
+        The status being overwritten is read from the row, locked until
+        commit, rather than from the instance: another writer may have moved
+        the task since it was loaded.
+        """
+        using = using or router.db_for_write(type(self), instance=self)
+        writes_status = "status" in self.__dict__ and (
+            update_fields is None or "status" in update_fields
+        )
+        adding = self._state.adding
+        with transaction.atomic(using=using, savepoint=False):
+            previous = None
+            if self.pk is not None and (adding or writes_status):
+                previous = self._locked_status(using)
+            inserted = previous is None and (adding or writes_status)
+            super().save(
+                force_insert=force_insert,
+                force_update=force_update,
+                using=using,
+                update_fields=update_fields,
+            )
+            bump_task_version(using)
+            invalidate_task_objects(using, self.pk)
+            deltas: Counter[str] = Counter()
+            if inserted:
+                deltas[self.status] += 1
+            elif previous is not None and writes_status and previous != self.status:
+                deltas[previous] -= 1
+                deltas[self.status] += 1
+            TaskCounter.objects.db_manager(using).adjust(deltas)
+
+    def delete(
+        self, using: str | None = None, keep_parents: bool = False
+    ) -> tuple[int, dict[str, int]]:
+        """Delete the task and remove it from the counters."""
+        using = using or router.db_for_write(type(self), instance=self)
+        pk = self.pk
+        with transaction.atomic(using=using, savepoint=False):
+            status = self._locked_status(using)
+            result = super().delete(using=using, keep_parents=keep_parents)
+            bump_task_version(using)
+            invalidate_task_objects(using, pk)
+            if status is not None and result[1].get(self._meta.label):
+                TaskCounter.objects.db_manager(using).adjust({status: -1})
+        return result
+
+    def _locked_status(self, using: str) -> str | None:
+        """Return the stored status, locking the row, or None if there is no row."""
+        return (
+            type(self)
+            ._base_manager.using(using)
+            .select_for_update()
+            .filter(pk=self.pk)
+            .values_list("status", flat=True)
+            .first()
+        )
 
     def mark_completed(self) -> None:
         """Mark the task as completed."""
@@ -57,9 +395,200 @@ class Task(models.Model):
         self.status = self.Status.IN_PROGRESS
         self.save(update_fields=["status", "updated_at"])
 
-    @property
-    def is_overdue(self) -> bool:
-        """Check if task is overdue."""
-        if self.due_date and self.status != self.Status.COMPLETED:
-            return timezone.now() > self.due_date
-        return False
+
+class TaskSearchIndex(models.Model):
+    """Row of the SQLite FTS5 table that indexes task text.
+
+    The table is created and kept in sync by migration 0004 (it does not
+    exist on other databases); the model only lets the ORM join to it.
+    """
+
+    task = models.OneToOneField(
+        Task,
+        on_delete=models.DO_NOTHING,
+        primary_key=True,
+        db_column="rowid",
+        db_constraint=False,
+        related_name="search_index",
+    )
+
+    class Meta:
+        """Model metadata."""
+
+        managed = False
+        db_table = "core_task_fts"
+
+    def __str__(self) -> str:
+        """Return string representation."""
+        return f"Search index entry for task {self.pk}"
+
+
+class TaskCounterManager(models.Manager["TaskCounter"]):
+    """Manager implementing counter maintenance for TaskCounter."""
+
+    def adjust(self, deltas: Mapping[str, int]) -> None:
+        """Apply signed deltas to the per-status counters."""
+        now = timezone.now()
+        for key, delta in deltas.items():
+            if not delta:
+                continue
+            updated = self.filter(key=key).update(value=F("value") + delta, updated_at=now)
+            if not updated:
+                self.create(key=key, value=delta)
+
+    def rebuild(self) -> dict[str, int]:
+        """Recompute every counter from the task table and return the new values.
+
+        The counter rows are locked before the tasks are counted. Writers
+        adjust those rows in their own transactions, so each one either
+        committed before the count or waits and applies its delta on top of
+        the rebuilt values; none is overwritten.
+        """
+        keys = [*Task.Status.values, TaskCounter.OVERDUE]
+        with transaction.atomic(using=self.db):
+            self.bulk_create([TaskCounter(key=key) for key in keys], ignore_conflicts=True)
+            list(self.select_for_update().values_list("key", flat=True))
+            values = dict.fromkeys(Task.Status.values, 0)
+            values.update(Task.objects.using(self.db).status_counts())
+            values[TaskCounter.OVERDUE] = Task.objects.using(self.db).overdue().count()
+            self.exclude(key__in=values).delete()
+            for key, value in values.items():
+                self.update_or_create(key=key, defaults={"value": value})
+        return values
+
+    def snapshot(self) -> dict[str, int]:
+        """Return all counters, refreshing the overdue total once it goes stale."""
+        counters = {counter.key: counter for counter in self.all()}
+        values = self._values(counters)
+        if self._overdue_stale(counters):
+            values[TaskCounter.OVERDUE] = Task.objects.using(self.db).overdue().count()
+            self.update_or_create(
+                key=TaskCounter.OVERDUE, defaults={"value": values[TaskCounter.OVERDUE]}
+            )
+        return values
+
+    async def asnapshot(self) -> dict[str, int]:
+        """Async version of ``snapshot()``."""
+        counters = {counter.key: counter async for counter in self.all()}
+        values = self._values(counters)
+        if self._overdue_stale(counters):
+            values[TaskCounter.OVERDUE] = await Task.objects.using(self.db).overdue().acount()
+            await self.aupdate_or_create(
+                key=TaskCounter.OVERDUE, defaults={"value": values[TaskCounter.OVERDUE]}
+            )
+        return values
+
+    @staticmethod
+    def _values(counters: Mapping[str, TaskCounter]) -> dict[str, int]:
+        """Return the counter values with every status present."""
+        values = dict.fromkeys(Task.Status.values, 0)
+        values.update({key: counter.value for key, counter in counters.items()})
+        return values
+
+    @staticmethod
+    def _overdue_stale(counters: Mapping[str, TaskCounter]) -> bool:
+        """Return whether the overdue total must be recomputed."""
+        # Tasks become overdue as time passes, not when they are written, so the
+        # overdue counter is recomputed on read once it is older than the TTL.
+        overdue = counters.get(TaskCounter.OVERDUE)
+        ttl = datetime.timedelta(seconds=settings.TASK_COUNTERS_OVERDUE_TTL)
+        return overdue is None or overdue.updated_at < timezone.now() - ttl
+
+
+class TaskCounter(models.Model):
+    """Denormalized task totals per status, plus the overdue total."""
+
+    OVERDUE = "OVERDUE"
+
+    key = models.CharField(max_length=20, primary_key=True, help_text="Task status or OVERDUE")
+    value = models.BigIntegerField(default=0, help_text="Number of tasks")
+    updated_at = models.DateTimeField(auto_now=True, help_text="When the counter last changed")
+
+    objects = TaskCounterManager()
+
+    class Meta:
+        """Model metadata."""
+
+        verbose_name = "Task counter"
+        verbose_name_plural = "Task counters"
+
+    def __str__(self) -> str:
+        """Return string representation."""
+        return f"{self.key}: {self.value}"
+
+
+class TaskImport(models.Model):
+    """Progress of a bulk task import (``manage.py import_tasks``).
+
+    The row is updated in the same transaction as each imported batch, so a
+    resumed import continues exactly after the last committed record.
+    """
+
+    source = models.CharField(max_length=500, unique=True, help_text="Absolute path of the file")
+    fingerprint = models.CharField(max_length=64, help_text="Hash of the start of the file")
+    records = models.BigIntegerField(default=0, help_text="Records read and committed")
+    imported = models.BigIntegerField(default=0, help_text="Tasks created")
+    rejected = models.BigIntegerField(default=0, help_text="Records that failed validation")
+    started_at = models.DateTimeField(auto_now_add=True, help_text="When the import started")
+    updated_at = models.DateTimeField(auto_now=True, help_text="When the last batch committed")
+    finished_at = models.DateTimeField(
+        null=True, blank=True, help_text="When the whole file was imported"
+    )
+
+    class Meta:
+        """Model metadata."""
+
+        verbose_name = "Task import"
+        verbose_name_plural = "Task imports"
+
+    def __str__(self) -> str:
+        """Return string representation."""
+        return f"{self.source}: {self.records} records"
+
+
+class TaskArchive(AbstractTask):
+    """A finished task moved out of the task table by ``manage.py archive_tasks``.
+
+    Keeping old completed and cancelled tasks here keeps the task table, and
+    its indexes, small enough for the hot rows to stay in memory. Archived
+    tasks keep their id and timestamps; they are read-only.
+    """
+
+    id = models.BigIntegerField(primary_key=True, help_text="Id the task had while active")
+    created_at = models.DateTimeField(help_text="When the task was created")
+    updated_at = models.DateTimeField(help_text="When the task was last updated")
+    archived_at = models.DateTimeField(help_text="When the task was archived")
+
+    class Meta:
+        """Model metadata."""
+
+        ordering = ["-priority", "-created_at"]
+        verbose_name = "Archived task"
+        verbose_name_plural = "Archived tasks"
+        indexes = [
+            # Lets ?include_archived=1 lists merge both tables in the default
+            # order instead of sorting the whole archive.
+            models.Index(fields=["-priority", "-created_at", "-id"]),
+            models.Index(fields=["archived_at"]),
+        ]
+
+
+class TaskWithArchived(AbstractTask):
+    """Read-only row of ``core_task_with_archived``, active and archived tasks together.
+
+    The view (``UNION ALL`` of ``core_task`` and ``core_taskarchive``) is
+    created by migration 0007 and, since it blocks the table rebuilds of
+    schema migrations, dropped before and re-created after every ``migrate``
+    (see ``apps.core.archive``).
+    """
+
+    id = models.BigIntegerField(primary_key=True)
+    created_at = models.DateTimeField(help_text="When the task was created")
+    updated_at = models.DateTimeField(help_text="When the task was last updated")
+
+    class Meta:
+        """Model metadata."""
+
+        managed = False
+        db_table = "core_task_with_archived"
+        ordering = ["-priority", "-created_at"]
@@ -0,0 +1,359 @@
+"""Pagination shared by the HTML views, the admin and the API.
+
+Keyset (seek) pagination avoids counting altogether; ``EstimatedCountPaginator``
+keeps page numbers but takes large counts from the planner statistics.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.paginator import EmptyPage, Page, Paginator
+from django.db import connections, models
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.models import Q, QuerySet
+from django.db.models.expressions import Col
+from django.db.models.lookups import Exact, In
+from django.utils.functional import cached_property
+
+# Appended to every ordering so that rows with equal sort keys still have a
+# strict, stable order and a cursor always identifies exactly one position.
+TIEBREAKER = "id"
+
+
+class InvalidCursor(ValueError):
+    """Raised when a cursor token cannot be decoded for the current ordering."""
+
+
+@dataclass(frozen=True)
+class SortKey:
+    """One column of a composite ordering."""
+
+    name: str
+    descending: bool
+    nullable: bool
+
+    def reversed(self) -> SortKey:
+        """Return the same column walked in the opposite direction."""
+        return SortKey(self.name, not self.descending, self.nullable)
+
+    @property
+    def order_by(self) -> str:
+        """Return the ``order_by()`` argument for this column."""
+        return f"-{self.name}" if self.descending else self.name
+
+
+@dataclass
+class KeysetPage:
+    """A page of rows plus the cursors that lead to its neighbours."""
+
+    object_list: list[Any]
+    next_cursor: str | None = None
+    previous_cursor: str | None = None
+
+    def __iter__(self) -> Any:
+        """Iterate over the rows of the page."""
+        return iter(self.object_list)
+
+    def __len__(self) -> int:
+        """Return the number of rows on the page."""
+        return len(self.object_list)
+
+    def has_next(self) -> bool:
+        """Return whether a following page exists."""
+        return self.next_cursor is not None
+
+    def has_previous(self) -> bool:
+        """Return whether a preceding page exists."""
+        return self.previous_cursor is not None
+
+    def has_other_pages(self) -> bool:
+        """Return whether there is more than this one page."""
+        return self.has_next() or self.has_previous()
+
+
+class KeysetPaginator:
+    """Paginate a queryset by seeking past the last row of the previous page.
+
+    Sort keys may be model fields or annotations on the queryset (such as a
+    search rank); annotations are treated as non-null.
+
+    Each page is fetched with ``WHERE (sort keys) > (cursor values) ORDER BY
+    sort keys LIMIT page_size + 1``, so with a matching composite index the
+    cost of a page does not depend on how deep into the result set it is. No
+    ``COUNT(*)`` is issued.
+    """
+
+    def __init__(self, model: type[models.Model], ordering: Sequence[str], page_size: int) -> None:
+        """Build the sort keys for ``ordering`` with the id tiebreaker appended."""
+        self.model = model
+        self.page_size = page_size
+        self.keys = self._sort_keys(ordering)
+
+    def _sort_keys(self, ordering: Sequence[str]) -> tuple[SortKey, ...]:
+        """Translate ``order_by()`` style strings into sort keys."""
+        keys: list[SortKey] = []
+        for term in ordering:
+            name = term.lstrip("-")
+            if name == "pk":
+                name = TIEBREAKER
+            if any(key.name == name for key in keys):
+                continue
+            model_field = self._field(name)
+            nullable = model_field.null if model_field is not None else False
+            keys.append(SortKey(name, term.startswith("-"), nullable))
+        if not any(key.name == TIEBREAKER for key in keys):
+            # Break ties in the direction of the last column, so one index
+            # (e.g. -priority, -created_at, -id) serves the whole ORDER BY.
+            descending = keys[-1].descending if keys else False
+            keys.append(SortKey(TIEBREAKER, descending, False))
+        return tuple(keys)
+
+    @property
+    def signature(self) -> str:
+        """Return the ordering a cursor was minted for."""
+        return ",".join(key.order_by for key in self.keys)
+
+    def paginate(self, queryset: QuerySet[Any], cursor: str | None) -> KeysetPage:
+        """Return the page addressed by ``cursor`` (the first page when empty)."""
+        position = self.decode_cursor(cursor) if cursor else None
+        rows = list(self.page_queryset(queryset, position))
+        return self.build_page(rows, position)
+
+    def page_queryset(
+        self, queryset: QuerySet[Any], position: tuple[list[Any], bool] | None
+    ) -> QuerySet[Any]:
+        """Return the ordered, filtered and sliced queryset for one page."""
+        reverse = position[1] if position else False
+        keys = [key.reversed() for key in self.keys] if reverse else list(self.keys)
+        queryset = queryset.order_by(*(key.order_by for key in keys))
+        if position is not None:
+            nulls_largest = connections[queryset.db].features.nulls_order_largest
+            queryset = queryset.filter(self._seek(keys, position[0], nulls_largest))
+        return queryset[: self.page_size + 1]
+
+    def build_page(self, rows: list[Any], position: tuple[list[Any], bool] | None) -> KeysetPage:
+        """Trim the look-ahead row and mint cursors for the neighbouring pages."""
+        reverse = position[1] if position else False
+        has_more = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+        if reverse:
+            rows.reverse()
+        page = KeysetPage(rows)
+        if not rows:
+            return page
+        if reverse:
+            # Walking backwards: the cursor was minted from a row after this page.
+            page.next_cursor = self.encode_cursor(rows[-1])
+            if has_more:
+                page.previous_cursor = self.encode_cursor(rows[0], reverse=True)
+        else:
+            if has_more:
+                page.next_cursor = self.encode_cursor(rows[-1])
+            if position is not None:
+                page.previous_cursor = self.encode_cursor(rows[0], reverse=True)
+        return page
+
+    def _seek(self, keys: Sequence[SortKey], values: Sequence[Any], nulls_largest: bool) -> Q:
+        """Build ``(k1, k2, ...) > (v1, v2, ...)`` as an expanded OR of ANDs."""
+        predicate = Q(pk__in=[])
+        equal = Q()
+        for key, value in zip(keys, values, strict=True):
+            predicate |= equal & self._after(key, value, nulls_largest)
+            equal &= Q(**{f"{key.name}__isnull": True}) if value is None else Q(**{key.name: value})
+        return predicate
+
+    @staticmethod
+    def _after(key: SortKey, value: Any, nulls_largest: bool) -> Q:
+        """Return rows strictly after ``value`` in ``key``'s walk direction."""
+        # Backends disagree on where NULL sorts; follow the backend's own rule
+        # so the ORDER BY stays index-friendly and the predicate matches it.
+        nulls_at_end = nulls_largest != key.descending
+        if value is None:
+            return Q(**{f"{key.name}__isnull": False}) if not nulls_at_end else Q(pk__in=[])
+        lookup = "lt" if key.descending else "gt"
+        after = Q(**{f"{key.name}__{lookup}": value})
+        if key.nullable and nulls_at_end:
+            after |= Q(**{f"{key.name}__isnull": True})
+        return after
+
+    def encode_cursor(self, row: Any, reverse: bool = False) -> str:
+        """Return an opaque token for the position of ``row``."""
+        values = [self._value(row, key.name) for key in self.keys]
+        payload = {"o": self.signature, "v": values, "r": int(reverse)}
+        raw = json.dumps(payload, separators=(",", ":"), default=str).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    def decode_cursor(self, cursor: str) -> tuple[list[Any], bool]:
+        """Decode a token into sort key values and the walk direction."""
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            payload = json.loads(raw)
+            if payload["o"] != self.signature or len(payload["v"]) != len(self.keys):
+                raise InvalidCursor("Cursor does not match the requested ordering.")
+            values = [
+                self._to_python(key.name, value)
+                for key, value in zip(self.keys, payload["v"], strict=True)
+            ]
+            return values, bool(payload["r"])
+        except InvalidCursor:
+            raise
+        except (binascii.Error, ValueError, KeyError, TypeError, ValidationError) as exc:
+            raise InvalidCursor("Invalid cursor.") from exc
+
+    def _field(self, name: str) -> models.Field[Any, Any] | None:
+        """Return the model field for ``name``, or None for an annotation."""
+        try:
+            return self.model._meta.get_field(name)  # type: ignore[return-value]
+        except FieldDoesNotExist:
+            return None
+
+    def _to_python(self, name: str, value: Any) -> Any:
+        """Restore a decoded cursor value to the type of its column."""
+        model_field = self._field(name)
+        if value is None or model_field is None:
+            return value
+        return model_field.to_python(value)
+
+    @staticmethod
+    def _value(row: Any, name: str) -> Any:
+        """Read a sort key from a model instance or a ``.values()`` dict."""
+        if isinstance(row, dict):
+            return row[name]
+        return getattr(row, name)
+
+
+def estimate_count(queryset: QuerySet[Any]) -> int | None:
+    """Return the planner's estimate of ``queryset.count()``, or None if there is none.
+
+    PostgreSQL answers from ``pg_class.reltuples`` (unfiltered) or the row
+    estimate of ``EXPLAIN`` (filtered). SQLite answers from ``sqlite_stat1``,
+    which ``ANALYZE`` fills: the table size, narrowed by the rows per key of
+    an index for equality filters on its leading column. Other filters, and
+    other databases, have no estimate.
+    """
+    connection = connections[queryset.db]
+    query = queryset.query
+    if query.is_sliced or query.distinct or query.combinator or query.group_by is not None:
+        return None
+    if connection.vendor == "postgresql":
+        return _postgresql_estimate(queryset, connection)
+    if connection.vendor == "sqlite":
+        return _sqlite_estimate(queryset, connection)
+    return None
+
+
+def _postgresql_estimate(queryset: QuerySet[Any], connection: BaseDatabaseWrapper) -> int | None:
+    """Estimate from ``reltuples`` or the top node of the ``EXPLAIN`` plan."""
+    with connection.cursor() as cursor:
+        if not queryset.query.where:
+            cursor.execute(
+                # Views (relkind "v") have no row estimate of their own.
+                "SELECT reltuples::bigint FROM pg_class "
+                "WHERE oid = %s::regclass AND relkind IN ('r', 'p')",
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+            # -1 until the table has been vacuumed or analyzed.
+            return int(row[0]) if row and row[0] >= 0 else None
+        sql, params = queryset.order_by().values("pk").query.sql_with_params()
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def _sqlite_estimate(queryset: QuerySet[Any], connection: BaseDatabaseWrapper) -> int | None:
+    """Estimate from ``sqlite_stat1`` for unfiltered or indexed equality queries."""
+    table = queryset.model._meta.db_table
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'")
+        if cursor.fetchone() is None:
+            return None
+        # One row per analyzed index: "<rows> <rows per key of column 1> ...",
+        # joined to the index's leading column. Partial indexes only count
+        # the rows they cover, so they are left out.
+        cursor.execute(
+            "SELECT stat.stat, info.name FROM sqlite_stat1 stat "
+            "LEFT JOIN pragma_index_list(stat.tbl) list ON list.name = stat.idx "
+            "LEFT JOIN pragma_index_info(stat.idx) info ON info.seqno = 0 "
+            "WHERE stat.tbl = %s AND NOT coalesce(list.partial, 0)",
+            [table],
+        )
+        rows = cursor.fetchall()
+    if not rows:
+        return None
+    total = int(rows[0][0].split()[0])
+    rows_per_key = {
+        column: int(stat.split()[1]) for stat, column in rows if column and len(stat.split()) > 1
+    }
+    where = queryset.query.where
+    if not where:
+        return total
+    if where.connector != "AND" or where.negated:
+        return None
+    pk_column = queryset.model._meta.pk.column
+    estimate = total
+    for child in where.children:
+        if not isinstance(child, Exact | In) or not isinstance(child.lhs, Col):
+            return None
+        if child.lhs.alias != table or hasattr(child.rhs, "resolve_expression"):
+            return None
+        column = child.lhs.target.column
+        per_key = 1 if column == pk_column else rows_per_key.get(column)
+        if per_key is None:
+            return None
+        keys = len(child.rhs) if isinstance(child, In) else 1
+        # Filters may be correlated, so take the most selective one alone.
+        estimate = min(estimate, per_key * keys)
+    return estimate
+
+
+class EstimatedCountPaginator(Paginator):
+    """Page-number paginator that uses planner estimates for large counts.
+
+    The exact ``COUNT(*)`` is only run when the estimate is below
+    ``COUNT_ESTIMATE_THRESHOLD`` (or there is no estimate), which keeps
+    small tables and selective filters exact. ``count_is_estimate`` tells
+    whether ``count`` is approximate; pages past an estimated end are still
+    served, empty if there are no more rows.
+    """
+
+    count_is_estimate = False
+
+    @cached_property
+    def count(self) -> int:
+        """Return the (possibly estimated) number of objects."""
+        threshold = settings.COUNT_ESTIMATE_THRESHOLD
+        if threshold and isinstance(self.object_list, QuerySet):
+            estimate = estimate_count(self.object_list)
+            if estimate is not None and estimate >= threshold:
+                self.count_is_estimate = True
+                return estimate
+        count: int = super().count
+        return count
+
+    def validate_number(self, number: Any) -> int:
+        """Accept page numbers past an estimated last page."""
+        try:
+            return super().validate_number(number)
+        except EmptyPage:
+            if self.count_is_estimate and int(number) > 1:
+                return int(number)
+            raise
+
+    def page(self, number: Any) -> Page:
+        """Return a page, without clamping it to an estimated count."""
+        number = self.validate_number(number)
+        if not self.count_is_estimate:
+            return super().page(number)
+        bottom = (number - 1) * self.per_page
+        return self._get_page(self.object_list[bottom : bottom + self.per_page], number, self)
@@ -0,0 +1,318 @@
+"""Read replicas: a database router and the per-request state it routes by.
+
+Replicas are configured with ``DATABASE_REPLICA_URLS``; settings turn each
+URL into a ``replica_<n>`` alias with a weight in ``DATABASE_REPLICAS``.
+Reads only go to a replica inside a *replica scope*:
+
+* ``apps.core.middleware.ReplicaMiddleware`` opens one for GET and HEAD requests to views marked
+  with ``@reads_from_replicas`` (the task API, the task list and the home
+  page, which reads ``TaskSelector``);
+* ``replica_reads()`` opens one around any other block of code.
+
+Everything else, and every write, uses the primary. Within a scope:
+
+* one replica is chosen per scope (so a request's queries see one
+  consistent snapshot), by smooth weighted round-robin over the replicas
+  whose last health check passed. Each process checks a replica at most
+  every ``DATABASE_REPLICA_CHECK_INTERVAL`` seconds; a replica that cannot
+  be reached, or (on PostgreSQL) lags more than
+  ``DATABASE_REPLICA_MAX_LAG`` seconds, is left out until a check passes.
+  One thread of the process checks at a time; the others go by the last
+  result meanwhile;
+* a GET or HEAD whose replica fails mid-request (``OperationalError``)
+  is served again from the primary, and the replica is left out until its
+  next check;
+* reads go to the primary once the scope has written, inside a transaction
+  on the primary, or when the client is *pinned*.
+
+A client is pinned for ``DATABASE_REPLICA_PIN_SECONDS`` after each
+successful unsafe request (POST, PUT, PATCH, DELETE), so it reads its own
+writes while the replicas catch up. The middleware sets a ``db_pin`` cookie
+and an ``X-DB-Pin`` response header holding the pin's expiry; clients
+without cookies send the header back to stay pinned.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, OperationalError, connections, router
+from django.db.models import Model
+from django.http import HttpRequest, HttpResponseBase
+
+PIN_COOKIE = "db_pin"
+PIN_HEADER = "X-DB-Pin"
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# Apps whose models are read from replicas; sessions, users and the admin's
+# own tables always come from the primary.
+REPLICA_APPS = frozenset({"core"})
+
+
+@dataclass
+class ReadScope:
+    """Where the reads of one request (or ``replica_reads()`` block) go."""
+
+    replicas: bool = False
+    pinned: bool = False
+    replica: str | None = None
+    view: Callable[[], Any] | None = None
+
+
+_scope: ContextVar[ReadScope | None] = ContextVar("read_scope", default=None)
+
+
+def replicas_configured() -> bool:
+    """Return whether any read replica is configured."""
+    return bool(settings.DATABASE_REPLICAS)
+
+
+def reads_pinned() -> bool:
+    """Return whether this request must read its own writes from the primary.
+
+    Pinned requests also bypass the task caches, which replica reads fill.
+    """
+    scope = _scope.get()
+    return scope is not None and scope.pinned
+
+
+def is_replica(alias: str) -> bool:
+    """Return whether ``alias`` is a read replica."""
+    return alias in settings.DATABASE_REPLICAS
+
+
+@contextmanager
+def replica_reads() -> Iterator[ReadScope]:
+    """Let the reads of the block go to a replica, unless the caller is pinned."""
+    outer = _scope.get()
+    scope = ReadScope(replicas=True, pinned=outer is not None and outer.pinned)
+    token = _scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _scope.reset(token)
+
+
+def reads_from_replicas[V](view: V) -> V:
+    """Mark a view (function or class) whose GET and HEAD requests may read replicas."""
+    view.replica_reads = True  # type: ignore[attr-defined]
+    return view
+
+
+def start(request: HttpRequest) -> Token[ReadScope | None]:
+    """Open the request's read scope, pinned if the request carries a live pin."""
+    return _scope.set(ReadScope(pinned=_has_pin(request)))
+
+
+def finish(token: Token[ReadScope | None]) -> None:
+    """Close the read scope ``start()`` opened."""
+    _scope.reset(token)
+
+
+def allow_replica_reads(
+    request: HttpRequest,
+    view_func: Callable[..., Any],
+    view_args: tuple[Any, ...],
+    view_kwargs: dict[str, Any],
+) -> None:
+    """Let the request read replicas if it is a GET or HEAD to a marked view."""
+    scope = _scope.get()
+    if scope is None or request.method not in ("GET", "HEAD"):
+        return
+    view_class = getattr(view_func, "cls", None) or getattr(view_func, "view_class", None)
+    if getattr(view_func, "replica_reads", False) or getattr(view_class, "replica_reads", False):
+        scope.replicas = True
+        scope.view = partial(view_func, request, *view_args, **view_kwargs)
+
+
+def fail_over(exception: BaseException) -> Callable[[], Any] | None:
+    """Take the scope's replica out after ``exception`` and return the view to call again.
+
+    Returns None unless the exception is an ``OperationalError`` raised
+    while the scope read a replica and had not written; the view then reads
+    the primary for the rest of the request.
+    """
+    scope = _scope.get()
+    if (
+        scope is None
+        or scope.replica is None
+        or scope.pinned
+        or not isinstance(exception, OperationalError)
+    ):
+        return None
+    for candidate in router.routers:
+        if isinstance(candidate, ReplicaRouter):
+            candidate.pool.mark_down(scope.replica)
+    scope.replicas = False
+    scope.replica = None
+    return scope.view
+
+
+def pin(request: HttpRequest, response: HttpResponseBase) -> HttpResponseBase:
+    """Pin the client to the primary after a successful unsafe request."""
+    if request.method in SAFE_METHODS or response.status_code >= 400:
+        return response
+    window = settings.DATABASE_REPLICA_PIN_SECONDS
+    expires = f"{time.time() + window:.3f}"
+    response[PIN_HEADER] = expires
+    response.set_cookie(PIN_COOKIE, expires, max_age=window, httponly=True, samesite="Lax")
+    return response
+
+
+def _has_pin(request: HttpRequest) -> bool:
+    """Return whether the request carries an unexpired pin (cookie or header)."""
+    now = time.time()
+    for value in (request.COOKIES.get(PIN_COOKIE), request.headers.get(PIN_HEADER)):
+        try:
+            expires = float(value or "")
+        except ValueError:
+            continue
+        # Pins are only ever issued for the window; ignore longer ones.
+        if now < expires <= now + settings.DATABASE_REPLICA_PIN_SECONDS:
+            return True
+    return False
+
+
+@dataclass
+class _Health:
+    """Last health check of one replica in this process."""
+
+    healthy: bool = True
+    checked_at: float = field(default=float("-inf"))
+
+
+class ReplicaPool:
+    """Weighted round-robin over the healthy replicas of ``weights``."""
+
+    def __init__(self, weights: dict[str, int]) -> None:
+        """Start with every replica presumed healthy."""
+        self.weights = {alias: weight for alias, weight in weights.items() if weight > 0}
+        self._current = dict.fromkeys(self.weights, 0)
+        self._health = {alias: _Health() for alias in self.weights}
+        self._lock = threading.Lock()
+        self._check_lock = threading.Lock()
+
+    def choose(self) -> str | None:
+        """Return the next healthy replica, or None when none is."""
+        healthy = [alias for alias in self.weights if self.healthy(alias)]
+        if not healthy:
+            return None
+        # Smooth weighted round-robin (as in nginx): every candidate gains
+        # its weight, the leader is picked and pays back the total, which
+        # interleaves the picks instead of sending them in runs.
+        with self._lock:
+            for alias in healthy:
+                self._current[alias] += self.weights[alias]
+            chosen = max(healthy, key=self._current.__getitem__)
+            self._current[chosen] -= sum(self.weights[alias] for alias in healthy)
+        return chosen
+
+    def healthy(self, alias: str) -> bool:
+        """Return the replica's health, checking it again once the last check is stale."""
+        health = self._health[alias]
+        if not self._stale(health):
+            return health.healthy
+        if _on_event_loop():
+            # No blocking I/O on the loop; a thread will check it soon enough.
+            return health.healthy
+        # One thread checks at a time; the others go by the last result.
+        if not self._check_lock.acquire(blocking=False):
+            return health.healthy
+        try:
+            health = self._health[alias]
+            if self._stale(health):
+                health = self._health[alias] = _Health(self.check(alias), time.monotonic())
+        finally:
+            self._check_lock.release()
+        return health.healthy
+
+    @staticmethod
+    def _stale(health: _Health) -> bool:
+        """Return whether ``health`` is older than the check interval."""
+        return time.monotonic() - health.checked_at >= settings.DATABASE_REPLICA_CHECK_INTERVAL
+
+    def mark_down(self, alias: str) -> None:
+        """Leave ``alias`` out until its next check, e.g. after a failed query."""
+        self._health[alias] = _Health(healthy=False, checked_at=time.monotonic())
+
+    @staticmethod
+    def check(alias: str) -> bool:
+        """Return whether ``alias`` answers and, on PostgreSQL, is not lagging too far."""
+        connection = connections[alias]
+        try:
+            with connection.cursor() as cursor:
+                if connection.vendor == "postgresql":
+                    # Replay lag; 0 when everything received has been replayed
+                    # (an idle primary would otherwise look like a lagging replica).
+                    cursor.execute(
+                        "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() "
+                        "THEN 0 ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) "
+                        "END"
+                    )
+                    lag = cursor.fetchone()[0]
+                    return lag is None or lag <= settings.DATABASE_REPLICA_MAX_LAG
+                cursor.execute("SELECT 1")
+                return True
+        except DatabaseError:
+            connection.close_if_unusable_or_obsolete()
+            return False
+
+
+def _on_event_loop() -> bool:
+    """Return whether this thread is running an asyncio event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+class ReplicaRouter:
+    """Send reads inside a replica scope to a replica, everything else to the primary."""
+
+    def __init__(self) -> None:
+        """Build the pool from ``DATABASE_REPLICAS``."""
+        self.pool = ReplicaPool(dict(settings.DATABASE_REPLICAS))
+
+    def db_for_read(self, model: type[Model], **hints: Any) -> str | None:
+        """Return the scope's replica for replicated models, if the scope allows one."""
+        scope = _scope.get()
+        if scope is None or not scope.replicas or scope.pinned:
+            return None
+        if model._meta.app_label not in REPLICA_APPS:
+            return None
+        instance = hints.get("instance")
+        if instance is not None and instance._state.db:
+            return str(instance._state.db)
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return None
+        if scope.replica is None:
+            scope.replica = self.pool.choose()
+        return scope.replica
+
+    def db_for_write(self, model: type[Model], **hints: Any) -> str:
+        """Write to the primary, and read from it for the rest of the scope."""
+        scope = _scope.get()
+        if scope is not None:
+            scope.pinned = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1: Model, obj2: Model, **hints: Any) -> bool | None:
+        """Allow relations between objects read from the primary and its replicas."""
+        databases = {DEFAULT_DB_ALIAS, *settings.DATABASE_REPLICAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db: str, app_label: str, **hints: Any) -> bool | None:
+        """Never migrate a replica: it gets its schema from the primary."""
+        return False if is_replica(db) else None
@@ -0,0 +1,188 @@
+"""Full-text search backends for tasks.
+
+``get_task_search_backend()`` picks the backend for a database alias:
+
+* PostgreSQL: a stored, generated ``tsvector`` column (``search_vector``) with
+  a GIN index, ranked with ``ts_rank_cd``.
+* SQLite: an external-content FTS5 table (``core_task_fts``) kept in sync by
+  triggers, so saves, ``bulk_create`` and ``queryset.update`` are all covered,
+  ranked with ``bm25``.
+* Anything else (or a database that has not been migrated yet): the
+  ``icontains`` scan that ``SearchFilter`` used to do.
+
+Every backend splits the search term into words and requires all of them to
+match; the indexed backends match each word by prefix.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any
+
+from django.conf import settings
+from django.db import connections
+from django.db.models import BooleanField, FloatField, Q, QuerySet
+from django.db.models.expressions import RawSQL
+from django.utils.module_loading import import_string
+
+SEARCH_RANK = "search_rank"
+SQLITE_FTS_TABLE = "core_task_fts"
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+# Statements that keep the FTS5 index in step with core_task. They use
+# IF NOT EXISTS so they can be re-applied after SQLite rebuilds the table
+# (which drops its triggers) during a later schema migration.
+SQLITE_FTS_TRIGGERS = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {SQLITE_FTS_TABLE}_ai AFTER INSERT ON core_task BEGIN
+        INSERT INTO {SQLITE_FTS_TABLE}(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {SQLITE_FTS_TABLE}_ad AFTER DELETE ON core_task BEGIN
+        INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {SQLITE_FTS_TABLE}_au
+    AFTER UPDATE OF title, description ON core_task BEGIN
+        INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO {SQLITE_FTS_TABLE}(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+]
+
+
+def search_words(term: str) -> list[str]:
+    """Split a user supplied search term into plain words."""
+    return _WORD.findall(term)
+
+
+class TaskSearchBackend:
+    """Base search backend: case-insensitive substring match on each word."""
+
+    fields = ("title", "description")
+
+    def search(self, queryset: QuerySet[Any], term: str, rank: bool = False) -> QuerySet[Any]:
+        """Filter ``queryset`` to rows matching every word of ``term``.
+
+        With ``rank=True`` the rows are annotated with a ``search_rank`` score
+        (higher is better) that callers may order by.
+        """
+        words = search_words(term)
+        if not words:
+            return queryset.none()
+        for word in words:
+            condition = Q()
+            for field in self.fields:
+                condition |= Q(**{f"{field}__icontains": word})
+            queryset = queryset.filter(condition)
+        if rank:
+            queryset = queryset.annotate(
+                **{SEARCH_RANK: RawSQL("0", [], output_field=FloatField())}
+            )
+        return queryset
+
+
+class PostgresTaskSearchBackend(TaskSearchBackend):
+    """Search the GIN-indexed ``search_vector`` column on PostgreSQL."""
+
+    config = "english"
+
+    def search(self, queryset: QuerySet[Any], term: str, rank: bool = False) -> QuerySet[Any]:
+        """Match with ``@@`` against a prefix tsquery, ranked by ``ts_rank_cd``."""
+        words = search_words(term)
+        if not words:
+            return queryset.none()
+        tsquery = " & ".join(f"{word}:*" for word in words)
+        queryset = queryset.filter(
+            RawSQL(
+                f"search_vector @@ to_tsquery('{self.config}', %s)",
+                [tsquery],
+                output_field=BooleanField(),
+            )
+        )
+        if rank:
+            queryset = queryset.annotate(
+                **{
+                    SEARCH_RANK: RawSQL(
+                        f"ts_rank_cd(search_vector, to_tsquery('{self.config}', %s))",
+                        [tsquery],
+                        output_field=FloatField(),
+                    )
+                }
+            )
+        return queryset
+
+
+class SQLiteTaskSearchBackend(TaskSearchBackend):
+    """Search the trigger-maintained FTS5 shadow table on SQLite."""
+
+    def search(self, queryset: QuerySet[Any], term: str, rank: bool = False) -> QuerySet[Any]:
+        """Match with FTS5 ``MATCH`` on prefix terms, ranked by ``bm25``.
+
+        The FTS table is joined (through ``TaskSearchIndex``) rather than
+        queried in a subquery, so SQLite drives the query from the index and
+        ``bm25`` is computed once per match instead of once per task row.
+        """
+        words = search_words(term)
+        if not words:
+            return queryset.none()
+        match = " ".join('"{}"*'.format(word.replace('"', '""')) for word in words)
+        queryset = queryset.filter(search_index__isnull=False).filter(
+            RawSQL(f"{SQLITE_FTS_TABLE} MATCH %s", [match], output_field=BooleanField())
+        )
+        if rank:
+            # bm25() is lower-is-better; negate it so every backend ranks the
+            # same way. Title matches weigh ten times description matches.
+            queryset = queryset.annotate(
+                **{
+                    SEARCH_RANK: RawSQL(
+                        f"-bm25({SQLITE_FTS_TABLE}, 10.0, 1.0)", [], output_field=FloatField()
+                    )
+                }
+            )
+        return queryset
+
+
+_fts_installed: set[tuple[str, str]] = set()
+
+
+def _sqlite_fts_installed(alias: str) -> bool:
+    """Return whether the FTS5 shadow table exists on ``alias``."""
+    connection = connections[alias]
+    key = (alias, str(connection.settings_dict["NAME"]))
+    if key not in _fts_installed:
+        with connection.cursor() as cursor:
+            if SQLITE_FTS_TABLE not in connection.introspection.table_names(cursor):
+                return False
+        _fts_installed.add(key)
+    return True
+
+
+def get_task_search_backend(alias: str = "default") -> TaskSearchBackend:
+    """Return the search backend to use for the database ``alias``."""
+    if settings.TASK_SEARCH_BACKEND:
+        backend_class: type[TaskSearchBackend] = import_string(settings.TASK_SEARCH_BACKEND)
+        return backend_class()
+    vendor = connections[alias].vendor
+    if vendor == "postgresql":
+        return PostgresTaskSearchBackend()
+    if vendor == "sqlite" and _sqlite_fts_installed(alias):
+        return SQLiteTaskSearchBackend()
+    return TaskSearchBackend()
+
+
+def install_sqlite_fts_triggers(using: str = "default", **kwargs: Any) -> None:
+    """Recreate the FTS5 sync triggers if a table rebuild dropped them."""
+    connection = connections[using]
+    if connection.vendor != "sqlite" or not _sqlite_fts_installed(using):
+        return
+    with connection.cursor() as cursor:
+        for statement in SQLITE_FTS_TRIGGERS:
+            cursor.execute(statement)
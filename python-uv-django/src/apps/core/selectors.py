@@ -1,9 +1,11 @@
 """Query layer for core app."""
 
-from django.db.models import QuerySet
+from __future__ import annotations
+
+from django.db.models import Count, Q, QuerySet
 from django.utils import timezone
 
-from .models import Task
+from .models import Task, TaskCounter
 
 
 class TaskSelector:
@@ -22,6 +24,44 @@ class TaskSelector:
     @staticmethod
     def get_overdue_tasks() -> QuerySet[Task]:
         """Get overdue tasks."""
-        return Task.objects.filter(due_date__lt=timezone.now()).exclude(
-            status=Task.Status.COMPLETED
+        return Task.objects.overdue()
+
+    @staticmethod
+    def get_statistics(queryset: QuerySet[Task] | None = None) -> dict[str, int]:
+        """Get task totals per status plus the overdue total.
+
+        Without a queryset the maintained counters are read. A filtered queryset
+        is summarised with a single conditional aggregation query instead.
+        """
+        if queryset is None:
+            return TaskSelector._counter_statistics(TaskCounter.objects.snapshot())
+        return queryset.order_by().aggregate(**TaskSelector._statistics_aggregates())
+
+    @staticmethod
+    async def aget_statistics(queryset: QuerySet[Task] | None = None) -> dict[str, int]:
+        """Async version of ``get_statistics()``."""
+        if queryset is None:
+            return TaskSelector._counter_statistics(await TaskCounter.objects.asnapshot())
+        return await queryset.order_by().aaggregate(**TaskSelector._statistics_aggregates())
+
+    @staticmethod
+    def _counter_statistics(counters: dict[str, int]) -> dict[str, int]:
+        """Shape a counter snapshot like the aggregate statistics."""
+        by_status = {status.lower(): counters[status] for status in Task.Status.values}
+        return {
+            "total": sum(by_status.values()),
+            **by_status,
+            "overdue": counters[TaskCounter.OVERDUE],
+        }
+
+    @staticmethod
+    def _statistics_aggregates() -> dict[str, Count]:
+        """Return the conditional aggregates behind filtered statistics."""
+        aggregates = {"total": Count("pk")}
+        for status in Task.Status.values:
+            aggregates[status.lower()] = Count("pk", filter=Q(status=status))
+        aggregates["overdue"] = Count(
+            "pk",
+            filter=Q(due_date__lt=timezone.now()) & ~Q(status=Task.Status.COMPLETED),
         )
+        return aggregates
@@ -1,6 +1,23 @@
 """Business logic layer for core app."""
 
-from .models import Task
+from __future__ import annotations
+
+import datetime
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Task, TaskQuerySet
+
+if TYPE_CHECKING:
+    from .importer import ImportResult
+
+
+class InvalidTransition(ValueError):
+    """Raised when a task may not move from its current status to the requested one."""
 
 
 class TaskService:
@@ -16,13 +33,181 @@ class TaskService:
         )
 
     @staticmethod
-    def complete_task(task: Task) -> Task:
-        """Mark task as completed."""
-        task.mark_completed()
+    def transition_tasks(
+        tasks: TaskQuerySet | Iterable[Any], status: str, *, force: bool = False
+    ) -> list[Task]:
+        """Move ``tasks`` (a queryset or primary keys) to ``status`` with set-based UPDATEs.
+
+        Tasks whose current status does not allow the move are left alone
+        unless ``force`` is set. Returns the tasks that were updated.
+        """
+        if not isinstance(tasks, TaskQuerySet):
+            tasks = Task.objects.filter(pk__in=list(tasks))
+        return tasks.transition(status, force=force)
+
+    @staticmethod
+    async def atransition_tasks(
+        tasks: TaskQuerySet | Iterable[Any], status: str, *, force: bool = False
+    ) -> list[Task]:
+        """Async version of ``transition_tasks()``."""
+        if not isinstance(tasks, TaskQuerySet):
+            tasks = Task.objects.filter(pk__in=list(tasks))
+        return await tasks.atransition(status, force=force)
+
+    @staticmethod
+    def transition_task(
+        task: Task | Any,
+        status: str,
+        *,
+        force: bool = False,
+        queryset: TaskQuerySet | None = None,
+    ) -> Task:
+        """Move one task (an instance or a primary key) to ``status`` without reading it first.
+
+        A task already in ``status`` is returned unchanged. Only tasks in
+        ``queryset`` (by default, all tasks) can be moved. Raises
+        ``Task.DoesNotExist``, ``ValidationError`` for a malformed key, or
+        ``InvalidTransition``. A passed instance is updated in place.
+        """
+        pk = Task._meta.pk.to_python(task.pk if isinstance(task, Task) else task)
+        tasks = (Task.objects.all() if queryset is None else queryset).filter(pk=pk)
+        updated = tasks.transition(status, force=force)
+        result = updated[0] if updated else tasks.get()
+        return TaskService._transitioned(task, result, status)
+
+    @staticmethod
+    async def atransition_task(
+        task: Task | Any,
+        status: str,
+        *,
+        force: bool = False,
+        queryset: TaskQuerySet | None = None,
+    ) -> Task:
+        """Async version of ``transition_task()``."""
+        pk = Task._meta.pk.to_python(task.pk if isinstance(task, Task) else task)
+        tasks = (Task.objects.all() if queryset is None else queryset).filter(pk=pk)
+        updated = await tasks.atransition(status, force=force)
+        result = updated[0] if updated else await tasks.aget()
+        return TaskService._transitioned(task, result, status)
+
+    @staticmethod
+    def _transitioned(task: Task | Any, result: Task, status: str) -> Task:
+        """Return the outcome of ``transition_task()`` from the task as read or written."""
+        if result.status != status:
+            raise InvalidTransition(
+                f"Cannot move task {result.pk} from {result.status} to {status}."
+            )
+        if not isinstance(task, Task):
+            return result
+        for field in Task._meta.concrete_fields:
+            setattr(task, field.attname, getattr(result, field.attname))
         return task
 
     @staticmethod
-    def start_task(task: Task) -> Task:
+    def complete_task(task: Task | Any, queryset: TaskQuerySet | None = None) -> Task:
+        """Mark task as completed."""
+        return TaskService.transition_task(task, Task.Status.COMPLETED, queryset=queryset)
+
+    @staticmethod
+    def start_task(task: Task | Any, queryset: TaskQuerySet | None = None) -> Task:
         """Mark task as in progress."""
-        task.mark_in_progress()
-        return task
+        return TaskService.transition_task(task, Task.Status.IN_PROGRESS, queryset=queryset)
+
+    @staticmethod
+    async def acomplete_task(task: Task | Any, queryset: TaskQuerySet | None = None) -> Task:
+        """Async version of ``complete_task()``."""
+        return await TaskService.atransition_task(task, Task.Status.COMPLETED, queryset=queryset)
+
+    @staticmethod
+    async def astart_task(task: Task | Any, queryset: TaskQuerySet | None = None) -> Task:
+        """Async version of ``start_task()``."""
+        return await TaskService.atransition_task(task, Task.Status.IN_PROGRESS, queryset=queryset)
+
+    @staticmethod
+    def bulk_create_tasks(items: Iterable[Mapping[str, Any]]) -> list[Task]:
+        """Create tasks from validated field values with multi-row INSERTs."""
+        tasks = [Task(**item) for item in items]
+        with transaction.atomic():
+            return Task.objects.bulk_create(tasks)
+
+    @staticmethod
+    def import_tasks(
+        path: str | Path,
+        *,
+        fmt: str | None = None,
+        batch_size: int = 5000,
+        errors_path: str | Path | None = None,
+        restart: bool = False,
+        progress: Callable[[ImportResult], None] | None = None,
+    ) -> ImportResult:
+        """Stream tasks from a CSV or NDJSON file into the table, in validated batches.
+
+        Resumable and with an error sidecar file; see ``apps.core.importer``.
+        Raises ``TaskImportError`` when the file cannot be imported as asked.
+        """
+        from .importer import import_tasks
+
+        return import_tasks(
+            path,
+            fmt=fmt,
+            batch_size=batch_size,
+            errors_path=errors_path,
+            restart=restart,
+            progress=progress,
+        )
+
+    @staticmethod
+    def archive_tasks(
+        older_than: datetime.timedelta,
+        *,
+        batch_size: int = 1000,
+        pause: float = 0.1,
+        limit: int | None = None,
+        progress: Callable[[int], None] | None = None,
+    ) -> int:
+        """Move finished tasks not updated within ``older_than`` to the archive table.
+
+        Runs in short, throttled batches; see ``apps.core.archive``. Returns
+        the number of tasks archived.
+        """
+        from .archive import archive_tasks
+
+        return archive_tasks(
+            older_than, batch_size=batch_size, pause=pause, limit=limit, progress=progress
+        )
+
+    @staticmethod
+    def bulk_update_tasks(
+        tasks: Sequence[Task], changes: Sequence[Mapping[str, Any]]
+    ) -> list[Task]:
+        """Apply ``changes[i]`` to ``tasks[i]`` and write them with one ``bulk_update``.
+
+        A status change sets or clears ``completed_at`` as ``transition()`` does.
+        """
+        now = timezone.now()
+        fields = {"updated_at"}
+        for task, change in zip(tasks, changes, strict=True):
+            previous = task.status
+            for name, value in change.items():
+                setattr(task, name, value)
+            fields.update(change)
+            if "status" in change:
+                fields.add("completed_at")
+                if task.status != Task.Status.COMPLETED:
+                    task.completed_at = None
+                elif previous != Task.Status.COMPLETED:
+                    task.completed_at = now
+            task.updated_at = now
+        with transaction.atomic():
+            Task.objects.bulk_update(tasks, sorted(fields))
+        return list(tasks)
+
+    @staticmethod
+    def bulk_complete_tasks(queryset: TaskQuerySet) -> int:
+        """Mark the tasks in ``queryset`` that may be completed as completed."""
+        return len(TaskService.transition_tasks(queryset, Task.Status.COMPLETED))
+
+    @staticmethod
+    def bulk_start_tasks(queryset: TaskQuerySet) -> int:
+        """Mark the tasks in ``queryset`` that may be started as in progress."""
+        return len(TaskService.transition_tasks(queryset, Task.Status.IN_PROGRESS))
@@ -0,0 +1,167 @@
+"""Per-request accounting of database, cache and serializer time.
+
+``TimingMiddleware`` opens a ``RequestTimings`` for every request in a
+context variable, so it follows the request into ``sync_to_async`` worker
+threads. Three probes add to it while it is open:
+
+* every database connection runs its queries through ``record_query()``
+  (installed by ``instrument_connection()`` on ``connection_created``);
+* ``TimedCache`` wraps a cache backend and times each call;
+* ``track("serializer")`` wraps the ``data`` of the task serializers.
+
+Outside a request the probes only cost a context variable lookup.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from asgiref.sync import iscoroutinefunction
+
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.http import HttpRequest, HttpResponseBase
+
+logger = logging.getLogger(__name__)
+
+METRICS = ("db", "cache", "serializer")
+
+
+@dataclass
+class RequestTimings:
+    """Time spent per metric, in seconds, plus the number of queries run."""
+
+    queries: int = 0
+    seconds: dict[str, float] = field(default_factory=lambda: dict.fromkeys(METRICS, 0.0))
+    started: float = field(default_factory=time.perf_counter)
+    _active: set[str] = field(default_factory=set)
+
+    @contextmanager
+    def track(self, metric: str) -> Iterator[None]:
+        """Add the time spent in the block to ``metric``, once if nested."""
+        if metric in self._active:
+            yield
+            return
+        self._active.add(metric)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[metric] += time.perf_counter() - start
+            self._active.discard(metric)
+
+    def elapsed(self) -> float:
+        """Return the seconds since the request started."""
+        return time.perf_counter() - self.started
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters in milliseconds, for logs and budgets."""
+        return {
+            "queries": self.queries,
+            **{f"{metric}_ms": round(value * 1000, 2) for metric, value in self.seconds.items()},
+            "total_ms": round(self.elapsed() * 1000, 2),
+        }
+
+    def server_timing(self) -> str:
+        """Return the value of a ``Server-Timing`` header."""
+        entries = [
+            f'db;dur={self.seconds["db"] * 1000:.2f};desc="{self.queries} queries"',
+            f"cache;dur={self.seconds['cache'] * 1000:.2f}",
+            f"serializer;dur={self.seconds['serializer'] * 1000:.2f}",
+            f"total;dur={self.elapsed() * 1000:.2f}",
+        ]
+        return ", ".join(entries)
+
+
+_current: ContextVar[RequestTimings | None] = ContextVar("request_timings", default=None)
+
+
+def start() -> tuple[RequestTimings, Any]:
+    """Open a ``RequestTimings`` for the current context; return it and a reset token."""
+    timings = RequestTimings()
+    return timings, _current.set(timings)
+
+
+def finish(token: Any) -> None:
+    """Close the ``RequestTimings`` opened with ``token``."""
+    _current.reset(token)
+
+
+def current() -> RequestTimings | None:
+    """Return the timings of the request being handled, if any."""
+    return _current.get()
+
+
+@contextmanager
+def track(metric: str) -> Iterator[None]:
+    """Add the time spent in the block to ``metric`` of the current request."""
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+    with timings.track(metric):
+        yield
+
+
+def log_request(request: HttpRequest, response: HttpResponseBase, timings: RequestTimings) -> None:
+    """Write one structured (JSON) log line with the request's timings."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    record = {
+        "method": request.method,
+        "path": request.path,
+        "status": response.status_code,
+        **timings.as_dict(),
+    }
+    logger.info(json.dumps(record), extra={"timings": record})
+
+
+def record_query(
+    execute: Callable[..., Any], sql: str, params: Any, many: bool, context: dict[str, Any]
+) -> Any:
+    """Database execute wrapper that counts and times queries."""
+    timings = _current.get()
+    if timings is None:
+        return execute(sql, params, many, context)
+    timings.queries += 1
+    with timings.track("db"):
+        return execute(sql, params, many, context)
+
+
+def instrument_connection(sender: Any, connection: BaseDatabaseWrapper, **kwargs: Any) -> None:
+    """Install ``record_query()`` on a connection (``connection_created`` receiver)."""
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+class TimedCache:
+    """Cache backend proxy that adds each call's duration to the request's cache time."""
+
+    def __init__(self, backend: Any) -> None:
+        """Wrap ``backend``."""
+        self._backend = backend
+
+    def __getattr__(self, name: str) -> Any:
+        """Return the backend attribute, timed if it is a method."""
+        attribute = getattr(self._backend, name)
+        if not callable(attribute):
+            return attribute
+        if iscoroutinefunction(attribute):
+
+            async def timed_async(*args: Any, **kwargs: Any) -> Any:
+                with track("cache"):
+                    return await attribute(*args, **kwargs)
+
+            return timed_async
+
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            with track("cache"):
+                return attribute(*args, **kwargs)
+
+        return timed
@@ -2,28 +2,37 @@
 
 from __future__ import annotations
 
+from typing import Any
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
 from django.db.models import QuerySet
-from django.http import HttpRequest, HttpResponse
+from django.http import Http404, HttpRequest, HttpResponse, HttpResponseBase
 from django.shortcuts import render
 from django.views.generic import DetailView, ListView
 
+from .cache import task_objects
+from .conditional import page_validators, task_validators
 from .models import Task
+from .pagination import EstimatedCountPaginator, InvalidCursor, KeysetPaginator
+from .replicas import reads_from_replicas
+from .selectors import TaskSelector
 
 
+@reads_from_replicas
 def index(request: HttpRequest) -> HttpResponse:
     """Home page view."""
-    task_count = Task.objects.count()
-    pending_count = Task.objects.filter(status=Task.Status.PENDING).count()
-    completed_count = Task.objects.filter(status=Task.Status.COMPLETED).count()
+    stats = TaskSelector.get_statistics()
 
     context = {
-        "task_count": task_count,
-        "pending_count": pending_count,
-        "completed_count": completed_count,
+        "task_count": stats["total"],
+        "pending_count": stats["pending"],
+        "completed_count": stats["completed"],
     }
     return render(request, "core/index.html", context)
 
 
+@reads_from_replicas
 class TaskListView(ListView):  # type: ignore[type-arg]
     """List view for tasks."""
 
@@ -31,6 +40,7 @@ class TaskListView(ListView):  # type: ignore[type-arg]
     template_name = "core/task_list.html"
     context_object_name = "tasks"
     paginate_by = 10
+    paginator_class = EstimatedCountPaginator
 
     def get_queryset(self) -> QuerySet[Task]:
         """Override queryset to add filtering."""
@@ -40,6 +50,32 @@ class TaskListView(ListView):  # type: ignore[type-arg]
             queryset = queryset.filter(status=status)
         return queryset
 
+    def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponseBase:
+        """Render the list, or answer a conditional request with 304 once the page is fetched."""
+        self.object_list = self.get_queryset()
+        context = self.get_context_data()
+        page, paginator = context["page_obj"], context["paginator"]
+        validators = page_validators(
+            context["object_list"],
+            variant=request.get_full_path(),
+            extra=(getattr(paginator, "count", None), page.has_next(), page.has_previous()),
+        )
+        response = validators.not_modified(request)
+        if response is None:
+            response = self.render_to_response(context)
+        return validators.apply(response)
+
+    def paginate_queryset(self, queryset: QuerySet[Task], page_size: int) -> tuple[Any, ...]:
+        """Paginate with keyset cursors unless page numbers are requested."""
+        if "page" in self.request.GET or settings.PAGINATION_MODE == "page":
+            return super().paginate_queryset(queryset, page_size)
+        paginator = KeysetPaginator(Task, self.get_ordering() or Task._meta.ordering, page_size)
+        try:
+            page = paginator.paginate(queryset, self.request.GET.get("cursor"))
+        except InvalidCursor as exc:
+            raise Http404(str(exc)) from exc
+        return paginator, page, page.object_list, page.has_other_pages()
+
 
 class TaskDetailView(DetailView):  # type: ignore[type-arg]
     """Detail view for a single task."""
@@ -47,3 +83,21 @@ class TaskDetailView(DetailView):  # type: ignore[type-arg]
     model = Task
     template_name = "core/task_detail.html"
     context_object_name = "task"
+
+    def get_object(self, queryset: QuerySet[Task] | None = None) -> Task:
+        """Return the task from the object cache."""
+        if queryset is not None or self.pk_url_kwarg not in self.kwargs:
+            return super().get_object(queryset)
+        try:
+            return task_objects.get(self.get_queryset(), self.kwargs[self.pk_url_kwarg])
+        except (Task.DoesNotExist, ValidationError) as exc:
+            raise Http404(f"No task found matching the query: {exc}") from exc
+
+    def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponseBase:
+        """Render the task, or answer a conditional request with 304."""
+        self.object = self.get_object()
+        validators = task_validators(self.object, variant=request.get_full_path())
+        response = validators.not_modified(request)
+        if response is None:
+            response = self.render_to_response(self.get_context_data(object=self.object))
+        return validators.apply(response)
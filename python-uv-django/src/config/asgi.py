@@ -1,6 +1,7 @@
 """ASGI config for Django project.
 
-It exposes the ASGI callable as a module-level variable named ``application``.
+It exposes the ASGI callable as a module-level variable named ``application``,
+warmed up (see ``config.warmup``) unless ``DJANGO_WARMUP`` is false.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.0/howto/deployment/asgi/
@@ -11,5 +12,16 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.development")
+# Serve the hot task API actions with native async handlers under ASGI.
+os.environ.setdefault("TASK_API_ASYNC", "true")
 
 application = get_asgi_application()
+
+from django.conf import settings
+
+from config.warmup import warm_up
+
+if settings.WARMUP:
+    # Requests get connections of their own in worker threads; this one only
+    # checks the databases can be reached and fills any pool.
+    warm_up(keep_connections=False)
@@ -0,0 +1,139 @@
+"""Database settings from ``DATABASE_URL``-style URLs.
+
+``dj_database_url`` turns the URL's query parameters into ``OPTIONS``. For
+PostgreSQL (psycopg 3) a few of them configure how connections are made:
+
+* ``pool=true``, or any ``pool_<option>=<value>`` (``min_size``,
+  ``max_size``, ``timeout``, ``max_idle``, ...), gives each worker process
+  a psycopg connection pool. Persistent connections are turned off, as
+  Django requires with a pool: the pool keeps the connections.
+* ``prepare_threshold=N`` prepares a statement on the server once a
+  connection has run it N times. Django leaves preparation off by
+  default; it needs server-side parameter binding, which is turned on
+  with it unless ``server_side_binding=false`` is given.
+* ``pgbouncer=transaction`` is the profile for PgBouncer in transaction
+  pooling mode, where consecutive transactions may run on different server
+  connections: no prepared statements and no server-side cursors.
+
+Other parameters (``sslmode``, ``connect_timeout``, ...) go to psycopg as
+they are.
+
+``sqlite_concurrency()`` turns a SQLite entry into the high-concurrency
+setup for several worker processes and threads writing to one file.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import dj_database_url
+
+from django.core.exceptions import ImproperlyConfigured
+
+POSTGRESQL = "django.db.backends.postgresql"
+SQLITE = "django.db.backends.sqlite3"
+
+# Arguments of psycopg_pool.ConnectionPool that may be set from the URL, and their types.
+POOL_OPTIONS: dict[str, type[int] | type[float]] = {
+    "min_size": int,
+    "max_size": int,
+    "timeout": float,
+    "max_waiting": int,
+    "max_lifetime": float,
+    "max_idle": float,
+    "reconnect_timeout": float,
+    "num_workers": int,
+}
+
+
+def parse_database_url(
+    url: str, *, conn_max_age: int = 0, conn_health_checks: bool = True
+) -> dict[str, Any]:
+    """Return the ``DATABASES`` entry for ``url``.
+
+    Raises ``ImproperlyConfigured`` for unknown pool options, pool or
+    statement options on a database other than PostgreSQL, and prepared
+    statements combined with the PgBouncer profile.
+    """
+    config: dict[str, Any] = dict(
+        dj_database_url.parse(url, conn_max_age=conn_max_age, conn_health_checks=conn_health_checks)
+    )
+    options: dict[str, Any] = config.pop("OPTIONS", {})
+    pool = options.pop("pool", False)
+    pool_options = {
+        key.removeprefix("pool_"): options.pop(key)
+        for key in list(options)
+        if key.startswith("pool_")
+    }
+    pgbouncer = options.pop("pgbouncer", None)
+    if unknown := pool_options.keys() - POOL_OPTIONS.keys():
+        raise ImproperlyConfigured(f"Unknown connection pool options: {', '.join(sorted(unknown))}")
+    try:
+        pool_options = {key: POOL_OPTIONS[key](value) for key, value in pool_options.items()}
+    except ValueError as e:
+        raise ImproperlyConfigured(f"Invalid connection pool option: {e}") from e
+    if config["ENGINE"] != POSTGRESQL and (
+        pool or pool_options or pgbouncer is not None or "prepare_threshold" in options
+    ):
+        raise ImproperlyConfigured(
+            "pool, prepare_threshold and pgbouncer are only supported with PostgreSQL"
+        )
+
+    if pool or pool_options:
+        options["pool"] = pool_options or True
+        config["CONN_MAX_AGE"] = 0
+    if pgbouncer is not None:
+        if pgbouncer != "transaction":
+            raise ImproperlyConfigured(
+                f"Unknown PgBouncer profile {pgbouncer!r}; only 'transaction' needs one"
+            )
+        if options.get("prepare_threshold") is not None or options.get("server_side_binding"):
+            raise ImproperlyConfigured(
+                "Prepared statements and server-side binding are not safe behind PgBouncer "
+                "in transaction mode"
+            )
+        options["prepare_threshold"] = None
+        # A named cursor only lives as long as its server connection is ours.
+        config["DISABLE_SERVER_SIDE_CURSORS"] = True
+    elif options.get("prepare_threshold") is not None:
+        options.setdefault("server_side_binding", True)
+
+    if options:
+        config["OPTIONS"] = options
+    return config
+
+
+def sqlite_concurrency(
+    config: dict[str, Any], *, timeout: float, mmap_size: int, cache_size: int
+) -> dict[str, Any]:
+    """Return SQLite entry ``config`` set up for concurrent readers and writers.
+
+    Every new connection runs with WAL journaling, so readers never wait for
+    the writer, and ``synchronous=NORMAL``, which is durable in WAL mode but
+    for the last transactions on power loss. ``mmap_size`` bytes of the file
+    are memory-mapped and ``cache_size`` KiB of pages cached per connection.
+    Transactions begin ``IMMEDIATE``, taking the write lock up front instead
+    of failing when they upgrade to it, and wait up to ``timeout`` seconds
+    for it, in turn with the other threads of the process (see
+    ``apps.core.backends.sqlite3``). Entries for other databases are
+    returned unchanged.
+    """
+    if config["ENGINE"] != SQLITE:
+        return config
+    pragmas = {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": mmap_size,
+        "cache_size": -cache_size,
+    }
+    init_command = ";".join(f"PRAGMA {name} = {value}" for name, value in pragmas.items())
+    return {
+        **config,
+        "ENGINE": "apps.core.backends.sqlite3",
+        "OPTIONS": {
+            **config.get("OPTIONS", {}),
+            "init_command": init_command,
+            "transaction_mode": "IMMEDIATE",
+            "timeout": timeout,
+        },
+    }
@@ -3,10 +3,12 @@
 import os
 from pathlib import Path
 from typing import Any
+from urllib.parse import parse_qs, urlencode
 
-import dj_database_url
 from dotenv import load_dotenv
 
+from config.database import POSTGRESQL, parse_database_url, sqlite_concurrency
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -36,6 +38,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'apps.core.middleware.TimingMiddleware',  # First, so it times the whole chain
+    'apps.core.middleware.ReplicaMiddleware',  # Read replicas and read-your-writes pins
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',  # Serve static files
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -47,6 +51,11 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
+# Send per-request query count and db/cache/serializer time to clients in a
+# Server-Timing header. The same figures are always logged as JSON on the
+# apps.core.timing logger (INFO).
+SERVER_TIMING = os.getenv('SERVER_TIMING', 'true').lower() == 'true'
+
 ROOT_URLCONF = 'config.urls'
 
 TEMPLATES = [
@@ -68,17 +77,117 @@ TEMPLATES = [
 WSGI_APPLICATION = 'config.wsgi.application'
 ASGI_APPLICATION = 'config.asgi.application'
 
+# Warm routes, serializers, templates and database connections before serving (config.warmup)
+WARMUP = os.getenv('DJANGO_WARMUP', 'true').lower() == 'true'
+# Whether the warm-up opens database connections (off where the process forks afterwards)
+WARMUP_DATABASES = os.getenv('DJANGO_WARMUP_DATABASES', 'true').lower() == 'true'
+
 # Database
 # https://docs.djangoproject.com/en/5.0/ref/settings/#databases
 DATABASE_URL = os.getenv('DATABASE_URL', 'sqlite:///db.sqlite3')
+# Serve task list/retrieve/statistics/complete with native async handlers (ASGI)
+TASK_API_ASYNC = os.getenv('TASK_API_ASYNC', 'false').lower() == 'true'
+# Under ASGI every request runs its queries in a thread of its own, so
+# persistent connections would only pile up; Django advises against them.
+# A pool (?pool_max_size=N, see config/database.py) replaces them either way.
+DATABASE_CONN_MAX_AGE = 0 if TASK_API_ASYNC else 600
 DATABASES = {
-    'default': dj_database_url.parse(
-        DATABASE_URL,
-        conn_max_age=600,
-        conn_health_checks=True,
-    )
+    'default': parse_database_url(DATABASE_URL, conn_max_age=DATABASE_CONN_MAX_AGE),
 }
 
+# Read replicas: comma-separated database URLs, each optionally weighted with
+# ?weight=N (default 1). They become the replica_1, replica_2, ... aliases;
+# apps.core.replicas routes the reads of views marked @reads_from_replicas
+# to them.
+DATABASE_REPLICA_URLS = [
+    url.strip() for url in os.getenv('DATABASE_REPLICA_URLS', '').split(',') if url.strip()
+]
+# Seconds to wait for a PostgreSQL replica to accept a connection, unless its URL
+# sets connect_timeout; a replica that does not answer then fails its health check
+DATABASE_REPLICA_CONNECT_TIMEOUT = int(os.getenv('DATABASE_REPLICA_CONNECT_TIMEOUT', '2'))
+DATABASE_REPLICAS: dict[str, int] = {}
+for number, url in enumerate(DATABASE_REPLICA_URLS, start=1):
+    url, _, query_string = url.partition('?')
+    query = parse_qs(query_string)
+    weight = int(query.pop('weight', ['1'])[0])
+    if query:
+        url = f'{url}?{urlencode(query, doseq=True)}'
+    replica = parse_database_url(url, conn_max_age=DATABASE_CONN_MAX_AGE)
+    if replica['ENGINE'] == POSTGRESQL:
+        replica.setdefault('OPTIONS', {}).setdefault(
+            'connect_timeout', DATABASE_REPLICA_CONNECT_TIMEOUT
+        )
+    DATABASES[f'replica_{number}'] = {
+        **replica,
+        # Tests read the primary through this alias instead of a test replica
+        'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_REPLICAS[f'replica_{number}'] = weight
+if DATABASE_REPLICAS:
+    DATABASE_ROUTERS = ['apps.core.replicas.ReplicaRouter']
+
+# SQLite high-concurrency mode: WAL journaling, synchronous=NORMAL, memory-mapped
+# I/O and a larger page cache on every connection, and BEGIN IMMEDIATE write
+# transactions that queue per process (see config.database.sqlite_concurrency)
+SQLITE_HIGH_CONCURRENCY = os.getenv('SQLITE_HIGH_CONCURRENCY', 'true').lower() == 'true'
+# Seconds a write transaction waits for the database before "database is locked"
+SQLITE_BUSY_TIMEOUT = float(os.getenv('SQLITE_BUSY_TIMEOUT', '5'))
+# Bytes of the database file read through mmap
+SQLITE_MMAP_SIZE = int(os.getenv('SQLITE_MMAP_SIZE', str(256 * 1024 * 1024)))
+# KiB of page cache per connection (SQLite's default is 2000)
+SQLITE_CACHE_SIZE = int(os.getenv('SQLITE_CACHE_SIZE', '16384'))
+if SQLITE_HIGH_CONCURRENCY:
+    DATABASES = {
+        alias: sqlite_concurrency(
+            config,
+            timeout=SQLITE_BUSY_TIMEOUT,
+            mmap_size=SQLITE_MMAP_SIZE,
+            cache_size=SQLITE_CACHE_SIZE,
+        )
+        for alias, config in DATABASES.items()
+    }
+# Seconds a client reads from the primary after each of its writes, so it sees
+# them before the replicas have caught up
+DATABASE_REPLICA_PIN_SECONDS = int(os.getenv('DATABASE_REPLICA_PIN_SECONDS', '5'))
+# Seconds between health checks of each replica (per process)
+DATABASE_REPLICA_CHECK_INTERVAL = int(os.getenv('DATABASE_REPLICA_CHECK_INTERVAL', '5'))
+# PostgreSQL replicas further behind than this many seconds get no reads
+DATABASE_REPLICA_MAX_LAG = int(
+    os.getenv('DATABASE_REPLICA_MAX_LAG', str(DATABASE_REPLICA_PIN_SECONDS))
+)
+
+# Cache
+# https://docs.djangoproject.com/en/5.0/topics/cache/
+# Redis when REDIS_URL is set; otherwise a file cache in CACHE_DIR, or local memory.
+# The task list cache relies on every worker seeing the same version key, so
+# local memory is only suitable for a single process (runserver, tests).
+REDIS_URL = os.getenv('REDIS_URL', '')
+CACHE_DIR = os.getenv('CACHE_DIR', '')
+# Entries the file/local-memory caches hold before culling (Django's default is 300)
+CACHE_MAX_ENTRIES = int(os.getenv('CACHE_MAX_ENTRIES', '10000'))
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+elif CACHE_DIR:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': CACHE_DIR,
+            'OPTIONS': {'MAX_ENTRIES': CACHE_MAX_ENTRIES},
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'OPTIONS': {'MAX_ENTRIES': CACHE_MAX_ENTRIES},
+        }
+    }
+
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
 AUTH_PASSWORD_VALIDATORS = [
@@ -120,12 +229,13 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # Django REST Framework
 # https://www.django-rest-framework.org/api-guide/settings/
 REST_FRAMEWORK: dict[str, Any] = {
+    # orjson-backed JSON (stdlib fallback); production drops the browsable API.
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'apps.api.renderers.FastJSONRenderer',
         'rest_framework.renderers.BrowsableAPIRenderer',
     ],
     'DEFAULT_PARSER_CLASSES': [
-        'rest_framework.parsers.JSONParser',
+        'apps.api.parsers.FastJSONParser',
         'rest_framework.parsers.FormParser',
         'rest_framework.parsers.MultiPartParser',
     ],
@@ -135,7 +245,7 @@ REST_FRAMEWORK: dict[str, Any] = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.AllowAny',
     ],
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    'DEFAULT_PAGINATION_CLASS': 'apps.api.pagination.KeysetPagination',
     'PAGE_SIZE': 10,
     'DEFAULT_FILTER_BACKENDS': [
         'rest_framework.filters.SearchFilter',
@@ -143,6 +253,49 @@ REST_FRAMEWORK: dict[str, Any] = {
     ],
 }
 
+# Pagination mode for the task API and HTML list: 'cursor' (keyset) or 'page'.
+# Requests that pass ?page= always get page-number pagination.
+PAGINATION_MODE = os.getenv('PAGINATION_MODE', 'cursor')
+
+# Page-number paginators (admin changelist, API ?page=, HTML list) take counts
+# at or above this many rows from the planner statistics instead of COUNT(*).
+# 0 always counts exactly.
+COUNT_ESTIMATE_THRESHOLD = int(os.getenv('COUNT_ESTIMATE_THRESHOLD', '100000'))
+
+# Rows fetched per database round trip when streaming NDJSON listings
+STREAM_CHUNK_SIZE = int(os.getenv('STREAM_CHUNK_SIZE', '2000'))
+
+# Task search backend (dotted path). Empty selects one from the database vendor:
+# PostgreSQL tsvector/GIN, SQLite FTS5, or an icontains scan elsewhere.
+TASK_SEARCH_BACKEND = os.getenv('TASK_SEARCH_BACKEND', '')
+
+# Serve task list/retrieve/pending through the .values()-based TaskReadSerializer
+TASK_FAST_SERIALIZER = os.getenv('TASK_FAST_SERIALIZER', 'false').lower() == 'true'
+
+# Most items accepted by one request to the /api/tasks/bulk/ endpoints
+TASK_BULK_MAX_BATCH_SIZE = int(os.getenv('TASK_BULK_MAX_BATCH_SIZE', '1000'))
+
+# Days a completed or cancelled task stays in the task table after its last
+# update before `manage.py archive_tasks` moves it to the archive table
+TASK_ARCHIVE_AFTER_DAYS = int(os.getenv('TASK_ARCHIVE_AFTER_DAYS', '90'))
+
+# Task counters
+# Seconds the maintained overdue total may be served before it is recomputed
+TASK_COUNTERS_OVERDUE_TTL = int(os.getenv('TASK_COUNTERS_OVERDUE_TTL', '60'))
+
+# Seconds a cached /api/tasks/ listing may be served (0 disables the cache).
+# Writes invalidate it at once; the timeout bounds overdue flags going stale.
+TASK_LIST_CACHE_TIMEOUT = int(os.getenv('TASK_LIST_CACHE_TIMEOUT', '60'))
+
+# Task object cache (single rows for retrieve and the HTML detail view)
+# Rows kept in each worker's in-process LRU tier (0 disables the object cache)
+TASK_OBJECT_CACHE_SIZE = int(os.getenv('TASK_OBJECT_CACHE_SIZE', '1024'))
+# Seconds a worker may serve its local copy before re-checking the shared stamps,
+# i.e. the bound on how stale a row written by another worker can be
+TASK_OBJECT_CACHE_STALENESS = float(os.getenv('TASK_OBJECT_CACHE_STALENESS', '1.0'))
+# Seconds rows are kept in the shared tier
+TASK_OBJECT_CACHE_TIMEOUT = int(os.getenv('TASK_OBJECT_CACHE_TIMEOUT', '300'))
+
 # CORS settings
 CORS_ALLOW_ALL_ORIGINS = False
 cors_origins = os.getenv('CORS_ALLOWED_ORIGINS', '')
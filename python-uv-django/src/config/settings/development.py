@@ -17,12 +17,7 @@ ALLOWED_HOSTS = ["*"]
 
 # Database - SQLite for development (can be overridden with DATABASE_URL env var)
 if "DATABASE_URL" not in os.environ:
-    DATABASES = {  # noqa: F405  # type: ignore[misc]
-        "default": {
-            "ENGINE": "django.db.backends.sqlite3",
-            "NAME": str(BASE_DIR / "db.sqlite3"),  # noqa: F405
-        }
-    }
+    DATABASES["default"]["NAME"] = str(BASE_DIR / "db.sqlite3")  # noqa: F405
 
 # CORS - Allow all origins in development
 CORS_ALLOW_ALL_ORIGINS = True
@@ -39,6 +39,14 @@ CORS_ALLOW_ALL_ORIGINS = False
 if not CORS_ALLOWED_ORIGINS:  # noqa: F405
     raise ValueError("CORS_ALLOWED_ORIGINS must be configured in production")
 
+# API - JSON only; the browsable API renders HTML forms on every request
+REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"] = [  # noqa: F405
+    "apps.api.renderers.FastJSONRenderer",
+]
+
+# Server-Timing exposes internal timings to every client; opt in explicitly
+SERVER_TIMING = os.getenv("SERVER_TIMING", "false").lower() == "true"
+
 # Logging - Less verbose in production
 LOGGING["root"]["level"] = "WARNING"  # noqa: F405  # type: ignore[index]
 LOGGING["loggers"]["django"]["level"] = "WARNING"  # noqa: F405  # type: ignore[index]
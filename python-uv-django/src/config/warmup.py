@@ -0,0 +1,152 @@
+"""Start-up warm-up for the WSGI and ASGI applications.
+
+Django and DRF build most of their per-process state lazily, on the first
+request that needs it: the URL resolvers' reverse dictionaries and route
+regexes, each serializer's fields (and the imports and model metadata
+behind them), compiled templates and database connections. After a deploy
+or a scale-up the first requests of every worker pay for all of it.
+
+``warm_up()`` does that work once, before the application serves. It is
+called by ``config/wsgi.py`` and ``config/asgi.py`` unless ``DJANGO_WARMUP``
+is false (the test suite turns it off). Under gunicorn with a preloaded
+application the master runs the warm-up without ``DJANGO_WARMUP_DATABASES``:
+database connections must not cross a fork, so each worker opens its own
+after forking (see ``gunicorn.conf.py``).
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+from django.conf import settings
+from django.db import connections
+from django.template import TemplateDoesNotExist, engines
+from django.urls import URLPattern, URLResolver, get_resolver
+from rest_framework import serializers
+
+logger = logging.getLogger(__name__)
+
+# Packages whose serializers and templates are warmed; third-party ones load on use.
+PROJECT_PACKAGES = ("apps.", "config.")
+
+
+def walk_urls(resolver: URLResolver) -> Iterator[URLPattern | URLResolver]:
+    """Yield every route and resolver below ``resolver``, depth first."""
+    for pattern in resolver.url_patterns:
+        yield pattern
+        if isinstance(pattern, URLResolver):
+            yield from walk_urls(pattern)
+
+
+def warm_urls() -> int:
+    """Compile every route's regex and build the reverse lookups; return the route count."""
+    resolver = get_resolver()
+    routes = 0
+    for pattern in walk_urls(resolver):
+        pattern.pattern.regex  # noqa: B018
+        if isinstance(pattern, URLResolver):
+            pattern.reverse_dict  # noqa: B018
+        else:
+            routes += 1
+    resolver.reverse_dict  # noqa: B018
+    return routes
+
+
+def project_serializers() -> list[type[serializers.Serializer[Any]]]:
+    """Return the project's serializer classes (list serializers excluded)."""
+    found = []
+    pending = list(serializers.Serializer.__subclasses__())
+    while pending:
+        cls = pending.pop()
+        pending.extend(cls.__subclasses__())
+        if cls.__module__.startswith(PROJECT_PACKAGES):
+            found.append(cls)
+    return found
+
+
+def warm_serializers() -> int:
+    """Build the fields of each project serializer once; return how many were built."""
+    count = 0
+    for cls in project_serializers():
+        cls().fields  # noqa: B018
+        count += 1
+    return count
+
+
+def template_names() -> set[str]:
+    """Return the project's template files and the templates its class-based views name."""
+    names = set()
+    for engine in engines.all():
+        for directory in engine.template_dirs:
+            if not Path(directory).resolve().is_relative_to(settings.BASE_DIR):
+                continue
+            names.update(
+                path.relative_to(directory).as_posix()
+                for path in Path(directory).rglob("*")
+                if path.is_file()
+            )
+    for pattern in walk_urls(get_resolver()):
+        view = getattr(pattern, "callback", None)
+        name = getattr(view, "view_initkwargs", {}).get(
+            "template_name", getattr(getattr(view, "view_class", None), "template_name", None)
+        )
+        if isinstance(name, str):
+            names.add(name)
+    return names
+
+
+def warm_templates() -> int:
+    """Load and compile the project's templates; return how many were found."""
+    count = 0
+    for name in template_names():
+        for engine in engines.all():
+            try:
+                engine.get_template(name)
+            except TemplateDoesNotExist:
+                continue
+            count += 1
+            break
+    return count
+
+
+def connect_databases(*, keep: bool = True) -> int:
+    """Open a connection to each database (and its pool); return how many opened.
+
+    A database that cannot be reached is logged and left for the first
+    request to retry. With ``keep=False`` the connections are closed again
+    once they have been made (pooled ones go back to their pool).
+    """
+    count = 0
+    for connection in connections.all():
+        try:
+            connection.ensure_connection()
+        except Exception:
+            logger.warning(
+                "Warm-up could not connect to database %r", connection.alias, exc_info=True
+            )
+            continue
+        count += 1
+        if not keep:
+            connection.close()
+    return count
+
+
+def warm_up(*, keep_connections: bool = True) -> dict[str, int]:
+    """Warm routes, serializers, templates and databases; return the counts of each."""
+    start = time.perf_counter()
+    counts = {
+        "routes": warm_urls(),
+        "serializers": warm_serializers(),
+        "templates": warm_templates(),
+        "databases": (connect_databases(keep=keep_connections) if settings.WARMUP_DATABASES else 0),
+    }
+    logger.info(
+        "Warm-up finished in %.0f ms: %s",
+        (time.perf_counter() - start) * 1000,
+        ", ".join(f"{count} {name}" for name, count in counts.items()),
+    )
+    return counts
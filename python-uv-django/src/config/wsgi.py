@@ -1,6 +1,7 @@
 """WSGI config for Django project.
 
-It exposes the WSGI callable as a module-level variable named ``application``.
+It exposes the WSGI callable as a module-level variable named ``application``,
+warmed up (see ``config.warmup``) unless ``DJANGO_WARMUP`` is false.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.0/howto/deployment/wsgi/
@@ -13,3 +14,10 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.development")
 
 application = get_wsgi_application()
+
+from django.conf import settings
+
+from config.warmup import warm_up
+
+if settings.WARMUP:
+    warm_up()
@@ -1,11 +1,28 @@
 """Tests for API endpoints."""
 
+import json
+from datetime import timedelta
+
 import pytest
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework import status
+from rest_framework.permissions import BasePermission
+
+from apps.api.views import TaskViewSet
+from apps.core.archive import archive_tasks
+from apps.core.models import Task, TaskCounter
+from apps.core.services import TaskService
+
 
-from apps.core.models import Task
+class DenyObjects(BasePermission):
+    """Permission refusing access to every task."""
+
+    def has_object_permission(self, request, view, obj):
+        return False
 
 
 @pytest.mark.django_db
@@ -20,6 +37,78 @@ class TestTaskAPI:
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data["results"]) == 3
 
+    def test_list_tasks_cursor_pagination(self, api_client, task_factory):
+        """Test following cursor links returns every task once."""
+        for i in range(25):
+            task_factory(title=f"Task {i}", priority=i % 4)
+
+        url = reverse("api:task-list")
+        response = api_client.get(url)
+        assert "count" not in response.data
+
+        ids = []
+        while url:
+            response = api_client.get(url)
+            assert response.status_code == status.HTTP_200_OK
+            ids.extend(task["id"] for task in response.data["results"])
+            url = response.data["next"]
+
+        assert ids == list(
+            Task.objects.order_by("-priority", "-created_at", "-id").values_list("id", flat=True)
+        )
+
+    def test_list_tasks_cursor_with_ordering(self, api_client, task_factory):
+        """Test cursor pagination follows ?ordering= selections."""
+        for i in range(15):
+            task_factory(title=f"Task {i:02d}", priority=i % 3)
+
+        url = reverse("api:task-list") + "?ordering=-title"
+        titles = []
+        while url:
+            response = api_client.get(url)
+            titles.extend(task["title"] for task in response.data["results"])
+            url = response.data["next"]
+
+        assert titles == sorted(titles, reverse=True)
+        assert len(titles) == 15
+
+    def test_list_tasks_page_number_mode(self, api_client, multiple_tasks):
+        """Test ?page= keeps the legacy page-number envelope."""
+        url = reverse("api:task-list")
+        response = api_client.get(url, {"page": 1})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["count"] == 3
+        assert response.data["count_is_approximate"] is False
+        assert len(response.data["results"]) == 3
+
+    def test_list_tasks_page_number_estimated(self, api_client, task_factory, settings):
+        """Test ?page= flags an estimated count and links past it."""
+        from django.db import connection
+
+        for i in range(30):
+            task_factory(title=f"Task {i}")
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+        task_factory(title="After ANALYZE")
+        settings.COUNT_ESTIMATE_THRESHOLD = 10
+        url = reverse("api:task-list")
+
+        third = api_client.get(url, {"page": 3})
+        past_estimate = api_client.get(url, {"page": 4})
+
+        assert (third.data["count"], third.data["count_is_approximate"]) == (30, True)
+        assert "page=4" in third.data["next"]
+        assert len(past_estimate.data["results"]) == 1
+        assert past_estimate.data["next"] is None
+
+    def test_list_tasks_invalid_cursor(self, api_client, multiple_tasks):
+        """Test an invalid cursor returns 404."""
+        url = reverse("api:task-list")
+        response = api_client.get(url, {"cursor": "bogus"})
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
     def test_create_task(self, api_client):
         """Test creating a task via API."""
         url = reverse("api:task-list")
@@ -43,6 +132,224 @@ class TestTaskAPI:
         assert response.data["id"] == sample_task.id
         assert response.data["title"] == sample_task.title
 
+    @pytest.mark.django_db(transaction=True)
+    def test_retrieve_task_not_modified(self, api_client, sample_task, django_assert_num_queries):
+        """Test a matching If-None-Match gets a 304 until the task changes."""
+        url = reverse("api:task-detail", kwargs={"pk": sample_task.pk})
+        etag = api_client.get(url).headers["ETag"]
+
+        # The task comes from the object cache.
+        with django_assert_num_queries(0):
+            response = api_client.get(url, headers={"if-none-match": etag})
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+        sample_task.title = "Changed"
+        sample_task.save()
+        response = api_client.get(url, headers={"if-none-match": etag})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["title"] == "Changed"
+
+    def test_list_tasks_not_modified(self, api_client, multiple_tasks, task_factory):
+        """Test list ETags follow the filtered rows and the query string."""
+        url = reverse("api:task-list")
+        response = api_client.get(url, {"status": "PENDING"})
+        etag = response.headers["ETag"]
+        assert response.headers["Last-Modified"]
+
+        response = api_client.get(url, {"status": "PENDING"}, headers={"if-none-match": etag})
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert not response.content
+
+        # A write outside the filter leaves the filtered list unchanged.
+        task_factory(title="Done", status=Task.Status.COMPLETED)
+        response = api_client.get(url, {"status": "PENDING"}, headers={"if-none-match": etag})
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+        task_factory(title="Another pending")
+        response = api_client.get(url, {"status": "PENDING"}, headers={"if-none-match": etag})
+        assert response.status_code == status.HTTP_200_OK
+
+        response = api_client.get(url, {"ordering": "title"}, headers={"if-none-match": etag})
+        assert response.status_code == status.HTTP_200_OK
+
+    @pytest.mark.parametrize("mode", ["cursor", "page"])
+    def test_list_validators_from_page(
+        self, api_client, task_factory, settings, django_assert_num_queries, mode
+    ):
+        """Test list validators come from the fetched page, with no aggregate query."""
+        settings.PAGINATION_MODE = mode
+        tasks = [task_factory(title=f"Task {i}") for i in range(12)]
+        url = reverse("api:task-list")
+        with django_assert_num_queries(1 if mode == "cursor" else 3):
+            etag = api_client.get(url, {"fields": "id,title"})["ETag"]
+
+        with django_assert_num_queries(1 if mode == "cursor" else 3):
+            response = api_client.get(url, {"fields": "id,title"}, headers={"if-none-match": etag})
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+        # A change to a row beyond the page leaves the page unchanged.
+        Task.objects.filter(pk=tasks[0].pk).update(title="Renamed")
+        response = api_client.get(url, {"fields": "id,title"}, headers={"if-none-match": etag})
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        tasks[-1].delete()
+        response = api_client.get(url, {"fields": "id,title"}, headers={"if-none-match": etag})
+        assert response.status_code == status.HTTP_200_OK
+
+    @pytest.mark.django_db(transaction=True)
+    def test_list_cache_hit(self, api_client, multiple_tasks, django_assert_num_queries):
+        """Test a repeated listing is served from the cache without queries."""
+        url = reverse("api:task-list")
+        first = api_client.get(url, {"status": "PENDING", "ordering": "title"})
+
+        with django_assert_num_queries(0):
+            second = api_client.get(url, {"ordering": " title ", "status": "PENDING"})
+
+        assert (first["X-Cache"], second["X-Cache"]) == ("MISS", "HIT")
+        assert second.content == first.content
+        assert second["ETag"] == first["ETag"]
+        not_modified = api_client.get(
+            url,
+            {"status": "PENDING", "ordering": "title"},
+            headers={"if-none-match": first["ETag"]},
+        )
+        assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_list_cache_invalidated_by_writes(self, api_client, sample_task):
+        """Test any write to the task table invalidates every cached listing."""
+        url = reverse("api:task-list")
+        api_client.get(url)
+        api_client.get(url, {"status": "PENDING"})
+
+        api_client.post(reverse("api:task-complete", kwargs={"pk": sample_task.pk}))
+
+        response = api_client.get(url, {"status": "PENDING"})
+        assert response["X-Cache"] == "MISS"
+        assert response.data["results"] == []
+        assert api_client.get(url).data["results"][0]["status"] == Task.Status.COMPLETED
+
+    def test_list_cache_keys(self, api_client, multiple_tasks):
+        """Test pages, fieldsets and streams are not mixed up."""
+        url = reverse("api:task-list")
+        api_client.get(url, {"page": 1})
+
+        assert api_client.get(url)["X-Cache"] == "MISS"
+        assert api_client.get(url, {"fields": "id"})["X-Cache"] == "MISS"
+        assert api_client.get(url, {"fields": "id"}).data["results"][0].keys() == {"id"}
+        assert api_client.get(url, {"stream": 1}).streaming
+
+    def test_list_cache_disabled(self, api_client, multiple_tasks, settings):
+        """Test a zero timeout turns the cache off."""
+        settings.TASK_LIST_CACHE_TIMEOUT = 0
+        url = reverse("api:task-list")
+        api_client.get(url)
+
+        assert "X-Cache" not in api_client.get(url)
+
+    @pytest.mark.django_db(transaction=True)
+    def test_cache_stats_action(self, api_client, multiple_tasks):
+        """Test the hit/miss counters are exposed."""
+        url = reverse("api:task-list")
+        for _ in range(3):
+            api_client.get(url)
+
+        api_client.get(reverse("api:task-detail", kwargs={"pk": multiple_tasks[0].pk}))
+        api_client.get(reverse("api:task-detail", kwargs={"pk": multiple_tasks[0].pk}))
+
+        response = api_client.get(reverse("api:task-cache-stats"))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert (response.data["list"]["hits"], response.data["list"]["misses"]) == (2, 1)
+        objects = response.data["objects"]
+        assert (objects["local"]["hits"], objects["misses"]) == (1, 1)
+
+    @pytest.mark.parametrize(
+        ("url_name", "params"),
+        [
+            ("api:task-list", {}),
+            ("api:task-list", {"search": "task", "ordering": "-due_date"}),
+            ("api:task-list", {"page": 1}),
+            ("api:task-list", {"stream": 1}),
+            ("api:task-pending", {}),
+        ],
+    )
+    def test_fast_serializer_output_matches(
+        self, api_client, multiple_tasks, settings, url_name, params
+    ):
+        """Test TASK_FAST_SERIALIZER does not change any response body."""
+
+        def body(response):
+            if response.streaming:
+                return b"".join(response.streaming_content)
+            return response.content
+
+        url = reverse(url_name)
+        expected = body(api_client.get(url, params))
+        settings.TASK_FAST_SERIALIZER = True
+        actual = body(api_client.get(url, params))
+
+        assert actual == expected
+
+    def test_fast_serializer_retrieve(self, api_client, sample_task, settings):
+        """Test the fast serializer also serves retrieve."""
+        url = reverse("api:task-detail", kwargs={"pk": sample_task.pk})
+        expected = api_client.get(url).content
+        settings.TASK_FAST_SERIALIZER = True
+
+        assert api_client.get(url).content == expected
+
+    @pytest.mark.parametrize("fast", [False, True])
+    def test_sparse_fieldset(self, api_client, task_factory, settings, fast):
+        """Test ?fields= limits the output and the columns selected."""
+        settings.TASK_FAST_SERIALIZER = fast
+        for i in range(12):
+            task_factory(title=f"Task {i}", description="long text " * 50, priority=i % 3)
+
+        url = reverse("api:task-list")
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get(url, {"fields": "id,title,is_overdue"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert all(list(task) == ["id", "title", "is_overdue"] for task in response.data["results"])
+        page_query = queries.captured_queries[-1]["sql"]
+        assert '"description"' not in page_query
+
+        # Sort keys are loaded too, so following the cursor costs no extra queries.
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get(response.data["next"])
+        assert len(response.data["results"]) == 2
+        assert len(queries) == 1
+
+    @pytest.mark.parametrize("fast", [False, True])
+    def test_sparse_fieldset_without_validators(self, api_client, sample_task, settings, fast):
+        """Test responses without list validators do not load the validator columns."""
+        settings.TASK_FAST_SERIALIZER = fast
+
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get(reverse("api:task-pending"), {"fields": "title"})
+
+        assert response.data == [{"title": sample_task.title}]
+        query = queries.captured_queries[-1]["sql"]
+        assert '"updated_at"' not in query
+        assert '"due_date"' not in query
+
+    def test_sparse_fieldset_exclude(self, api_client, sample_task):
+        """Test ?exclude= drops fields from list and detail responses."""
+        response = api_client.get(reverse("api:task-list"), {"exclude": "description,is_overdue"})
+        assert "description" not in response.data["results"][0]
+        assert "is_overdue" not in response.data["results"][0]
+        assert "title" in response.data["results"][0]
+
+        url = reverse("api:task-detail", kwargs={"pk": sample_task.pk})
+        response = api_client.get(url, {"fields": "status"})
+        assert response.data == {"status": sample_task.status}
+
+    def test_sparse_fieldset_unknown_field(self, api_client, sample_task):
+        """Test unknown field names are rejected."""
+        response = api_client.get(reverse("api:task-list"), {"fields": "title,secret"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "fields" in response.data
+
     def test_update_task(self, api_client, sample_task):
         """Test updating a task."""
         url = reverse("api:task-detail", kwargs={"pk": sample_task.pk})
@@ -97,6 +404,50 @@ class TestTaskAPI:
         sample_task.refresh_from_db()
         assert sample_task.status == Task.Status.IN_PROGRESS
 
+    def test_transition_actions_write_without_reading(self, api_client, sample_task):
+        """Test complete/start run UPDATE ... RETURNING instead of a read first."""
+        url = reverse("api:task-complete", kwargs={"pk": sample_task.pk})
+
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.post(url)
+
+        assert response.data["status"] == Task.Status.COMPLETED
+        task_queries = [q["sql"] for q in queries if '"core_task"' in q["sql"]]
+        assert len(task_queries) == 2  # one UPDATE per allowed source status
+        assert all(sql.startswith("UPDATE") for sql in task_queries)
+
+    def test_transition_actions_conflict(self, api_client, sample_task):
+        """Test forbidden transitions get 409 and repeated ones are idempotent."""
+        api_client.post(reverse("api:task-complete", kwargs={"pk": sample_task.pk}))
+
+        again = api_client.post(reverse("api:task-complete", kwargs={"pk": sample_task.pk}))
+        start = api_client.post(reverse("api:task-start", kwargs={"pk": sample_task.pk}))
+        missing = api_client.post(reverse("api:task-start", kwargs={"pk": 999999}))
+
+        assert again.status_code == status.HTTP_200_OK
+        assert start.status_code == status.HTTP_409_CONFLICT
+        assert missing.status_code == status.HTTP_404_NOT_FOUND
+        sample_task.refresh_from_db()
+        assert sample_task.status == Task.Status.COMPLETED
+
+    def test_transition_actions_respect_queryset_and_permissions(
+        self, api_client, sample_task, monkeypatch
+    ):
+        """Test complete/start only reach visible tasks and check object permissions."""
+        url = reverse("api:task-complete", kwargs={"pk": sample_task.pk})
+        get_queryset = TaskViewSet.get_queryset
+        monkeypatch.setattr(
+            TaskViewSet, "get_queryset", lambda view: get_queryset(view).exclude(pk=sample_task.pk)
+        )
+        assert api_client.post(url).status_code == status.HTTP_404_NOT_FOUND
+
+        monkeypatch.setattr(TaskViewSet, "get_queryset", get_queryset)
+        monkeypatch.setattr(TaskViewSet, "permission_classes", [DenyObjects])
+        assert api_client.post(url).status_code == status.HTTP_403_FORBIDDEN
+
+        sample_task.refresh_from_db()
+        assert sample_task.status == Task.Status.PENDING
+
     def test_pending_action(self, api_client, task_factory):
         """Test the pending action."""
         # Create a mix of pending and non-pending tasks
@@ -121,6 +472,31 @@ class TestTaskAPI:
         for task_data in response.data:
             assert task_data["status"] == Task.Status.PENDING
 
+    def test_pending_action_stream(self, api_client, task_factory):
+        """Test ?stream=1 streams pending tasks as NDJSON."""
+        for i in range(5):
+            task_factory(title=f"Pending {i}", status=Task.Status.PENDING)
+        task_factory(title="Completed Task", status=Task.Status.COMPLETED)
+
+        url = reverse("api:task-pending")
+        response = api_client.get(url, {"stream": "1"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.streaming
+        assert response["Content-Type"] == "application/x-ndjson"
+        rows = [json.loads(line) for line in b"".join(response.streaming_content).splitlines()]
+        assert len(rows) == 5
+        assert {row["status"] for row in rows} == {Task.Status.PENDING}
+
+    def test_list_stream_with_accept_header(self, api_client, multiple_tasks):
+        """Test Accept: application/x-ndjson streams the filtered list unpaginated."""
+        url = reverse("api:task-list")
+        response = api_client.get(url, {"ordering": "priority"}, HTTP_ACCEPT="application/x-ndjson")
+
+        assert response.streaming
+        rows = [json.loads(line) for line in b"".join(response.streaming_content).splitlines()]
+        assert [row["priority"] for row in rows] == [1, 2, 3]
+
     def test_statistics_action(self, api_client, multiple_tasks):
         """Test the statistics action."""
         url = reverse("api:task-statistics")
@@ -133,6 +509,50 @@ class TestTaskAPI:
         assert response.data["in_progress"] == 1
         assert response.data["completed"] == 1
 
+    def test_statistics_action_with_filters(self, api_client, multiple_tasks):
+        """Test statistics are scoped to the list filters when given."""
+        url = reverse("api:task-statistics")
+        response = api_client.get(url, {"search": "Progress"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["total"] == 1
+        assert response.data["in_progress"] == 1
+        assert response.data["pending"] == 0
+
+    def test_include_archived(self, api_client, task_factory):
+        """Test archived tasks are only listed, retrieved and counted when asked for."""
+        active = task_factory(title="Active report", priority=1)
+        done = task_factory(title="Archived report", status=Task.Status.COMPLETED, priority=2)
+        Task.objects.filter(pk=done.pk).update(updated_at=timezone.now() - timedelta(days=100))
+        archive_tasks(timedelta(days=90), pause=0)
+
+        list_url = reverse("api:task-list")
+        detail_url = reverse("api:task-detail", kwargs={"pk": done.pk})
+        stats_url = reverse("api:task-statistics")
+        assert [task["id"] for task in api_client.get(list_url).data["results"]] == [active.pk]
+        assert api_client.get(detail_url).status_code == status.HTTP_404_NOT_FOUND
+        assert api_client.get(stats_url).data["total"] == 1
+
+        archived = {"include_archived": "1"}
+        response = api_client.get(list_url, archived)
+        assert [task["id"] for task in response.data["results"]] == [done.pk, active.pk]
+        assert api_client.get(detail_url, archived).data["title"] == "Archived report"
+        stats = api_client.get(stats_url, archived).data
+        assert (stats["total"], stats["completed"]) == (2, 1)
+        response = api_client.get(list_url, {**archived, "search": "archived"})
+        assert [task["id"] for task in response.data["results"]] == [done.pk]
+
+    def test_include_archived_is_read_only(self, api_client, task_factory):
+        """Test writes never reach archived tasks."""
+        done = task_factory(status=Task.Status.COMPLETED)
+        Task.objects.filter(pk=done.pk).update(updated_at=timezone.now() - timedelta(days=100))
+        archive_tasks(timedelta(days=90), pause=0)
+
+        url = reverse("api:task-detail", kwargs={"pk": done.pk})
+        response = api_client.patch(f"{url}?include_archived=1", {"priority": 5}, format="json")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
     def test_filter_tasks_by_status(self, api_client, multiple_tasks):
         """Test filtering tasks by status."""
         url = reverse("api:task-list")
@@ -154,6 +574,25 @@ class TestTaskAPI:
         assert len(response.data["results"]) == 1
         assert "Python" in response.data["results"][0]["title"]
 
+    def test_search_results_are_ranked(self, api_client, task_factory):
+        """Test search results are ordered by relevance and stay pageable."""
+        task_factory(title="Notes", description="mentions python once", priority=50)
+        task_factory(title="Python Python", description="python", priority=1)
+        for i in range(12):
+            task_factory(title=f"Filler python {i}", priority=i)
+
+        url = reverse("api:task-list")
+        response = api_client.get(url, {"search": "python"})
+        assert response.data["results"][0]["title"] == "Python Python"
+
+        seen = []
+        next_url = url + "?search=python"
+        while next_url:
+            response = api_client.get(next_url)
+            seen.extend(task["id"] for task in response.data["results"])
+            next_url = response.data["next"]
+        assert len(seen) == len(set(seen)) == 14
+
     def test_ordering_tasks(self, api_client, task_factory):
         """Test ordering tasks."""
         task_factory(title="Task A", priority=1)
@@ -166,3 +605,135 @@ class TestTaskAPI:
         assert response.status_code == status.HTTP_200_OK
         priorities = [task["priority"] for task in response.data["results"]]
         assert priorities == sorted(priorities)
+
+    def test_bulk_create_tasks(self, api_client):
+        """Test creating a list of tasks in one request."""
+        url = reverse("api:task-bulk")
+        data = [{"title": "First", "priority": 3}, {"title": "Second"}]
+        response = api_client.post(url, data, format="json")
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert [task["title"] for task in response.data] == ["First", "Second"]
+        assert all(task["id"] for task in response.data)
+        assert Task.objects.count() == 2
+
+    def test_bulk_create_reports_item_errors(self, api_client):
+        """Test invalid items are reported per item and nothing is written."""
+        url = reverse("api:task-bulk")
+        data = [{"title": "Valid"}, {"title": "Invalid", "priority": 500}]
+        response = api_client.post(url, data, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert list(response.data) == [1]
+        assert "priority" in response.data[1]
+        assert not Task.objects.exists()
+
+    def test_bulk_create_max_batch_size(self, api_client, settings):
+        """Test batches above TASK_BULK_MAX_BATCH_SIZE are rejected."""
+        settings.TASK_BULK_MAX_BATCH_SIZE = 2
+        url = reverse("api:task-bulk")
+        data = [{"title": f"Task {i}"} for i in range(3)]
+        response = api_client.post(url, data, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not Task.objects.exists()
+
+    def test_bulk_partial_update_tasks(self, api_client, task_factory):
+        """Test partially updating a list of tasks by id."""
+        first = task_factory(title="First")
+        second = task_factory(title="Second")
+
+        url = reverse("api:task-bulk")
+        data = [{"id": first.pk, "priority": 8}, {"id": second.pk, "title": "Renamed"}]
+        response = api_client.patch(url, data, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        first.refresh_from_db()
+        second.refresh_from_db()
+        assert (first.title, first.priority) == ("First", 8)
+        assert (second.title, second.priority) == ("Renamed", 0)
+
+    def test_bulk_partial_update_completes(self, api_client, task_factory):
+        """Test a status change in a bulk PATCH sets or clears completed_at."""
+        pending = task_factory()
+        completed = task_factory()
+        TaskService.complete_task(completed)
+
+        url = reverse("api:task-bulk")
+        data = [
+            {"id": pending.pk, "status": Task.Status.COMPLETED},
+            {"id": completed.pk, "status": Task.Status.PENDING},
+        ]
+        response = api_client.patch(url, data, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data[0]["completed_at"] is not None
+        pending.refresh_from_db()
+        completed.refresh_from_db()
+        assert pending.completed_at == pending.updated_at
+        assert completed.completed_at is None
+
+    def test_bulk_partial_update_unknown_id(self, api_client, sample_task):
+        """Test an unknown id fails its item and leaves the others unwritten."""
+        url = reverse("api:task-bulk")
+        data = [
+            {"id": sample_task.pk, "priority": 8},
+            {"id": 999999, "priority": 1},
+            {"priority": 2},
+        ]
+        response = api_client.patch(url, data, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert list(response.data) == [1, 2]
+        assert "id" in response.data[1]
+        assert "id" in response.data[2]
+        sample_task.refresh_from_db()
+        assert sample_task.priority != 8
+
+    def test_bulk_partial_update_duplicate_id(self, api_client, sample_task):
+        """Test a task named twice fails the repeated item and nothing is written."""
+        url = reverse("api:task-bulk")
+        data = [
+            {"id": sample_task.pk, "status": Task.Status.COMPLETED},
+            {"id": sample_task.pk, "title": "Renamed"},
+        ]
+        response = api_client.patch(url, data, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert list(response.data) == [1]
+        assert response.data[1]["id"] == ["Duplicate task."]
+        assert Task.objects.get().status == Task.Status.PENDING
+        assert TaskCounter.objects.get(key=Task.Status.PENDING).value == 1
+
+    def test_bulk_complete_and_start(self, api_client, task_factory):
+        """Test the bulk complete and start actions."""
+        tasks = [task_factory(title=f"Task {i}") for i in range(3)]
+
+        url = reverse("api:task-bulk-complete")
+        response = api_client.post(url, {"ids": [tasks[0].pk, tasks[1].pk]}, format="json")
+        assert response.status_code == status.HTTP_200_OK
+        assert {task["status"] for task in response.data} == {Task.Status.COMPLETED}
+
+        url = reverse("api:task-bulk-start")
+        response = api_client.post(url, {"ids": [tasks[2].pk]}, format="json")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data[0]["status"] == Task.Status.IN_PROGRESS
+
+    def test_bulk_complete_skips_forbidden(self, api_client, multiple_tasks):
+        """Test bulk transitions return only the tasks they moved, in request order."""
+        ids = [task.pk for task in reversed(multiple_tasks)]
+
+        response = api_client.post(reverse("api:task-bulk-start"), {"ids": ids}, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [task["title"] for task in response.data] == ["Pending Task"]
+
+    def test_bulk_complete_unknown_id(self, api_client, sample_task):
+        """Test missing ids are reported by position and nothing is updated."""
+        url = reverse("api:task-bulk-complete")
+        response = api_client.post(url, {"ids": [sample_task.pk, 999999]}, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert list(response.data["ids"]) == [1]
+        sample_task.refresh_from_db()
+        assert sample_task.status == Task.Status.PENDING
@@ -0,0 +1,244 @@
+"""Tests for the native async task API (AsyncTaskViewSet)."""
+
+import json
+from datetime import timedelta
+
+import pytest
+from asgiref.sync import async_to_sync, iscoroutinefunction
+
+from django.test import AsyncClient
+from django.urls import include, path, resolve, reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.permissions import BasePermission
+from rest_framework.routers import DefaultRouter
+from rest_framework.test import APIRequestFactory
+
+from apps.api.views import AsyncTaskViewSet, TaskViewSet
+from apps.core.archive import archive_tasks
+from apps.core.models import Task
+
+# The project only routes to AsyncTaskViewSet under ASGI (TASK_API_ASYNC), so
+# these tests mount it on their own URLconf.
+router = DefaultRouter()
+router.register(r"tasks", AsyncTaskViewSet, basename="task")
+urlpatterns = [path("api/", include((router.urls, "api")))]
+
+
+class DenyObjects(BasePermission):
+    """Permission refusing access to every task."""
+
+    def has_object_permission(self, request, view, obj):
+        return False
+
+
+class Client:
+    """Drive an ``AsyncClient`` from synchronous tests."""
+
+    def __init__(self, **defaults):
+        self.client = AsyncClient(**defaults)
+
+    def __getattr__(self, method):
+        return async_to_sync(getattr(self.client, method))
+
+
+@pytest.fixture
+def async_client(settings):
+    """Provide a client for the async task API."""
+    settings.ROOT_URLCONF = __name__
+    return Client()
+
+
+def sync_response(path, action="list", **kwargs):
+    """Render the sync TaskViewSet's response for GET ``path``."""
+    view = TaskViewSet.as_view({"get": action})
+    response = view(APIRequestFactory().get(path), **kwargs)
+    response.render()
+    return response
+
+
+async def read_stream(response):
+    """Collect the body of a streaming response."""
+    return b"".join([chunk async for chunk in response.streaming_content])
+
+
+@pytest.mark.django_db
+class TestAsyncTaskAPI:
+    """Test the async handlers answer exactly like the sync ones."""
+
+    def test_hot_routes_are_async(self, async_client):
+        """Test only routes with an async action get a coroutine view."""
+        assert iscoroutinefunction(resolve(reverse("api:task-list")).func)
+        assert iscoroutinefunction(resolve(reverse("api:task-statistics")).func)
+        assert not iscoroutinefunction(resolve(reverse("api:task-bulk")).func)
+
+    @pytest.mark.parametrize("fast", [False, True])
+    def test_list_matches_sync(self, async_client, task_factory, settings, fast):
+        """Test every page is byte-identical to the sync viewset's."""
+        settings.TASK_FAST_SERIALIZER = fast
+        for i in range(15):
+            task_factory(title=f"Task {i}", priority=i % 3)
+
+        path = reverse("api:task-list") + "?fields=id,title,is_overdue"
+        pages = 0
+        while path:
+            response = async_client.get(path)
+            assert response.status_code == status.HTTP_200_OK
+            assert response.content == sync_response(path).content
+            path = response.json()["next"]
+            pages += 1
+        assert pages == 2
+
+    def test_list_not_modified(self, async_client, multiple_tasks):
+        """Test a matching ETag is answered with 304 from the async path."""
+        url = reverse("api:task-list")
+        etag = async_client.get(url)["ETag"]
+
+        response = async_client.get(url, headers={"If-None-Match": etag})
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_list_cached(self, async_client, multiple_tasks):
+        """Test the async path shares the versioned list cache."""
+        url = reverse("api:task-list")
+        first = async_client.get(url)
+        second = async_client.get(url)
+        Task.objects.filter(status=Task.Status.PENDING).update(priority=10)
+        third = async_client.get(url)
+
+        assert [first["X-Cache"], second["X-Cache"], third["X-Cache"]] == ["MISS", "HIT", "MISS"]
+        assert second.content == first.content
+        assert third.json()["results"][0]["priority"] == 10
+
+    def test_list_invalid_cursor(self, async_client, multiple_tasks):
+        """Test a malformed cursor is a 404 like on the sync path."""
+        response = async_client.get(reverse("api:task-list") + "?cursor=garbage")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_list_search(self, async_client, task_factory):
+        """Test searches run through the search backend."""
+        task_factory(title="Write the quarterly report")
+        task_factory(title="Water the plants")
+
+        response = async_client.get(reverse("api:task-list") + "?search=report")
+
+        assert [task["title"] for task in response.json()["results"]] == [
+            "Write the quarterly report"
+        ]
+
+    def test_list_page_numbers(self, async_client, multiple_tasks):
+        """Test legacy page-number pagination still reports the count."""
+        response = async_client.get(reverse("api:task-list") + "?page=1")
+
+        assert response.json()["count"] == 3
+
+    def test_list_stream(self, async_client, multiple_tasks):
+        """Test NDJSON listings are streamed from an async iterator."""
+        response = async_client.get(reverse("api:task-list") + "?stream=1")
+
+        assert response.streaming
+        assert response["Content-Type"] == "application/x-ndjson"
+        lines = async_to_sync(read_stream)(response).splitlines()
+        assert len(lines) == 3
+        assert {json.loads(line)["title"] for line in lines} == {
+            task.title for task in multiple_tasks
+        }
+
+    def test_retrieve(self, async_client, sample_task):
+        """Test retrieve matches the sync viewset and 404s for unknown ids."""
+        url = reverse("api:task-detail", kwargs={"pk": sample_task.pk})
+
+        response = async_client.get(url)
+
+        assert response.content == sync_response(url, "retrieve", pk=sample_task.pk).content
+        missing = async_client.get(reverse("api:task-detail", kwargs={"pk": 0}))
+        assert missing.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_statistics(self, async_client, multiple_tasks):
+        """Test unfiltered and filtered statistics."""
+        url = reverse("api:task-statistics")
+
+        assert async_client.get(url).json()["total"] == 3
+        filtered = async_client.get(url + f"?status={Task.Status.PENDING}").json()
+        assert filtered["total"] == filtered["pending"] == 1
+
+    def test_include_archived(self, async_client, task_factory):
+        """Test the async list, retrieve and statistics read archived tasks on request."""
+        task_factory(title="Active", priority=1)
+        done = task_factory(title="Archived", status=Task.Status.COMPLETED, priority=2)
+        Task.objects.filter(pk=done.pk).update(updated_at=timezone.now() - timedelta(days=100))
+        archive_tasks(timedelta(days=90), pause=0)
+
+        requests = [
+            ("api:task-list", "list", {}),
+            ("api:task-detail", "retrieve", {"pk": done.pk}),
+            ("api:task-statistics", "statistics", {}),
+        ]
+        for name, action, kwargs in requests:
+            path = reverse(name, kwargs=kwargs) + "?include_archived=1"
+            response = async_client.get(path)
+            assert response.status_code == status.HTTP_200_OK
+            assert response.content == sync_response(path, action, **kwargs).content
+
+    def test_complete_and_start(self, async_client, task_factory):
+        """Test the async transitions persist and return the task."""
+        to_complete = task_factory()
+        to_start = task_factory()
+
+        completed = async_client.post(reverse("api:task-complete", kwargs={"pk": to_complete.pk}))
+        started = async_client.post(reverse("api:task-start", kwargs={"pk": to_start.pk}))
+
+        assert completed.json()["status"] == Task.Status.COMPLETED
+        assert started.json()["status"] == Task.Status.IN_PROGRESS
+        to_complete.refresh_from_db()
+        assert to_complete.completed_at is not None
+
+    def test_transitions_respect_queryset_and_permissions(
+        self, async_client, sample_task, monkeypatch
+    ):
+        """Test the async transitions only reach visible tasks and check object permissions."""
+        url = reverse("api:task-start", kwargs={"pk": sample_task.pk})
+        get_queryset = AsyncTaskViewSet.get_queryset
+        monkeypatch.setattr(
+            AsyncTaskViewSet,
+            "get_queryset",
+            lambda view: get_queryset(view).exclude(pk=sample_task.pk),
+        )
+        assert async_client.post(url).status_code == status.HTTP_404_NOT_FOUND
+
+        monkeypatch.setattr(AsyncTaskViewSet, "get_queryset", get_queryset)
+        monkeypatch.setattr(AsyncTaskViewSet, "permission_classes", [DenyObjects])
+        assert async_client.post(url).status_code == status.HTTP_403_FORBIDDEN
+
+        sample_task.refresh_from_db()
+        assert sample_task.status == Task.Status.PENDING
+
+    def test_sync_actions_still_served(self, async_client, sample_task):
+        """Test actions without an async handler fall back to the sync ones."""
+        created = async_client.post(
+            reverse("api:task-list"),
+            data={"title": "Created"},
+            content_type="application/json",
+        )
+        deleted = async_client.delete(reverse("api:task-detail", kwargs={"pk": sample_task.pk}))
+
+        assert created.status_code == status.HTTP_201_CREATED
+        assert deleted.status_code == status.HTTP_204_NO_CONTENT
+        assert list(Task.objects.values_list("title", flat=True)) == ["Created"]
+
+    def test_session_user(self, async_client, multiple_tasks, django_user_model):
+        """Test a logged-in session is resolved without sync database access."""
+        user = django_user_model.objects.create_user(username="async", password="secret")
+        async_client.aforce_login(user)
+
+        response = async_client.get(reverse("api:task-list"))
+
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_browsable_api(self, async_client, multiple_tasks):
+        """Test HTML responses are still rendered (by Django, in a thread)."""
+        response = async_client.get(reverse("api:task-list"), headers={"Accept": "text/html"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"].startswith("text/html")
@@ -0,0 +1,96 @@
+"""Tests for the API renderers and parsers."""
+
+import datetime
+import decimal
+import io
+import zoneinfo
+
+import pytest
+
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ErrorDetail, ParseError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.serializer_helpers import ReturnDict
+
+from apps.api import parsers, renderers
+from apps.api.parsers import FastJSONParser
+from apps.api.renderers import FastJSONRenderer
+
+PAYLOAD = {
+    "results": [
+        ReturnDict(
+            {
+                "id": 1,
+                "title": "Ünïcödé \u2028 line separator \u2029",
+                "due_date": datetime.datetime(2026, 1, 2, 3, 4, 5, 6789, tzinfo=datetime.UTC),
+                "created_at": datetime.datetime(
+                    2026, 1, 2, 3, 4, 5, tzinfo=zoneinfo.ZoneInfo("Asia/Kolkata")
+                ),
+                "is_overdue": False,
+                "completed_at": None,
+            },
+            serializer=None,
+        )
+    ],
+    "errors": {1: {"priority": [ErrorDetail("Priority cannot exceed 100.", code="invalid")]}},
+    "label": gettext_lazy("Task"),
+    "amount": decimal.Decimal("1.50"),
+    "day": datetime.date(2026, 1, 2),
+}
+
+
+class TestFastJSONRenderer:
+    """Test FastJSONRenderer matches JSONRenderer."""
+
+    @pytest.mark.parametrize("fast", [True, False])
+    def test_output_matches_json_renderer(self, monkeypatch, fast):
+        """Test the orjson path and the fallback render identical bytes."""
+        if not fast:
+            monkeypatch.setattr(renderers, "orjson", None)
+        elif renderers.orjson is None:
+            pytest.skip("orjson is not installed")
+
+        assert FastJSONRenderer().render(PAYLOAD) == JSONRenderer().render(PAYLOAD)
+
+    def test_indent_uses_json_renderer(self):
+        """Test indented output (as used by the browsable API) is unchanged."""
+        media_type = "application/json; indent=4"
+
+        assert FastJSONRenderer().render(PAYLOAD, media_type) == JSONRenderer().render(
+            PAYLOAD, media_type
+        )
+
+    def test_none_renders_empty(self):
+        """Test None renders as an empty body."""
+        assert FastJSONRenderer().render(None) == b""
+
+
+class TestFastJSONParser:
+    """Test FastJSONParser."""
+
+    @pytest.mark.parametrize("fast", [True, False])
+    def test_parse(self, monkeypatch, fast):
+        """Test parsing with and without orjson."""
+        if not fast:
+            monkeypatch.setattr(parsers, "orjson", None)
+
+        data = FastJSONParser().parse(io.BytesIO('{"title": "Tâche", "ids": [1, 2]}'.encode()))
+
+        assert data == {"title": "Tâche", "ids": [1, 2]}
+
+    def test_non_utf8_charset(self):
+        """Test bodies declared in another charset use the stdlib decoder."""
+        stream = io.BytesIO('{"title": "Tâche"}'.encode("latin-1"))
+        parser_context = {"encoding": "latin-1"}
+
+        data = FastJSONParser().parse(
+            stream, "application/json; charset=latin-1", parser_context=parser_context
+        )
+
+        assert data == {"title": "Tâche"}
+
+    @pytest.mark.parametrize("body", [b"{", b'{"value": NaN}'])
+    def test_invalid_json(self, body):
+        """Test malformed JSON raises ParseError."""
+        with pytest.raises(ParseError):
+            FastJSONParser().parse(io.BytesIO(body))
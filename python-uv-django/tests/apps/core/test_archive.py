@@ -0,0 +1,137 @@
+"""Tests for archiving finished tasks and the archive_tasks command."""
+
+import datetime
+from io import StringIO
+
+import pytest
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.utils import timezone
+
+from apps.core.archive import archive_batch, archive_tasks, drop_archive_view, install_archive_view
+from apps.core.cache import task_version
+from apps.core.models import Task, TaskArchive, TaskCounter, TaskWithArchived
+
+RETENTION = datetime.timedelta(days=90)
+
+
+@pytest.fixture
+def old_tasks(task_factory):
+    """Tasks of every status, all last updated 100 days ago, plus a recent completed one."""
+    tasks = {
+        status: task_factory(title=f"Old {status.lower()}", status=status, priority=3)
+        for status in Task.Status.values
+    }
+    Task.objects.update(updated_at=timezone.now() - datetime.timedelta(days=100))
+    tasks["recent"] = task_factory(title="Recent", status=Task.Status.COMPLETED)
+    return tasks
+
+
+@pytest.mark.django_db
+class TestArchiveTasks:
+    """Test finished tasks move to the archive table intact and in batches."""
+
+    def test_moves_only_old_finished_tasks(self, old_tasks):
+        """Test old completed and cancelled tasks are archived, others stay."""
+        archived = archive_tasks(RETENTION, pause=0)
+
+        assert archived == 2
+        assert set(TaskArchive.objects.values_list("status", flat=True)) == {
+            Task.Status.COMPLETED,
+            Task.Status.CANCELLED,
+        }
+        assert set(Task.objects.values_list("title", flat=True)) == {
+            "Old pending",
+            "Old in_progress",
+            "Recent",
+        }
+
+    def test_rows_are_copied_intact(self, old_tasks):
+        """Test an archived task keeps its id, fields and timestamps."""
+        task = Task.objects.get(pk=old_tasks[Task.Status.COMPLETED].pk)
+
+        archive_tasks(RETENTION, pause=0)
+
+        archived = TaskArchive.objects.get(pk=task.pk)
+        for field in ("title", "description", "status", "priority", "due_date"):
+            assert getattr(archived, field) == getattr(task, field)
+        assert archived.created_at == task.created_at
+        assert archived.updated_at == task.updated_at
+        assert archived.archived_at > task.updated_at
+
+    def test_counters_and_cache_version(self, old_tasks):
+        """Test archiving removes the tasks from the counters and invalidates lists."""
+        version = task_version()
+
+        archive_tasks(RETENTION, pause=0)
+
+        values = dict(TaskCounter.objects.values_list("key", "value"))
+        assert values[Task.Status.COMPLETED] == 1
+        assert values[Task.Status.CANCELLED] == 0
+        assert values[Task.Status.PENDING] == 1
+        assert task_version() != version
+
+    def test_batches_and_limit(self, task_factory):
+        """Test batches advance by id and the limit caps the total."""
+        for i in range(5):
+            task_factory(title=f"Done {i}", status=Task.Status.COMPLETED)
+        Task.objects.update(updated_at=timezone.now() - datetime.timedelta(days=100))
+        before = timezone.now() - RETENTION
+        first, *_ = Task.objects.order_by("pk").values_list("pk", flat=True)
+
+        assert archive_batch(before, 2) == [first, first + 1]
+        assert archive_batch(before, 10, after=first + 3) == [first + 4]
+
+        totals = []
+        assert archive_tasks(RETENTION, batch_size=1, pause=0, limit=1, progress=totals.append) == 1
+        assert totals == [1]
+        assert Task.objects.count() == 1
+
+    def test_view_reads_both_tables(self, old_tasks):
+        """Test TaskWithArchived lists active and archived tasks once each."""
+        archive_tasks(RETENTION, pause=0)
+
+        assert TaskWithArchived.objects.count() == len(old_tasks)
+        archived = TaskWithArchived.objects.get(pk=old_tasks[Task.Status.CANCELLED].pk)
+        assert archived.get_status_display() == "Cancelled"
+
+    def test_view_is_recreated_after_migrating(self, old_tasks):
+        """Test the migrate hooks drop the view and create it again."""
+        drop_archive_view()
+        with connection.cursor() as cursor:
+            tables = connection.introspection.table_names(cursor, include_views=True)
+        assert TaskWithArchived._meta.db_table not in tables
+
+        install_archive_view()
+
+        assert TaskWithArchived.objects.count() == len(old_tasks)
+
+
+@pytest.mark.django_db
+class TestArchiveTasksCommand:
+    """Test the archive_tasks management command."""
+
+    def test_archives(self, old_tasks):
+        """Test the command archives and reports the total."""
+        out = StringIO()
+
+        call_command("archive_tasks", "--sleep=0", stdout=out)
+
+        assert "Archived 2 tasks." in out.getvalue()
+        assert TaskArchive.objects.count() == 2
+
+    def test_dry_run(self, old_tasks):
+        """Test a dry run only counts."""
+        out = StringIO()
+
+        call_command("archive_tasks", "--dry-run", "--older-than=0", stdout=out)
+
+        assert "3 tasks would be archived." in out.getvalue()
+        assert not TaskArchive.objects.exists()
+
+    def test_invalid_options(self):
+        """Test a non-positive batch size is refused."""
+        with pytest.raises(CommandError, match="--batch-size must be positive"):
+            call_command("archive_tasks", "--batch-size=0", stdout=StringIO())
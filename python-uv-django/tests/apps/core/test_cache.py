@@ -0,0 +1,287 @@
+"""Tests for the task list and task object caches."""
+
+from unittest.mock import Mock
+
+import pytest
+from asgiref.sync import async_to_sync
+
+from django.contrib.admin.sites import site
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.http import Http404
+from django.urls import reverse
+
+from apps.core import cache as task_cache
+from apps.core.cache import (
+    HITS_KEY,
+    VERSION_KEY,
+    TaskObjectCache,
+    bump_task_version,
+    get_cached_list,
+    list_cache_key,
+    list_cache_stats,
+    set_cached_list,
+    task_objects,
+    task_version,
+)
+from apps.core.models import Task
+from apps.core.services import TaskService
+from apps.core.views import TaskDetailView
+
+
+@pytest.fixture
+def version_changes():
+    """Return a callable that runs ``write`` and reports whether the version moved."""
+
+    def changes(write):
+        before = task_version()
+        write()
+        return task_version() != before
+
+    return changes
+
+
+@pytest.mark.django_db
+class TestTaskVersion:
+    """Test every write path invalidates cached listings."""
+
+    def test_version_created_on_first_read(self):
+        """Test the version is created lazily and then stable."""
+        assert cache.get(VERSION_KEY) is None
+        assert task_version() == task_version()
+
+    def test_version_survives_eviction(self):
+        """Test a re-created version never repeats an evicted one."""
+        first = task_version()
+        cache.delete(VERSION_KEY)
+
+        assert task_version() > first
+
+    def test_model_writes_bump(self, version_changes, sample_task):
+        """Test Task.save() and Task.delete() bump the version."""
+        sample_task.title = "Renamed"
+
+        assert version_changes(sample_task.save)
+        assert version_changes(lambda: Task.objects.create(title="New"))
+        assert version_changes(sample_task.delete)
+
+    def test_queryset_writes_bump(self, version_changes, multiple_tasks):
+        """Test set-based writes bump the version."""
+        tasks = Task.objects.all()
+
+        assert version_changes(lambda: tasks.update(priority=9))
+        assert version_changes(lambda: tasks.bulk_create([Task(title="Bulk")]))
+        assert version_changes(lambda: tasks.bulk_update(multiple_tasks, ["status"]))
+        assert version_changes(lambda: Task.objects.filter(priority=9).delete())
+
+    def test_service_writes_bump(self, version_changes, sample_task):
+        """Test the service layer transitions bump the version."""
+        assert version_changes(lambda: TaskService.start_task(sample_task))
+        assert version_changes(lambda: TaskService.complete_task(sample_task))
+
+    def test_admin_actions_bump(self, version_changes, rf, multiple_tasks, monkeypatch):
+        """Test the admin bulk actions bump the version."""
+        model_admin = site._registry[Task]
+        request = rf.post("/")
+        monkeypatch.setattr(model_admin, "message_user", Mock())
+
+        for action in ("mark_as_in_progress", "mark_as_pending", "mark_as_completed"):
+            assert version_changes(
+                lambda action=action: getattr(model_admin, action)(request, Task.objects.all())
+            )
+
+    def test_bumped_again_on_commit(self, django_capture_on_commit_callbacks):
+        """Test the version moves once more when the transaction commits."""
+        with django_capture_on_commit_callbacks(execute=False) as callbacks:
+            bump_task_version()
+        before = task_version()
+
+        for callback in callbacks:
+            callback()
+
+        assert task_version() != before
+
+
+@pytest.mark.django_db(transaction=True)
+def test_autocommit_update_bumps_after_write(sample_task, monkeypatch):
+    """Test an update outside a transaction bumps the version once the row has changed."""
+    bump = task_cache._bump
+    seen = []
+
+    def record():
+        seen.append(Task.objects.get(pk=sample_task.pk).title)
+        bump()
+
+    monkeypatch.setattr(task_cache, "_bump", record)
+
+    Task.objects.filter(pk=sample_task.pk).update(title="Renamed")
+
+    assert seen and set(seen) == {"Renamed"}
+
+
+def test_cached_list_stats():
+    """Test lookups are counted as hits and misses."""
+    key = list_cache_key(task_version(), "listing")
+
+    assert get_cached_list(key) is None
+    set_cached_list(key, ["row"])
+    assert get_cached_list(key) == ["row"]
+    assert get_cached_list(key) == ["row"]
+
+    stats = list_cache_stats()
+    assert (stats["hits"], stats["misses"], stats["hit_ratio"]) == (2, 1, 0.6667)
+    assert cache.get(HITS_KEY) == 2
+
+
+@pytest.mark.django_db(transaction=True)
+def test_rolled_back_write_not_cached(api_client, multiple_tasks):
+    """Test a listing read inside a transaction that rolls back is not served afterwards."""
+    url = reverse("api:task-list")
+
+    def titles():
+        return {task["title"] for task in api_client.get(url).data["results"]}
+
+    with pytest.raises(RuntimeError), transaction.atomic():
+        TaskService.create_task(title="Rolled back")
+        assert "Rolled back" in titles()
+        raise RuntimeError
+
+    assert "Rolled back" not in titles()
+    assert titles() == {task.title for task in multiple_tasks}
+
+
+def test_key_depends_on_version():
+    """Test bumping the version orphans every existing key."""
+    assert list_cache_key(1, "listing") != list_cache_key(2, "listing")
+    assert list_cache_key(1, "listing") == list_cache_key(1, "listing")
+
+
+@pytest.fixture
+def other_worker():
+    """Provide the object cache of a second worker process."""
+    return TaskObjectCache()
+
+
+# Rows are only cached outside transactions, so these tests run without the
+# transaction a test case wraps each test in.
+@pytest.mark.django_db(transaction=True)
+class TestTaskObjectCache:
+    """Test the two-tier task row cache."""
+
+    def test_local_then_shared_tier(self, sample_task, other_worker, django_assert_num_queries):
+        """Test a row is loaded once, then served from memory and from the shared tier."""
+        first = task_objects.get(Task.objects.all(), sample_task.pk)
+
+        with django_assert_num_queries(0):
+            second = task_objects.get(Task.objects.all(), str(sample_task.pk))
+            shared = other_worker.get(Task.objects.all(), sample_task.pk)
+
+        assert first == second == shared == sample_task
+        assert second is not first
+        assert second.title == shared.title == sample_task.title
+        assert not second._state.adding
+        assert task_objects.stats()["local"]["hits"] == 1
+        assert other_worker.stats()["shared"] == {"hits": 1, "hit_ratio": 1.0}
+
+    def test_write_seen_by_other_worker_within_bound(self, sample_task, other_worker, settings):
+        """Test another worker serves its copy only until the staleness bound."""
+        other_worker.get(Task.objects.all(), sample_task.pk)
+        sample_task.title = "Renamed"
+        sample_task.save()
+
+        assert task_objects.get(Task.objects.all(), sample_task.pk).title == "Renamed"
+        assert other_worker.get(Task.objects.all(), sample_task.pk).title == "Test Task"
+        settings.TASK_OBJECT_CACHE_STALENESS = 0
+        assert other_worker.get(Task.objects.all(), sample_task.pk).title == "Renamed"
+
+    def test_rolled_back_write_not_cached(self, sample_task, other_worker):
+        """Test a row read inside a transaction that rolls back is not served afterwards."""
+        with pytest.raises(RuntimeError), transaction.atomic():
+            sample_task.title = "Uncommitted"
+            sample_task.save()
+            assert task_objects.get(Task.objects.all(), sample_task.pk).title == "Uncommitted"
+            raise RuntimeError
+
+        assert task_objects.get(Task.objects.all(), sample_task.pk).title == "Test Task"
+        assert other_worker.get(Task.objects.all(), sample_task.pk).title == "Test Task"
+
+    def test_set_based_write_invalidates(self, multiple_tasks, other_worker, settings):
+        """Test queryset updates invalidate every cached row."""
+        settings.TASK_OBJECT_CACHE_STALENESS = 0
+        for task in multiple_tasks:
+            other_worker.get(Task.objects.all(), task.pk)
+
+        Task.objects.update(priority=42)
+
+        assert {other_worker.get(Task.objects.all(), t.pk).priority for t in multiple_tasks} == {42}
+        assert other_worker.stats()["misses"] == 6
+
+    def test_autocommit_update_not_refilled_with_old_row(
+        self, sample_task, other_worker, settings, monkeypatch
+    ):
+        """Test a detail read racing a plain queryset update cannot cache the old row."""
+        settings.TASK_OBJECT_CACHE_STALENESS = 0
+        bump_generation = task_objects.bump_generation
+
+        def racing_read():
+            bump_generation()
+            other_worker.get(Task.objects.all(), sample_task.pk)
+
+        monkeypatch.setattr(task_objects, "bump_generation", racing_read)
+
+        Task.objects.filter(pk=sample_task.pk).update(title="Renamed")
+
+        assert other_worker.get(Task.objects.all(), sample_task.pk).title == "Renamed"
+        assert task_objects.get(Task.objects.all(), sample_task.pk).title == "Renamed"
+
+    def test_delete_invalidates(self, sample_task):
+        """Test a deleted task is no longer served."""
+        task_objects.get(Task.objects.all(), sample_task.pk)
+        pk = sample_task.pk
+        sample_task.delete()
+
+        with pytest.raises(Task.DoesNotExist):
+            task_objects.get(Task.objects.all(), pk)
+
+    def test_local_tier_is_bounded(self, multiple_tasks, settings):
+        """Test the least recently used rows are evicted from memory."""
+        settings.TASK_OBJECT_CACHE_SIZE = 2
+        for task in multiple_tasks:
+            task_objects.get(Task.objects.all(), task.pk)
+
+        assert task_objects.stats()["size"] == 2
+
+    def test_disabled(self, sample_task, settings, django_assert_num_queries):
+        """Test a zero size reads straight from the database."""
+        settings.TASK_OBJECT_CACHE_SIZE = 0
+        task_objects.get(Task.objects.all(), sample_task.pk)
+
+        with django_assert_num_queries(1):
+            task_objects.get(Task.objects.all(), sample_task.pk)
+
+    def test_malformed_pk(self):
+        """Test a malformed id is rejected before any lookup."""
+        with pytest.raises(ValidationError):
+            task_objects.get(Task.objects.all(), "abc")
+
+    def test_async_lookup(self, sample_task, other_worker):
+        """Test the async lookup shares both tiers."""
+        task_objects.get(Task.objects.all(), sample_task.pk)
+
+        task = async_to_sync(other_worker.aget)(Task.objects.all(), sample_task.pk)
+
+        assert task.title == sample_task.title
+        assert other_worker.stats()["shared"]["hits"] == 1
+
+    def test_detail_view(self, rf, sample_task, django_assert_num_queries):
+        """Test the HTML detail view reads through the object cache."""
+        task_objects.get(Task.objects.all(), sample_task.pk)
+        view = TaskDetailView()
+        view.setup(rf.get("/"), pk=sample_task.pk)
+
+        with django_assert_num_queries(0):
+            assert view.get_object() == sample_task
+        view.setup(rf.get("/"), pk=0)
+        with pytest.raises(Http404):
+            view.get_object()
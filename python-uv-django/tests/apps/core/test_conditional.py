@@ -0,0 +1,80 @@
+"""Tests for conditional GET support on task views."""
+
+import datetime
+
+import pytest
+
+from django.utils import timezone
+
+from apps.core.conditional import page_validators, task_validators
+from apps.core.models import Task
+from apps.core.views import TaskDetailView, TaskListView
+
+
+@pytest.mark.django_db
+class TestValidators:
+    """Test ETag / Last-Modified computation."""
+
+    def test_list_etag_tracks_writes(self, multiple_tasks, task_factory):
+        """Test inserts, updates and deletes all change the list ETag."""
+        etags = [page_validators(Task.objects.all()).etag]
+
+        task_factory(title="New")
+        etags.append(page_validators(Task.objects.all()).etag)
+        multiple_tasks[0].title = "Renamed"
+        multiple_tasks[0].save()
+        etags.append(page_validators(Task.objects.all()).etag)
+        multiple_tasks[1].delete()
+        etags.append(page_validators(Task.objects.values()).etag)
+
+        assert len(set(etags)) == 4
+        assert page_validators(Task.objects.all()).etag == etags[-1]
+        assert page_validators(Task.objects.all(), extra=(5,)).etag != etags[-1]
+
+    def test_validators_track_becoming_overdue(self, task_factory):
+        """Test a task passing its due date changes both validators."""
+        due = timezone.now() + datetime.timedelta(hours=1)
+        task = task_factory(due_date=due)
+        before = task_validators(task)
+        after = task_validators(task, now=due + datetime.timedelta(minutes=1))
+
+        assert before.etag != after.etag
+        assert after.last_modified == due
+
+        listed = page_validators(Task.objects.all(), now=due + datetime.timedelta(minutes=1))
+        assert listed.etag != page_validators(Task.objects.all()).etag
+        assert listed.last_modified == due
+
+    def test_empty_list(self):
+        """Test an empty list has an ETag but no Last-Modified."""
+        validators = page_validators([])
+
+        assert validators.etag
+        assert validators.last_modified is None
+
+
+@pytest.mark.django_db
+class TestConditionalViews:
+    """Test the HTML views answer conditional requests."""
+
+    def test_task_list_view_not_modified(self, rf, multiple_tasks):
+        """Test a matching If-None-Match gets a 304 from the list view."""
+        response = TaskListView.as_view()(rf.get("/tasks/"))
+        etag = response.headers["ETag"]
+
+        response = TaskListView.as_view()(rf.get("/tasks/", headers={"if-none-match": etag}))
+
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+
+    def test_task_detail_view_not_modified(self, rf, sample_task):
+        """Test Last-Modified round-trips into a 304 from the detail view."""
+        view = TaskDetailView.as_view()
+        response = view(rf.get("/tasks/1/"), pk=sample_task.pk)
+        last_modified = response.headers["Last-Modified"]
+
+        response = view(
+            rf.get("/tasks/1/", headers={"if-modified-since": last_modified}), pk=sample_task.pk
+        )
+
+        assert response.status_code == 304
@@ -0,0 +1,174 @@
+"""Tests for the maintained task counters."""
+
+from io import StringIO
+
+import pytest
+from asgiref.sync import async_to_sync
+
+from django.core.management import call_command
+from django.utils import timezone
+
+from apps.core.models import Task, TaskCounter, TaskCounterManager
+from apps.core.selectors import TaskSelector
+from apps.core.services import TaskService
+
+
+def counters():
+    """Return the stored per-status counter values."""
+    return {
+        key: value
+        for key, value in TaskCounter.objects.values_list("key", "value")
+        if key != TaskCounter.OVERDUE
+    }
+
+
+def expected():
+    """Return the per-status totals computed from the task table."""
+    values = dict.fromkeys(Task.Status.values, 0)
+    values.update(Task.objects.status_counts())
+    return values
+
+
+@pytest.mark.django_db
+class TestTaskCounters:
+    """Test that every write path keeps TaskCounter consistent."""
+
+    def test_create_increments_counter(self, task_factory):
+        """Test creating tasks increments their status counter."""
+        task_factory(status=Task.Status.PENDING)
+        TaskService.create_task(title="Service Task")
+        task_factory(status=Task.Status.COMPLETED)
+
+        assert counters()[Task.Status.PENDING] == 2
+        assert counters()[Task.Status.COMPLETED] == 1
+
+    def test_status_transitions_move_counts(self, sample_task):
+        """Test mark_in_progress and mark_completed move the task between counters."""
+        sample_task.mark_in_progress()
+        assert counters() == expected()
+
+        TaskService.complete_task(sample_task)
+        assert counters() == expected()
+        assert counters()[Task.Status.COMPLETED] == 1
+
+    def test_save_of_unloaded_instance(self, sample_task):
+        """Test saving an instance that was not loaded from the database."""
+        Task(
+            pk=sample_task.pk,
+            title=sample_task.title,
+            status=Task.Status.CANCELLED,
+            created_at=sample_task.created_at,
+        ).save()
+
+        assert counters() == expected()
+        assert counters()[Task.Status.CANCELLED] == 1
+
+    def test_delete_decrements_counter(self, multiple_tasks):
+        """Test instance and queryset deletes decrement the counters."""
+        multiple_tasks[0].delete()
+        Task.objects.filter(status=Task.Status.COMPLETED).delete()
+
+        assert counters() == expected()
+        assert sum(counters().values()) == 1
+
+    def test_bulk_paths(self, multiple_tasks):
+        """Test bulk_create, bulk_update and queryset.update maintain the counters."""
+        Task.objects.bulk_create(
+            [Task(title=f"Bulk {i}", status=Task.Status.CANCELLED) for i in range(3)]
+        )
+        assert counters() == expected()
+
+        task = Task.objects.get(title="Pending Task")
+        task.status = Task.Status.IN_PROGRESS
+        Task.objects.bulk_update([task], ["status"])
+        assert counters() == expected()
+
+        Task.objects.filter(status=Task.Status.CANCELLED).update(status=Task.Status.PENDING)
+        assert counters() == expected()
+        assert counters()[Task.Status.PENDING] == 3
+
+        again = Task.objects.get(pk=task.pk)
+        task.status, again.status = Task.Status.COMPLETED, Task.Status.CANCELLED
+        Task.objects.bulk_update([task, again], ["status"])
+        assert counters() == expected()
+
+    def test_writes_after_another_writer(self, multiple_tasks):
+        """Test stale instances move the status stored now, not the one they loaded."""
+        pending, in_progress, _ = multiple_tasks
+        # Another writer moves both tasks after they were loaded here.
+        Task.objects.filter(pk__in=[pending.pk, in_progress.pk]).update(
+            status=Task.Status.CANCELLED
+        )
+
+        pending.mark_in_progress()
+        assert counters() == expected()
+        in_progress.delete()
+        assert counters() == expected()
+
+        Task.objects.all().update(status=Task.Status.COMPLETED, priority=1)
+        assert counters() == expected()
+        assert counters()[Task.Status.COMPLETED] == 2
+
+    def test_reconcile_command_fixes_drift(self, multiple_tasks):
+        """Test the reconciliation command rebuilds drifted counters."""
+        TaskCounter.objects.filter(key=Task.Status.PENDING).update(value=42)
+
+        call_command("reconcile_task_counters", stdout=StringIO())
+
+        assert counters() == expected()
+
+    def test_rebuild_keeps_concurrent_delta(self, multiple_tasks, monkeypatch):
+        """Test a rebuild does not overwrite a delta another writer committed meanwhile."""
+        get_queryset = TaskCounterManager.get_queryset
+        writers = [lambda: Task.objects.create(title="Concurrent")]
+
+        def first_access(manager):
+            # The other writer commits just before the rebuild reaches the counters.
+            if writers:
+                writers.pop()()
+            return get_queryset(manager)
+
+        monkeypatch.setattr(TaskCounterManager, "get_queryset", first_access)
+        TaskCounter.objects.rebuild()
+
+        assert counters() == expected()
+        assert counters()[Task.Status.PENDING] == 2
+
+    def test_statistics_from_counters(self, task_factory):
+        """Test unfiltered statistics are served from the counters."""
+        past_date = timezone.now() - timezone.timedelta(days=1)
+        task_factory(status=Task.Status.PENDING, due_date=past_date)
+        task_factory(status=Task.Status.COMPLETED, due_date=past_date)
+        TaskCounter.objects.filter(key=TaskCounter.OVERDUE).delete()
+
+        stats = TaskSelector.get_statistics()
+
+        assert stats["total"] == 2
+        assert stats["pending"] == 1
+        assert stats["completed"] == 1
+        assert stats["overdue"] == 1
+
+    def test_statistics_for_filtered_queryset(self, multiple_tasks):
+        """Test filtered statistics use a single aggregation query."""
+        queryset = Task.objects.filter(priority__gte=2)
+
+        stats = TaskSelector.get_statistics(queryset)
+
+        assert stats == {
+            "total": 2,
+            "pending": 0,
+            "in_progress": 1,
+            "completed": 1,
+            "cancelled": 0,
+            "overdue": 0,
+        }
+
+    def test_async_statistics_match(self, multiple_tasks):
+        """Test the async selector returns what the sync one does."""
+        TaskCounter.objects.filter(key=TaskCounter.OVERDUE).delete()
+        queryset = Task.objects.filter(priority__gte=2)
+
+        assert async_to_sync(TaskSelector.aget_statistics)() == TaskSelector.get_statistics()
+        assert async_to_sync(TaskSelector.aget_statistics)(queryset) == (
+            TaskSelector.get_statistics(queryset)
+        )
@@ -0,0 +1,212 @@
+"""Tests for the streaming task import and the import_tasks management command."""
+
+import json
+from io import StringIO
+
+import pytest
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from apps.core.cache import task_version
+from apps.core.importer import TaskImportError, import_tasks
+from apps.core.models import Task, TaskCounter, TaskImport
+
+CSV = (
+    "title,description,status,priority\n"
+    "Write docs,,PENDING,5\n"
+    "Ship it,Today,COMPLETED,\n"
+    "Too urgent,,PENDING,101\n"
+    ",No title,PENDING,1\n"
+)
+
+
+def write_ndjson(path, records):
+    """Write ``records`` (dicts, or raw strings) to ``path`` one per line."""
+    lines = [record if isinstance(record, str) else json.dumps(record) for record in records]
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+@pytest.mark.django_db
+class TestImportTasks:
+    """Test validation, error files, checkpoints and bookkeeping of imports."""
+
+    def test_csv_import(self, tmp_path):
+        """Test valid rows are imported and invalid ones go to the error file."""
+        path = tmp_path / "tasks.csv"
+        path.write_text(CSV)
+
+        result = import_tasks(path)
+
+        assert (result.records, result.imported, result.rejected) == (4, 2, 2)
+        assert dict(Task.objects.values_list("title", "priority")) == {
+            "Write docs": 5,
+            "Ship it": 0,
+        }
+        assert Task.objects.get(title="Ship it").status == Task.Status.COMPLETED
+
+        errors = (tmp_path / "tasks.errors.csv").read_text().splitlines()
+        assert errors[0] == "title,description,status,priority,errors"
+        assert errors[1].startswith("Too urgent,,PENDING,101,")
+        assert "priority" in errors[1]
+        assert errors[2].startswith(",No title,PENDING,1,")
+        assert "title" in errors[2]
+
+    def test_ndjson_import(self, tmp_path):
+        """Test NDJSON records, including lines that are not JSON objects."""
+        path = write_ndjson(
+            tmp_path / "tasks.ndjson",
+            [
+                {"title": "One", "priority": 3},
+                {"title": "Two", "status": "IN_PROGRESS"},
+                "{not json",
+                "[1, 2]",
+                {"title": "Three", "priority": -1},
+            ],
+        )
+
+        result = import_tasks(path)
+
+        assert (result.imported, result.rejected) == (2, 3)
+        errors = [
+            json.loads(line) for line in (tmp_path / "tasks.errors.ndjson").read_text().splitlines()
+        ]
+        assert errors[0] == {
+            "line": "{not json",
+            "errors": {"non_field_errors": ["Expected a JSON object."]},
+        }
+        assert errors[1]["line"] == "[1, 2]"
+        assert errors[2]["title"] == "Three"
+        assert "priority" in errors[2]["errors"]
+
+    def test_rejected_records_can_be_imported_again(self, tmp_path):
+        """Test a corrected error file imports like any other file."""
+        path = write_ndjson(tmp_path / "tasks.ndjson", [{"title": "Late", "priority": 500}])
+        import_tasks(path)
+        errors_path = tmp_path / "tasks.errors.ndjson"
+        fixed = [
+            {**json.loads(line), "priority": 100} for line in errors_path.read_text().splitlines()
+        ]
+
+        result = import_tasks(write_ndjson(tmp_path / "fixed.ndjson", fixed))
+
+        assert result.imported == 1
+        assert Task.objects.get().priority == 100
+
+    def test_no_error_file_without_rejections(self, tmp_path):
+        """Test a clean import leaves no empty error file behind."""
+        path = write_ndjson(tmp_path / "tasks.ndjson", [{"title": "Fine"}])
+
+        import_tasks(path)
+
+        assert not (tmp_path / "tasks.errors.ndjson").exists()
+
+    def test_resume_after_interruption(self, tmp_path):
+        """Test a rerun resumes after the last committed batch without duplicates."""
+        records = [{"title": f"Task {i}", "priority": 200 if i == 1 else i} for i in range(5)]
+        path = write_ndjson(tmp_path / "tasks.ndjson", records)
+
+        def interrupt(result):
+            raise KeyboardInterrupt
+
+        with pytest.raises(KeyboardInterrupt):
+            import_tasks(path, batch_size=2, progress=interrupt)
+        assert Task.objects.count() == 1
+        assert TaskImport.objects.get().records == 2
+
+        result = import_tasks(path, batch_size=2)
+
+        assert result.resumed_from == 2
+        assert (result.records, result.imported, result.rejected) == (5, 4, 1)
+        assert sorted(Task.objects.values_list("title", flat=True)) == [
+            "Task 0",
+            "Task 2",
+            "Task 3",
+            "Task 4",
+        ]
+        # The first run's rejection is kept; no header or record is written twice.
+        errors = (tmp_path / "tasks.errors.ndjson").read_text().splitlines()
+        assert [json.loads(line)["title"] for line in errors] == ["Task 1"]
+
+    def test_finished_import_needs_restart(self, tmp_path):
+        """Test a finished file is only imported again with ``restart``."""
+        path = write_ndjson(tmp_path / "tasks.ndjson", [{"title": "Once"}])
+        import_tasks(path)
+
+        with pytest.raises(TaskImportError, match="already imported"):
+            import_tasks(path)
+        result = import_tasks(path, restart=True)
+
+        assert result.imported == 1
+        assert Task.objects.filter(title="Once").count() == 2
+
+    def test_changed_file_is_not_resumed(self, tmp_path):
+        """Test a checkpoint is not applied to a file that changed since."""
+        path = write_ndjson(tmp_path / "tasks.ndjson", [{"title": "A"}, {"title": "B"}])
+
+        def interrupt(result):
+            raise KeyboardInterrupt
+
+        with pytest.raises(KeyboardInterrupt):
+            import_tasks(path, batch_size=1, progress=interrupt)
+        write_ndjson(path, [{"title": "C"}, {"title": "D"}])
+
+        with pytest.raises(TaskImportError, match="changed since"):
+            import_tasks(path)
+
+    def test_counters_and_cache_version(self, tmp_path, task_factory):
+        """Test imported tasks are counted and cached listings invalidated."""
+        task_factory(status=Task.Status.PENDING)
+        version = task_version()
+        path = write_ndjson(
+            tmp_path / "tasks.ndjson",
+            [{"title": "P"}, {"title": "C", "status": "COMPLETED"}, {"title": "Q"}],
+        )
+
+        import_tasks(path)
+
+        values = dict(TaskCounter.objects.values_list("key", "value"))
+        assert values[Task.Status.PENDING] == 3
+        assert values[Task.Status.COMPLETED] == 1
+        assert task_version() != version
+
+    def test_unknown_format(self, tmp_path):
+        """Test a file whose format cannot be told is refused."""
+        path = tmp_path / "tasks.txt"
+        path.write_text("title\nA\n")
+
+        with pytest.raises(TaskImportError, match="Cannot tell the format"):
+            import_tasks(path)
+        assert import_tasks(path, fmt="csv").imported == 1
+
+
+@pytest.mark.django_db
+class TestImportTasksCommand:
+    """Test the import_tasks management command."""
+
+    def test_reports_totals(self, tmp_path):
+        """Test the command prints the import's totals."""
+        path = tmp_path / "tasks.csv"
+        path.write_text(CSV)
+        out = StringIO()
+
+        call_command("import_tasks", str(path), "--batch-size=2", "-v2", stdout=out)
+
+        output = out.getvalue()
+        assert "2 records: 2 imported, 0 rejected" in output
+        assert "2 tasks imported, 2 rejected in total. See the error file." in output
+
+    def test_errors_option(self, tmp_path):
+        """Test ``--errors`` chooses where rejected records go."""
+        path = write_ndjson(tmp_path / "tasks.ndjson", [{"priority": 1}])
+        errors_path = tmp_path / "rejected.ndjson"
+
+        call_command("import_tasks", str(path), f"--errors={errors_path}", stdout=StringIO())
+
+        assert "title" in json.loads(errors_path.read_text())["errors"]
+
+    def test_import_errors_become_command_errors(self, tmp_path):
+        """Test import problems are reported as command errors."""
+        with pytest.raises(CommandError, match="does not exist"):
+            call_command("import_tasks", str(tmp_path / "missing.csv"), stdout=StringIO())
@@ -0,0 +1,120 @@
+"""Tests for the load generator and the loadtest management command."""
+
+import json
+import random
+from io import StringIO
+
+import pytest
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from apps.core import loadtest
+from apps.core.models import Task
+
+# Short runs; the tests check the plumbing, not the numbers.
+RUN = {"duration": "0.3", "warmup": "0", "concurrency": "2"}
+
+
+def run_command(tmp_path, *args, **options):
+    """Run ``loadtest`` and return its JSON summary."""
+    path = tmp_path / "results.json"
+    options = {**RUN, **options}
+    flags = [f"--{name}={value}" for name, value in options.items()]
+    call_command("loadtest", *args, *flags, f"--json={path}", stdout=StringIO())
+    return json.loads(path.read_text())
+
+
+@pytest.fixture
+def tasks(transactional_db, task_factory):
+    """Tasks the detail and complete operations can use, visible to every thread."""
+    return [task_factory(title=f"Task {i}") for i in range(5)]
+
+
+def test_parse_mix():
+    """Test weights default to 1 and unknown operations are rejected."""
+    assert loadtest.parse_mix("list=3, detail") == {"list": 3, "detail": 1}
+    with pytest.raises(ValueError, match="Unknown operation"):
+        loadtest.parse_mix("list=1,delete=1")
+    with pytest.raises(ValueError, match="positive weight"):
+        loadtest.parse_mix("list=0")
+
+
+def test_complete_uses_each_pending_task_once():
+    """Test completions never repeat a task and fall back to creates."""
+    workload = loadtest.Workload({"complete": 1}, pending_ids=[7, 8])
+    rng = random.Random(0)
+
+    calls = [workload.next_call(rng) for _ in range(3)]
+
+    assert [call.path for call in calls[:2]] == ["/api/tasks/7/complete/", "/api/tasks/8/complete/"]
+    assert calls[2].operation == "create"
+    assert json.loads(calls[2].body)["title"] == "Load test task 1"
+
+
+def test_summary_percentiles_and_histogram():
+    """Test the summary counts every request once, in the right bucket."""
+    results = loadtest.Results(elapsed=2.0)
+    call = loadtest.Call("list", "GET", "/api/tasks/")
+    for latency in (0.0005, 0.003, 0.003, 0.040, 7.0):
+        results.add(call, latency, None)
+    results.add(call, 0.003, "HTTP 500")
+
+    summary = results.summary()
+
+    assert summary["requests"] == 6
+    assert summary["throughput_rps"] == 3.0
+    assert summary["error_rate"] == 0.1667
+    assert summary["latency_ms"]["p50"] == 3.0
+    assert summary["latency_ms"]["max"] == 7000.0
+    assert summary["histogram_ms"]["<=1"] == 1
+    assert summary["histogram_ms"]["<=5"] == 3
+    assert summary["histogram_ms"]["<=50"] == 1
+    assert summary["histogram_ms"][">5000"] == 1
+    assert summary["operations"]["list"]["errors"] == 1
+
+
+def test_in_process_wsgi(tasks, tmp_path):
+    """Test a closed loop of threads against the WSGI application."""
+    summary = run_command(tmp_path, app="wsgi", mix="list=1,detail=1,statistics=1")
+
+    assert summary["requests"] > 0
+    assert summary["errors"] == {}
+    assert set(summary["operations"]) == {"list", "detail", "statistics"}
+    assert sum(summary["histogram_ms"].values()) == summary["requests"]
+
+
+def test_in_process_asgi_completes_tasks(tasks, tmp_path):
+    """Test the asyncio engine against the ASGI application, including writes."""
+    summary = run_command(tmp_path, app="asgi", mix="detail=1,complete=1", concurrency="1")
+
+    assert summary["errors"] == {}
+    completed = Task.objects.filter(status=Task.Status.COMPLETED).count()
+    assert summary["operations"]["complete"]["requests"] <= completed
+
+
+@pytest.mark.parametrize("engine", ["threads", "asyncio"])
+def test_live_server_closed_loop(engine, tasks, live_server, tmp_path):
+    """Test both engines reuse connections to a running server without errors."""
+    summary = run_command(tmp_path, url=live_server.url, engine=engine, mix="list=1,detail=1")
+
+    assert summary["requests"] > 0
+    assert summary["errors"] == {}
+    assert summary["config"]["engine"] == engine
+
+
+@pytest.mark.parametrize("engine", ["threads", "asyncio"])
+def test_live_server_open_loop(engine, tasks, live_server, tmp_path):
+    """Test an open loop sends about ``rate`` requests per second."""
+    summary = run_command(
+        tmp_path, url=live_server.url, engine=engine, mix="detail=1", rate="50", duration="1"
+    )
+
+    assert 25 <= summary["requests"] + summary["missed"] <= 80
+    assert summary["errors"] == {}
+
+
+def test_in_process_wsgi_needs_threads():
+    """Test an engine that cannot drive the in-process app is refused."""
+    with pytest.raises(CommandError, match="needs --engine threads"):
+        call_command("loadtest", "--app=wsgi", "--engine=asyncio", stdout=StringIO())
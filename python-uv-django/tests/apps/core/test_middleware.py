@@ -0,0 +1,95 @@
+"""Tests for the project middleware."""
+
+import json
+import logging
+
+import pytest
+from asgiref.sync import async_to_sync
+
+from django.contrib.sessions.backends.db import SessionStore
+from django.core.cache import cache as default_cache
+from django.test import AsyncClient
+
+from apps.core import timing
+from apps.core.timing import TimedCache
+
+
+@pytest.mark.django_db
+def test_async_login_persists_session(django_user_model):
+    """Test a session written during an ASGI request is saved."""
+    user = django_user_model.objects.create_superuser(username="asgi", password="secret")
+    client = AsyncClient()
+
+    response = async_to_sync(client.post)(
+        "/admin/login/", {"username": "asgi", "password": "secret"}
+    )
+
+    assert response.status_code == 302
+    assert SessionStore(client.cookies["sessionid"].value).get("_auth_user_id") == str(user.pk)
+
+
+def server_timing(response):
+    """Return the ``Server-Timing`` entries of a response by metric name."""
+    return {entry.split(";")[0].strip(): entry for entry in response["Server-Timing"].split(",")}
+
+
+@pytest.mark.django_db
+def test_server_timing_header(api_client, task_factory):
+    """Test API responses report query count and db, cache and serializer time."""
+    task_factory()
+
+    response = api_client.get("/api/tasks/")
+
+    entries = server_timing(response)
+    assert set(entries) == {"db", "cache", "serializer", "total"}
+    assert 'desc="1 queries"' in entries["db"]
+
+
+@pytest.mark.django_db
+def test_server_timing_disabled(api_client, settings):
+    """Test the header can be turned off."""
+    settings.SERVER_TIMING = False
+
+    response = api_client.get("/api/tasks/")
+
+    assert "Server-Timing" not in response
+
+
+@pytest.mark.django_db
+def test_timings_logged(api_client, caplog):
+    """Test every request writes one JSON line with its timings."""
+    caplog.set_level(logging.INFO, logger="apps.core.timing")
+
+    api_client.get("/api/tasks/", {"status": "PENDING"})
+
+    (record,) = [r for r in caplog.records if r.name == "apps.core.timing"]
+    line = json.loads(record.getMessage())
+    assert line == record.timings
+    assert line["method"] == "GET"
+    assert line["path"] == "/api/tasks/"
+    assert line["status"] == 200
+    assert line["queries"] == 1
+    assert line["total_ms"] >= line["db_ms"] >= 0
+
+
+@pytest.mark.django_db
+def test_server_timing_async_chain():
+    """Test queries run in ``sync_to_async`` threads are counted under ASGI."""
+    response = async_to_sync(AsyncClient().get)("/api/tasks/")
+
+    assert 'desc="1 queries"' in server_timing(response)["db"]
+
+
+def test_timed_cache():
+    """Test cache calls are only timed while a request is open."""
+    cache = TimedCache(default_cache)
+    cache.set("key", "value")
+
+    timings, token = timing.start()
+    try:
+        assert cache.get("key") == "value"
+    finally:
+        timing.finish(token)
+
+    assert timings.seconds["cache"] > 0
+    assert timing.current() is None
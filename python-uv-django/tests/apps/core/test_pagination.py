@@ -0,0 +1,215 @@
+"""Tests for keyset and estimated-count pagination."""
+
+import pytest
+
+from django.db import connection
+from django.utils import timezone
+
+from apps.core.models import Task
+from apps.core.pagination import (
+    EstimatedCountPaginator,
+    InvalidCursor,
+    KeysetPaginator,
+    estimate_count,
+)
+
+
+def tiebroken(ordering):
+    """Return ``ordering`` plus the id tiebreaker, in the last column's direction."""
+    return [*ordering, "-id" if ordering[-1].startswith("-") else "id"]
+
+
+def walk_forward(paginator, queryset):
+    """Collect every row by following next cursors from the first page."""
+    rows, cursor = [], None
+    while True:
+        page = paginator.paginate(queryset, cursor)
+        rows.extend(page.object_list)
+        if not page.has_next():
+            return rows, page
+        cursor = page.next_cursor
+
+
+@pytest.mark.django_db
+class TestKeysetPaginator:
+    """Test KeysetPaginator functionality."""
+
+    @pytest.fixture
+    def tasks(self, task_factory):
+        """Create tasks with duplicate priorities and some missing due dates."""
+        now = timezone.now()
+        return [
+            task_factory(
+                title=f"Task {i}",
+                priority=i % 3,
+                due_date=None if i % 4 == 0 else now + timezone.timedelta(days=i % 5),
+            )
+            for i in range(11)
+        ]
+
+    @pytest.mark.parametrize(
+        "ordering",
+        [
+            ["-priority", "-created_at"],
+            ["priority"],
+            ["due_date"],
+            ["-due_date"],
+            ["title"],
+            ["status", "-priority"],
+        ],
+    )
+    def test_forward_walk_matches_ordered_queryset(self, tasks, ordering):
+        """Test following cursors visits every row once in ORDER BY order."""
+        paginator = KeysetPaginator(Task, ordering, page_size=3)
+        expected = list(Task.objects.order_by(*tiebroken(ordering)))
+
+        rows, _ = walk_forward(paginator, Task.objects.all())
+
+        assert rows == expected
+
+    @pytest.mark.parametrize("ordering", [["-priority", "-created_at"], ["due_date"]])
+    def test_backward_walk(self, tasks, ordering):
+        """Test previous cursors walk back to the first page."""
+        paginator = KeysetPaginator(Task, ordering, page_size=4)
+        expected = list(Task.objects.order_by(*tiebroken(ordering)))
+        _, page = walk_forward(paginator, Task.objects.all())
+
+        rows = list(page.object_list)
+        while page.has_previous():
+            page = paginator.paginate(Task.objects.all(), page.previous_cursor)
+            rows = list(page.object_list) + rows
+
+        assert rows == expected
+        assert page.has_next()
+
+    def test_first_page_has_no_previous(self, tasks):
+        """Test the first page only links forward."""
+        page = KeysetPaginator(Task, ["-priority"], page_size=5).paginate(Task.objects.all(), None)
+
+        assert len(page) == 5
+        assert page.has_next()
+        assert not page.has_previous()
+
+    def test_cursor_is_bound_to_ordering(self, tasks):
+        """Test a cursor minted for one ordering is rejected by another."""
+        page = KeysetPaginator(Task, ["priority"], page_size=2).paginate(Task.objects.all(), None)
+
+        with pytest.raises(InvalidCursor):
+            KeysetPaginator(Task, ["title"], page_size=2).paginate(
+                Task.objects.all(), page.next_cursor
+            )
+
+    def test_garbage_cursor_is_rejected(self):
+        """Test malformed cursors raise InvalidCursor."""
+        with pytest.raises(InvalidCursor):
+            KeysetPaginator(Task, ["priority"], page_size=2).decode_cursor("not-a-cursor")
+
+    def test_pages_issue_no_count_query(self, tasks, django_assert_num_queries):
+        """Test each page costs a single query."""
+        paginator = KeysetPaginator(Task, ["-priority", "-created_at"], page_size=3)
+        cursor = paginator.paginate(Task.objects.all(), None).next_cursor
+
+        with django_assert_num_queries(1):
+            paginator.paginate(Task.objects.all(), cursor)
+
+    def test_task_list_view_uses_cursor(self, rf, tasks):
+        """Test TaskListView pages with cursors and still honours ?page=."""
+        from apps.core.views import TaskListView
+
+        view = TaskListView()
+        view.setup(rf.get("/tasks/"))
+        view.object_list = view.get_queryset()
+        context = view.get_context_data()
+
+        assert len(context["tasks"]) == 10
+        assert context["page_obj"].has_next()
+        assert context["is_paginated"]
+
+        view.setup(rf.get("/tasks/", {"page": 2}))
+        view.object_list = view.get_queryset()
+        context = view.get_context_data()
+
+        assert context["page_obj"].number == 2
+        assert len(context["tasks"]) == 1
+
+
+@pytest.mark.django_db
+class TestEstimatedCountPaginator:
+    """Test counts are taken from planner statistics above the threshold."""
+
+    @pytest.fixture
+    def analyzed(self, task_factory, settings):
+        """Create 12 tasks in two statuses and gather planner statistics."""
+        settings.COUNT_ESTIMATE_THRESHOLD = 5
+        for i in range(12):
+            task_factory(
+                title=f"Task {i}", status=Task.Status.PENDING if i % 3 else Task.Status.COMPLETED
+            )
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+    def test_estimate_above_threshold(self, analyzed):
+        """Test a large unfiltered count is estimated and flagged."""
+        paginator = EstimatedCountPaginator(Task.objects.all(), 5)
+
+        assert paginator.count == 12
+        assert paginator.count_is_estimate
+        assert paginator.num_pages == 3
+
+    def test_exact_below_threshold(self, analyzed, settings):
+        """Test small tables, and a zero threshold, are counted exactly."""
+        settings.COUNT_ESTIMATE_THRESHOLD = 100
+        assert not EstimatedCountPaginator(Task.objects.all(), 5).count_is_estimate
+        settings.COUNT_ESTIMATE_THRESHOLD = 0
+        assert not EstimatedCountPaginator(Task.objects.all(), 5).count_is_estimate
+
+    def test_indexed_equality_filter(self, analyzed):
+        """Test equality filters on a leading index column use its rows per key."""
+        assert estimate_count(Task.objects.filter(status=Task.Status.PENDING)) == 6
+        assert (
+            estimate_count(
+                Task.objects.filter(status__in=[Task.Status.PENDING, Task.Status.COMPLETED])
+            )
+            == 12
+        )
+        assert estimate_count(Task.objects.filter(pk=1, status=Task.Status.PENDING)) == 1
+
+    def test_unknown_filter_is_counted(self, analyzed):
+        """Test filters the statistics cannot answer fall back to COUNT(*)."""
+        queryset = Task.objects.filter(title__startswith="Task 1")
+        paginator = EstimatedCountPaginator(queryset, 5)
+
+        assert estimate_count(queryset) is None
+        assert estimate_count(Task.objects.exclude(status=Task.Status.PENDING)) is None
+        assert paginator.count == 3
+        assert not paginator.count_is_estimate
+
+    def test_no_statistics(self, task_factory, settings):
+        """Test a table never analyzed is counted exactly."""
+        settings.COUNT_ESTIMATE_THRESHOLD = 1
+        task_factory()
+
+        assert estimate_count(Task.objects.all()) is None
+        assert not EstimatedCountPaginator(Task.objects.all(), 5).count_is_estimate
+
+    def test_pages_past_estimate(self, analyzed, task_factory):
+        """Test rows added since ANALYZE stay reachable past the estimated end."""
+        for i in range(4):
+            task_factory(title=f"Late {i}")
+        paginator = EstimatedCountPaginator(Task.objects.order_by("pk"), 5)
+
+        assert paginator.num_pages == 3
+        assert len(paginator.page(4)) == 1
+        assert len(paginator.page(5)) == 0
+
+    def test_admin_changelist(self, analyzed, admin_client):
+        """Test the admin changelist flags estimated counts."""
+        response = admin_client.get("/admin/core/task/", {"status__exact": Task.Status.PENDING})
+        content = response.content.decode()
+
+        assert response.status_code == 200
+        assert response.context["cl"].paginator.count_is_estimate
+        assert response.context["cl"].full_result_count_is_estimate
+        assert "~6 results" in content
+        assert "~12 total" in content
+        assert "~6 Tasks" in content
@@ -0,0 +1,138 @@
+"""Plan regression tests for the hot task queries.
+
+Every query the selectors, the task API and the admin changelist send for
+``core_task`` is run through ``EXPLAIN`` on a seeded, analyzed table. A full
+table scan or a sort of the result (a filesort) fails the test, so dropping
+or reshaping an index that one of them relies on is caught here.
+"""
+
+import json
+
+import pytest
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.core.models import Task
+from apps.core.selectors import TaskSelector
+
+ROWS = 200
+
+NOW = timezone.now()
+
+
+def next_page(client):
+    """Follow the first page's cursor, which adds the keyset seek predicate."""
+    client.get(client.get("/api/tasks/").data["next"])
+
+
+API_REQUESTS = {
+    "api list": {},
+    "api status": {"status": Task.Status.PENDING},
+    "api overdue": {"overdue": "true"},
+    "api overdue by due_date": {"overdue": "true", "ordering": "due_date"},
+    "api due_date": {"ordering": "due_date"},
+    "api -due_date": {"ordering": "-due_date"},
+    "api page number": {"page": 2},
+}
+
+ADMIN_REQUESTS = {
+    "admin changelist": {},
+    "admin status": {"status__exact": Task.Status.PENDING},
+    "admin priority": {"priority": "2"},
+    "admin year": {"created_at__year": NOW.year},
+    "admin page": {"p": 2},
+}
+
+# Callables taking the test client; selector results are paged like their callers do.
+SCENARIOS = {
+    "selector pending": lambda _client: list(TaskSelector.get_pending_tasks()[:10]),
+    "selector completed": lambda _client: list(TaskSelector.get_completed_tasks()[:10]),
+    "selector overdue": lambda _client: list(TaskSelector.get_overdue_tasks()[:10]),
+    "selector statistics": lambda _client: TaskSelector.get_statistics(
+        Task.objects.filter(status=Task.Status.PENDING)
+    ),
+    **{
+        name: lambda client, params=params: client.get("/api/tasks/", params)
+        for name, params in API_REQUESTS.items()
+    },
+    "api next page": next_page,
+    "api pending": lambda client: client.get("/api/tasks/pending/"),
+    **{
+        name: lambda client, params=params: client.get("/admin/core/task/", params)
+        for name, params in ADMIN_REQUESTS.items()
+    },
+}
+
+
+def explain(sql):
+    """Return the plan of ``sql`` as a list of step descriptions."""
+    with connection.cursor() as cursor:
+        if connection.vendor == "postgresql":
+            # Tiny tables are cheaper to scan; only fall back to a scan or a
+            # sort when no index can answer the query at all.
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            cursor.execute("SET LOCAL enable_sort = off")
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}")
+            plan = cursor.fetchone()[0]
+            plan = json.loads(plan) if isinstance(plan, str) else plan
+            return list(_postgresql_steps(plan[0]["Plan"]))
+        cursor.execute(f"EXPLAIN QUERY PLAN {sql}")
+        return [row[3] for row in cursor.fetchall()]
+
+
+def _postgresql_steps(node):
+    """Yield ``"<node type> <relation>"`` for every node of a JSON plan."""
+    yield f"{node['Node Type']} {node.get('Relation Name', '')}".strip()
+    for child in node.get("Plans", []):
+        yield from _postgresql_steps(child)
+
+
+def is_full_scan(step):
+    """Return whether a plan step reads every row of the task table."""
+    if connection.vendor == "postgresql":
+        return step == "Seq Scan core_task"
+    return step == "SCAN core_task"
+
+
+def is_filesort(step):
+    """Return whether a plan step sorts rows an index could have ordered."""
+    if connection.vendor == "postgresql":
+        return step in ("Sort", "Incremental Sort")
+    return step.startswith("USE TEMP B-TREE FOR") and "ORDER BY" in step
+
+
+@pytest.fixture
+def seeded(db):
+    """Seed tasks in every status, some without due dates, and analyze them."""
+    Task.objects.bulk_create(
+        Task(
+            title=f"Task {i}",
+            status=Task.Status.values[i % len(Task.Status.values)],
+            priority=i % 5,
+            due_date=None if i % 7 == 0 else NOW + timezone.timedelta(days=i % 11 - 5),
+        )
+        for i in range(ROWS)
+    )
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
+
+
+@pytest.mark.parametrize("name", SCENARIOS)
+def test_no_full_scan_or_filesort(name, seeded, request):
+    """Test every task query is answered from an index, in index order."""
+    client = request.getfixturevalue("admin_client" if name.startswith("admin") else "api_client")
+    with CaptureQueriesContext(connection) as queries:
+        SCENARIOS[name](client)
+
+    plans = {
+        query["sql"]: explain(query["sql"])
+        for query in queries.captured_queries
+        if query["sql"].startswith("SELECT") and '"core_task"' in query["sql"]
+    }
+
+    assert plans, "scenario issued no task query"
+    for sql, steps in plans.items():
+        assert not any(is_full_scan(step) for step in steps), f"full scan: {steps}\n{sql}"
+        assert not any(is_filesort(step) for step in steps), f"filesort: {steps}\n{sql}"
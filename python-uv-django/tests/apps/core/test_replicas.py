@@ -0,0 +1,242 @@
+"""Tests for the read replica router, its middleware and read-your-writes pins."""
+
+import sqlite3
+import threading
+import time
+
+import pytest
+from asgiref.sync import async_to_sync
+
+from django.db import connection, connections, transaction
+from django.db.utils import load_backend
+from django.test import AsyncClient
+from django.urls import include, path, resolve
+from rest_framework.routers import DefaultRouter
+
+from apps.api.views import AsyncTaskViewSet
+from apps.core.cache import _list_timeout
+from apps.core.models import Task
+from apps.core.replicas import PIN_COOKIE, PIN_HEADER, ReplicaRouter, replica_reads
+
+WEIGHTS = {"replica_1": 2, "replica_2": 1}
+
+# AsyncTaskViewSet is only routed under ASGI, so the async test mounts it here.
+router = DefaultRouter()
+router.register(r"tasks", AsyncTaskViewSet, basename="task")
+urlpatterns = [path("api/", include((router.urls, "api")))]
+
+
+@pytest.fixture
+def replicas(tmp_path, settings, transactional_db):
+    """Two SQLite files standing in for replicas, each with a task of its own.
+
+    The files are copies of the (migrated) test database; the primary gets a
+    task of its own too, so every title tells which database it came from.
+    """
+    connection.ensure_connection()
+    for alias in WEIGHTS:
+        path = tmp_path / f"{alias}.sqlite3"
+        copy = sqlite3.connect(path)
+        connection.connection.backup(copy)
+        copy.close()
+        # Connections Django does not know from DATABASES are allowed in tests.
+        settings_dict = {**connection.settings_dict, "NAME": str(path)}
+        connections[alias] = load_backend(settings_dict["ENGINE"]).DatabaseWrapper(
+            settings_dict, alias
+        )
+    settings.DATABASE_REPLICAS = WEIGHTS
+    settings.DATABASE_ROUTERS = ["apps.core.replicas.ReplicaRouter"]
+    settings.TASK_LIST_CACHE_TIMEOUT = 0
+    for alias in ["default", *WEIGHTS]:
+        Task.objects.using(alias).create(title=f"From {alias}")
+    yield tmp_path
+    for alias in WEIGHTS:
+        connections[alias].close()
+        del connections[alias]
+
+
+def titles(response):
+    """Return the task titles of a list response."""
+    return [task["title"] for task in response.json()["results"]]
+
+
+def take_down(alias, tmp_path):
+    """Point ``alias`` at a file that cannot be opened."""
+    connections[alias].close()
+    connections[alias].settings_dict["NAME"] = str(tmp_path / "missing" / "db.sqlite3")
+
+
+class TestReplicaRouter:
+    """Test which database reads and writes are routed to."""
+
+    def test_reads_outside_a_scope_use_the_primary(self, replicas):
+        """Test only code inside a replica scope reads replicas."""
+        assert Task.objects.get().title == "From default"
+
+    def test_weighted_round_robin(self, replicas):
+        """Test replicas are picked in proportion to, and interleaved by, weight."""
+        pool = ReplicaRouter().pool
+
+        assert [pool.choose() for _ in range(6)] == [
+            "replica_1",
+            "replica_2",
+            "replica_1",
+        ] * 2
+
+    def test_one_replica_per_scope(self, replicas):
+        """Test all reads of a scope go to the same replica."""
+        with replica_reads():
+            assert Task.objects.get().title == "From replica_1"
+            assert Task.objects.values_list("title", flat=True).get() == "From replica_1"
+        with replica_reads():
+            assert Task.objects.get().title == "From replica_2"
+
+    def test_writes_go_to_the_primary_and_pin_the_scope(self, replicas):
+        """Test set-based writes hit the primary, and later reads follow them there."""
+        with replica_reads():
+            assert Task.objects.filter(title__startswith="From").update(priority=7) == 1
+            assert Task.objects.get().priority == 7
+        assert Task.objects.using("replica_1").get().priority == 0
+
+    def test_transactions_read_the_primary(self, replicas):
+        """Test reads inside a transaction on the primary stay on the primary."""
+        with replica_reads(), transaction.atomic():
+            assert Task.objects.get().title == "From default"
+
+    def test_unhealthy_replicas_are_skipped(self, replicas):
+        """Test a replica that fails its check gets no reads, and none left means the primary."""
+        take_down("replica_1", replicas)
+        pool = ReplicaRouter().pool
+
+        assert [pool.choose() for _ in range(3)] == ["replica_2"] * 3
+        take_down("replica_2", replicas)
+        pool.mark_down("replica_2")
+        assert pool.choose() is None
+        with replica_reads():
+            assert Task.objects.get().title == "From default"
+
+    def test_one_thread_checks_at_a_time(self, replicas, monkeypatch):
+        """Test a thread finding a check under way goes by the last result instead of waiting."""
+        pool = ReplicaRouter().pool
+        probing = threading.Event()
+        release = threading.Event()
+        checks = []
+
+        def check(alias):
+            checks.append(alias)
+            probing.set()
+            release.wait(5)
+            return False
+
+        monkeypatch.setattr(pool, "check", check)
+        prober = threading.Thread(target=pool.healthy, args=["replica_1"])
+        prober.start()
+        probing.wait(5)
+        try:
+            assert pool.healthy("replica_1") is True
+            assert pool.healthy("replica_2") is True
+        finally:
+            release.set()
+            prober.join()
+
+        assert checks == ["replica_1"]
+        assert pool.healthy("replica_1") is False
+
+    def test_replicas_are_not_migrated(self, replicas):
+        """Test migrations only run on the primary."""
+        router = ReplicaRouter()
+
+        assert router.allow_migrate("replica_1", "core") is False
+        assert router.allow_migrate("default", "core") is None
+
+
+class TestReplicaMiddleware:
+    """Test requests read replicas, and clients that wrote read their writes."""
+
+    def test_marked_views_read_replicas(self, replicas, api_client):
+        """Test GETs to the task API are spread over the replicas."""
+        pages = [titles(api_client.get("/api/tasks/")) for _ in range(3)]
+
+        assert pages == [["From replica_1"], ["From replica_2"], ["From replica_1"]]
+        assert PIN_HEADER not in api_client.get("/api/tasks/")
+
+    def test_marked_html_views(self):
+        """Test the home page and task list read replicas, the detail page does not."""
+        assert resolve("/").func.replica_reads
+        assert resolve("/tasks/").func.view_class.replica_reads
+        assert not hasattr(resolve("/tasks/1/").func.view_class, "replica_reads")
+
+    def test_object_cache_loads_from_the_primary(self, replicas, api_client, settings):
+        """Test retrieve misses fill the object cache from the primary."""
+        pk = Task.objects.get().pk
+
+        assert api_client.get(f"/api/tasks/{pk}/").json()["title"] == "From default"
+        settings.TASK_OBJECT_CACHE_SIZE = 0
+        assert api_client.get(f"/api/tasks/{pk}/").json()["title"] == "From replica_2"
+
+    def test_writes_pin_the_client(self, replicas, api_client, settings):
+        """Test a successful write pins the client to the primary for the window."""
+        settings.TASK_LIST_CACHE_TIMEOUT = 60
+
+        response = api_client.post("/api/tasks/", {"title": "New"}, format="json")
+
+        expires = float(response[PIN_HEADER])
+        assert time.time() < expires <= time.time() + settings.DATABASE_REPLICA_PIN_SECONDS
+        assert response.cookies[PIN_COOKIE]["max-age"] == settings.DATABASE_REPLICA_PIN_SECONDS
+        response = api_client.get("/api/tasks/")
+        assert sorted(titles(response)) == ["From default", "New"]
+        assert "X-Cache" not in response
+
+    def test_pin_header(self, replicas, api_client, settings):
+        """Test clients without cookies stay pinned by sending the header back."""
+        live = time.time() + settings.DATABASE_REPLICA_PIN_SECONDS
+        expired = time.time() - 1
+        too_long = time.time() + settings.DATABASE_REPLICA_PIN_SECONDS + 60
+
+        assert titles(api_client.get("/api/tasks/", HTTP_X_DB_PIN=str(live))) == ["From default"]
+        for value in (expired, too_long, "soon"):
+            response = api_client.get("/api/tasks/", HTTP_X_DB_PIN=str(value))
+            assert titles(response) != ["From default"]
+
+    def test_failing_replica_falls_back_to_the_primary(self, replicas, api_client):
+        """Test a replica failing mid-request is left out and the request served by the primary."""
+        assert titles(api_client.get("/api/tasks/")) == ["From replica_1"]
+        take_down("replica_1", replicas)
+        api_client.get("/api/tasks/")  # replica_2
+
+        response = api_client.get("/api/tasks/")
+
+        assert response.status_code == 200
+        assert titles(response) == ["From default"]
+        assert [titles(api_client.get("/api/tasks/")) for _ in range(2)] == [["From replica_2"]] * 2
+
+    def test_failed_writes_do_not_pin(self, replicas, api_client):
+        """Test a rejected write leaves the client on the replicas."""
+        response = api_client.post("/api/tasks/", {"priority": -1}, format="json")
+
+        assert response.status_code == 400
+        assert PIN_HEADER not in response
+
+    def test_async_chain(self, replicas, settings):
+        """Test the async handlers read replicas and honour pins too."""
+        settings.ROOT_URLCONF = __name__
+        client = AsyncClient()
+
+        response = async_to_sync(client.get)("/api/tasks/")
+        assert titles(response) == ["From replica_1"]
+        response = async_to_sync(client.get)(
+            "/api/tasks/", headers={PIN_HEADER: str(time.time() + 1)}
+        )
+        assert titles(response) == ["From default"]
+        take_down("replica_2", replicas)
+        response = async_to_sync(client.get)("/api/tasks/")
+        assert titles(response) == ["From default"]
+
+
+def test_replica_pages_are_cached_for_the_pin_window(settings):
+    """Test listings read from a replica expire with the pin window."""
+    settings.DATABASE_REPLICAS = WEIGHTS
+    settings.TASK_LIST_CACHE_TIMEOUT = 60
+
+    assert _list_timeout("default") == 60
+    assert _list_timeout("replica_1") == settings.DATABASE_REPLICA_PIN_SECONDS
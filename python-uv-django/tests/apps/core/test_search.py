@@ -0,0 +1,94 @@
+"""Tests for task full-text search backends."""
+
+import pytest
+
+from django.contrib.admin.sites import site
+
+from apps.core.models import Task
+from apps.core.search import (
+    SQLiteTaskSearchBackend,
+    TaskSearchBackend,
+    get_task_search_backend,
+    install_sqlite_fts_triggers,
+)
+
+
+def titles(queryset):
+    """Return the titles in ``queryset`` as a set."""
+    return set(queryset.values_list("title", flat=True))
+
+
+@pytest.mark.django_db
+class TestTaskSearch:
+    """Test the search backends against the migrated test database."""
+
+    @pytest.fixture
+    def tasks(self, task_factory):
+        """Create tasks with distinct searchable text."""
+        return [
+            task_factory(title="Python Development", description="Write Python code"),
+            task_factory(title="JavaScript Development", description="Write JS code"),
+            task_factory(title="Release notes", description="Summarise the python upgrade"),
+        ]
+
+    def test_sqlite_uses_fts_backend(self):
+        """Test the FTS5 backend is selected on a migrated SQLite database."""
+        assert isinstance(get_task_search_backend(), SQLiteTaskSearchBackend)
+
+    @pytest.mark.parametrize("backend", [SQLiteTaskSearchBackend(), TaskSearchBackend()])
+    def test_backends_agree(self, tasks, backend):
+        """Test the indexed and fallback backends return the same rows."""
+        queryset = Task.objects.all()
+
+        assert titles(backend.search(queryset, "python")) == {
+            "Python Development",
+            "Release notes",
+        }
+        assert titles(backend.search(queryset, "Write JS")) == {"JavaScript Development"}
+        assert titles(backend.search(queryset, "Develop")) == {
+            "Python Development",
+            "JavaScript Development",
+        }
+        assert not backend.search(queryset, "!!!").exists()
+
+    def test_index_follows_writes(self, tasks):
+        """Test saves, bulk writes and deletes are reflected by the FTS index."""
+        backend = SQLiteTaskSearchBackend()
+        tasks[1].title = "Rust Development"
+        tasks[1].save()
+        Task.objects.bulk_create([Task(title="Bulk Rust import")])
+        Task.objects.filter(title="Release notes").update(description="Nothing relevant")
+        tasks[0].delete()
+
+        assert titles(backend.search(Task.objects.all(), "rust")) == {
+            "Rust Development",
+            "Bulk Rust import",
+        }
+        assert not backend.search(Task.objects.all(), "python").exists()
+
+    def test_rank_prefers_title_matches(self, tasks):
+        """Test ranked results put title matches before description matches."""
+        results = SQLiteTaskSearchBackend().search(Task.objects.all(), "python", rank=True)
+
+        ranked = [task.title for task in results.order_by("-search_rank")]
+
+        assert ranked == ["Python Development", "Release notes"]
+
+    def test_triggers_reinstall_is_idempotent(self, tasks):
+        """Test re-installing the triggers after migrate is harmless."""
+        install_sqlite_fts_triggers("default")
+
+        assert titles(SQLiteTaskSearchBackend().search(Task.objects.all(), "javascript")) == {
+            "JavaScript Development"
+        }
+
+    def test_admin_search_uses_backend(self, rf, tasks):
+        """Test the admin changelist search goes through the backend."""
+        model_admin = site._registry[Task]
+
+        queryset, may_have_duplicates = model_admin.get_search_results(
+            rf.get("/"), Task.objects.all(), "python"
+        )
+
+        assert titles(queryset) == {"Python Development", "Release notes"}
+        assert may_have_duplicates is False
@@ -0,0 +1,58 @@
+"""Tests for core app serializers."""
+
+import datetime
+
+import pytest
+
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from apps.core.models import Task
+from apps.core.serializers import TaskReadSerializer, TaskSerializer
+
+
+@pytest.mark.django_db
+class TestTaskReadSerializer:
+    """Test the fast read-path serializer matches TaskSerializer exactly."""
+
+    @pytest.fixture
+    def tasks(self, task_factory):
+        """Create tasks covering every branch of the representation."""
+        now = timezone.now()
+        task_factory(title="No due date", description="")
+        task_factory(title="Overdue", due_date=now - datetime.timedelta(days=3), priority=100)
+        task_factory(title="Future", due_date=now + datetime.timedelta(days=3, microseconds=7))
+        task_factory(
+            title="Done late ✓",
+            description="ünïcödé\nmulti-line",
+            status=Task.Status.COMPLETED,
+            due_date=now - datetime.timedelta(days=1),
+        )
+        Task.objects.filter(title="Done late ✓").update(completed_at=now)
+
+    @pytest.mark.parametrize("tz", ["UTC", "America/New_York", "Asia/Kolkata"])
+    def test_output_is_byte_identical(self, tasks, tz):
+        """Test rendering both serializers yields the same bytes."""
+        renderer = JSONRenderer()
+        queryset = Task.objects.all()
+
+        with timezone.override(tz):
+            expected = renderer.render(TaskSerializer(queryset, many=True).data)
+            rows = queryset.values(*TaskReadSerializer.values_fields)
+            actual = renderer.render(TaskReadSerializer(rows, many=True).data)
+            single = renderer.render(TaskReadSerializer(queryset.first()).data)
+            expected_single = renderer.render(TaskSerializer(queryset.first()).data)
+
+        assert actual == expected
+        assert single == expected_single
+
+    def test_uses_one_now(self, task_factory):
+        """Test is_overdue is evaluated against the context's now."""
+        due = timezone.now() + datetime.timedelta(hours=1)
+        task_factory(due_date=due)
+        rows = Task.objects.values(*TaskReadSerializer.values_fields)
+
+        later = {"now": due + datetime.timedelta(seconds=1)}
+        data = TaskReadSerializer(rows, many=True, context=later).data
+
+        assert data[0]["is_overdue"] is True
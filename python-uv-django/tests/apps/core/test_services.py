@@ -1,9 +1,25 @@
 """Tests for core app services."""
 
+from unittest.mock import Mock
+
 import pytest
+from asgiref.sync import async_to_sync
+
+from django.contrib import messages
+from django.contrib.admin.sites import site
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.core.models import Task, TaskCounter
+from apps.core.services import InvalidTransition, TaskService
 
-from apps.core.models import Task
-from apps.core.services import TaskService
+
+def counters_match():
+    """Return whether the status counters agree with the task table."""
+    stored = dict(TaskCounter.objects.exclude(key=TaskCounter.OVERDUE).values_list("key", "value"))
+    actual = Task.objects.status_counts()
+    return {key: value for key, value in stored.items() if value} == actual
 
 
 @pytest.mark.django_db
@@ -46,3 +62,148 @@ class TestTaskService:
         started_task = TaskService.start_task(sample_task)
 
         assert started_task.status == Task.Status.IN_PROGRESS
+
+    def test_async_complete_and_start_task(self, task_factory):
+        """Test the async transitions persist like the sync ones."""
+        to_complete = task_factory()
+        to_start = task_factory()
+
+        async_to_sync(TaskService.acomplete_task)(to_complete)
+        async_to_sync(TaskService.astart_task)(to_start)
+
+        to_complete.refresh_from_db()
+        to_start.refresh_from_db()
+        assert to_complete.status == Task.Status.COMPLETED
+        assert to_complete.completed_at is not None
+        assert to_start.status == Task.Status.IN_PROGRESS
+
+    def test_bulk_create_tasks(self):
+        """Test creating tasks in bulk through service."""
+        tasks = TaskService.bulk_create_tasks(
+            [{"title": "First"}, {"title": "Second", "priority": 7}]
+        )
+
+        assert all(task.pk is not None for task in tasks)
+        assert list(Task.objects.order_by("pk").values_list("title", "priority")) == [
+            ("First", 0),
+            ("Second", 7),
+        ]
+
+    def test_bulk_update_tasks(self, task_factory):
+        """Test applying per-task changes in bulk through service."""
+        first = task_factory(title="First")
+        second = task_factory(title="Second")
+
+        TaskService.bulk_update_tasks(
+            [first, second], [{"priority": 9}, {"status": Task.Status.IN_PROGRESS}]
+        )
+
+        first.refresh_from_db()
+        second.refresh_from_db()
+        assert first.priority == 9
+        assert second.status == Task.Status.IN_PROGRESS
+        assert second.updated_at > second.created_at
+
+    def test_bulk_complete_and_start_tasks(self, task_factory):
+        """Test set-based transitions through service."""
+        tasks = [task_factory(title=f"Task {i}") for i in range(3)]
+
+        started = TaskService.bulk_start_tasks(Task.objects.filter(pk=tasks[0].pk))
+        completed = TaskService.bulk_complete_tasks(
+            Task.objects.filter(pk__in=[tasks[1].pk, tasks[2].pk])
+        )
+
+        assert (started, completed) == (1, 2)
+        assert Task.objects.filter(status=Task.Status.IN_PROGRESS).count() == 1
+        assert not Task.objects.filter(status=Task.Status.COMPLETED, completed_at=None).exists()
+
+
+@pytest.mark.django_db
+class TestTaskTransitions:
+    """Test the set-based transition engine."""
+
+    def test_transition_by_ids(self, multiple_tasks):
+        """Test allowed rows move with UPDATE ... RETURNING and the rest are skipped."""
+        pending, in_progress, completed = multiple_tasks
+
+        with CaptureQueriesContext(connection) as queries:
+            updated = TaskService.transition_tasks(
+                [task.pk for task in multiple_tasks], Task.Status.COMPLETED
+            )
+
+        assert {task.pk for task in updated} == {pending.pk, in_progress.pk}
+        assert all(task.completed_at and task.status == Task.Status.COMPLETED for task in updated)
+        task_queries = [q["sql"] for q in queries if '"core_task"' in q["sql"]]
+        assert all(sql.startswith("UPDATE") and "RETURNING" in sql for sql in task_queries)
+        completed.refresh_from_db()
+        assert completed.updated_at == multiple_tasks[2].updated_at
+        assert counters_match()
+
+    def test_forced_transition(self, multiple_tasks):
+        """Test ``force`` reopens completed tasks and clears ``completed_at``."""
+        completed = multiple_tasks[2]
+        Task.objects.filter(pk=completed.pk).update(completed_at=timezone.now())
+
+        assert not TaskService.transition_tasks([completed.pk], Task.Status.PENDING)
+        reopened = TaskService.transition_tasks([completed.pk], Task.Status.PENDING, force=True)
+
+        assert reopened[0].status == Task.Status.PENDING
+        assert reopened[0].completed_at is None
+        assert counters_match()
+
+    def test_transition_without_returning(self, multiple_tasks, monkeypatch):
+        """Test databases without UPDATE ... RETURNING get the same result."""
+        monkeypatch.setattr(connection.features, "can_return_rows_from_update", False)
+
+        updated = TaskService.transition_tasks(Task.objects.all(), Task.Status.IN_PROGRESS)
+
+        assert [task.title for task in updated] == ["Pending Task"]
+        assert updated[0].status == Task.Status.IN_PROGRESS
+        assert counters_match()
+
+    def test_transition_task(self, sample_task):
+        """Test a single task moves by id and updates a passed instance."""
+        started = TaskService.start_task(sample_task.pk)
+        assert started.status == Task.Status.IN_PROGRESS
+
+        TaskService.complete_task(sample_task)
+        assert sample_task.status == Task.Status.COMPLETED
+
+        # Already completed: returned unchanged.
+        assert TaskService.complete_task(sample_task.pk).completed_at == sample_task.completed_at
+        with pytest.raises(InvalidTransition):
+            TaskService.start_task(sample_task.pk)
+        with pytest.raises(Task.DoesNotExist):
+            TaskService.start_task(0)
+
+    def test_async_transitions(self, multiple_tasks):
+        """Test the async transitions follow the same rules as the sync ones."""
+        pending, in_progress, completed = multiple_tasks
+
+        updated = async_to_sync(TaskService.atransition_tasks)(
+            [task.pk for task in multiple_tasks], Task.Status.COMPLETED
+        )
+
+        assert {task.pk for task in updated} == {pending.pk, in_progress.pk}
+        assert counters_match()
+        async_to_sync(TaskService.atransition_task)(completed, Task.Status.PENDING, force=True)
+        assert completed.status == Task.Status.PENDING
+        with pytest.raises(InvalidTransition):
+            async_to_sync(TaskService.astart_task)(pending.pk)
+        with pytest.raises(Task.DoesNotExist):
+            async_to_sync(TaskService.astart_task)(0)
+
+    def test_admin_actions_report_skipped(self, rf, multiple_tasks, monkeypatch):
+        """Test admin actions move allowed tasks and warn about the others."""
+        model_admin = site._registry[Task]
+        message_user = Mock()
+        monkeypatch.setattr(model_admin, "message_user", message_user)
+
+        model_admin.mark_as_pending(rf.post("/"), Task.objects.all())
+
+        assert Task.objects.status_counts() == {
+            Task.Status.PENDING: 2,
+            Task.Status.COMPLETED: 1,
+        }
+        assert message_user.call_args_list[0].args[1] == "1 tasks marked as pending."
+        assert message_user.call_args_list[1].args[2] == messages.WARNING
@@ -0,0 +1,122 @@
+"""Tests for the SQLite high-concurrency mode and its write-queueing backend."""
+
+import sqlite3
+import threading
+
+import pytest
+
+from django.db import connection, connections, transaction
+from django.db.utils import load_backend
+
+from config.database import sqlite_concurrency
+
+ALIAS = "concurrent"
+
+
+def open_connection(path, timeout=5.0):
+    """Register a high-concurrency connection to ``path`` for this thread."""
+    config = {
+        **connection.settings_dict,
+        **sqlite_concurrency(
+            {"ENGINE": "django.db.backends.sqlite3", "NAME": str(path)},
+            timeout=timeout,
+            mmap_size=1024 * 1024,
+            cache_size=4096,
+        ),
+    }
+    connections[ALIAS] = load_backend(config["ENGINE"]).DatabaseWrapper(config, ALIAS)
+    return connections[ALIAS]
+
+
+@pytest.fixture
+def database(tmp_path, db):
+    """A SQLite file with one table, and a connection to it for this thread."""
+    path = tmp_path / "concurrent.sqlite3"
+    with open_connection(path).cursor() as cursor:
+        cursor.execute("CREATE TABLE item (n integer)")
+    yield path
+    connections[ALIAS].close()
+    del connections[ALIAS]
+
+
+def test_connection_pragmas(database):
+    """Test every new connection runs in WAL mode with the configured tuning."""
+    pragmas = {}
+    with connections[ALIAS].cursor() as cursor:
+        for name in ("journal_mode", "synchronous", "mmap_size", "cache_size", "busy_timeout"):
+            cursor.execute(f"PRAGMA {name}")
+            pragmas[name] = cursor.fetchone()[0]
+
+    assert pragmas == {
+        "journal_mode": "wal",
+        "synchronous": 1,
+        "mmap_size": 1024 * 1024,
+        "cache_size": -4096,
+        "busy_timeout": 5000,
+    }
+
+
+def test_transactions_take_the_write_lock_up_front(database):
+    """Test ``atomic()`` begins IMMEDIATE, so other writers wait before it writes."""
+    other = sqlite3.connect(database, timeout=0)
+    with transaction.atomic(using=ALIAS):
+        connections[ALIAS].cursor().execute("SELECT count(*) FROM item")
+        assert connections[ALIAS].holds_write_lock
+        with pytest.raises(sqlite3.OperationalError, match="database is locked"):
+            other.execute("BEGIN IMMEDIATE")
+    assert not connections[ALIAS].holds_write_lock
+    other.execute("BEGIN IMMEDIATE")
+    other.rollback()
+    other.close()
+
+
+def test_lock_is_released_on_rollback(database):
+    """Test a failed transaction lets the next one in."""
+    with pytest.raises(RuntimeError), transaction.atomic(using=ALIAS):
+        connections[ALIAS].cursor().execute("INSERT INTO item VALUES (1)")
+        raise RuntimeError
+
+    assert not connections[ALIAS].holds_write_lock
+    with transaction.atomic(using=ALIAS):
+        connections[ALIAS].cursor().execute("INSERT INTO item VALUES (2)")
+    with connections[ALIAS].cursor() as cursor:
+        cursor.execute("SELECT n FROM item")
+        assert cursor.fetchall() == [(2,)]
+
+
+def test_threads_queue_their_writes(database):
+    """Test read-then-write transactions from many threads all succeed, in turn."""
+    errors = []
+
+    def write():
+        wrapper = open_connection(database, timeout=10)
+        try:
+            for _ in range(20):
+                with transaction.atomic(using=ALIAS):
+                    cursor = wrapper.cursor()
+                    cursor.execute("SELECT count(*) FROM item")
+                    (count,) = cursor.fetchone()
+                    cursor.execute("INSERT INTO item VALUES (%s)", [count + 1])
+        except Exception as e:  # noqa: BLE001
+            errors.append(e)
+        finally:
+            wrapper.close()
+
+    threads = [threading.Thread(target=write) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    with connections[ALIAS].cursor() as cursor:
+        cursor.execute("SELECT n FROM item ORDER BY n")
+        # Each transaction saw all the earlier ones: no lost updates.
+        assert [n for (n,) in cursor.fetchall()] == list(range(1, 161))
+
+
+@pytest.mark.django_db
+def test_in_memory_databases_are_left_alone():
+    """Test the in-memory test database takes no process lock."""
+    with transaction.atomic():
+        assert not connection.holds_write_lock
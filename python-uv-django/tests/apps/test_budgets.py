@@ -0,0 +1,138 @@
+"""Query and latency budgets for every endpoint in the API and core URLconfs.
+
+Each request below runs against 25 seeded tasks, more than a page, so an
+N+1 query or an extra count shows up as a budget overrun. The budgets live
+in ``tests/budgets.json``: raise one deliberately, in the same change that
+needs it, never to make CI pass.
+"""
+
+import json
+
+import pytest
+
+from django.test import Client
+from django.urls import URLResolver
+from rest_framework.test import APIClient
+
+from apps.api import urls as api_urls
+from apps.core import urls as core_urls
+from apps.core.models import Task
+from tests.conftest import BUDGETS_FILE
+
+SEEDED = 25
+
+# The core views render project templates that this template project leaves
+# to its users; these minimal ones touch the same context.
+HTML_TEMPLATES = {
+    "core/index.html": "{{ task_count }} {{ pending_count }} {{ completed_count }}",
+    "core/task_list.html": "{% for task in tasks %}{{ task.title }} {{ task.status }}{% endfor %}",
+    "core/task_detail.html": "{{ task.title }} {{ task.get_status_display }}",
+}
+
+
+def ids(tasks, count):
+    """Return the ids of the first ``count`` tasks."""
+    return [task.pk for task in tasks[:count]]
+
+
+# Budget name -> request. Names are "<METHOD> <namespace>:<url name>[ variant]".
+REQUESTS = {
+    "GET api:api-root": lambda c, _tasks: c.get("/api/"),
+    "GET api:task-list": lambda c, _tasks: c.get("/api/tasks/"),
+    "GET api:task-list page": lambda c, _tasks: c.get("/api/tasks/", {"page": 2}),
+    "GET api:task-list overdue": lambda c, _tasks: c.get("/api/tasks/", {"overdue": "true"}),
+    "GET api:task-list search": lambda c, _tasks: c.get("/api/tasks/", {"search": "task"}),
+    "POST api:task-list": lambda c, _tasks: c.post("/api/tasks/", {"title": "New"}, format="json"),
+    "GET api:task-detail": lambda c, t: c.get(f"/api/tasks/{t[0].pk}/"),
+    "PUT api:task-detail": lambda c, t: c.put(
+        f"/api/tasks/{t[0].pk}/", {"title": "Renamed", "status": "PENDING"}, format="json"
+    ),
+    "PATCH api:task-detail": lambda c, t: c.patch(
+        f"/api/tasks/{t[0].pk}/", {"priority": 3}, format="json"
+    ),
+    "DELETE api:task-detail": lambda c, t: c.delete(f"/api/tasks/{t[0].pk}/"),
+    "POST api:task-complete": lambda c, t: c.post(f"/api/tasks/{t[0].pk}/complete/"),
+    "POST api:task-start": lambda c, t: c.post(f"/api/tasks/{t[0].pk}/start/"),
+    "POST api:task-bulk": lambda c, _tasks: c.post(
+        "/api/tasks/bulk/", [{"title": f"Bulk {i}"} for i in range(10)], format="json"
+    ),
+    "PATCH api:task-bulk": lambda c, t: c.patch(
+        "/api/tasks/bulk/", [{"id": pk, "priority": 5} for pk in ids(t, 10)], format="json"
+    ),
+    "POST api:task-bulk-complete": lambda c, t: c.post(
+        "/api/tasks/bulk/complete/", {"ids": ids(t, 10)}, format="json"
+    ),
+    "POST api:task-bulk-start": lambda c, t: c.post(
+        "/api/tasks/bulk/start/", {"ids": ids(t, 10)}, format="json"
+    ),
+    "GET api:task-pending": lambda c, _tasks: c.get("/api/tasks/pending/"),
+    "GET api:task-statistics": lambda c, _tasks: c.get("/api/tasks/statistics/"),
+    "GET api:task-cache-stats": lambda c, _tasks: c.get("/api/tasks/cache-stats/"),
+    "GET core:index": lambda c, _tasks: c.get("/"),
+    "GET core:task_list": lambda c, _tasks: c.get("/tasks/"),
+    "GET core:task_list page": lambda c, _tasks: c.get("/tasks/", {"page": 2}),
+    "GET core:task_detail": lambda c, t: c.get(f"/tasks/{t[0].pk}/"),
+}
+
+
+def url_names(module):
+    """Return ``namespace:name`` for every named URL pattern of a URLconf module."""
+
+    def walk(patterns):
+        for pattern in patterns:
+            if isinstance(pattern, URLResolver):
+                yield from walk(pattern.url_patterns)
+            elif pattern.name:
+                yield f"{module.app_name}:{pattern.name}"
+
+    return set(walk(module.urlpatterns))
+
+
+@pytest.fixture
+def seeded_tasks(db, task_factory):
+    """Seed tasks in every status, with due dates in the past and future."""
+    from django.utils import timezone
+
+    now = timezone.now()
+    return [
+        task_factory(
+            title=f"Task {i}",
+            status=Task.Status.PENDING if i % 2 else Task.Status.IN_PROGRESS,
+            priority=i % 4,
+            due_date=now + timezone.timedelta(days=i - SEEDED // 2),
+        )
+        for i in range(SEEDED)
+    ]
+
+
+@pytest.fixture
+def html_templates(tmp_path, settings):
+    """Make minimal templates for the core views available."""
+    for name, source in HTML_TEMPLATES.items():
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(source)
+    settings.TEMPLATES = [
+        {**settings.TEMPLATES[0], "DIRS": [tmp_path, *settings.TEMPLATES[0]["DIRS"]]}
+    ]
+
+
+def test_every_endpoint_has_a_budget():
+    """Test every named URL is exercised and every budget is used."""
+    budgets = json.loads(BUDGETS_FILE.read_text())
+    endpoints = url_names(api_urls) | url_names(core_urls)
+    covered = {name.split()[1] for name in REQUESTS}
+
+    assert endpoints - covered == set(), "endpoints without a budgeted request"
+    assert set(budgets) == set(REQUESTS)
+
+
+@pytest.mark.parametrize("name", REQUESTS)
+def test_endpoint_within_budget(name, seeded_tasks, html_templates, assert_budget):
+    """Test one request stays within its committed query and latency budget."""
+    client = APIClient() if " api:" in name else Client()
+
+    with assert_budget(name):
+        response = REQUESTS[name](client, seeded_tasks)
+
+    assert response.status_code < 400, response.content[:200]
@@ -0,0 +1 @@
+"""Standalone benchmark scripts (not collected by pytest)."""
@@ -0,0 +1,329 @@
+"""Latency, query and memory benchmark of the task API and admin.
+
+Usage::
+
+    python tests/benchmarks/bench_api.py --size 10k
+    python tests/benchmarks/bench_api.py --size 1m --baseline tests/benchmarks/baselines/api-1m.json
+
+Seeds a dataset of ``--size`` tasks (10k, 1m or 10m) in its own database
+(``<tmp>/tasks-bench-<size>.sqlite3`` unless ``DATABASE_URL`` is set), then
+sends ``--requests`` requests per scenario through the in-process test
+client: the list with every filter and ordering, search, detail,
+statistics, pending, complete/start and the admin changelist. The list and
+object caches are off unless ``--cached`` is given, so every request reaches
+the database. A scenario stops after ``--max-seconds``, so the unpaginated
+ones stay bounded on large datasets.
+
+Each scenario reports p50/p95/p99 latency, the queries per request (counted
+by ``TimingMiddleware``) and the peak RSS of the process once it has run.
+The results are written as JSON to ``--output``. With ``--baseline``, the
+run is compared with a stored result: a p95 more than ``--tolerance`` above
+the baseline, or more queries, is a regression and the exit status is 1.
+``--save-baseline`` stores the run as the new baseline instead.
+
+Writes are undone after each write scenario, so runs stay comparable.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from tests.benchmarks import dataset  # noqa: E402
+
+BASELINES_DIR = Path(__file__).resolve().parent / "baselines"
+
+SEARCH_TERMS = ["python", "invoice latency", "kalomi"]
+
+
+class TimingsHandler(logging.Handler):
+    """Keep the timings ``TimingMiddleware`` logs for each request."""
+
+    def __init__(self) -> None:
+        """Start with no requests recorded."""
+        super().__init__(logging.INFO)
+        self.records: list[dict[str, Any]] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Record one request's timings."""
+        self.records.append(record.timings)  # type: ignore[attr-defined]
+
+
+def peak_rss_mb() -> float:
+    """Return the peak resident set size of this process so far, in MiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def percentiles(samples: list[float]) -> dict[str, float]:
+    """Return the p50, p95 and p99 of ``samples`` (seconds) in milliseconds."""
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return {
+        name: round(cuts[cut - 1] * 1000, 3)
+        for name, cut in (("p50", 50), ("p95", 95), ("p99", 99))
+    }
+
+
+def scenarios(api: Any, admin: Any, fixtures: dict[str, Any]) -> dict[str, Callable[[int], Any]]:
+    """Return the benchmark scenarios: name -> callable taking the request number."""
+    from apps.api.views import TaskViewSet
+    from apps.core.models import Task
+
+    detail_ids = fixtures["detail_ids"]
+    result: dict[str, Callable[[int], Any]] = {
+        "api list": lambda _i: api.get("/api/tasks/"),
+    }
+    for status in Task.Status.values:
+        result[f"api list status={status}"] = lambda _i, s=status: api.get(
+            "/api/tasks/", {"status": s}
+        )
+    result["api list overdue"] = lambda _i: api.get("/api/tasks/", {"overdue": "true"})
+    for field in TaskViewSet.ordering_fields:
+        for ordering in (field, f"-{field}"):
+            result[f"api list ordering={ordering}"] = lambda _i, o=ordering: api.get(
+                "/api/tasks/", {"ordering": o}
+            )
+    result["api list next page"] = lambda _i: api.get(fixtures["next_page"])
+    result["api list page=2"] = lambda _i: api.get("/api/tasks/", {"page": 2})
+    for term in SEARCH_TERMS:
+        result[f"api search {term}"] = lambda _i, t=term: api.get("/api/tasks/", {"search": t})
+    result.update(
+        {
+            "api detail": lambda i: api.get(f"/api/tasks/{detail_ids[i % len(detail_ids)]}/"),
+            "api statistics": lambda _i: api.get("/api/tasks/statistics/"),
+            "api statistics status=PENDING": lambda _i: api.get(
+                "/api/tasks/statistics/", {"status": Task.Status.PENDING}
+            ),
+            "api pending": lambda _i: api.get("/api/tasks/pending/"),
+            "api complete": lambda i: api.post(
+                f"/api/tasks/{fixtures['complete_ids'][i]}/complete/"
+            ),
+            "api start": lambda i: api.post(f"/api/tasks/{fixtures['start_ids'][i]}/start/"),
+            "admin changelist": lambda _i: admin.get("/admin/core/task/"),
+            "admin changelist status": lambda _i: admin.get(
+                "/admin/core/task/", {"status__exact": Task.Status.PENDING}
+            ),
+            "admin changelist search": lambda _i: admin.get("/admin/core/task/", {"q": "python"}),
+        }
+    )
+    return result
+
+
+def load_fixtures(count: int) -> dict[str, Any]:
+    """Pick the tasks the detail and write scenarios use."""
+    from apps.core.models import Task
+
+    pending = list(
+        Task.objects.filter(status=Task.Status.PENDING)
+        .order_by("pk")
+        .values_list("pk", flat=True)[: 2 * count]
+    )
+    if len(pending) < 2 * count:
+        raise SystemExit(f"need {2 * count} pending tasks for the write scenarios")
+    total = Task.objects.order_by("-pk").values_list("pk", flat=True).first() or 0
+    # Spread over the whole table, so the detail scenario does not only read one page.
+    step = max(total // count, 1)
+    return {
+        "detail_ids": list(range(1, total + 1, step))[:count] or [1],
+        "complete_ids": pending[:count],
+        "start_ids": pending[count:],
+    }
+
+
+def run(
+    scenario: Callable[[int], Any],
+    requests: int,
+    warmup: int,
+    max_seconds: float,
+    timings: TimingsHandler,
+) -> dict[str, Any]:
+    """Run one scenario and summarise it.
+
+    A scenario stops early, after at least two requests, once it has run for
+    ``max_seconds``; ``samples`` says how many requests were measured.
+    """
+    deadline = time.perf_counter() + max_seconds
+    for i in range(warmup):
+        scenario(requests + i)
+        if time.perf_counter() > deadline:
+            break
+    samples: list[float] = []
+    errors = 0
+    timings.records.clear()
+    for i in range(requests):
+        start = time.perf_counter()
+        response = scenario(i)
+        samples.append(time.perf_counter() - start)
+        errors += response.status_code >= 400
+        if len(samples) >= 2 and time.perf_counter() > deadline:
+            break
+    queries = [record["queries"] for record in timings.records]
+    db_ms = [record["db_ms"] for record in timings.records]
+    return {
+        **percentiles(samples),
+        "mean": round(statistics.fmean(samples) * 1000, 3),
+        "samples": len(samples),
+        "queries": max(queries, default=0),
+        "db_p50": round(statistics.median(db_ms), 3) if db_ms else 0.0,
+        "errors": errors,
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+    }
+
+
+def git_revision() -> str | None:
+    """Return the checked-out commit, if this is a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True, cwd=dataset.SRC_DIR,
+        ).stdout.strip()  # fmt: skip
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(result: dict[str, Any], baseline: dict[str, Any], tolerance: float) -> list[str]:
+    """Print the run next to ``baseline``; return the regressed scenarios."""
+    regressions = []
+    print(f"\n{'scenario':<38}{'p50':>16}{'p95':>16}{'p99':>16}{'queries':>10}")
+    for name, now in result["scenarios"].items():
+        before = baseline["scenarios"].get(name)
+        if before is None:
+            print(f"{name:<38}{'(new)':>16}")
+            continue
+        cells = [
+            f"{now[key]:.1f} {(now[key] / before[key] - 1) * 100 if before[key] else 0:+.0f}%"
+            for key in ("p50", "p95", "p99")
+        ]
+        queries = f"{before['queries']}->{now['queries']}"
+        regressed = (
+            now["p95"] > before["p95"] * (1 + tolerance) or now["queries"] > before["queries"]
+        )
+        if regressed:
+            regressions.append(name)
+        print(f"{name:<38}{cells[0]:>16}{cells[1]:>16}{cells[2]:>16}{queries:>10}"
+              f"{'  REGRESSION' if regressed else ''}")  # fmt: skip
+    return regressions
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument("--size", choices=dataset.SIZES, default="10k")
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument(
+        "--max-seconds", type=float, default=60.0, help="time limit per scenario (min. 2 requests)"
+    )
+    parser.add_argument("--cached", action="store_true", help="keep the list and object caches on")
+    parser.add_argument("--only", help="run only the scenarios containing this text")
+    parser.add_argument("--output", type=Path, help="default: <tmp>/bench-api-<size>.json")
+    parser.add_argument("--baseline", type=Path, help="compare with this stored result")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.25, help="allowed p95 growth (0.25 = 25%%)"
+    )
+    parser.add_argument(
+        "--save-baseline", action="store_true", help=f"store the run in {BASELINES_DIR}"
+    )
+    args = parser.parse_args()
+
+    if not args.cached:
+        os.environ.update(TASK_LIST_CACHE_TIMEOUT="0", TASK_OBJECT_CACHE_SIZE="0")
+    os.environ.update(SERVER_TIMING="false")
+    dataset.setup(f"tasks-bench-{args.size}")
+    rows = dataset.SIZES[args.size]
+    started = time.perf_counter()
+    inserted = dataset.seed_tasks(rows)
+    if inserted:
+        print(f"seeded {inserted} tasks in {time.perf_counter() - started:.0f}s")
+
+    from django.contrib.auth import get_user_model
+    from django.db import connection
+    from django.test import Client
+    from rest_framework.test import APIClient
+
+    from apps.core.models import Task
+
+    timings = TimingsHandler()
+    timing_logger = logging.getLogger("apps.core.timing")
+    timing_logger.handlers, timing_logger.propagate = [timings], False
+    timing_logger.setLevel(logging.INFO)
+
+    admin_user = get_user_model().objects.filter(username="bench").first()
+    if admin_user is None:
+        admin_user = get_user_model().objects.create_superuser("bench", password="bench")
+    admin = Client()
+    admin.force_login(admin_user)
+    api = APIClient()
+
+    count = args.requests + args.warmup
+    fixtures = load_fixtures(count)
+    fixtures["next_page"] = api.get("/api/tasks/").data["next"]
+    selected = {
+        name: scenario
+        for name, scenario in scenarios(api, admin, fixtures).items()
+        if not args.only or args.only in name
+    }
+
+    result: dict[str, Any] = {
+        "meta": {
+            "size": args.size,
+            "rows": Task.objects.count(),
+            "database": connection.vendor,
+            "requests": args.requests,
+            "cached": args.cached,
+            "python": platform.python_version(),
+            "machine": f"{platform.system()} {platform.machine()}, {os.cpu_count()} CPU",
+            "revision": git_revision(),
+            "date": datetime.now(UTC).isoformat(timespec="seconds"),
+        },
+        "scenarios": {},
+    }
+    print(f"{result['meta']['rows']} tasks on {connection.vendor}, {args.requests} requests each")
+    print(f"{'scenario':<38}{'p50':>9}{'p95':>9}{'p99':>9}{'queries':>9}{'RSS MiB':>9}")
+    for name, scenario in selected.items():
+        try:
+            summary = run(scenario, args.requests, args.warmup, args.max_seconds, timings)
+        finally:
+            if name in ("api complete", "api start"):
+                Task.objects.filter(pk__in=fixtures["complete_ids"] + fixtures["start_ids"]).update(
+                    status=Task.Status.PENDING, completed_at=None
+                )
+        result["scenarios"][name] = summary
+        print(f"{name:<38}{summary['p50']:>9.1f}{summary['p95']:>9.1f}{summary['p99']:>9.1f}"
+              f"{summary['queries']:>9}{summary['peak_rss_mb']:>9.0f}"
+              f"{'  ' + str(summary['errors']) + ' errors' if summary['errors'] else ''}")  # fmt: skip
+
+    output = args.output or Path(tempfile.gettempdir()) / f"bench-api-{args.size}.json"
+    if args.save_baseline:
+        BASELINES_DIR.mkdir(exist_ok=True)
+        output = BASELINES_DIR / f"api-{args.size}.json"
+    output.write_text(json.dumps(result, indent=2) + "\n")
+    print(f"\nwrote {output}")
+
+    if args.baseline:
+        regressions = compare(result, json.loads(args.baseline.read_text()), args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""Compare one gunicorn sync (WSGI) worker with one uvicorn (ASGI) worker.
+
+Usage::
+
+    python tests/benchmarks/bench_asgi.py --rows 10000 --concurrency 1 8 32 64
+
+Starts each server on the benchmark database with the production settings,
+the WSGI one the way the ``Dockerfile`` runs it (``gunicorn`` sync workers)
+and the ASGI one with ``uvicorn`` (which enables ``TASK_API_ASYNC`` through
+``config/asgi.py``). A closed loop of ``--concurrency`` clients then cycles
+through the list, detail and statistics endpoints for ``--duration``
+seconds per level. Prints throughput, p50/p99 latency, errors and the peak
+number of threads in the server process.
+"""
+
+from __future__ import annotations
+
+import argparse
+import http.client
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from tests.benchmarks import dataset  # noqa: E402
+
+HOST = "127.0.0.1"
+
+
+def server_commands(port: int, workers: int) -> dict[str, list[str]]:
+    """Return the command line of each server under test."""
+    bind = f"{HOST}:{port}"
+    return {
+        "wsgi/gunicorn": [
+            sys.executable, "-m", "gunicorn", "--bind", bind, "--workers", str(workers),
+            "--log-level", "warning", "config.wsgi:application",
+        ],
+        "asgi/uvicorn": [
+            sys.executable, "-m", "uvicorn", "--host", HOST, "--port", str(port),
+            "--workers", str(workers), "--log-level", "warning", "--no-access-log",
+            "config.asgi:application",
+        ],
+    }  # fmt: skip
+
+
+def server_env() -> dict[str, str]:
+    """Return the environment for the production settings on the bench database."""
+    env = dict(os.environ)
+    env.update(
+        DJANGO_SETTINGS_MODULE="config.settings.production",
+        SECRET_KEY="benchmark-only",
+        ALLOWED_HOSTS=HOST,
+        CORS_ALLOWED_ORIGINS=f"http://{HOST}",
+    )
+    return env
+
+
+def wait_for_port(port: int, timeout: float = 30.0) -> None:
+    """Block until something accepts connections on ``port``."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection((HOST, port), timeout=0.5).close()
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"server did not start on port {port}")
+
+
+def thread_count(pid: int) -> int:
+    """Return the number of threads of ``pid`` and its children (Linux only)."""
+    total = 0
+    pids = [pid]
+    try:
+        children = Path(f"/proc/{pid}/task/{pid}/children").read_text().split()
+        pids.extend(int(child) for child in children)
+        for each in pids:
+            status = Path(f"/proc/{each}/status").read_text()
+            total += int(status.split("Threads:")[1].split()[0])
+    except (OSError, IndexError, ValueError):
+        return 0
+    return total
+
+
+def run_level(
+    port: int, paths: list[str], concurrency: int, duration: float, pid: int
+) -> dict[str, float]:
+    """Run a closed loop of ``concurrency`` clients and summarise it."""
+    latencies: list[float] = []
+    errors = 0
+    lock = threading.Lock()
+    stop = time.monotonic() + duration
+    # The settings redirect plain HTTP; a TLS-terminating proxy would set this.
+    headers = {"X-Forwarded-Proto": "https", "Host": HOST}
+
+    def client(offset: int) -> None:
+        nonlocal errors
+        # http.client reconnects by itself when a server closes the connection
+        # (gunicorn's sync workers do after every response).
+        connection = http.client.HTTPConnection(HOST, port, timeout=60)
+        mine: list[float] = []
+        failed = 0
+        index = offset
+        while time.monotonic() < stop:
+            start = time.perf_counter()
+            try:
+                connection.request("GET", paths[index % len(paths)], headers=headers)
+                response = connection.getresponse()
+                response.read()
+                if response.status != 200:
+                    failed += 1
+            except (OSError, http.client.HTTPException):
+                failed += 1
+                connection.close()
+            mine.append(time.perf_counter() - start)
+            index += 1
+        connection.close()
+        with lock:
+            latencies.extend(mine)
+            errors += failed
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(concurrency)]
+    peak_threads = 0
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    while any(thread.is_alive() for thread in threads):
+        peak_threads = max(peak_threads, thread_count(pid))
+        time.sleep(0.05)
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else [0.0] * 99
+    return {
+        "rps": len(latencies) / elapsed,
+        "p50": quantiles[49] * 1000,
+        "p99": quantiles[98] * 1000,
+        "errors": errors,
+        "threads": peak_threads,
+    }
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32, 64])
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    dataset.setup()
+    dataset.seed_tasks(args.rows)
+
+    from apps.core.models import Task
+
+    task_id = Task.objects.order_by("pk").values_list("pk", flat=True)[args.rows // 2]
+    paths = ["/api/tasks/", f"/api/tasks/{task_id}/", "/api/tasks/statistics/"]
+    (dataset.SRC_DIR.parent / "logs").mkdir(exist_ok=True)  # production file logging
+
+    print(f"{args.rows} tasks, {args.workers} worker(s), {args.duration:.0f}s per level")
+    print(f"{'server':<15}{'clients':>8}{'req/s':>9}{'p50 ms':>9}{'p99 ms':>9}"
+          f"{'errors':>8}{'threads':>9}")  # fmt: skip
+    for name, command in server_commands(args.port, args.workers).items():
+        server = subprocess.Popen(command, cwd=dataset.SRC_DIR, env=server_env())
+        try:
+            wait_for_port(args.port)
+            run_level(args.port, paths, 4, 1.0, server.pid)  # warm up every worker
+            for concurrency in args.concurrency:
+                result = run_level(args.port, paths, concurrency, args.duration, server.pid)
+                print(
+                    f"{name:<15}{concurrency:>8}{result['rps']:>9.0f}{result['p50']:>9.1f}"
+                    f"{result['p99']:>9.1f}{result['errors']:>8}{result['threads']:>9}"
+                )
+        finally:
+            server.terminate()
+            server.wait(timeout=30)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Compare JSON encode/decode throughput of the stdlib and orjson paths.
+
+Usage::
+
+    python tests/benchmarks/bench_json.py --rows 10000
+
+Encodes a serialized page of ``--rows`` tasks with ``JSONRenderer`` and
+``FastJSONRenderer`` and parses it back with ``JSONParser`` and
+``FastJSONParser``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from tests.benchmarks import dataset  # noqa: E402
+
+
+def timed(func: Callable[[], object], repeat: int) -> float:
+    """Return the median wall time of ``func`` in seconds."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=15)
+    args = parser.parse_args()
+
+    dataset.setup()
+
+    from rest_framework.parsers import JSONParser
+    from rest_framework.renderers import JSONRenderer
+
+    from apps.api.parsers import FastJSONParser
+    from apps.api.renderers import FastJSONRenderer, fast_json_available
+    from apps.core.models import Task
+    from apps.core.serializers import TaskSerializer
+
+    if not fast_json_available():
+        print("orjson is not installed: FastJSON* fall back to the stdlib", file=sys.stderr)
+
+    dataset.seed_tasks(args.rows)
+    page = {"results": TaskSerializer(Task.objects.all()[: args.rows], many=True).data}
+    body = JSONRenderer().render(page)
+    megabytes = len(body) / 1e6
+    print(f"page: {args.rows} tasks, {megabytes:.1f} MB")
+
+    for name, renderer in (
+        ("JSONRenderer", JSONRenderer()),
+        ("FastJSONRenderer", FastJSONRenderer()),
+    ):
+        seconds = timed(lambda r=renderer: r.render(page), args.repeat)
+        print(f"encode {name:<18}{seconds * 1000:>9.1f} ms{megabytes / seconds:>9.1f} MB/s")
+    for name, json_parser in (("JSONParser", JSONParser()), ("FastJSONParser", FastJSONParser())):
+        seconds = timed(lambda p=json_parser: p.parse(io.BytesIO(body)), args.repeat)
+        print(f"decode {name:<18}{seconds * 1000:>9.1f} ms{megabytes / seconds:>9.1f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
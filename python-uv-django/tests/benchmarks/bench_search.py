@@ -0,0 +1,67 @@
+"""Compare the indexed search backend with the ``icontains`` scan.
+
+Usage::
+
+    python tests/benchmarks/bench_search.py --rows 1000000
+
+Prints the median time to fetch the first ranked page and to count all
+matches for a few terms, for both backends.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from tests.benchmarks import dataset  # noqa: E402
+
+TERMS = ["python", "invoice latency", "webhook", "kalomi", "sec", "nomatch"]
+
+
+def timed(func: Callable[[], object], repeat: int) -> float:
+    """Return the median wall time of ``func`` in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--page-size", type=int, default=20)
+    args = parser.parse_args()
+
+    dataset.setup()
+
+    from apps.core.models import Task
+    from apps.core.search import SEARCH_RANK, TaskSearchBackend, get_task_search_backend
+
+    inserted = dataset.seed_tasks(args.rows)
+    print(f"rows={Task.objects.count()} (inserted {inserted})")
+
+    backends = {"scan": TaskSearchBackend(), "indexed": get_task_search_backend()}
+    print(f"{'term':<18}{'backend':<10}{'page ms':>10}{'count ms':>10}{'matches':>10}")
+    for term in TERMS:
+        for name, backend in backends.items():
+            ranked = backend.search(Task.objects.all(), term, rank=True).order_by(
+                f"-{SEARCH_RANK}", "id"
+            )
+            page_ms = timed(lambda q=ranked: list(q[: args.page_size]), args.repeat)
+            matches = backend.search(Task.objects.all(), term)
+            count_ms = timed(matches.count, args.repeat)
+            print(f"{term:<18}{name:<10}{page_ms:>10.1f}{count_ms:>10.1f}{matches.count():>10}")
+
+
+if __name__ == "__main__":
+    main()
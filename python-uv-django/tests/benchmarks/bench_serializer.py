@@ -0,0 +1,70 @@
+"""Compare TaskSerializer with the .values()-based TaskReadSerializer.
+
+Usage::
+
+    python tests/benchmarks/bench_serializer.py --rows 10000
+
+Reports rows/sec for serialization alone and for fetch + serialize.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from tests.benchmarks import dataset  # noqa: E402
+
+
+def rows_per_second(func: Callable[[], object], rows: int, repeat: int) -> float:
+    """Return the median throughput of ``func`` over ``rows`` rows."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return rows / statistics.median(samples)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    dataset.setup()
+
+    from apps.core.models import Task
+    from apps.core.serializers import TaskReadSerializer, TaskSerializer
+
+    dataset.seed_tasks(args.rows)
+    queryset = Task.objects.order_by("id")[: args.rows]
+    values = queryset.values(*TaskReadSerializer.values_fields)
+    tasks, rows = list(queryset), list(values)
+
+    results = {
+        "TaskSerializer (serialize)": rows_per_second(
+            lambda: TaskSerializer(tasks, many=True).data, len(tasks), args.repeat
+        ),
+        "TaskReadSerializer (serialize)": rows_per_second(
+            lambda: TaskReadSerializer(rows, many=True).data, len(rows), args.repeat
+        ),
+        "TaskSerializer (fetch + serialize)": rows_per_second(
+            lambda: TaskSerializer(list(queryset.all()), many=True).data, len(tasks), args.repeat
+        ),
+        "TaskReadSerializer (fetch + serialize)": rows_per_second(
+            lambda: TaskReadSerializer(list(values.all()), many=True).data, len(rows), args.repeat
+        ),
+    }
+    for name, rate in results.items():
+        print(f"{name:<40}{rate:>12,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
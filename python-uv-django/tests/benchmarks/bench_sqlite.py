@@ -0,0 +1,207 @@
+"""Compare SQLite's default setup with the high-concurrency mode under mixed load.
+
+Usage::
+
+    python tests/benchmarks/bench_sqlite.py --rows 10000 --processes 2 --threads 8
+
+Runs each mode (``SQLITE_HIGH_CONCURRENCY`` off, then on) on a SQLite file
+of its own: ``--processes`` worker processes, like gunicorn's, each with
+``--threads`` threads, like gthread's, issue a mix of reads (list page,
+detail, statistics) and writes (create, transition, edit) for
+``--duration`` seconds. ``--write-ratio`` of the operations are writes.
+Prints reads and writes per second, p50/p99 latency per kind and the
+number of failed operations (``database is locked``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from tests.benchmarks import dataset  # noqa: E402
+
+MODES = {"default": "false", "concurrent": "true"}
+
+
+def operations() -> dict[str, tuple[str, Callable[[random.Random, int], object]]]:
+    """Return each operation's kind (read or write) and callable."""
+    from apps.core.models import Task
+    from apps.core.selectors import TaskSelector
+    from apps.core.services import TaskService
+
+    def list_page(rng: random.Random, top: int) -> object:
+        return list(Task.objects.filter(status=Task.Status.PENDING)[:20])
+
+    def detail(rng: random.Random, top: int) -> object:
+        return Task.objects.filter(pk=rng.randint(1, top)).first()
+
+    def stats(rng: random.Random, top: int) -> object:
+        return TaskSelector.get_statistics()
+
+    def create(rng: random.Random, top: int) -> object:
+        return TaskService.create_task(title=f"Load {rng.random():.6f}", priority=rng.randint(0, 9))
+
+    def transition(rng: random.Random, top: int) -> object:
+        status = rng.choice([Task.Status.PENDING, Task.Status.IN_PROGRESS])
+        return Task.objects.filter(pk=rng.randint(1, top)).transition(status, force=True)
+
+    def edit(rng: random.Random, top: int) -> object:
+        # Reads the tasks, then writes them: the upgrade from a read to a
+        # write transaction is what fails first under the default mode.
+        tasks = list(Task.objects.filter(pk=rng.randint(1, top)))
+        changes = [{"priority": rng.randint(0, 9), "status": Task.Status.PENDING} for _ in tasks]
+        return TaskService.bulk_update_tasks(tasks, changes)
+
+    return {
+        "list": ("read", list_page),
+        "detail": ("read", detail),
+        "statistics": ("read", stats),
+        "create": ("write", create),
+        "transition": ("write", transition),
+        "edit": ("write", edit),
+    }
+
+
+def worker(index: int, args: argparse.Namespace, top: int, results: Any) -> None:
+    """Run ``args.threads`` load threads in this process and report their samples."""
+    from django.db import OperationalError, connections
+
+    ops = operations()
+    reads = [name for name, (kind, _) in ops.items() if kind == "read"]
+    writes = [name for name, (kind, _) in ops.items() if kind == "write"]
+    latencies: dict[str, list[float]] = {"read": [], "write": []}
+    errors: Counter[str] = Counter()
+    lock = threading.Lock()
+    deadline = time.monotonic() + args.duration
+
+    def run(thread: int) -> None:
+        rng = random.Random(index * 1000 + thread)
+        samples: dict[str, list[float]] = {"read": [], "write": []}
+        failed: Counter[str] = Counter()
+        while time.monotonic() < deadline:
+            name = rng.choice(writes if rng.random() < args.write_ratio else reads)
+            kind, operation = ops[name]
+            start = time.perf_counter()
+            try:
+                operation(rng, top)
+            except OperationalError as e:
+                failed[f"{kind}: {e}"] += 1
+                continue
+            samples[kind].append(time.perf_counter() - start)
+        connections.close_all()
+        with lock:
+            for kind, values in samples.items():
+                latencies[kind].extend(values)
+            errors.update(failed)
+
+    threads = [threading.Thread(target=run, args=(thread,)) for thread in range(args.threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    results.put({"latencies": latencies, "errors": dict(errors)})
+
+
+def run_mode(mode: str, args: argparse.Namespace) -> None:
+    """Seed this mode's database, run the workers and print a JSON summary."""
+    dataset.setup(f"tasks-bench-sqlite-{mode}")
+
+    from django.db import connections
+
+    from apps.core.models import Task
+
+    dataset.seed_tasks(args.rows)
+    top = Task.objects.order_by("-pk").values_list("pk", flat=True).first() or 1
+    connections.close_all()
+
+    context = multiprocessing.get_context("fork")
+    results = context.Queue()
+    processes = [
+        context.Process(target=worker, args=(index, args, top, results))
+        for index in range(args.processes)
+    ]
+    for process in processes:
+        process.start()
+    reports = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+
+    latencies: dict[str, list[float]] = {"read": [], "write": []}
+    errors: Counter[str] = Counter()
+    for report in reports:
+        for kind, values in report["latencies"].items():
+            latencies[kind].extend(values)
+        errors.update(report["errors"])
+    summary: dict[str, Any] = {"mode": mode, "errors": dict(errors)}
+    for kind, values in latencies.items():
+        values.sort()
+        summary[kind] = {
+            "per_second": len(values) / args.duration,
+            "p50_ms": statistics.median(values) * 1000 if values else None,
+            "p99_ms": values[int(len(values) * 0.99)] * 1000 if values else None,
+        }
+    print(json.dumps(summary))
+
+
+def main() -> None:
+    """Run the benchmark, one subprocess per mode."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--processes", type=int, default=2)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--write-ratio", type=float, default=0.2)
+    parser.add_argument("--mode", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        run_mode(args.mode, args)
+        return
+
+    print(
+        f"{args.processes} processes x {args.threads} threads, {args.duration:g} s, "
+        f"{args.write_ratio:.0%} writes, {args.rows} rows"
+    )
+    print(
+        f"{'mode':<12}{'reads/s':>10}{'p50 ms':>9}{'p99 ms':>9}"
+        f"{'writes/s':>10}{'p50 ms':>9}{'p99 ms':>9}{'failed':>8}"
+    )
+    for mode, enabled in MODES.items():
+        env = {**os.environ, "SQLITE_HIGH_CONCURRENCY": enabled}
+        env.pop("DATABASE_URL", None)
+        output = subprocess.run(
+            [sys.executable, __file__, *sys.argv[1:], "--mode", mode],
+            env=env,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        summary = json.loads(output.strip().splitlines()[-1])
+        row = f"{mode:<12}"
+        for kind in ("read", "write"):
+            figures = summary[kind]
+            row += f"{figures['per_second']:>10.0f}"
+            for key in ("p50_ms", "p99_ms"):
+                value = figures[key]
+                row += f"{value:>9.1f}" if value is not None else f"{'-':>9}"
+        print(row + f"{sum(summary['errors'].values()):>8}")
+        for error, count in sorted(summary["errors"].items()):
+            print(f"{'':<12}{count} x {error}")
+
+
+if __name__ == "__main__":
+    main()
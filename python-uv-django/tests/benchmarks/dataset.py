@@ -0,0 +1,130 @@
+"""Shared setup for the benchmark scripts.
+
+Benchmarks run against their own database, selected with ``DATABASE_URL``
+(default: ``sqlite:///<tmp>/tasks-bench.sqlite3``), so they never touch the
+development database. Call ``setup()`` before importing any app module.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[2] / "src"
+
+WORDS = [
+    "python",
+    "invoice",
+    "latency",
+    "backend",
+    "billing",
+    "cache",
+    "client",
+    "database",
+    "deploy",
+    "design",
+    "docs",
+    "export",
+    "frontend",
+    "import",
+    "login",
+    "metrics",
+    "migrate",
+    "mobile",
+    "onboarding",
+    "payment",
+    "queue",
+    "refactor",
+    "release",
+    "report",
+    "search",
+    "security",
+    "server",
+    "signup",
+    "storage",
+    "sync",
+    "testing",
+    "upgrade",
+    "webhook",
+    "worker",
+]
+_SYLLABLES = [
+    "ka",
+    "lo",
+    "mi",
+    "ne",
+    "ru",
+    "sa",
+    "ti",
+    "vo",
+    "ze",
+    "bu",
+    "da",
+    "fe",
+    "gi",
+    "ho",
+    "ju",
+]
+
+# A Zipf-distributed vocabulary: the real words above are the most frequent,
+# followed by a long tail of generated ones, so search terms range from common
+# to highly selective the way they do in real task text.
+VOCABULARY = WORDS + [a + b + c for a in _SYLLABLES for b in _SYLLABLES for c in _SYLLABLES]
+# Cumulative, so ``random.choices()`` does not re-add the weights on every call.
+CUM_WEIGHTS = list(itertools.accumulate(1 / rank for rank in range(1, len(VOCABULARY) + 1)))
+
+# The dataset sizes the benchmarks are run at.
+SIZES = {"10k": 10_000, "1m": 1_000_000, "10m": 10_000_000}
+
+
+def setup(database: str = "tasks-bench") -> None:
+    """Configure Django for a benchmark run and apply migrations.
+
+    ``database`` names the SQLite file used when ``DATABASE_URL`` is unset.
+    """
+    sys.path.insert(0, str(SRC_DIR))
+    default_url = f"sqlite:///{Path(tempfile.gettempdir()) / database}.sqlite3"
+    os.environ.setdefault("DATABASE_URL", default_url)
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.development")
+
+    import django
+    from django.conf import settings
+    from django.core.management import call_command
+
+    django.setup()
+    # Development settings log and keep every query; neither belongs in a timing.
+    settings.DEBUG = False
+    for name in ("django", "factory", "faker"):
+        logging.getLogger(name).setLevel(logging.WARNING)
+    call_command("migrate", verbosity=0)
+
+
+def seed_tasks(rows: int, batch_size: int = 5000, seed: int = 0) -> int:
+    """Top the task table up to ``rows`` rows and return the number inserted.
+
+    Tasks are built by ``TaskFactory`` and inserted with ``bulk_create()``;
+    the same ``rows`` and ``seed`` always produce the same rows. The table is
+    analyzed afterwards, as a production database's would be.
+    """
+    import factory.random
+
+    from django.db import connection
+
+    from apps.core.models import Task
+    from tests.benchmarks.factories import TaskFactory
+
+    existing = Task.objects.count()
+    factory.random.reseed_random(seed + existing)
+    inserted = 0
+    while existing + inserted < rows:
+        size = min(batch_size, rows - existing - inserted)
+        Task.objects.bulk_create(TaskFactory.build_batch(size), batch_size=batch_size)
+        inserted += size
+    if inserted:
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {Task._meta.db_table}")
+    return inserted
@@ -0,0 +1,53 @@
+"""factory-boy factories for the benchmark dataset.
+
+Objects are only built, never saved one by one: ``dataset.seed_tasks()``
+inserts them with ``bulk_create()``. Reseed with
+``factory.random.reseed_random()`` for a reproducible dataset; it seeds both
+the fuzzy attributes and Faker.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC
+
+import factory
+from factory import fuzzy
+from factory.random import randgen
+
+from apps.core.models import Task
+from tests.benchmarks.dataset import CUM_WEIGHTS, VOCABULARY
+
+
+class ZipfText(fuzzy.BaseFuzzyAttribute):
+    """Words drawn from the Zipf-distributed benchmark vocabulary."""
+
+    def __init__(self, words: int, capitalize: bool = False) -> None:
+        """Draw ``words`` words, capitalizing the first if asked."""
+        super().__init__()
+        self.words = words
+        self.capitalize = capitalize
+
+    def fuzz(self) -> str:
+        """Return the next text."""
+        text = " ".join(randgen.choices(VOCABULARY, cum_weights=CUM_WEIGHTS, k=self.words))
+        return text.capitalize() if self.capitalize else text
+
+
+class TaskFactory(factory.django.DjangoModelFactory):
+    """A task in any status; one in five has no due date."""
+
+    class Meta:
+        model = Task
+
+    title = ZipfText(4, capitalize=True)
+    description = ZipfText(20)
+    status = fuzzy.FuzzyChoice(Task.Status.values)
+    priority = fuzzy.FuzzyInteger(0, 100)
+    # The rest are due within two months either side of today.
+    due_date = factory.Maybe(
+        factory.LazyFunction(lambda: randgen.random() >= 0.2),
+        yes_declaration=factory.Faker(
+            "date_time_between", start_date="-60d", end_date="+60d", tzinfo=UTC
+        ),
+        no_declaration=None,
+    )
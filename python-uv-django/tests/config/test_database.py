@@ -0,0 +1,87 @@
+"""Tests for database settings parsed from DATABASE_URL."""
+
+import pytest
+
+from django.core.exceptions import ImproperlyConfigured
+
+from config.database import parse_database_url, sqlite_concurrency
+
+URL = "postgresql://app:secret@db:5432/tasks"
+
+
+class TestParseDatabaseUrl:
+    """Test pool, prepared statement and PgBouncer options from URL parameters."""
+
+    def test_plain_url(self):
+        """Test a URL without connection options keeps persistent connections."""
+        config = parse_database_url(f"{URL}?sslmode=require", conn_max_age=600)
+
+        assert config["CONN_MAX_AGE"] == 600
+        assert config["CONN_HEALTH_CHECKS"] is True
+        assert config["OPTIONS"] == {"sslmode": "require"}
+
+    def test_pool(self):
+        """Test pool parameters become psycopg pool options and disable persistence."""
+        config = parse_database_url(
+            f"{URL}?pool_min_size=2&pool_max_size=8&pool_timeout=2.5", conn_max_age=600
+        )
+
+        assert config["OPTIONS"] == {"pool": {"min_size": 2, "max_size": 8, "timeout": 2.5}}
+        assert config["CONN_MAX_AGE"] == 0
+        assert parse_database_url(f"{URL}?pool=true")["OPTIONS"] == {"pool": True}
+        assert "OPTIONS" not in parse_database_url(f"{URL}?pool=false")
+
+    def test_prepared_statements(self):
+        """Test a prepare threshold turns on the server-side binding it needs."""
+        config = parse_database_url(f"{URL}?prepare_threshold=5")
+
+        assert config["OPTIONS"] == {"prepare_threshold": 5, "server_side_binding": True}
+        config = parse_database_url(f"{URL}?prepare_threshold=5&server_side_binding=false")
+        assert config["OPTIONS"]["server_side_binding"] is False
+
+    def test_pgbouncer_transaction_profile(self):
+        """Test the PgBouncer profile turns off prepared statements and named cursors."""
+        config = parse_database_url(f"{URL}?pgbouncer=transaction&pool_max_size=4")
+
+        assert config["OPTIONS"] == {"pool": {"max_size": 4}, "prepare_threshold": None}
+        assert config["DISABLE_SERVER_SIDE_CURSORS"] is True
+
+    @pytest.mark.parametrize(
+        ("url", "message"),
+        [
+            (f"{URL}?pool_size=4", "Unknown connection pool options: size"),
+            (f"{URL}?pgbouncer=session", "Unknown PgBouncer profile"),
+            (f"{URL}?pgbouncer=transaction&prepare_threshold=5", "not safe behind PgBouncer"),
+            ("sqlite:///db.sqlite3?pool_max_size=4", "only supported with PostgreSQL"),
+        ],
+    )
+    def test_invalid_options(self, url, message):
+        """Test contradictory or unknown options are refused."""
+        with pytest.raises(ImproperlyConfigured, match=message):
+            parse_database_url(url)
+
+
+class TestSqliteConcurrency:
+    """Test the SQLite high-concurrency profile."""
+
+    def test_sqlite(self):
+        """Test SQLite entries get the queueing backend, PRAGMAs and IMMEDIATE transactions."""
+        config = sqlite_concurrency(
+            parse_database_url("sqlite:///db.sqlite3"), timeout=3, mmap_size=1024, cache_size=512
+        )
+
+        assert config["ENGINE"] == "apps.core.backends.sqlite3"
+        assert config["OPTIONS"] == {
+            "init_command": (
+                "PRAGMA journal_mode = WAL;PRAGMA synchronous = NORMAL;"
+                "PRAGMA mmap_size = 1024;PRAGMA cache_size = -512"
+            ),
+            "transaction_mode": "IMMEDIATE",
+            "timeout": 3,
+        }
+
+    def test_other_databases_unchanged(self):
+        """Test entries for other databases are returned as they are."""
+        config = parse_database_url(URL)
+
+        assert sqlite_concurrency(config, timeout=3, mmap_size=0, cache_size=0) == config
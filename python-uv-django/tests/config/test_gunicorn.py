@@ -0,0 +1,149 @@
+"""Tests for the gunicorn configuration in gunicorn.conf.py."""
+
+import gc
+import os
+import runpy
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+CONFIG = Path(__file__).resolve().parents[2] / "gunicorn.conf.py"
+
+
+@pytest.fixture
+def load_config(monkeypatch):
+    """Return a function loading the configuration with the given environment."""
+    for name in ("WEB_CONCURRENCY", "GUNICORN_THREADS", "GUNICORN_WORKER_CLASS"):
+        monkeypatch.delenv(name, raising=False)
+    # Loading the configuration turns off the master's database warm-up.
+    monkeypatch.setenv("DJANGO_WARMUP_DATABASES", "true")
+
+    def load(**environ):
+        for name, value in environ.items():
+            monkeypatch.setenv(name, value)
+        return runpy.run_path(str(CONFIG))
+
+    yield load
+    # Loading the configuration disables the collector, as in the master.
+    gc.enable()
+
+
+def write_cgroup(root, files):
+    """Write cgroup files under ``root``."""
+    for name, content in files.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    return root
+
+
+@pytest.mark.parametrize(
+    ("files", "cpus"),
+    [
+        ({"cpu.max": "200000 100000\n"}, 2),
+        ({"cpu.max": "150000 100000\n"}, 2),
+        ({"cpu.max": "50000 100000\n"}, 1),
+        ({"cpu/cpu.cfs_quota_us": "300000\n", "cpu/cpu.cfs_period_us": "100000\n"}, 3),
+        ({"cpu/cpu.cfs_quota_us": "-1\n", "cpu/cpu.cfs_period_us": "100000\n"}, None),
+        ({"cpu.max": "max 100000\n"}, None),
+        ({}, None),
+    ],
+)
+def test_cpu_limit(load_config, tmp_path, monkeypatch, files, cpus):
+    """Test the CPU quota is read from cgroup v2 or v1, and the affinity mask otherwise."""
+    config = load_config()
+    monkeypatch.setattr("os.sched_getaffinity", lambda _pid: set(range(8)))
+
+    assert config["cpu_limit"](write_cgroup(tmp_path, files)) == (cpus or 8)
+
+
+def test_quota_is_capped_at_the_affinity_mask(load_config, tmp_path, monkeypatch):
+    """Test a quota above the CPUs the process may run on is not used."""
+    config = load_config()
+    monkeypatch.setattr("os.sched_getaffinity", lambda _pid: {0, 1})
+
+    assert config["cpu_limit"](write_cgroup(tmp_path, {"cpu.max": "800000 100000"})) == 2
+
+
+@pytest.mark.parametrize(
+    ("worker_class", "expected"),
+    [
+        ("sync", ("sync", "config.wsgi:application", 1)),
+        ("gthread", ("gthread", "config.wsgi:application", 4)),
+        ("uvicorn", ("uvicorn_worker.UvicornWorker", "config.asgi:application", 1)),
+    ],
+)
+def test_worker_classes(load_config, worker_class, expected):
+    """Test each worker class serves its application with its default threads."""
+    config = load_config(GUNICORN_WORKER_CLASS=worker_class, WEB_CONCURRENCY="3")
+
+    assert (config["worker_class"], config["wsgi_app"], config["threads"]) == expected
+    assert config["workers"] == 3
+    assert Path(config["chdir"]) == CONFIG.parent / "src"
+
+
+def test_worker_counts(load_config):
+    """Test the default worker and thread counts per CPU."""
+    worker_counts = load_config()["worker_counts"]
+
+    assert worker_counts("sync", 2) == (5, 1)
+    assert worker_counts("gthread", 2) == (3, 4)
+    assert worker_counts("uvicorn", 2) == (2, 1)
+
+
+def test_unknown_worker_class(load_config):
+    """Test an unknown worker class is refused."""
+    with pytest.raises(ValueError, match="GUNICORN_WORKER_CLASS must be one of"):
+        load_config(GUNICORN_WORKER_CLASS="eventlet")
+
+
+def test_preload_freezes_objects_before_fork(load_config):
+    """Test the collector is off while the application loads and frozen objects survive forks."""
+    config = load_config(GUNICORN_PRELOAD="true")
+    assert config["preload_app"] is True
+    assert config["max_requests"] == 1000
+    assert config["max_requests_jitter"] == 100
+    assert not gc.isenabled()
+
+    try:
+        config["pre_fork"](None, None)
+        assert gc.get_freeze_count() > 0
+        config["post_fork"](None, None)
+        assert gc.isenabled()
+    finally:
+        gc.unfreeze()
+
+
+def test_preloaded_master_does_not_connect(load_config):
+    """Test the preloaded application leaves opening database connections to the workers."""
+    load_config(GUNICORN_PRELOAD="true")
+    assert os.environ["DJANGO_WARMUP_DATABASES"] == "false"
+
+
+@pytest.mark.parametrize(
+    ("worker_class", "keep"), [("sync", True), ("gthread", False), ("uvicorn", False)]
+)
+def test_workers_connect_after_fork(load_config, monkeypatch, settings, worker_class, keep):
+    """Test each worker opens its connections, keeping them only where requests use them."""
+    settings.WARMUP = True
+    calls = []
+    monkeypatch.setattr("config.warmup.connect_databases", lambda **kwargs: calls.append(kwargs))
+    config = load_config(GUNICORN_PRELOAD="true", GUNICORN_WORKER_CLASS=worker_class)
+
+    config["post_worker_init"](SimpleNamespace(pid=1, log=Mock()))
+
+    assert calls == [{"keep": keep}]
+
+
+def test_memory_usage(load_config):
+    """Test the worker memory report has the figures to size a node by."""
+    config = load_config()
+    usage = config["memory_usage"]()
+
+    if Path("/proc/self/smaps_rollup").exists():
+        assert usage.keys() == {"rss", "pss", "shared", "private"}
+        assert usage["rss"] == usage["shared"] + usage["private"]
+    assert usage["rss"] > 0
+    assert config["format_memory"]({"rss": 2048}) == "rss=2.0MiB"
@@ -0,0 +1,63 @@
+"""Import-time budgets for the WSGI and ASGI entry points.
+
+``python -X importtime`` reports the cumulative time each module took to
+import, everything it imported included. For ``config.wsgi`` and
+``config.asgi`` that is the cold start of a worker before its warm-up: Django
+set-up, every installed app and the URLconf's imports. The budgets live in
+``tests/import_budgets.json``; raise one deliberately, in the change that
+needs it, and prefer importing a heavy dependency where it is used.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from tests.conftest import BASE_DIR, SRC_DIR
+
+BUDGETS_FILE = BASE_DIR / "tests" / "import_budgets.json"
+BUDGETS = json.loads(BUDGETS_FILE.read_text())
+# Fastest of this many runs, to leave out a slow first read from disk and scheduling noise.
+RUNS = 3
+
+
+def run(module, **environ):
+    """Import ``module`` in a fresh interpreter with ``-X importtime``; return its stderr."""
+    env = {**os.environ, "DJANGO_WARMUP": "false", **environ}
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=SRC_DIR,
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stderr
+
+
+def import_time_ms(module):
+    """Return the cumulative import time of ``module`` in milliseconds."""
+    for line in run(module).splitlines():
+        fields = [field.strip() for field in line.removeprefix("import time:").split("|")]
+        if len(fields) == 3 and fields[2] == module:
+            return int(fields[1]) / 1000
+    raise AssertionError(f"{module} is missing from the -X importtime report")
+
+
+@pytest.mark.parametrize("module", sorted(BUDGETS))
+def test_import_time_budget(module):
+    """Test the entry point imports within its budget."""
+    elapsed = min(import_time_ms(module) for _ in range(RUNS))
+
+    budget = BUDGETS[module]["ms"]
+    assert elapsed <= budget, f"import {module} took {elapsed:.0f} ms, budget {budget} ms"
+
+
+@pytest.mark.parametrize("module", sorted(BUDGETS))
+def test_entry_point_warms_up(module):
+    """Test importing the entry point runs the warm-up unless it is turned off."""
+    output = run(module, DJANGO_WARMUP="true", DJANGO_WARMUP_DATABASES="false", LOG_LEVEL="INFO")
+
+    assert "Warm-up finished" in output
+    assert "Warm-up finished" not in run(module, LOG_LEVEL="INFO")
@@ -0,0 +1,109 @@
+"""Tests for the start-up warm-up in config.warmup."""
+
+import logging
+
+import pytest
+
+from django.db import OperationalError, connections
+from django.urls import clear_url_caches, get_resolver
+from rest_framework import serializers
+
+from apps.api.serializers import TaskBulkTransitionSerializer
+from apps.core.serializers import TaskCreateSerializer, TaskSerializer, TaskUpdateSerializer
+from config import warmup
+
+
+def test_urls_are_resolved_up_front():
+    """Test every resolver, nested ones included, has built its reverse lookups."""
+    clear_url_caches()
+    resolver = get_resolver()
+    assert not resolver._populated
+
+    routes = warmup.warm_urls()
+
+    assert routes == sum(1 for p in warmup.walk_urls(resolver) if not hasattr(p, "url_patterns"))
+    assert resolver._populated
+    _, api = resolver.namespace_dict["api"]
+    assert api._populated
+    assert all(p._populated for p in warmup.walk_urls(resolver) if hasattr(p, "url_patterns"))
+
+
+def test_project_serializers():
+    """Test the project's serializers are found and list serializers are left out."""
+    found = warmup.project_serializers()
+
+    assert {
+        TaskSerializer,
+        TaskCreateSerializer,
+        TaskUpdateSerializer,
+        TaskBulkTransitionSerializer,
+    } <= set(found)
+    assert all(cls.__module__.startswith(warmup.PROJECT_PACKAGES) for cls in found)
+    assert not any(issubclass(cls, serializers.ListSerializer) for cls in found)
+    assert warmup.warm_serializers() == len(found)
+
+
+def test_templates(settings, tmp_path):
+    """Test project templates and those named by views are loaded, missing ones skipped."""
+    (tmp_path / "templates" / "core").mkdir(parents=True)
+    (tmp_path / "templates" / "core" / "task_row.html").write_text("{{ task.title }}")
+    settings.BASE_DIR = tmp_path
+    settings.TEMPLATES = [{**settings.TEMPLATES[0], "DIRS": [tmp_path / "templates"]}]
+
+    names = warmup.template_names()
+
+    assert {
+        "core/task_row.html",
+        "core/task_list.html",
+        "rest_framework/login.html",
+    } <= names
+    assert not any(name.startswith("admin/base") for name in names)
+    # The core views' templates are left to the project's users.
+    missing = {"core/task_list.html", "core/task_detail.html"}
+    assert warmup.warm_templates() == len(names - missing)
+
+
+@pytest.fixture
+def connected(monkeypatch):
+    """Record the aliases the warm-up connects to."""
+    aliases = []
+    for connection in connections.all():
+        monkeypatch.setattr(
+            connection, "ensure_connection", lambda alias=connection.alias: aliases.append(alias)
+        )
+    return aliases
+
+
+@pytest.mark.django_db
+def test_warm_up(connected, caplog):
+    """Test the warm-up covers each kind of lazy state and logs a summary."""
+    with caplog.at_level(logging.INFO, logger="config.warmup"):
+        counts = warmup.warm_up()
+
+    assert counts["routes"] > 0
+    assert counts["serializers"] >= 4
+    assert counts["databases"] == len(connections.all())
+    assert connected == [connection.alias for connection in connections.all()]
+    assert "Warm-up finished" in caplog.text
+
+
+@pytest.mark.django_db
+def test_databases_can_be_left_to_the_workers(settings, connected):
+    """Test the warm-up opens no connection with WARMUP_DATABASES off."""
+    settings.WARMUP_DATABASES = False
+
+    assert warmup.warm_up()["databases"] == 0
+    assert connected == []
+
+
+@pytest.mark.django_db
+def test_unreachable_database_is_logged(monkeypatch, caplog):
+    """Test a database that cannot be reached does not stop the application from starting."""
+
+    def refuse():
+        raise OperationalError("connection refused")
+
+    monkeypatch.setattr(connections["default"], "ensure_connection", refuse)
+
+    assert warmup.connect_databases() == 0
+    assert "could not connect to database 'default'" in caplog.text
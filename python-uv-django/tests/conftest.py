@@ -1,7 +1,10 @@
 """Pytest configuration and fixtures for Django tests."""
 
+import json
 import os
 import sys
+import time
+from contextlib import contextmanager
 from pathlib import Path
 
 import pytest
@@ -15,11 +18,31 @@ sys.path.insert(0, str(SRC_DIR))
 
 # Configure Django settings for tests
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.development")
+# Tests that import config.wsgi or config.asgi do not need them warmed up
+os.environ.setdefault("DJANGO_WARMUP", "false")
 
 import django
 
 django.setup()
 
+from django.db import connection  # noqa: E402
+from django.test.utils import CaptureQueriesContext  # noqa: E402
+
+# Committed per-endpoint query and latency budgets (see ``assert_budget``).
+BUDGETS_FILE = BASE_DIR / "tests" / "budgets.json"
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start every test with empty caches (flushing the test database does not bump them)."""
+    from django.core.cache import cache
+
+    from apps.core.cache import task_objects
+
+    cache.clear()
+    task_objects.clear()
+    task_objects.reset_stats()
+
 
 @pytest.fixture
 def api_client():
@@ -77,3 +100,29 @@ def multiple_tasks(db, task_factory):
         task_factory(title="In Progress Task", status=Task.Status.IN_PROGRESS, priority=2),
         task_factory(title="Completed Task", status=Task.Status.COMPLETED, priority=3),
     ]
+
+
+@pytest.fixture
+def assert_budget(db):
+    """Return a context manager failing when its block exceeds a committed budget.
+
+    ``with assert_budget("GET api:task-list"): ...`` looks the name up in
+    ``tests/budgets.json`` and checks the queries run and the wall time of
+    the block against its ``queries`` and ``ms`` entries.
+    """
+    budgets = json.loads(BUDGETS_FILE.read_text())
+
+    @contextmanager
+    def within(name):
+        budget = budgets[name]
+        with CaptureQueriesContext(connection) as queries:
+            start = time.perf_counter()
+            yield
+            elapsed_ms = (time.perf_counter() - start) * 1000
+        statements = "\n".join(query["sql"] for query in queries.captured_queries)
+        assert (
+            len(queries) <= budget["queries"]
+        ), f"{name} ran {len(queries)} queries, budget {budget['queries']}:\n{statements}"
+        assert elapsed_ms <= budget["ms"], f"{name} took {elapsed_ms:.1f} ms, budget {budget['ms']}"
+
+    return within